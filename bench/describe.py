@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+# Copyright 2011 Obsidian Research Corp. GPLv2, see COPYING.
+"""Measure the cost of printing a large SAPortInfoRecord table, as saquery
+does for a big fabric, and a PMPortCounters reply as perfquery does, with
+the dump and dotted pretty printers. Output goes to a buffered writer on
+the null device so only the formatting is measured."""
+import os,sys,io,timeit
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),".."))
+import rdma.binstruct
+import rdma.IBA as IBA
+import rdma.IBA_describe
+from libibtool import libibopts
+
+FORMATS = (("dump",{"format": "dump"}),
+           ("dotted",{"format": "dotted"}),
+           ("saquery",{"format": "dotted","colon": False,"column": 25,
+                       "name_map": libibopts.libib_name_map_saquery,
+                       "skip_reserved": False}),
+           ("perfquery",{"format": "dotted","colon": True,"dump_list": True,
+                         "name_map": libibopts.libib_name_map_perfquery}))
+
+def sample(cls,count):
+    """Return a ViewList of *count* records of *cls* with every byte set."""
+    step = (cls.MAD_LENGTH + 7)//8*8
+    rec = bytes((I*37 + 11) & 0xFF for I in range(cls.MAD_LENGTH))
+    rbuf = bytes(rec + bytes(step - len(rec)))*count
+    return rdma.binstruct.ViewList(cls,memoryview(rbuf),0,step,count)
+
+def bench(recs,args):
+    """Return the seconds to print every record in *recs*."""
+    F = io.TextIOWrapper(open(os.devnull,"wb"))
+    def run():
+        for I in recs:
+            I.printer(F,header=False,**args)
+        F.flush()
+    return min(timeit.repeat(run,number=1,repeat=3))
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    tables = ((IBA.SAPortInfoRecord,sample(IBA.SAPortInfoRecord,count)),
+              (IBA.PMPortCounters,sample(IBA.PMPortCounters,count)))
+    print("%-12s %18s %18s"%(("msec",) + tuple(
+        "%u %s"%(count,cls.__name__) for cls,recs in tables)))
+    for name,args in FORMATS:
+        print("%-12s %18.1f %18.1f"%((name,) + tuple(bench(recs,args)*1E3
+                                                     for cls,recs in tables)))
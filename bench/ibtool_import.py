@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+# Copyright 2011 Obsidian Research Corp. GPLv2, see COPYING.
+"""Measure the start up cost of short ibtool invocations: the time to import
+the library and the module of a command and to build its option parser,
+which is paid before the first MAD is sent. Each run is a fresh
+interpreter. The eager column first loads every structure in the catalog,
+as importing :mod:`rdma.IBA` used to."""
+import os,sys,subprocess,json
+
+TOP = os.path.join(os.path.dirname(os.path.abspath(__file__)),"..")
+CMDS = ("ibstat","perfquery","ibnetdiscover")
+
+CHILD = """
+import sys,time,types,json
+start = time.perf_counter()
+sys.path.insert(0,%(top)r)
+if %(eager)r:
+    import rdma.IBA as IBA
+    for I in dir(IBA):
+        getattr(IBA,I)
+ibtool = types.ModuleType("ibtool")
+with open(%(ibtool)r) as F:
+    exec(compile(F.read(),%(ibtool)r,"exec"),ibtool.__dict__)
+func,shown = ibtool.get_cmd_func(%(cmd)r,ibtool)
+ibtool.MyOptParse(func)
+res = time.perf_counter() - start
+print(json.dumps((res,sorted(I.rpartition(".")[2] for I in sys.modules
+                             if I.startswith("rdma.IBA_struct.")))))
+"""
+
+def run(cmd,eager):
+    """Return (seconds,structure modules) for one interpreter starting
+    *cmd*."""
+    code = CHILD%{"top": TOP,"cmd": cmd,"eager": eager,
+                  "ibtool": os.path.join(TOP,"ibtool")}
+    out = subprocess.check_output([sys.executable,"-c",code])
+    return json.loads(out)
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    print("%-16s %10s %10s  %s"%("command","msec","eager","structure modules"))
+    for cmd in CMDS:
+        lazy = [run(cmd,False) for I in range(count)]
+        eager = [run(cmd,True) for I in range(count)]
+        print("%-16s %10.1f %10.1f  %s"%(cmd,min(I[0] for I in lazy)*1E3,
+                                         min(I[0] for I in eager)*1E3,
+                                         ",".join(lazy[0][1])))
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+# Copyright 2011 Obsidian Research Corp. GPLv2, see COPYING.
+"""Measure the CPU cost of building a request MAD in
+MADTransactor._prepareMAD for the formats used by bulk sweeps.
+
+The *get* and *set* columns are _prepareMAD with a class and an object
+payload. *keyed* is a pre-rendered template cache for Gets, keyed on the
+format class, attribute, method and the header fields the RPC wrappers set
+from the path. It still has to update the format, which the reply is
+matched and decoded against, and copy the template. *floor* only copies a
+template and patches the TID and attribute modifier, which is less work
+than any real implementation can do.
+
+The keyed template is no faster than _prepareMAD for Gets, building the
+key and updating the format costs about what skipping pack_into saves.
+Sets cannot use it at all, since their payload changes every time and must
+still be packed. The gap between *get* and *floor*, about 1-2 usec for a
+Get and 3-5 usec for a Set, is mostly that format update and payload
+packing, and is small against the roughly 50 usec the scheduler spends on
+every MAD (see sched_bulk.py)."""
+import os,sys,struct,timeit
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),".."))
+import rdma.sim
+import rdma.IBA as IBA
+
+# Format name, payload and the header fields the RPC wrappers fill in
+FORMATS = (("SMPFormat",IBA.SMPPortInfo,("MKey",)),
+           ("SMPFormatDirected",IBA.SMPPortInfo,
+            ("MKey","drSLID","drDLID","hopCount")),
+           ("PMFormat",IBA.PMPortCounters,()),
+           ("SAFormat",IBA.SAPortInfoRecord,("componentMask","SMKey")))
+
+_tid = struct.Struct(">Q")
+_modifier = struct.Struct(">L")
+
+def best(stmt,number):
+    return min(timeit.repeat(stmt,number=number,repeat=15))/number
+
+def keyed_prepare(umad,templates,fields):
+    """Return a _prepareMAD replacement for Gets that renders from
+    *templates*, a dict of key to packed MAD."""
+    def prepare(fmt,payload,attributeModifier,method,path):
+        fmt.baseVersion = IBA.MAD_BASE_VERSION
+        fmt.mgmtClass = fmt.MAD_CLASS
+        fmt.classVersion = fmt.MAD_CLASS_VERSION
+        fmt.method = method
+        fmt.transactionID = umad._get_new_TID()
+        fmt.attributeID = payload.MAD_ATTRIBUTE_ID
+        fmt.attributeModifier = attributeModifier
+        key = (fmt.__class__,payload.MAD_ATTRIBUTE_ID,method,
+               tuple(getattr(fmt,I) for I in fields))
+        tmpl = templates.get(key)
+        if tmpl is None:
+            buf = bytearray(fmt.MAD_LENGTH)
+            fmt.pack_into(buf)
+            tmpl = templates[key] = bytes(buf)
+        buf = bytearray(tmpl)
+        _tid.pack_into(buf,8,fmt.transactionID)
+        _modifier.pack_into(buf,20,attributeModifier)
+        return buf
+    return prepare
+
+def bench(umad,cls,payload,fields,number):
+    """Return the seconds to create a *cls*, to build a MAD for the class
+    *payload*, to build one for a *payload* instance, to build one from a
+    keyed template and to copy and patch a template."""
+    fmt = cls()
+    obj = payload()
+    keyed = keyed_prepare(umad,{},fields)
+    buf = umad._prepareMAD(fmt,payload,0,IBA.MAD_METHOD_GET,None)
+    kbuf = keyed(fmt,payload,0,IBA.MAD_METHOD_GET,None)
+    assert kbuf[:8] + kbuf[16:] == buf[:8] + buf[16:]
+    tmpl = bytes(buf)
+    def render():
+        buf = bytearray(tmpl)
+        _tid.pack_into(buf,8,1)
+        _modifier.pack_into(buf,20,0)
+        return buf
+    return (best(cls,number),
+            best(lambda: umad._prepareMAD(fmt,payload,0,
+                                          IBA.MAD_METHOD_GET,None),number),
+            best(lambda: umad._prepareMAD(fmt,obj,0,
+                                          IBA.MAD_METHOD_SET,None),number),
+            best(lambda: keyed(fmt,payload,0,IBA.MAD_METHOD_GET,None),number),
+            best(render,number))
+
+if __name__ == '__main__':
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    umad = rdma.sim.SimUMAD(rdma.sim.fat_tree(4))
+    print("%-18s %8s %8s %8s %8s %8s"%("usec","format","get","set",
+                                       "keyed","floor"))
+    for name,payload,fields in FORMATS:
+        print("%-18s %8.2f %8.2f %8.2f %8.2f %8.2f"%(
+            (name,) + tuple(I*1E6 for I in bench(umad,getattr(IBA,name),
+                                                  payload,fields,number))))
@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+# Copyright 2011 Obsidian Research Corp. GPLv2, see COPYING.
+"""Compare the CPU cost per MAD of MADSchedule.get_many against running a
+coroutine for each MAD. Every switch port of a simulated fat tree has its
+PortInfo fetched over LID routes, the way a port sweep does. The time the
+simulated agents take to build replies is reported separately so the
+scheduler's own overhead can be seen."""
+import os,sys,time
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),".."))
+import rdma.path,rdma.sched,rdma.sim
+import rdma.IBA as IBA
+
+def requests(umad):
+    fabric = umad.fabric
+    end_port = umad.end_port
+    for node in fabric.nodes:
+        if not node.is_switch:
+            continue
+        path = rdma.path.IBPath(end_port,DLID=node.ports[0].LID,
+                                SLID=end_port.lid,dqpn=0,sqpn=0)
+        for I in range(1,node.numPorts + 1):
+            yield (path,I)
+
+def coroutines(umad,sched,res):
+    def get_pinf(path,port):
+        pinf = yield sched.SubnGet(IBA.SMPPortInfo,path,port)
+        res.append(pinf)
+    sched.run(mqueue=(get_pinf(path,port) for path,port in requests(umad)))
+
+def bulk(umad,sched,res):
+    def start():
+        yield sched.get_many(IBA.SMPPortInfo,requests(umad),
+                             lambda path,port,pinf:res.append(pinf))
+    sched.run(queue=start())
+
+def bench(fabric,func):
+    umad = rdma.sim.SimUMAD(fabric)
+    sendto = umad.sendto
+    agent = [0]
+    def timed_sendto(buf,path):
+        start = time.process_time()
+        sendto(buf,path)
+        agent[0] = agent[0] + time.process_time() - start
+    umad.sendto = timed_sendto
+    sched = rdma.sched.MADSchedule(umad)
+    sched.initial_window = sched.max_outstanding
+    res = []
+    start = time.process_time()
+    func(umad,sched,res)
+    total = time.process_time() - start
+    return len(res),total/len(res),(total - agent[0])/len(res)
+
+if __name__ == '__main__':
+    k = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    fabric = rdma.sim.fat_tree(k)
+    print("%12s %8s %14s %14s"%("method","MADs","usec CPU/MAD",
+                                 "w/o agents"))
+    for name,func in (("coroutine",coroutines),("get_many",bulk)):
+        count,cost,sched_cost = bench(fabric,func)
+        print("%12s %8u %14.2f %14.2f"%(name,count,cost*1E6,sched_cost*1E6))
@@ -0,0 +1,29 @@
+#!/usr/bin/env python
+# Copyright 2011 Obsidian Research Corp. GPLv2, see COPYING.
+"""Measure the MADSchedule cost per reply as the number of outstanding MADs
+grows. The MADs go to a fake UMAD that answers in random order so every
+reply cancels a timer from the middle of the timer queue."""
+import os,sys,time
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),".."))
+import rdma.sched
+import rdma.IBA as IBA
+from tests.sched_fake import FakeUMAD,fake_path
+
+def get(sched,path):
+    yield sched.SubnGet(IBA.SMPNodeInfo,path)
+
+def bench(outstanding,count):
+    umad = FakeUMAD(shuffle=True)
+    sched = rdma.sched.MADSchedule(umad)
+    sched.max_outstanding = outstanding
+    sched.initial_window = outstanding
+    paths = [fake_path(umad,I % 0xBFFF + 1) for I in range(count)]
+    start = time.perf_counter()
+    sched.run(mqueue=(get(sched,I) for I in paths))
+    return (time.perf_counter() - start)/count
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 40000
+    print("%10s %14s"%("outstanding","usec/reply"))
+    for I in (4,16,64,256,1024,4096):
+        print("%10u %14.2f"%(I,bench(I,count)*1E6))
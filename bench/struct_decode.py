@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# Copyright 2011 Obsidian Research Corp. GPLv2, see COPYING.
+"""Measure the cost of decoding and encoding a few of the generated
+IBA_struct classes, the operations done for every MAD reply and request,
+and of turning a large RMPP table into records with and without views, or
+into NumPy columns when it is installed."""
+import os,sys,timeit,tracemalloc
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),".."))
+import rdma.binstruct,rdma.columns
+import rdma.IBA as IBA
+
+STRUCTS = (IBA.SMPPortInfo,IBA.SAPathRecord,IBA.PMPortCounters,
+           IBA.SMPFormat)
+
+def sample(cls):
+    """Return a buffer for *cls* with every byte set, so every field decodes
+    to something non zero."""
+    return bytes((I*37 + 11) & 0xFF for I in range(cls.MAD_LENGTH))
+
+def bench(cls,number):
+    buf = sample(cls)
+    obj = cls(buf)
+    out = bytearray(cls.MAD_LENGTH)
+    res = []
+    for stmt in (lambda: cls(buf),
+                 lambda: obj.unpack_from(buf,0),
+                 lambda: obj.pack_into(out,0),
+                 lambda: cls()):
+        res.append(min(timeit.repeat(stmt,number=number,repeat=5))/number)
+    return res
+
+def bench_table(cls,count):
+    """Return a list of (method,seconds,bytes) for decoding a *count* record
+    table of *cls* into a list of structures, a ViewList and NumPy columns,
+    and then reading one member of every record. bytes is the memory held
+    by the records before any member is read."""
+    step = (cls.MAD_LENGTH + 7)//8*8
+    rec = sample(cls)
+    rbuf = bytes(rec + bytes(step - len(rec)))*count
+    def eager():
+        return [cls(rbuf[step*I:step*(I+1)]) for I in range(count)]
+    def views():
+        return rdma.binstruct.ViewList(cls,memoryview(rbuf),0,step,count)
+    res = []
+    for func in (eager,views):
+        tracemalloc.start()
+        lst = func()
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del lst
+        res.append(("decoded" if func is eager else "views",
+                    min(timeit.repeat(lambda: [I.portInfo.LID for I in func()],
+                                      number=1,repeat=3)),size))
+    if rdma.columns.numpy is not None:
+        res.append(("columns",
+                    min(timeit.repeat(lambda: rdma.columns.columns(
+                        views(),["portInfo.LID"]),number=1,repeat=3)),0))
+    return res
+
+if __name__ == '__main__':
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    print("%-16s %12s %12s %12s %12s"%("struct","usec decode","unpack_from",
+                                        "pack_into","zero"))
+    for cls in STRUCTS:
+        print("%-16s %12.2f %12.2f %12.2f %12.2f"%(
+            (cls.__name__,) + tuple(I*1E6 for I in bench(cls,number))))
+
+    count = 50000
+    print()
+    print("%u record SAPortInfoRecord table"%(count))
+    print("%-16s %12s %12s"%("method","msec","MiB"))
+    for name,t,size in bench_table(IBA.SAPortInfoRecord,count):
+        print("%-16s %12.1f %12.2f"%(name,t*1E3,size/(1 << 20)))
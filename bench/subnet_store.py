@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# Copyright 2011 Obsidian Research Corp. GPLv2, see COPYING.
+"""Compare the memory use, pickle cost and iteration speed of a discovered
+Subnet object graph against the same fabric held in a CompactSubnet. The
+fabric is a simulated fat tree built from a radix *k* switch, loaded with
+SA discovery as 'ibtool --discovery=SA' does."""
+import os,sys,pickle,timeit,tracemalloc
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),".."))
+import rdma.discovery
+import rdma.satransactor
+import rdma.sched
+import rdma.sim
+import rdma.subnet
+
+def discover(k):
+    umad = rdma.sim.SimUMAD(rdma.sim.fat_tree(k))
+    sa = rdma.satransactor.SATransactor(rdma.sched.MADSchedule(umad))
+    sbn = rdma.subnet.Subnet()
+    rdma.discovery.load(sa,sbn,["all_NodeInfo","all_NodeDescription",
+                                "all_PortInfo","all_topology",
+                                "all_SwitchInfo"])
+    return umad,sbn
+
+def best(stmt,number=1):
+    return min(timeit.repeat(stmt,number=number,repeat=3))/number
+
+def allocated(func):
+    """Return the result of *func* and the bytes it left allocated."""
+    tracemalloc.start()
+    ret = func()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return ret,size
+
+def walk_ports(sbn):
+    for port,idx in sbn.iterports():
+        port.LID,port.portGUID
+
+def walk_pinf(sbn):
+    for port in sbn.iterend_ports():
+        port.pinf.LID
+
+def bench(umad,sbn):
+    """Return a list of (name,value) for *sbn*."""
+    data = pickle.dumps(sbn,-1)
+    sbn,size = allocated(lambda: pickle.loads(data))
+    start = sbn.ports[umad.end_port.port_guid]
+    return [("memory MiB",size/2**20),
+            ("pickle KiB",len(data)/2**10),
+            ("dump ms",best(lambda: pickle.dumps(sbn,-1))*1E3),
+            ("load ms",best(lambda: pickle.loads(data))*1E3),
+            ("iterports ms",best(lambda: walk_ports(sbn))*1E3),
+            ("pinf.LID ms",best(lambda: walk_pinf(sbn))*1E3),
+            ("lids ms",best(lambda: [I for I in sbn.lids if I is not None])*1E3),
+            ("iterbfs ms",best(lambda: list(sbn.iterbfs(start)))*1E3)]
+
+if __name__ == '__main__':
+    k = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    umad,sbn = discover(k)
+    compact = sbn.compact()
+    print("%u nodes, %u ports, %u links"%(len(sbn.all_nodes),
+                                          sum(1 for I in sbn.iterports()),
+                                          len(sbn.topology)//2))
+    print("%-14s %12s %12s"%("","Subnet","CompactSubnet"))
+    for (name,obj),(name2,cpt) in zip(bench(umad,sbn),bench(umad,compact)):
+        print("%-14s %12.1f %12.1f"%(name,obj,cpt))
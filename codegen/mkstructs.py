@@ -1,10 +1,10 @@
 #!/usr/bin/env python
 # Copyright 2011 Obsidian Research Corp. GPLv2, see COPYING.
-# ./mkstructs.py -x iba_transport.xml -x iba_12.xml -x iba_13_4.xml -x iba_13_6.xml -x iba_14.xml -x iba_15.xml -x iba_16_1.xml -x iba_16_3.xml -x iba_16_4.xml -x iba_16_5.xml  -o ../rdma/IBA_struct.py -r ../doc/iba_struct.inc
+# ./mkstructs.py -x iba_transport.xml -x iba_12.xml -x iba_13_4.xml -x iba_13_6.xml -x iba_14.xml -x iba_15.xml -x iba_16_1.xml -x iba_16_3.xml -x iba_16_4.xml -x iba_16_5.xml  -p ../rdma/IBA_struct -r ../doc/iba_struct.inc
 '''This script converts the XML descriptions of IB structures into python
    classes and associated codegen'''
 
-import sys,optparse,re,os
+import sys,optparse,re,os,io
 from xml.etree import ElementTree
 from contextlib import contextmanager
 from functools import reduce
@@ -60,6 +60,25 @@ def rst_tableize(lst,idx):
             first = False
     yield line
 
+structObjects = {}
+def structObject(fmt):
+    """Return the name of the module level :class:`struct.Struct` for the
+    format string *fmt*."""
+    name = structObjects.get(fmt)
+    if name is None:
+        name = structObjects[fmt] = "_struct_%s"%(fmt[1:])
+    return name
+
+# The structures defined in the module being written, the others are reached
+# through rdma.IBA.
+localStructs = set()
+def structRef(name):
+    """Return the expression that refers to the structure class *name* from
+    the module being written."""
+    if name in localStructs or "." in name:
+        return name
+    return "IBA." + name
+
 class Type(object):
     """Hold a single typed field in the structure"""
     mutable = True
@@ -104,9 +123,9 @@ class Type(object):
     def initStr(self):
         base = "0"
         if self.isObject():
-            base = self.type[7:] + "()"
+            base = structRef(self.type[7:]) + "()"
         elif self.bits > 64:
-            base = "bytearray(%u)"%(self.bits/8)
+            base = "bytearray(%u)"%(self.bits//8)
         if self.count != 1:
             if self.bits == 8:
                 return "bytearray(%u)"%(self.count)
@@ -123,7 +142,7 @@ class Type(object):
             else:
                 base = ":class:`~rdma.IBA.%s`"%(self.type[7:])
         elif self.bits > 64:
-            base = ":class:`bytearray` (%u)"%(self.bits/8)
+            base = ":class:`bytearray` (%u)"%(self.bits//8)
         if self.count != 1:
             if self.bits == 8:
                 base = ":class:`bytearray` (%u)"%(self.count)
@@ -131,13 +150,13 @@ class Type(object):
         return base
 
     def make_pack(self,name,idx=0):
-        return "%s.pack_into(buffer,offset + %u)"%(name,self.off/8 + idx*self.bits/8)
+        return "%s.pack_into(buffer,offset + %u)"%(name,self.off//8 + idx*self.bits//8)
     def make_unpack(self,name,idx=0):
         if self.mutable:
-            return "%s.unpack_from(buffer,offset + %u)"%(name,self.off/8 + idx*self.bits/8)
+            return "%s.unpack_from(buffer,offset + %u)"%(name,self.off//8 + idx*self.bits//8)
         return "%s = %s(buffer[offset + %u:offset + %u],raw=True)"%\
-               (name,self.type[7:],self.off/8 + idx*self.bits/8,
-                self.off/8 + (idx+1)*self.bits/8)
+               (name,self.type[7:],self.off//8 + idx*self.bits//8,
+                self.off//8 + (idx+1)*self.bits//8)
 
     def isAligned(self):
         if self.bits >= 32:
@@ -176,7 +195,6 @@ class Struct(object):
 
         self.inherits = {}
         self.mb = []
-        self.packCount = 0
 
         off = 0
         for I in xml.iter("mb"):
@@ -294,10 +312,10 @@ class Struct(object):
             return ("[:16]",name,bits)
         if mbt.count == 1:
             if mbt.type is None and bits > 64:
-                return ("[:%u]"%(bits/8),name,bits)
+                return ("[:%u]"%(bits//8),name,bits)
             return (self.bitsToFormat(bits),name,bits)
         if mbt.bits == 8:
-            return ("[:%u]"%(bits/8),name,bits)
+            return ("[:%u]"%(bits//8),name,bits)
         if mbt.bits == 16 or mbt.bits == 32:
             res = []
             for I in range(0,mbt.count):
@@ -308,9 +326,9 @@ class Struct(object):
         # Must be a bit array
         assert(bits % 8 == 0)
         return (None,("rdma.binstruct.pack_array8(buffer,offset+%u,%u,%u,%s)"%\
-                      (mbt.off/8,mbt.bits,mbt.count,name),
+                      (mbt.off//8,mbt.bits,mbt.count,name),
                       "rdma.binstruct.unpack_array8(buffer,offset+%u,%u,%u,%s)"%\
-                      (mbt.off/8,mbt.bits,mbt.count,name)),
+                      (mbt.off//8,mbt.bits,mbt.count,name)),
                 bits)
 
     def structFormat(self,groups,prefix):
@@ -326,24 +344,102 @@ class Struct(object):
                     res.append(x)
                 continue
 
-            func = "_pack_%u_%u"%(self.packCount,bits)
-            self.packCount = self.packCount + 1
-
-            pack = ["@property","def %s(self):"%(func)]
-            unpack = ["@%s.setter"%(func),"def %s(self,value):"%(func)]
-            tmp = []
+            # The members share a single word, which is assembled and split
+            # inline with shifts and masks.
+            fields = []
             off = bits
             for J in I:
                 off = off - J[1].bits
-                tmp.append("((%s%s & 0x%X) << %u)"%(prefix,J[0],(1 << J[1].bits)-1,off))
-                unpack.append("    %s%s = (value >> %u) & 0x%X;"%(prefix,J[0],off,(1 << J[1].bits)-1))
-            pack.append("    return %s"%(" | ".join(tmp)))
-            self.funcs.append(pack)
-            self.funcs.append(unpack)
-
-            res.append((self.bitsToFormat(bits),"self.%s"%(func),bits))
+                fields.append((prefix + J[0],J[1].bits,off))
+            res.append((self.bitsToFormat(bits),fields,bits))
         return res
 
+    def packField(self,name,bits,shift):
+        if shift == 0:
+            return "(%s & 0x%X)"%(name,(1 << bits)-1)
+        return "((%s & 0x%X) << %u)"%(name,(1 << bits)-1,shift)
+
+    def extractField(self,word,wbits,bits,shift):
+        if shift + bits == wbits:
+            return "%s >> %u"%(word,shift)
+        if shift == 0:
+            return "%s & 0x%X"%(word,(1 << bits)-1)
+        return "(%s >> %u) & 0x%X"%(word,shift,(1 << bits)-1)
+
+    def unpackField(self,word,wbits,name,bits,shift):
+        return "%s = %s"%(name,self.extractField(word,wbits,bits,shift))
+
+    def viewWord(self,bits,off):
+        """Return an expression that reads the *bits* wide word at byte
+        *off* of a view."""
+        pos = "self._off + %u"%(off) if off else "self._off"
+        if bits == 8:
+            return "self._buf[%s]"%(pos)
+        return "%s.unpack_from(self._buf,%s)[0]"%(
+            structObject(">" + self.bitsToFormat(bits)),pos)
+
+    def viewGetter(self,name,ty):
+        """Return an expression that decodes the single member *name* from
+        the buffer of a view."""
+        def at(off):
+            if off == 0:
+                return "self._off"
+            return "self._off + %u"%(off)
+
+        off = ty.off//8
+        bits = ty.lenBits()
+        other = ty.getStruct()
+        if other:
+            other = structRef(other)
+            size = ty.bits//8
+            if ty.count == 1:
+                start = at(off)
+            else:
+                start = "%s + I*%u"%(at(off),size)
+            if ty.mutable:
+                obj = "%s.View(self._buf,%s)"%(other,start)
+            else:
+                obj = "%s(self._buf[%s:%s + %u],raw=True)"%(other,start,
+                                                            start,size)
+            if ty.count == 1:
+                return obj
+            return "[%s for I in range(%u)]"%(obj,ty.count)
+        if ty.type == "HdrIPv6Addr" or (ty.count == 1 and bits > 64) or \
+           (ty.count != 1 and ty.bits == 8):
+            return "bytearray(self._buf[%s:%s])"%(at(off),at(off + bits//8))
+        if ty.count == 1:
+            return self.viewWord(bits,off)
+        if ty.bits == 16 or ty.bits == 32:
+            return "list(%s.unpack_from(self._buf,%s))"%(
+                structObject(">" + self.bitsToFormat(ty.bits)*ty.count),
+                at(off))
+        return "rdma.binstruct.unpack_array8(self._buf,%s,%u,%u,[0]*%u)"%(
+            at(off),ty.bits,ty.count,ty.count)
+
+    def asPythonView(self,F):
+        """Generate the read only view class, it decodes each member from
+        the buffer when it is accessed."""
+        getters = []
+        for I in self.mbGroup:
+            if len(I) == 1:
+                getters.append((I[0][0],self.viewGetter(*I[0])))
+                continue
+            bits = sum(J[1].lenBits() for J in I)
+            word = self.viewWord(bits,I[0][1].off//8)
+            off = bits
+            for name,ty in I:
+                off = off - ty.bits
+                getters.append((name,self.extractField(word,bits,ty.bits,off)))
+
+        view = "_%sView"%(self.name)
+        print("class %s(rdma.binstruct.BinStructView,%s):"%(view,self.name), file=F)
+        print("    '''Read only view of a packed :class:`%s`'''"%(self.name), file=F)
+        print("    __slots__ = ('_buf','_off')", file=F)
+        for name,get in getters:
+            print("    %s = property(lambda self:%s)"%(name,get), file=F)
+        print("%s.View = %s"%(self.name,view), file=F)
+        print(file=F)
+
     def genFormats(self,fmts,pack,unpack):
         """Split into struct processing blocks and byte array assignment
         blocks"""
@@ -353,16 +449,16 @@ class Struct(object):
         fmtsOff = 0
         for I in fmts:
             if I[0] is None:
-                pack.append("    %s;"%(I[1][0]))
-                unpack.append("    %s;"%(I[1][1]))
+                pack.append("    %s"%(I[1][0]))
+                unpack.append("    %s"%(I[1][1]))
                 off = off + I[2]
                 continue
             if I[0][0] == '[':
                 assert off % 8 == 0 and I[2] % 8 == 0
                 pack.append("    buffer[offset + %u:offset + %u] = %s"%\
-                            (off/8,off/8 + I[2]/8,I[1]))
+                            (off//8,off//8 + I[2]//8,I[1]))
                 unpack.append("    %s = bytearray(buffer[offset + %u:offset + %u])"%\
-                              (I[1],off/8,off/8 + I[2]/8))
+                              (I[1],off//8,off//8 + I[2]//8))
                 off = off + I[2]
                 continue
             if fmtsOff != off and sfmts[-1]:
@@ -374,15 +470,28 @@ class Struct(object):
             off = off + I[2]
             fmtsOff = off
 
+        words = 0
         for I,off in zip(sfmts,sfmtsOff):
-            pack.append("    struct.pack_into('>%s',buffer,offset+%u,%s);"%\
-                     ("".join(J[0] for J in I),
-                      off/8,
-                      ",".join(J[1] for J in I)))
-            unpack.append("    (%s,) = struct.unpack_from('>%s',buffer,offset+%u);"%\
-                          (",".join(J[1] for J in I),
-                          "".join(J[0] for J in I),
-                          off/8))
+            sname = structObject(">" + "".join(J[0] for J in I))
+            args = []
+            targets = []
+            split = []
+            for J in I:
+                if not isinstance(J[1],list):
+                    args.append(J[1])
+                    targets.append(J[1])
+                    continue
+                word = "w%u"%(words)
+                words = words + 1
+                args.append(" | ".join(self.packField(*K) for K in J[1]))
+                targets.append(word)
+                split.extend("    %s"%(self.unpackField(word,J[2],*K))
+                             for K in J[1])
+            pack.append("    %s.pack_into(buffer,offset+%u,%s)"%\
+                        (sname,off//8,",".join(args)))
+            unpack.append("    (%s,) = %s.unpack_from(buffer,offset+%u)"%\
+                          (",".join(targets),sname,off//8))
+            unpack.extend(split)
 
     def get_properties(self):
         yield "MAD_LENGTH","%u"%(self.size)
@@ -410,17 +519,26 @@ class Struct(object):
         self.funcs = []
 
         if self.mb:
-            x = ["def __init__(self,*args):"]
+            # Unpacking assigns every member so zero is only needed when
+            # there is no buffer, but the containers unpack_from fills in
+            # place must exist.
+            x = ["def __init__(self,buf=None,offset=0):",
+                 "    if buf is None:",
+                 "        self.zero()",
+                 "        return"]
             for name,ty in self.mb:
-                if (ty.isObject() and ty.mutable) or ty.count != 1:
-                    x.append("    self.%s = %s;"%(name,ty.initStr()))
-            if len(x) != 1:
-                x.append("    rdma.binstruct.BinStruct.__init__(self,*args);")
-                self.funcs.append(x)
+                if (ty.isObject() and ty.mutable) or \
+                   (ty.count != 1 and ty.bits != 8):
+                    x.append("    self.%s = %s"%(name,ty.initStr()))
+            x.extend(("    if buf.__class__ is bytes:",
+                      "        self.unpack_from(buf,offset)",
+                      "    else:",
+                      "        rdma.binstruct.BinStruct.__init__(self,buf,offset)"))
+            self.funcs.append(x)
             x = ["def zero(self):"]
             for name,ty in self.mb:
                 if ty.lenBits() != 0:
-                    x.append("    self.%s = %s;"%(name,ty.initStr()))
+                    x.append("    self.%s = %s"%(name,ty.initStr()))
             self.funcs.append(x)
 
         pack = ["def pack_into(self,buffer,offset=0):"]
@@ -429,8 +547,8 @@ class Struct(object):
         if fmts:
             self.genFormats(fmts,pack,unpack)
         else:
-            pack.append("    return None;")
-            unpack.append("    return;")
+            pack.append("    return None")
+            unpack.append("    return")
         self.funcs.append(pack)
         self.funcs.append(unpack)
 
@@ -440,7 +558,7 @@ class Struct(object):
         else:
             print("class %s(rdma.binstruct.BinStruct):"%(self.name), file=F)
         print("    '''%s'''"%(self.desc), file=F)
-        print("    __slots__ = (%s);"""%(self.slots), file=F)
+        print("    __slots__ = (%s)"""%(self.slots), file=F)
 
         for name,value in self.get_properties():
             print("    %s = %s"%(name,value), file=F)
@@ -481,6 +599,7 @@ class Struct(object):
 parser = optparse.OptionParser(usage="%prog")
 parser.add_option('-x', '--xml', dest='xml', action="append")
 parser.add_option('-o', '--struct-out', dest='struct_out')
+parser.add_option('-p', '--package-out', dest='package_out')
 parser.add_option('-r', '--rst-out', dest='rst_out')
 (options, args) = parser.parse_args()
 
@@ -515,42 +634,100 @@ for I in structs:
             if J.methods:
                 I.methods.update(J.methods)
 
-with safeUpdateCtx(options.struct_out) as F:
+def writeModule(F,structs):
+    """Write the classes for *structs* as a python module."""
+    localStructs.clear()
+    localStructs.update(I.name for I in structs)
+    structObjects.clear()
+
     to_import = set(("struct","rdma.binstruct"))
     for I in structs:
         if I.format is not None:
             p = I.format.rpartition('.')
             if p[0]:
                 to_import.add(p[0])
-    print("import %s"%(",".join(sorted(to_import))), file=F)
-    for I in structs:
-        I.asPython(F)
+    for I in sorted(to_import):
+        print("import %s"%(I), file=F)
+    print("import rdma.IBA as IBA", file=F)
+    print(file=F)
 
-    fmts = {}
-    for I in structs:
-       for J in I.mb:
-          if J[0].startswith("reserved"):
-              continue
-          assert fmts.get(J[0],J[1].fmt) == J[1].fmt
-          if J[1].fmt != "%r":
-             fmts[J[0]] = J[1].fmt
-    print("MEMBER_FORMATS = %r;"%(fmts), file=F)
-
-    res = (I for I in structs if I.is_format)
-    print("CLASS_TO_STRUCT = {%s};"%(",\n\t".join("(%u,%u):%s"%(
-        int(I.mgmtClass,0),(1<<8) | int(I.mgmtClassVersion,0),I.name) for I in res)), file=F)
-
-    res = {}
+    # The classes refer to the precompiled struct.Struct objects so they are
+    # generated first.
+    body = io.StringIO()
     for I in structs:
-        if I.is_format:
-            for J in structs:
-                if J.attributeID is not None and not I.methods.isdisjoint(J.methods):
-                    res[I.name,J.attributeID] = J
+        I.asPython(body)
+        if I.mb and not I.is_format:
+            I.asPythonView(body)
+    for fmt,name in sorted(structObjects.items(),key=lambda x:x[1]):
+        print("%s = struct.Struct(%r)"%(name,fmt), file=F)
+    print(file=F)
+    F.write(body.getvalue())
+
+fmts = {}
+for I in structs:
+   for J in I.mb:
+      if J[0].startswith("reserved"):
+          continue
+      assert fmts.get(J[0],J[1].fmt) == J[1].fmt
+      if J[1].fmt != "%r":
+         fmts[J[0]] = J[1].fmt
+
+classToStruct = dict(((int(I.mgmtClass,0),(1<<8) | int(I.mgmtClassVersion,0)),I)
+                     for I in structs if I.is_format)
+attrToStruct = {}
+for I in structs:
+    if I.is_format:
+        for J in structs:
+            if J.attributeID is not None and not I.methods.isdisjoint(J.methods):
+                attrToStruct[I.name,J.attributeID] = J
+for I in structs:
+    if I.format is not None and I.attributeID is not None:
+        attrToStruct[I.format,I.attributeID] = I
+
+if options.struct_out is not None:
+ with safeUpdateCtx(options.struct_out) as F:
+    writeModule(F,structs)
+    print("MEMBER_FORMATS = %r"%(fmts), file=F)
+    print("CLASS_TO_STRUCT = {%s}"%(",\n\t".join("(%u,%u):%s"%(
+        k[0],k[1],v.name) for k,v in classToStruct.items())), file=F)
+    print("ATTR_TO_STRUCT = {%s}"%(",\n\t".join("(%s,%u):%s"%(
+        k[0],k[1],v.name) for k,v in sorted(attrToStruct.items()))), file=F)
+
+if options.package_out is not None:
+    # One module for each XML file, the package only holds the index
+    # rdma.IBA uses to import them on demand.
+    modules = {}
     for I in structs:
-        if I.format is not None and I.attributeID is not None:
-            res[I.format,I.attributeID] = I
-    print("ATTR_TO_STRUCT = {%s};"%(",\n\t".join("(%s,%u):%s"%(
-        k[0],k[1],v.name) for k,v in sorted(res.items()))), file=F)
+        name = os.path.splitext(os.path.basename(I.filename))[0]
+        modules.setdefault(name,[]).append(I)
+    if not os.path.isdir(options.package_out):
+        os.mkdir(options.package_out)
+    for name,lst in sorted(modules.items()):
+        with safeUpdateCtx(os.path.join(options.package_out,name + ".py")) as F:
+            writeModule(F,lst)
+
+    with safeUpdateCtx(os.path.join(options.package_out,"__init__.py")) as F:
+        print("""'''The IBA structure classes, generated by codegen/mkstructs.py. Each module
+holds the structures from one XML file, they are imported on first use
+through :mod:`rdma.IBA`.'''""", file=F)
+        print(file=F)
+        print("#: Structure name -> module in this package that defines it", file=F)
+        print("STRUCTS = {%s}"%(",\n\t".join("%r:%r"%(I.name,name)
+            for name,lst in sorted(modules.items()) for I in lst)), file=F)
+        print("MEMBER_FORMATS = %r"%(fmts), file=F)
+        print("#: :data:`rdma.IBA.CLASS_TO_STRUCT` by structure name", file=F)
+        print("CLASS_TO_STRUCT_NAME = {%s}"%(",\n\t".join("(%u,%u):%r"%(
+            k[0],k[1],v.name) for k,v in classToStruct.items())), file=F)
+        print("#: :data:`rdma.IBA.ATTR_TO_STRUCT` by structure name", file=F)
+        print("ATTR_TO_STRUCT_NAME = {%s}"%(",\n\t".join("(%r,%u):%r"%(
+            k[0],k[1],v.name) for k,v in sorted(attrToStruct.items()))), file=F)
+        print(file=F)
+        print("""def __getattr__(name):
+    # Structures pickled before the split refer to this module
+    import rdma.IBA
+    if name in STRUCTS:
+        return getattr(rdma.IBA,name)
+    raise AttributeError("module %r has no attribute %r"%(__name__,name))""", file=F)
 
 if options.rst_out is not None:
  with safeUpdateCtx(options.rst_out) as F:
@@ -183,8 +183,8 @@ def tmpl_attribute(v):
 def cmd_query_help(o,cmd,usage):
     """Generate the help text by merging in information from OPS."""
     def get_attrs():
-        for k,v in rdma.IBA.__dict__.items():
-            if is_valid_attribute(v):
+        for k in dir(rdma.IBA):
+            if is_valid_attribute(getattr(rdma.IBA,k)):
                 yield k
 
     return (usage + "\n    Valid METHOD:\n    " + "\n    ".join("   %s"%(I) for I in sorted(methods)) +
@@ -351,13 +351,13 @@ def cmd_ibportstate(argv,o):
 
         if isinstance(path,rdma.path.IBDRPath):
             peer_path = path.copy()
-            peer_path.drPath += chr(portIdx)
+            peer_path.drPath += bytes((portIdx,))
         else:
             peer_path = rdma.path.IBDRPath(path.end_port,
                                            SLID=path.SLID,
                                            drSLID=path.SLID,
                                            DLID=path.DLID,
-                                           drPath="\0" + chr(portIdx))
+                                           drPath=b"\0" + bytes((portIdx,)))
         if pinf.portState != IBA.PORT_STATE_DOWN:
             peer_pinf = umad.SubnGet(IBA.SMPPortInfo,peer_path,portIdx)
         else:
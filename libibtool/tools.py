@@ -12,9 +12,16 @@ class MyHelpFormatter(optparse.IndentedHelpFormatter):
     def format_usage(self, usage):
         return usage + "\n"
 
+def _enable_stats(option,opt,value,parser):
+    import rdma.madstats,rdma.madtransactor
+    parser.stats = rdma.madstats.MADStats()
+    rdma.madtransactor.MADTransactor.stats = parser.stats
+
 class MyOptParse(optparse.OptionParser):
     #: Global verbosity for exception reporting
     verbosity = 0
+    #: The :class:`rdma.madstats.MADStats` enabled by --stats
+    stats = None
 
     def __init__(self,cmd,option_list = [],description = None,
                  top_mod=None):
@@ -29,6 +36,8 @@ class MyOptParse(optparse.OptionParser):
 
         self.current_command = cmd
         self.prog = "%s %s"%(os.path.basename(sys.argv[0]),cmd.__name__[4:])
+        self.add_option("--stats",action="callback",callback=_enable_stats,
+                        help="Print MAD latency and retry statistics to stderr when the command finishes.")
 
     def parse_args(self,args,values = None,expected_values=-1):
         (args,values) = optparse.OptionParser.parse_args(self,args,values)
@@ -6,6 +6,8 @@
 import socket
 import sys
 import codecs
+import operator
+import importlib
 import rdma.binstruct
 import rdma.util as util
 
@@ -262,7 +264,7 @@ class GUID(bytes):
 
     def pack_into(self,buf,offset=0):
         """Pack the value into a byte array."""
-        buf[offset:offset+8] = self
+        buf[offset:offset+8] = bytes(self)
 
     def __str__(self):
         """Return a printable string of the GUID."""
@@ -448,6 +450,56 @@ class ComponentMask(object):
             self._parent._touch("%s.%s"%(self._name,name))
             return setattr(self._obj,name,value)
 
+#: Compiled :func:`sa_query` field sets, (class,names) -> (mask,setters)
+_sa_queries = {}
+
+def _compile_sa_query(cls,names):
+    """Return the component mask and a list of (getter,attribute) pairs
+    that store each of *names* into an instance of *cls*.
+
+    :raises AttributeError: If a name is not a member of *cls*."""
+    mask = 0
+    setters = []
+    obj = cls()
+    for name in names:
+        bit = cls.COMPONENT_MASK.get(name)
+        if bit is not None:
+            mask = mask | (1<<bit)
+        parent,_,attr = name.rpartition('.')
+        get = operator.attrgetter(parent) if parent else None
+        getattr(get(obj) if get else obj,attr)
+        setters.append((get,attr))
+    return mask,setters
+
+def sa_query(cls,values=None,**kwargs):
+    """Return a :class:`ComponentMask` for a new *cls* with the members
+    in *values* and *kwargs* set and their component mask bits included.
+    Nested members are named with dots, eg ``{"portInfo.LMC": 1}``, and
+    have to be passed in *values*. The result can be passed directly to the
+    `SubnAdm*` RPC methods::
+
+        req = IBA.sa_query(IBA.SAPathRecord,DGID=dgid,SGID=sgid,
+                           reversible=True)
+        rep = umad.SubnAdmGet(req)
+
+    The mask and member lookups are computed the first time a field set is
+    used with *cls* and cached, later queries only store the values.
+
+    :raises AttributeError: If a name is not a member of *cls*."""
+    if values:
+        values = dict(values,**kwargs)
+    else:
+        values = kwargs
+    key = (cls,tuple(values))
+    try:
+        mask,setters = _sa_queries[key]
+    except KeyError:
+        mask,setters = _sa_queries[key] = _compile_sa_query(cls,key[1])
+    obj = cls()
+    for (get,attr),value in zip(setters,values.values()):
+        setattr(get(obj) if get else obj,attr,value)
+    return ComponentMask(obj,mask)
+
 def const_str(prefix,value,with_int=False,me=sys.modules[__name__]):
     """Generalized constant integer to string that uses introspection
     to figure it out."""
@@ -469,6 +521,17 @@ def get_fmt_payload(class_id,class_version,attribute_id):
     """Find the MAD format and MAD payload classes for class_id and
     attribute_id. *class_version* is `(base_version << 8) | class_version`.
     See :meth:`rdma.madtransactor.MADTransactor.get_request_match_key`."""
+    if "ATTR_TO_STRUCT" not in globals():
+        # Only import the modules holding the two structures
+        me = sys.modules[__name__]
+        cls = IBA_struct.CLASS_TO_STRUCT_NAME.get((class_id,class_version))
+        if cls is None:
+            return (None,None)
+        attr = IBA_struct.ATTR_TO_STRUCT_NAME.get((cls,attribute_id))
+        if attr is None:
+            return (getattr(me,cls),None)
+        return (getattr(me,cls),getattr(me,attr))
+
     cls = CLASS_TO_STRUCT.get((class_id,class_version))
     if cls is None:
         return (None,None)
@@ -477,14 +540,40 @@ def get_fmt_payload(class_id,class_version,attribute_id):
         return (cls,None)
     return (cls,attr)
 
-from rdma.IBA_struct import *
-def _make_IBA_link():
-    """We have a bit of a circular dependency here, make a IBA
-    name inside the IBA_struct module so that it can see the
-    stuff in this module when its code runs. Fugly, but I
-    don't think you can do #include in python, which is what
-    I really want.."""
+# The structure classes live in the modules of rdma.IBA_struct and are only
+# imported when one of them is first used. Most programs need only a few.
+import rdma.IBA_struct as IBA_struct
+from rdma.IBA_struct import MEMBER_FORMATS
+
+def _load_structs(module):
+    """Import *module* from :mod:`rdma.IBA_struct` and copy its structures
+    into this module, so later lookups do not call :func:`__getattr__`."""
+    mod = importlib.import_module("rdma.IBA_struct." + module)
+    me = globals()
+    for name,I in IBA_struct.STRUCTS.items():
+        if I == module:
+            me[name] = getattr(mod,name)
+
+def _make_struct_maps():
+    """Build :data:`CLASS_TO_STRUCT` and :data:`ATTR_TO_STRUCT`, this imports
+    every module holding a MAD."""
     me = sys.modules[__name__]
-    struct = sys.modules["rdma.IBA_struct"]
-    setattr(struct,"IBA",me)
-_make_IBA_link()
+    classes = dict((k,getattr(me,v))
+                   for k,v in IBA_struct.CLASS_TO_STRUCT_NAME.items())
+    attrs = dict(((getattr(me,k[0]),k[1]),getattr(me,v))
+                 for k,v in IBA_struct.ATTR_TO_STRUCT_NAME.items())
+    globals().update(CLASS_TO_STRUCT=classes,ATTR_TO_STRUCT=attrs)
+
+def __getattr__(name):
+    if name == "CLASS_TO_STRUCT" or name == "ATTR_TO_STRUCT":
+        _make_struct_maps()
+        return globals()[name]
+    module = IBA_struct.STRUCTS.get(name)
+    if module is None:
+        raise AttributeError("module %r has no attribute %r"%(__name__,name))
+    _load_structs(module)
+    return globals()[name]
+
+def __dir__():
+    return sorted(set(globals()).union(IBA_struct.STRUCTS,
+                                       ("CLASS_TO_STRUCT","ATTR_TO_STRUCT")))
@@ -1,5 +1,6 @@
 # Copyright 2011 Obsidian Research Corp. GPLv2, see COPYING.
 # Describe various IBA constants as strings
+import operator
 import rdma.IBA as IBA
 import rdma.binstruct
 
@@ -200,199 +201,378 @@ def dstr(value,quotes = False):
         return r
     return r[1:-1]
 
-def _array_dump(F,a,buf,mbits,name,offset=0):
-    """Dump an array beside the hex values. Each array member is printed
-    beside the hex dword that it starts on."""
-    cur_dword = 0
+def _conv_str(value):
+    return dstr(description(value),quotes=True)
+
+def _conv_gid_prefix(value):
+    return IBA.GID(prefix=value,guid=IBA.GUID(0))
+
+def _member_format(name,mbits,ref):
+    """Return the format string and conversion function used to print
+    member *name*, *ref* is its value or the first entry of an array."""
+    if isinstance(ref,IBA.GID) or isinstance(ref,IBA.GUID):
+        return "%s",None
+    fmt = IBA.MEMBER_FORMATS.get(name,"%r")
+    if fmt == "hex":
+        return "0x%%0%ux"%((mbits+3)//4),None
+    if fmt == "str":
+        return "%s",_conv_str
+    if fmt == "gid_prefix":
+        return "%s/64",_conv_gid_prefix
+    return fmt,None
+
+#: Compiled :func:`struct_dump` formatters by class
+_dump_formatters = {}
+#: Compiled :func:`struct_dotted` formatters by class and options
+_dotted_formatters = {}
+
+def _dump_row(cur,names,text):
+    """Print the hex dword at *cur* and *text*, which is formatted with the
+    values of *names*."""
+    h = 2*cur
+    if not names:
+        def row(s,out,buf,hexs,pos,offset,prefix):
+            p = 2*pos + h
+            out.append("%3u %s %s\n"%(offset + cur,hexs[p:p + 8],text))
+        return row
+    get = operator.attrgetter(*names)
+    single = len(names) == 1
+    def row(s,out,buf,hexs,pos,offset,prefix):
+        p = 2*pos + h
+        vals = get(s)
+        out.append("%3u %s %s\n"%(offset + cur,hexs[p:p + 8],
+                                  text%((vals,) if single else vals)))
+    return row
+
+def _dump_array(name,cur,mbits,count):
+    """Print the array *name* with each entry beside the hex dword that it
+    starts on."""
+    rows = []
     off = 0
     idx = 0
-    mb = []
-    max_idx = len(a)
-    max_dword = (mbits*max_idx)//8
-    while cur_dword < max_dword:
-        del mb[:]
-        while off < cur_dword*8 + 32 and idx < max_idx:
+    dword = 0
+    while dword < (mbits*count)//8:
+        lo = idx
+        mb = []
+        while off < dword*8 + 32 and idx < count:
             off = off + mbits
             if idx == 0:
-                mb.append("%s=[%u:%r"%(name,idx,a[idx]))
-            elif idx+1 == max_idx:
-                mb.append("%u:%r]"%(idx,a[idx]))
+                mb.append("%s=[%u:%%r"%(name,idx))
+            elif idx+1 == count:
+                mb.append("%u:%%r]"%(idx))
             else:
-                mb.append("%u:%r"%(idx,a[idx]))
+                mb.append("%u:%%r"%(idx))
             idx = idx + 1
+        rows.append((cur + dword,2*(cur + dword),lo,idx,", ".join(mb)))
+        dword = dword + 4
+    def array(s,out,buf,hexs,pos,offset,prefix):
+        a = getattr(s,name)
+        for dword,h,lo,hi,text in rows:
+            p = 2*pos + h
+            out.append("%3u %s %s\n"%(offset + dword,hexs[p:p + 8],
+                                      text%tuple(a[lo:hi])))
+    return array
 
-        print("%3u %02X%02X%02X%02X %s"%\
-              (offset + cur_dword,ord(buf[cur_dword]),ord(buf[cur_dword+1]),
-               ord(buf[cur_dword+2]),ord(buf[cur_dword+3]),
-               ", ".join(mb)), file=F)
-        cur_dword = cur_dword + 4
+def _dump_struct(name,cur,size,count,last):
+    """Recurse into the structure member *name*, or into each of its *count*
+    entries if it is an array."""
+    def struct(s,out,buf,hexs,pos,offset,prefix):
+        attr = getattr(s,name)
+        if count is None:
+            out.append("   + %s%s %s\n"%(prefix,name,attr.__class__.__name__))
+            _dump_formatter(attr.__class__)(attr,out,buf,hexs,pos + cur,
+                                            offset + cur,
+                                            "%s%s."%(prefix,name))
+        else:
+            for I,v in enumerate(attr):
+                out.append("   + %s%s[%u] %s\n"%(prefix,name,I,
+                                                 v.__class__.__name__))
+                _dump_formatter(v.__class__)(v,out,buf,hexs,
+                                             pos + cur + I*size,
+                                             offset + cur + I*size,
+                                             "%s%s[%u]."%(prefix,name,I))
+        if not last:
+            out.append("   - %s%s\n"%(prefix,name))
+    return struct
 
-def struct_dump(F,s,offset=0,name_prefix=''):
-    """Pretty print the structure *s*. *F* is the output file, *offset* is
-    added to all printed offsets and name_prefix is used to prefix names
-    when descending."""
-    buf = bytearray(s.MAD_LENGTH)
-    s.pack_into(buf)
-    buf = bytes(buf)
+def _dump_data(cls,cur,bits,max_dword):
+    """Print the data member of a `*Format`, decoded as the structure the
+    attribute ID selects if there is one."""
+    size = bits//8
+    last = cur + size >= max_dword
+    rows = [_dump_row(cur,(),"data=<%u bytes>"%(size))]
+    rows.extend(_dump_row(I,(),"") for I in range(cur + 4,cur + size,4))
+    def data(s,out,buf,hexs,pos,offset,prefix):
+        nattr = IBA.ATTR_TO_STRUCT.get((cls,s.attributeID))
+        if nattr is None or nattr.MAD_LENGTH > max_dword - cur:
+            for I in rows:
+                I(s,out,buf,hexs,pos,offset,prefix)
+            return
+        out.append("   + %sdata %s\n"%(prefix,nattr.__name__))
+        _dump_formatter(nattr)(nattr(buf,pos + cur),out,buf,hexs,pos + cur,
+                               offset + cur,"%sdata."%(prefix))
+        if not last:
+            out.append("   - %sdata\n"%(prefix))
+    return data
 
+def _dump_formatter(cls):
+    """Return the function that prints an instance of *cls* for
+    :func:`struct_dump`. The layout of the output only depends on the class
+    so it is worked out once, leaving formatting the member values for each
+    instance."""
+    try:
+        return _dump_formatters[cls]
+    except KeyError:
+        pass
+    struct = getattr(cls,"STRUCT",cls)
+    ref = struct()
+    is_format = isinstance(ref,rdma.binstruct.BinFormat)
+    steps = []
     idx = 0
     off = 0
-    mb = []
-    max_idx = len(s.MEMBERS)
-    max_dword = len(buf)
-    for nz_dword in range(max_dword-1,-1,-1):
-        if buf[nz_dword] != '\0':
-            break
+    max_idx = len(struct.MEMBERS)
+    max_dword = struct.MAD_LENGTH
     cur_dword = 0
-    while cur_dword < max_dword:
-        del mb[:]
-        if (idx >= max_idx and cur_dword > nz_dword):
-            break
+    done = False
+    while cur_dword < max_dword and idx < max_idx and not done:
+        names = []
+        mb = []
         while off < cur_dword*8 + 32 and idx < max_idx:
-            name,mbits,count = s.MEMBERS[idx]
+            name,mbits,count = struct.MEMBERS[idx]
             bits = mbits*count
             aligned = (off % 32) == 0 and (bits % 32) == 0
             off = off + bits
             idx = idx + 1
-            attr = getattr(s,name)
+            attr = getattr(ref,name)
 
             if aligned and count == 1:
                 # Special automagic decode of format data members based on
                 # attribute ID.
-                if name == "data" and isinstance(s,rdma.binstruct.BinFormat):
-                    nattr = IBA.ATTR_TO_STRUCT.get((s.__class__,s.attributeID))
-                    if nattr != None:
-                        if nattr.MAD_LENGTH <= max_dword - cur_dword:
-                            attr = nattr(buf,cur_dword)
+                if name == "data" and is_format:
+                    steps.append(_dump_data(struct,cur_dword,bits,max_dword))
+                    cur_dword = cur_dword + bits//8
+                    if cur_dword >= max_dword:
+                        done = True
+                        break
+                    continue
 
                 # Recurse into children structs
                 if isinstance(attr,rdma.binstruct.BinStruct):
-                    print("   + %s%s %s"%(name_prefix,name,
-                                               attr.__class__.__name__), file=F)
-                    struct_dump(F,attr,cur_dword+offset,
-                                name_prefix="%s%s."%(name_prefix,name))
+                    steps.append(_dump_struct(name,cur_dword,bits//8,None,
+                                              cur_dword + bits//8 >= max_dword))
                     cur_dword = cur_dword + bits//8
                     if cur_dword >= max_dword:
-                        return
-                    print("   - %s%s"%(name_prefix,name), file=F)
+                        done = True
+                        break
                     continue
 
             # Handle aligned arrays by pretty printing the array
             if aligned and count != 1 and count == len(attr):
                 # Handle arrays of structures
                 if isinstance(attr[0],rdma.binstruct.BinStruct):
-                    for I,v in enumerate(attr):
-                        print("   + %s%s[%u] %s"%(
-                            name_prefix,name,I,v.__class__.__name__), file=F)
-                        struct_dump(F,v,cur_dword,
-                                    name_prefix="%s%s[%u]."%(
-                                        name_prefix,name,I))
-                        cur_dword = cur_dword + bits//8
+                    steps.append(_dump_struct(name,cur_dword,mbits//8,count,
+                                              cur_dword + bits//8 >= max_dword))
+                    cur_dword = cur_dword + bits//8
                     if cur_dword >= max_dword:
-                        return
-                    print("   - %s%s"%(name_prefix,name), file=F)
+                        done = True
+                        break
                     continue
 
-                _array_dump(F,attr,buf[cur_dword:cur_dword + bits//8],
-                            mbits,name,offset=cur_dword+offset)
+                steps.append(_dump_array(name,cur_dword,mbits,count))
                 cur_dword = cur_dword + bits//8
                 continue
 
             if aligned:
                 # Not much sense in printing bytes we can see in hex.
                 if isinstance(attr,bytearray):
-                    mb.append("%s=<%u bytes>"%(name,bits/8))
+                    mb.append("%s=<%u bytes>"%(name,bits//8))
                     continue
-            mb.append("%s=%r"%(name,getattr(s,name)))
+            names.append(name)
+            mb.append("%s=%%r"%(name))
 
-        if cur_dword+3 >= max_dword:
-            return
+        if done or cur_dword+3 >= max_dword:
+            break
 
+        text = ",".join(mb)
         while off > cur_dword*8:
-            print("%3u %02X%02X%02X%02X %s"%\
-                (offset + cur_dword,ord(buf[cur_dword]),ord(buf[cur_dword+1]),
-                 ord(buf[cur_dword+2]),ord(buf[cur_dword+3]),
-                 ",".join(mb)), file=F)
-            del mb[:]
+            steps.append(_dump_row(cur_dword,names,text))
+            names = ()
+            text = ""
             cur_dword = cur_dword + 4
 
-def struct_dotted(F,s,name_prefix='',dump_list=False,skip_reserved=True,
-                  column=33,colon=False,name_map=None):
-    """This tries to emulate the libib structure print format. Members are
-    printed one per line with values aligned on column 32."""
-    for name,mbits,count in s.MEMBERS:
+    def dump(s,out,buf,hexs,pos,offset,prefix):
+        for I in steps:
+            I(s,out,buf,hexs,pos,offset,prefix)
+    _dump_formatters[cls] = dump
+    return dump
+
+def struct_dump(F,s,offset=0,name_prefix=''):
+    """Pretty print the structure *s*. *F* is the output file, *offset* is
+    added to all printed offsets and name_prefix is used to prefix names
+    when descending."""
+    if isinstance(s,rdma.binstruct.BinStructView):
+        # Reading every member of a view decodes it many times over
+        s = s.decode()
+    buf = bytearray(s.MAD_LENGTH)
+    s.pack_into(buf)
+    buf = bytes(buf)
+    out = []
+    _dump_formatter(s.__class__)(s,out,buf,buf.hex().upper(),0,offset,
+                                 name_prefix)
+    if out:
+        F.write("".join(out))
+
+def _dotted_line(n,column,colon,fmt):
+    if colon:
+        n = n + ":"
+    return "%s%s%s\n"%(n,"."*(column-len(n)),fmt)
+
+def _dotted_values(names,lines):
+    """Print the scalar members *names*, each with its line from
+    *lines*. Members that are `None` are skipped."""
+    get = operator.attrgetter(*names)
+    if len(names) == 1:
+        line = lines[0]
+        def values(s,out):
+            v = get(s)
+            if v is not None:
+                out.append(line%(v,))
+        return values
+    fmt = "".join(lines)
+    def values(s,out):
+        vals = get(s)
+        if None not in vals:
+            out.append(fmt%vals)
+            return
+        for line,v in zip(lines,vals):
+            if v is not None:
+                out.append(line%(v,))
+    return values
+
+def _dotted_conv(name,line,conv):
+    def value(s,out):
+        v = getattr(s,name)
+        if v is not None:
+            out.append(line%(conv(v),))
+    return value
+
+def _dotted_array(name,line):
+    def array(s,out):
+        v = getattr(s,name)
+        if v is not None:
+            out.append(line%tuple(v))
+    return array
+
+def _dotted_struct(name,prefixes,args):
+    """Recurse into the structure member *name*. *prefixes* is the name
+    prefix of the member or a list of them if it is an array."""
+    if isinstance(prefixes,str):
+        def struct(s,out):
+            v = getattr(s,name)
+            if v is not None:
+                _dotted_formatter(v.__class__,prefixes,*args)(v,out)
+        return struct
+    def struct(s,out):
+        v = getattr(s,name)
+        if v is not None:
+            for prefix,I in zip(prefixes,v):
+                _dotted_formatter(I.__class__,prefix,*args)(I,out)
+    return struct
+
+def _dotted_data(cls,name_prefix,line,conv,args):
+    """Print the data member of a `*Format`, decoded as the structure the
+    attribute ID selects if there is one."""
+    prefix = "%sdata."%(name_prefix)
+    def data(s,out):
+        v = s.data
+        if v is None:
+            return
+        nattr = IBA.ATTR_TO_STRUCT.get((cls,s.attributeID))
+        if nattr is not None and nattr.MAD_LENGTH <= len(v):
+            _dotted_formatter(nattr,prefix,*args)(nattr(v),out)
+        else:
+            out.append(line%(conv(v) if conv else v,))
+    return data
+
+def _dotted_formatter(cls,name_prefix,dump_list,skip_reserved,column,colon,
+                      name_map):
+    """Return the function that prints an instance of *cls* for
+    :func:`struct_dotted` with these options. The labels and formats of the
+    members are worked out once for each class and set of options."""
+    key = (cls,name_prefix,dump_list,skip_reserved,column,colon,id(name_map))
+    res = _dotted_formatters.get(key)
+    if res is not None and res[1] is name_map:
+        return res[0]
+
+    args = (dump_list,skip_reserved,column,colon,name_map)
+    struct = getattr(cls,"STRUCT",cls)
+    ref = struct()
+    is_format = isinstance(ref,rdma.binstruct.BinFormat)
+    steps = []
+    names = []
+    lines = []
+    for name,mbits,count in struct.MEMBERS:
         if skip_reserved and name.startswith("reserved_"):
             continue
-        attr = getattr(s,name)
-        if attr is None:
-            continue
+        attr = getattr(ref,name)
         cname = name[0].upper() + name[1:]
         if name_map:
             cname = name_map.get(cname,cname)
+        n = "%s%s"%(name_prefix,cname)
 
-        # Special automagic decode of format data members based on
-        # attribute ID.
-        if name == "data" and isinstance(s,rdma.binstruct.BinFormat):
-            nattr = IBA.ATTR_TO_STRUCT.get((s.__class__,s.attributeID))
-            if nattr != None:
-                if nattr.MAD_LENGTH <= len(attr):
-                    attr = nattr(attr)
-
-        if isinstance(attr,rdma.binstruct.BinStruct):
-            struct_dotted(F,attr,"%s%s."%(name_prefix,name),
-                          dump_list=dump_list,
-                          skip_reserved=skip_reserved,
-                          column=column,
-                          colon=colon,
-                          name_map=name_map)
-            continue
-
-        if count != 1 and len(attr) == count:
-            ref = attr[0]
+        if is_format and name == "data":
+            fmt,conv = _member_format(name,mbits,attr)
+            step = _dotted_data(struct,name_prefix,
+                                _dotted_line(n,column,colon,fmt),conv,args)
+        elif isinstance(attr,rdma.binstruct.BinStruct):
+            step = _dotted_struct(name,"%s%s."%(name_prefix,name),args)
         else:
-            ref = attr
+            is_array = count != 1 and len(attr) == count
+            fmt,conv = _member_format(name,mbits,
+                                      attr[0] if is_array else attr)
+            if not is_array or conv is not None:
+                line = _dotted_line(n,column,colon,fmt)
+                if conv is None:
+                    names.append(name)
+                    lines.append(line)
+                    continue
+                step = _dotted_conv(name,line,conv)
+            elif isinstance(attr[0],rdma.binstruct.BinStruct):
+                step = _dotted_struct(name,["%s%s[%u]."%(name_prefix,name,I)
+                                            for I in range(count)],args)
+            elif mbits > 16 or dump_list:
+                step = _dotted_array(name,"".join(
+                    _dotted_line("%s[%u]"%(n,I),column,colon,fmt)
+                    for I in range(count)))
+            else:
+                step = _dotted_array(name,_dotted_line(n,column,colon,"[%s]"%(
+                    ", ".join(("%u:"%(I)) + fmt for I in range(count)))))
 
-        conv = None
-        if isinstance(ref,IBA.GID) or isinstance(ref,IBA.GUID):
-            fmt = "%s"
-        else:
-            fmt = IBA.MEMBER_FORMATS.get(name,"%r")
-            if fmt == "hex":
-                fmt = "0x%%0%ux"%((mbits+3)//4)
-            if fmt == "str":
-                fmt = "%s"
-                conv = lambda value: dstr(description(value),quotes=True)
-            if fmt == "gid_prefix":
-                fmt = "%s/64"
-                conv = lambda value: IBA.GID(prefix=value,guid=IBA.GUID(0))
-
-        if count != 1 and len(attr) == count and conv == None:
-            if isinstance(attr[0],rdma.binstruct.BinStruct):
-                for I,v in enumerate(attr):
-                    struct_dotted(F,v,"%s%s[%u]."%(name_prefix,name,I),
-                                  dump_list=dump_list,
-                                  skip_reserved=skip_reserved,
-                                  column=column,
-                                  colon=colon,
-                                  name_map=name_map)
-                continue
+        if names:
+            steps.append(_dotted_values(names,lines))
+            names = []
+            lines = []
+        steps.append(step)
+    if names:
+        steps.append(_dotted_values(names,lines))
 
-            if mbits > 16 or dump_list:
-                for I,v in enumerate(attr):
-                    n = "%s%s[%u]"%(name_prefix,cname,I)
-                    if colon:
-                        n = n + ":"
-                    if conv:
-                        v = conv(v)
-                    print(("%s%s"+fmt)%(n,"."*(column-len(n)),v), file=F)
-                continue
-            else:
-                attr = "[%s]"%(", ".join(("%u:"+fmt)%(I,v) for I,v in enumerate(attr)))
-                fmt = "%s"
+    def dotted(s,out):
+        for I in steps:
+            I(s,out)
+    _dotted_formatters[key] = (dotted,name_map)
+    return dotted
 
-        n = "%s%s"%(name_prefix,cname)
-        if colon:
-            n = n + ":"
-        if conv:
-            attr = conv(attr)
-        print(("%s%s"+fmt)%(n,"."*(column-len(n)),attr), file=F)
+def struct_dotted(F,s,name_prefix='',dump_list=False,skip_reserved=True,
+                  column=33,colon=False,name_map=None):
+    """This tries to emulate the libib structure print format. Members are
+    printed one per line with values aligned on column 32.
+
+    The layout for each structure class and set of options is computed once
+    and cached, *name_map* should not be changed after it has been used."""
+    if isinstance(s,rdma.binstruct.BinStructView):
+        s = s.decode()
+    out = []
+    _dotted_formatter(s.__class__,name_prefix,dump_list,skip_reserved,column,
+                      colon,name_map)(s,out)
+    if out:
+        F.write("".join(out))
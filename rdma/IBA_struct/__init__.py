@@ -0,0 +1,221 @@
+'''The IBA structure classes, generated by codegen/mkstructs.py. Each module
+holds the structures from one XML file, they are imported on first use
+through :mod:`rdma.IBA`.'''
+
+#: Structure name -> module in this package that defines it
+STRUCTS = {'CMFormat':'iba_12',
+	'CMPath':'iba_12',
+	'CMREQ':'iba_12',
+	'CMMRA':'iba_12',
+	'CMREJ':'iba_12',
+	'CMREP':'iba_12',
+	'CMRTU':'iba_12',
+	'CMDREQ':'iba_12',
+	'CMDREP':'iba_12',
+	'CMLAP':'iba_12',
+	'CMAPR':'iba_12',
+	'CMSIDR_REQ':'iba_12',
+	'CMSIDR_REP':'iba_12',
+	'MADHeader':'iba_13_4',
+	'MADHeaderDirected':'iba_13_4',
+	'MADClassPortInfo':'iba_13_4',
+	'MADInformInfo':'iba_13_4',
+	'RMPPHeader':'iba_13_6',
+	'RMPPShortHeader':'iba_13_6',
+	'RMPPData':'iba_13_6',
+	'RMPPAck':'iba_13_6',
+	'RMPPAbort':'iba_13_6',
+	'RMPPStop':'iba_13_6',
+	'SMPLIDPortBlock':'iba_14',
+	'SMPFormat':'iba_14',
+	'SMPFormatDirected':'iba_14',
+	'SMPNodeDescription':'iba_14',
+	'SMPNodeInfo':'iba_14',
+	'SMPSwitchInfo':'iba_14',
+	'SMPGUIDInfo':'iba_14',
+	'SMPPortInfo':'iba_14',
+	'SMPPKeyTable':'iba_14',
+	'SMPSLToVLMappingTable':'iba_14',
+	'SMPVLArbitrationTable':'iba_14',
+	'SMPLinearForwardingTable':'iba_14',
+	'SMPRandomForwardingTable':'iba_14',
+	'SMPMulticastForwardingTable':'iba_14',
+	'SMPSMInfo':'iba_14',
+	'SMPVendorDiag':'iba_14',
+	'SMPLedInfo':'iba_14',
+	'SMPNoticeTrap':'iba_14',
+	'SAHeader':'iba_15',
+	'SAFormat':'iba_15',
+	'SANodeRecord':'iba_15',
+	'SAPortInfoRecord':'iba_15',
+	'SASLToVLMappingTableRecord':'iba_15',
+	'SASwitchInfoRecord':'iba_15',
+	'SALinearForwardingTableRecord':'iba_15',
+	'SARandomForwardingTableRecord':'iba_15',
+	'SAMulticastForwardingTableRecord':'iba_15',
+	'SAVLArbitrationTableRecord':'iba_15',
+	'SASMInfoRecord':'iba_15',
+	'SAInformInfoRecord':'iba_15',
+	'SALinkRecord':'iba_15',
+	'SAGUIDInfoRecord':'iba_15',
+	'SAServiceRecord':'iba_15',
+	'SAPKeyTableRecord':'iba_15',
+	'SAPathRecord':'iba_15',
+	'SAMCMemberRecord':'iba_15',
+	'SATraceRecord':'iba_15',
+	'SAMultiPathRecord':'iba_15',
+	'SAServiceAssociationRecord':'iba_15',
+	'PMFormat':'iba_16_1',
+	'PMPortSamplesCtl':'iba_16_1',
+	'PMPortSamplesRes':'iba_16_1',
+	'PMPortCounters':'iba_16_1',
+	'PMPortRcvErrorDetails':'iba_16_1',
+	'PMPortXmitDiscardDetails':'iba_16_1',
+	'PMPortOpRcvCounters':'iba_16_1',
+	'PMPortFlowCtlCounters':'iba_16_1',
+	'PMPortVLOpPackets':'iba_16_1',
+	'PMPortVLOpData':'iba_16_1',
+	'PMPortVLXmitFlowCtlUpdateErrors':'iba_16_1',
+	'PMPortVLXmitWaitCounters':'iba_16_1',
+	'PMSwPortVLCongestion':'iba_16_1',
+	'PMPortSamplesResExt':'iba_16_1',
+	'PMPortCountersExt':'iba_16_1',
+	'PMPortXmitDataSL':'iba_16_1',
+	'PMPortRcvDataSL':'iba_16_1',
+	'DMFormat':'iba_16_3',
+	'DMServiceEntry':'iba_16_3',
+	'DMIOUnitInfo':'iba_16_3',
+	'DMIOControllerProfile':'iba_16_3',
+	'DMServiceEntries':'iba_16_3',
+	'DMDiagnosticTimeout':'iba_16_3',
+	'DMPrepareToTest':'iba_16_3',
+	'DMTestDeviceOnce':'iba_16_3',
+	'DMTestDeviceLoop':'iba_16_3',
+	'DMDiagCode':'iba_16_3',
+	'SNMPFormat':'iba_16_4',
+	'SNMPCommunityInfo':'iba_16_4',
+	'SNMPPDUInfo':'iba_16_4',
+	'VendFormat':'iba_16_5',
+	'VendOUIFormat':'iba_16_5',
+	'HdrLRH':'iba_transport',
+	'HdrRWH':'iba_transport',
+	'HdrGRH':'iba_transport',
+	'HdrBTH':'iba_transport',
+	'HdrRDETH':'iba_transport',
+	'HdrDETH':'iba_transport',
+	'HdrRETH':'iba_transport',
+	'HdrAtomicETH':'iba_transport',
+	'HdrAETH':'iba_transport',
+	'HdrAtomicAckETH':'iba_transport',
+	'HdrImmDt':'iba_transport',
+	'HdrIETH':'iba_transport',
+	'HdrFlowControl':'iba_transport'}
+MEMBER_FORMATS = {'PKey': 'hex', 'QKey': 'hex', 'transactionID': 'hex', 'TClass': 'hex', 'serviceID': 'hex', 'localCMQKey': 'hex', 'localQKey': 'hex', 'altTClass': 'hex', 'capabilityMask': 'hex', 'capabilityMask2': 'hex', 'redirectTC': 'hex', 'redirectPKey': 'hex', 'redirectQP': 'hex', 'redirectQKey': 'hex', 'trapPKey': 'hex', 'trapQP': 'hex', 'trapQKey': 'hex', 'MKey': 'hex', 'nodeString': 'str', 'deviceID': 'hex', 'revision': 'hex', 'vendorID': 'hex', 'GIDPrefix': 'gid_prefix', 'diagCode': 'hex', 'initType': 'hex', 'initTypeReply': 'hex', 'PKeyBlock': 'hex', 'SMKey': 'hex', 'servicePKey': 'hex', 'serviceName': 'str', 'QOSClass': 'hex', 'MLID': 'hex', 'counterSelect0': 'hex', 'counterSelect1': 'hex', 'counterSelect2': 'hex', 'counterSelect3': 'hex', 'counterSelect4': 'hex', 'counterSelect5': 'hex', 'counterSelect6': 'hex', 'counterSelect7': 'hex', 'counterSelect8': 'hex', 'counterSelect9': 'hex', 'counterSelect10': 'hex', 'counterSelect11': 'hex', 'counterSelect12': 'hex', 'counterSelect13': 'hex', 'counterSelect14': 'hex', 'counterSelect': 'hex', 'IDString': 'str', 'communityName': 'str'}
+#: :data:`rdma.IBA.CLASS_TO_STRUCT` by structure name
+CLASS_TO_STRUCT_NAME = {(7,258):'CMFormat',
+	(1,257):'SMPFormat',
+	(129,257):'SMPFormatDirected',
+	(3,258):'SAFormat',
+	(4,257):'PMFormat',
+	(6,257):'DMFormat',
+	(8,257):'SNMPFormat',
+	(9,257):'VendFormat',
+	(48,257):'VendOUIFormat'}
+#: :data:`rdma.IBA.ATTR_TO_STRUCT` by structure name
+ATTR_TO_STRUCT_NAME = {('CMFormat',16):'CMREQ',
+	('CMFormat',17):'CMMRA',
+	('CMFormat',18):'CMREJ',
+	('CMFormat',19):'CMREP',
+	('CMFormat',20):'CMRTU',
+	('CMFormat',21):'CMDREQ',
+	('CMFormat',22):'CMDREP',
+	('CMFormat',23):'CMSIDR_REQ',
+	('CMFormat',24):'CMSIDR_REP',
+	('CMFormat',25):'CMLAP',
+	('CMFormat',26):'CMAPR',
+	('DMFormat',1):'MADClassPortInfo',
+	('DMFormat',16):'DMIOUnitInfo',
+	('DMFormat',17):'DMIOControllerProfile',
+	('DMFormat',18):'DMServiceEntries',
+	('DMFormat',32):'DMDiagnosticTimeout',
+	('DMFormat',33):'DMPrepareToTest',
+	('DMFormat',34):'DMTestDeviceOnce',
+	('DMFormat',35):'DMTestDeviceLoop',
+	('DMFormat',36):'DMDiagCode',
+	('PMFormat',1):'MADClassPortInfo',
+	('PMFormat',16):'PMPortSamplesCtl',
+	('PMFormat',17):'PMPortSamplesRes',
+	('PMFormat',18):'PMPortCounters',
+	('PMFormat',21):'PMPortRcvErrorDetails',
+	('PMFormat',22):'PMPortXmitDiscardDetails',
+	('PMFormat',23):'PMPortOpRcvCounters',
+	('PMFormat',24):'PMPortFlowCtlCounters',
+	('PMFormat',25):'PMPortVLOpPackets',
+	('PMFormat',26):'PMPortVLOpData',
+	('PMFormat',27):'PMPortVLXmitFlowCtlUpdateErrors',
+	('PMFormat',28):'PMPortVLXmitWaitCounters',
+	('PMFormat',29):'PMPortCountersExt',
+	('PMFormat',30):'PMPortSamplesResExt',
+	('PMFormat',48):'PMSwPortVLCongestion',
+	('PMFormat',54):'PMPortXmitDataSL',
+	('PMFormat',55):'PMPortRcvDataSL',
+	('SAFormat',1):'MADClassPortInfo',
+	('SAFormat',3):'MADInformInfo',
+	('SAFormat',17):'SANodeRecord',
+	('SAFormat',18):'SAPortInfoRecord',
+	('SAFormat',19):'SASLToVLMappingTableRecord',
+	('SAFormat',20):'SASwitchInfoRecord',
+	('SAFormat',21):'SALinearForwardingTableRecord',
+	('SAFormat',22):'SARandomForwardingTableRecord',
+	('SAFormat',23):'SAMulticastForwardingTableRecord',
+	('SAFormat',24):'SASMInfoRecord',
+	('SAFormat',32):'SALinkRecord',
+	('SAFormat',48):'SAGUIDInfoRecord',
+	('SAFormat',49):'SAServiceRecord',
+	('SAFormat',51):'SAPKeyTableRecord',
+	('SAFormat',53):'SAPathRecord',
+	('SAFormat',54):'SAVLArbitrationTableRecord',
+	('SAFormat',56):'SAMCMemberRecord',
+	('SAFormat',57):'SATraceRecord',
+	('SAFormat',58):'SAMultiPathRecord',
+	('SAFormat',59):'SAServiceAssociationRecord',
+	('SAFormat',243):'SAInformInfoRecord',
+	('SMPFormat',2):'SMPNoticeTrap',
+	('SMPFormat',16):'SMPNodeDescription',
+	('SMPFormat',17):'SMPNodeInfo',
+	('SMPFormat',18):'SMPSwitchInfo',
+	('SMPFormat',20):'SMPGUIDInfo',
+	('SMPFormat',21):'SMPPortInfo',
+	('SMPFormat',22):'SMPPKeyTable',
+	('SMPFormat',23):'SMPSLToVLMappingTable',
+	('SMPFormat',24):'SMPVLArbitrationTable',
+	('SMPFormat',25):'SMPLinearForwardingTable',
+	('SMPFormat',26):'SMPRandomForwardingTable',
+	('SMPFormat',27):'SMPMulticastForwardingTable',
+	('SMPFormat',32):'SMPSMInfo',
+	('SMPFormat',48):'SMPVendorDiag',
+	('SMPFormat',49):'SMPLedInfo',
+	('SMPFormatDirected',2):'SMPNoticeTrap',
+	('SMPFormatDirected',16):'SMPNodeDescription',
+	('SMPFormatDirected',17):'SMPNodeInfo',
+	('SMPFormatDirected',18):'SMPSwitchInfo',
+	('SMPFormatDirected',20):'SMPGUIDInfo',
+	('SMPFormatDirected',21):'SMPPortInfo',
+	('SMPFormatDirected',22):'SMPPKeyTable',
+	('SMPFormatDirected',23):'SMPSLToVLMappingTable',
+	('SMPFormatDirected',24):'SMPVLArbitrationTable',
+	('SMPFormatDirected',25):'SMPLinearForwardingTable',
+	('SMPFormatDirected',26):'SMPRandomForwardingTable',
+	('SMPFormatDirected',27):'SMPMulticastForwardingTable',
+	('SMPFormatDirected',32):'SMPSMInfo',
+	('SMPFormatDirected',48):'SMPVendorDiag',
+	('SMPFormatDirected',49):'SMPLedInfo',
+	('SNMPFormat',16):'SNMPCommunityInfo',
+	('SNMPFormat',17):'SNMPPDUInfo'}
+
+def __getattr__(name):
+    # Structures pickled before the split refer to this module
+    import rdma.IBA
+    if name in STRUCTS:
+        return getattr(rdma.IBA,name)
+    raise AttributeError("module %r has no attribute %r"%(__name__,name))
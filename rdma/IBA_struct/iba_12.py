@@ -0,0 +1,778 @@
+import rdma.binstruct
+import struct
+import rdma.IBA as IBA
+
+_struct_BBBBHHQHHL = struct.Struct('>BBBBHHQHHL')
+_struct_H = struct.Struct('>H')
+_struct_HH = struct.Struct('>HH')
+_struct_L = struct.Struct('>L')
+_struct_LL = struct.Struct('>LL')
+_struct_LLBBH = struct.Struct('>LLBBH')
+_struct_LLL = struct.Struct('>LLL')
+_struct_LLLLLHH = struct.Struct('>LLLLLHH')
+_struct_LLLLLLL = struct.Struct('>LLLLLLL')
+_struct_LLQ = struct.Struct('>LLQ')
+_struct_LLQL = struct.Struct('>LLQL')
+_struct_Q = struct.Struct('>Q')
+
+class CMFormat(rdma.binstruct.BinFormat):
+    '''Request for Communication (section 16.7.1)'''
+    __slots__ = ('baseVersion','mgmtClass','classVersion','method','status','classSpecific','transactionID','attributeID','reserved_144','attributeModifier','data')
+    MAD_LENGTH = 256
+    MAD_CLASS = 0x7
+    MAD_CLASS_VERSION = 0x2
+    MEMBERS = [('baseVersion',8,1), ('mgmtClass',8,1), ('classVersion',8,1), ('method',8,1), ('status',16,1), ('classSpecific',16,1), ('transactionID',64,1), ('attributeID',16,1), ('reserved_144',16,1), ('attributeModifier',32,1), ('data',1856,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.baseVersion = 0
+        self.mgmtClass = 0
+        self.classVersion = 0
+        self.method = 0
+        self.status = 0
+        self.classSpecific = 0
+        self.transactionID = 0
+        self.attributeID = 0
+        self.reserved_144 = 0
+        self.attributeModifier = 0
+        self.data = bytearray(232)
+
+    def pack_into(self,buffer,offset=0):
+        buffer[offset + 24:offset + 256] = self.data
+        _struct_BBBBHHQHHL.pack_into(buffer,offset+0,self.baseVersion,self.mgmtClass,self.classVersion,self.method,self.status,self.classSpecific,self.transactionID,self.attributeID,self.reserved_144,self.attributeModifier)
+
+    def unpack_from(self,buffer,offset=0):
+        self.data = bytearray(buffer[offset + 24:offset + 256])
+        (self.baseVersion,self.mgmtClass,self.classVersion,self.method,self.status,self.classSpecific,self.transactionID,self.attributeID,self.reserved_144,self.attributeModifier,) = _struct_BBBBHHQHHL.unpack_from(buffer,offset+0)
+
+class CMPath(rdma.binstruct.BinStruct):
+    '''Path Information (section 12.6)'''
+    __slots__ = ('SLID','DLID','SGID','DGID','flowLabel','reserved_308','reserved_312','PD','TClass','hopLimit','SL','subnetLocal','reserved_341','localACKTimeout','reserved_349')
+    MAD_LENGTH = 44
+    MEMBERS = [('SLID',16,1), ('DLID',16,1), ('SGID',128,1), ('DGID',128,1), ('flowLabel',20,1), ('reserved_308',4,1), ('reserved_312',2,1), ('PD',6,1), ('TClass',8,1), ('hopLimit',8,1), ('SL',4,1), ('subnetLocal',1,1), ('reserved_341',3,1), ('localACKTimeout',5,1), ('reserved_349',3,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.SLID = 0
+        self.DLID = 0
+        self.SGID = IBA.GID()
+        self.DGID = IBA.GID()
+        self.flowLabel = 0
+        self.reserved_308 = 0
+        self.reserved_312 = 0
+        self.PD = 0
+        self.TClass = 0
+        self.hopLimit = 0
+        self.SL = 0
+        self.subnetLocal = 0
+        self.reserved_341 = 0
+        self.localACKTimeout = 0
+        self.reserved_349 = 0
+
+    def pack_into(self,buffer,offset=0):
+        self.SGID.pack_into(buffer,offset + 4)
+        self.DGID.pack_into(buffer,offset + 20)
+        _struct_HH.pack_into(buffer,offset+0,self.SLID,self.DLID)
+        _struct_LL.pack_into(buffer,offset+36,((self.flowLabel & 0xFFFFF) << 12) | ((self.reserved_308 & 0xF) << 8) | ((self.reserved_312 & 0x3) << 6) | (self.PD & 0x3F),((self.TClass & 0xFF) << 24) | ((self.hopLimit & 0xFF) << 16) | ((self.SL & 0xF) << 12) | ((self.subnetLocal & 0x1) << 11) | ((self.reserved_341 & 0x7) << 8) | ((self.localACKTimeout & 0x1F) << 3) | (self.reserved_349 & 0x7))
+
+    def unpack_from(self,buffer,offset=0):
+        self.SGID = IBA.GID(buffer[offset + 4:offset + 20],raw=True)
+        self.DGID = IBA.GID(buffer[offset + 20:offset + 36],raw=True)
+        (self.SLID,self.DLID,) = _struct_HH.unpack_from(buffer,offset+0)
+        (w0,w1,) = _struct_LL.unpack_from(buffer,offset+36)
+        self.flowLabel = w0 >> 12
+        self.reserved_308 = (w0 >> 8) & 0xF
+        self.reserved_312 = (w0 >> 6) & 0x3
+        self.PD = w0 & 0x3F
+        self.TClass = w1 >> 24
+        self.hopLimit = (w1 >> 16) & 0xFF
+        self.SL = (w1 >> 12) & 0xF
+        self.subnetLocal = (w1 >> 11) & 0x1
+        self.reserved_341 = (w1 >> 8) & 0x7
+        self.localACKTimeout = (w1 >> 3) & 0x1F
+        self.reserved_349 = w1 & 0x7
+
+class _CMPathView(rdma.binstruct.BinStructView,CMPath):
+    '''Read only view of a packed :class:`CMPath`'''
+    __slots__ = ('_buf','_off')
+    SLID = property(lambda self:_struct_H.unpack_from(self._buf,self._off)[0])
+    DLID = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 2)[0])
+    SGID = property(lambda self:IBA.GID(self._buf[self._off + 4:self._off + 4 + 16],raw=True))
+    DGID = property(lambda self:IBA.GID(self._buf[self._off + 20:self._off + 20 + 16],raw=True))
+    flowLabel = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 36)[0] >> 12)
+    reserved_308 = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 36)[0] >> 8) & 0xF)
+    reserved_312 = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 36)[0] >> 6) & 0x3)
+    PD = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 36)[0] & 0x3F)
+    TClass = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 40)[0] >> 24)
+    hopLimit = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 40)[0] >> 16) & 0xFF)
+    SL = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 40)[0] >> 12) & 0xF)
+    subnetLocal = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 40)[0] >> 11) & 0x1)
+    reserved_341 = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 40)[0] >> 8) & 0x7)
+    localACKTimeout = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 40)[0] >> 3) & 0x1F)
+    reserved_349 = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 40)[0] & 0x7)
+CMPath.View = _CMPathView
+
+class CMREQ(rdma.binstruct.BinStruct):
+    '''Request for Communication (section 12.6.5)'''
+    __slots__ = ('LCID','reserved_32','serviceID','LGUID','localCMQKey','localQKey','localQPN','responderResources','localEECN','initiatorDepth','remoteEECN','remoteResponseTimeout','transportService','flowControl','startingPSN','localResponseTimeout','retryCount','PKey','pathPacketMTU','RDCExists','RNRRetryCount','maxCMRetries','reserved_412','primaryPath','alternatePath','privateData')
+    MAD_LENGTH = 232
+    MAD_ATTRIBUTE_ID = 0x10
+    MAD_COMMMGTSEND = 0x3 # MAD_METHOD_SEND
+    MEMBERS = [('LCID',32,1), ('reserved_32',32,1), ('serviceID',64,1), ('LGUID',64,1), ('localCMQKey',32,1), ('localQKey',32,1), ('localQPN',24,1), ('responderResources',8,1), ('localEECN',24,1), ('initiatorDepth',8,1), ('remoteEECN',24,1), ('remoteResponseTimeout',5,1), ('transportService',2,1), ('flowControl',1,1), ('startingPSN',24,1), ('localResponseTimeout',5,1), ('retryCount',3,1), ('PKey',16,1), ('pathPacketMTU',4,1), ('RDCExists',1,1), ('RNRRetryCount',3,1), ('maxCMRetries',4,1), ('reserved_412',4,1), ('primaryPath',352,1), ('alternatePath',352,1), ('privateData',736,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        self.primaryPath = CMPath()
+        self.alternatePath = CMPath()
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.LCID = 0
+        self.reserved_32 = 0
+        self.serviceID = 0
+        self.LGUID = IBA.GUID()
+        self.localCMQKey = 0
+        self.localQKey = 0
+        self.localQPN = 0
+        self.responderResources = 0
+        self.localEECN = 0
+        self.initiatorDepth = 0
+        self.remoteEECN = 0
+        self.remoteResponseTimeout = 0
+        self.transportService = 0
+        self.flowControl = 0
+        self.startingPSN = 0
+        self.localResponseTimeout = 0
+        self.retryCount = 0
+        self.PKey = 0
+        self.pathPacketMTU = 0
+        self.RDCExists = 0
+        self.RNRRetryCount = 0
+        self.maxCMRetries = 0
+        self.reserved_412 = 0
+        self.primaryPath = CMPath()
+        self.alternatePath = CMPath()
+        self.privateData = bytearray(92)
+
+    def pack_into(self,buffer,offset=0):
+        self.LGUID.pack_into(buffer,offset + 16)
+        self.primaryPath.pack_into(buffer,offset + 52)
+        self.alternatePath.pack_into(buffer,offset + 96)
+        buffer[offset + 140:offset + 232] = self.privateData
+        _struct_LLQ.pack_into(buffer,offset+0,self.LCID,self.reserved_32,self.serviceID)
+        _struct_LLLLLLL.pack_into(buffer,offset+24,self.localCMQKey,self.localQKey,((self.localQPN & 0xFFFFFF) << 8) | (self.responderResources & 0xFF),((self.localEECN & 0xFFFFFF) << 8) | (self.initiatorDepth & 0xFF),((self.remoteEECN & 0xFFFFFF) << 8) | ((self.remoteResponseTimeout & 0x1F) << 3) | ((self.transportService & 0x3) << 1) | (self.flowControl & 0x1),((self.startingPSN & 0xFFFFFF) << 8) | ((self.localResponseTimeout & 0x1F) << 3) | (self.retryCount & 0x7),((self.PKey & 0xFFFF) << 16) | ((self.pathPacketMTU & 0xF) << 12) | ((self.RDCExists & 0x1) << 11) | ((self.RNRRetryCount & 0x7) << 8) | ((self.maxCMRetries & 0xF) << 4) | (self.reserved_412 & 0xF))
+
+    def unpack_from(self,buffer,offset=0):
+        self.LGUID = IBA.GUID(buffer[offset + 16:offset + 24],raw=True)
+        self.primaryPath.unpack_from(buffer,offset + 52)
+        self.alternatePath.unpack_from(buffer,offset + 96)
+        self.privateData = bytearray(buffer[offset + 140:offset + 232])
+        (self.LCID,self.reserved_32,self.serviceID,) = _struct_LLQ.unpack_from(buffer,offset+0)
+        (self.localCMQKey,self.localQKey,w0,w1,w2,w3,w4,) = _struct_LLLLLLL.unpack_from(buffer,offset+24)
+        self.localQPN = w0 >> 8
+        self.responderResources = w0 & 0xFF
+        self.localEECN = w1 >> 8
+        self.initiatorDepth = w1 & 0xFF
+        self.remoteEECN = w2 >> 8
+        self.remoteResponseTimeout = (w2 >> 3) & 0x1F
+        self.transportService = (w2 >> 1) & 0x3
+        self.flowControl = w2 & 0x1
+        self.startingPSN = w3 >> 8
+        self.localResponseTimeout = (w3 >> 3) & 0x1F
+        self.retryCount = w3 & 0x7
+        self.PKey = w4 >> 16
+        self.pathPacketMTU = (w4 >> 12) & 0xF
+        self.RDCExists = (w4 >> 11) & 0x1
+        self.RNRRetryCount = (w4 >> 8) & 0x7
+        self.maxCMRetries = (w4 >> 4) & 0xF
+        self.reserved_412 = w4 & 0xF
+
+class _CMREQView(rdma.binstruct.BinStructView,CMREQ):
+    '''Read only view of a packed :class:`CMREQ`'''
+    __slots__ = ('_buf','_off')
+    LCID = property(lambda self:_struct_L.unpack_from(self._buf,self._off)[0])
+    reserved_32 = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 4)[0])
+    serviceID = property(lambda self:_struct_Q.unpack_from(self._buf,self._off + 8)[0])
+    LGUID = property(lambda self:IBA.GUID(self._buf[self._off + 16:self._off + 16 + 8],raw=True))
+    localCMQKey = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 24)[0])
+    localQKey = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 28)[0])
+    localQPN = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 32)[0] >> 8)
+    responderResources = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 32)[0] & 0xFF)
+    localEECN = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 36)[0] >> 8)
+    initiatorDepth = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 36)[0] & 0xFF)
+    remoteEECN = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 40)[0] >> 8)
+    remoteResponseTimeout = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 40)[0] >> 3) & 0x1F)
+    transportService = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 40)[0] >> 1) & 0x3)
+    flowControl = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 40)[0] & 0x1)
+    startingPSN = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 44)[0] >> 8)
+    localResponseTimeout = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 44)[0] >> 3) & 0x1F)
+    retryCount = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 44)[0] & 0x7)
+    PKey = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 48)[0] >> 16)
+    pathPacketMTU = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 48)[0] >> 12) & 0xF)
+    RDCExists = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 48)[0] >> 11) & 0x1)
+    RNRRetryCount = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 48)[0] >> 8) & 0x7)
+    maxCMRetries = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 48)[0] >> 4) & 0xF)
+    reserved_412 = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 48)[0] & 0xF)
+    primaryPath = property(lambda self:CMPath.View(self._buf,self._off + 52))
+    alternatePath = property(lambda self:CMPath.View(self._buf,self._off + 96))
+    privateData = property(lambda self:bytearray(self._buf[self._off + 140:self._off + 232]))
+CMREQ.View = _CMREQView
+
+class CMMRA(rdma.binstruct.BinStruct):
+    '''Message Receipt Acknowledgement (section 12.6.6)'''
+    __slots__ = ('LCID','RCID','messageMRAed','reserved_66','serviceTimeout','reserved_77','reserved_80','privateData')
+    MAD_LENGTH = 232
+    MAD_ATTRIBUTE_ID = 0x11
+    MAD_COMMMGTSEND = 0x3 # MAD_METHOD_SEND
+    MEMBERS = [('LCID',32,1), ('RCID',32,1), ('messageMRAed',2,1), ('reserved_66',6,1), ('serviceTimeout',5,1), ('reserved_77',3,1), ('reserved_80',16,1), ('privateData',1760,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.LCID = 0
+        self.RCID = 0
+        self.messageMRAed = 0
+        self.reserved_66 = 0
+        self.serviceTimeout = 0
+        self.reserved_77 = 0
+        self.reserved_80 = 0
+        self.privateData = bytearray(220)
+
+    def pack_into(self,buffer,offset=0):
+        buffer[offset + 12:offset + 232] = self.privateData
+        _struct_LLL.pack_into(buffer,offset+0,self.LCID,self.RCID,((self.messageMRAed & 0x3) << 30) | ((self.reserved_66 & 0x3F) << 24) | ((self.serviceTimeout & 0x1F) << 19) | ((self.reserved_77 & 0x7) << 16) | (self.reserved_80 & 0xFFFF))
+
+    def unpack_from(self,buffer,offset=0):
+        self.privateData = bytearray(buffer[offset + 12:offset + 232])
+        (self.LCID,self.RCID,w0,) = _struct_LLL.unpack_from(buffer,offset+0)
+        self.messageMRAed = w0 >> 30
+        self.reserved_66 = (w0 >> 24) & 0x3F
+        self.serviceTimeout = (w0 >> 19) & 0x1F
+        self.reserved_77 = (w0 >> 16) & 0x7
+        self.reserved_80 = w0 & 0xFFFF
+
+class _CMMRAView(rdma.binstruct.BinStructView,CMMRA):
+    '''Read only view of a packed :class:`CMMRA`'''
+    __slots__ = ('_buf','_off')
+    LCID = property(lambda self:_struct_L.unpack_from(self._buf,self._off)[0])
+    RCID = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 4)[0])
+    messageMRAed = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 8)[0] >> 30)
+    reserved_66 = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 8)[0] >> 24) & 0x3F)
+    serviceTimeout = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 8)[0] >> 19) & 0x1F)
+    reserved_77 = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 8)[0] >> 16) & 0x7)
+    reserved_80 = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 8)[0] & 0xFFFF)
+    privateData = property(lambda self:bytearray(self._buf[self._off + 12:self._off + 232]))
+CMMRA.View = _CMMRAView
+
+class CMREJ(rdma.binstruct.BinStruct):
+    '''Reject (section 12.6.7)'''
+    __slots__ = ('LCID','RCID','messageRejected','reserved_66','rejectInfoLength','reserved_79','reason','ARI','privateData')
+    MAD_LENGTH = 232
+    MAD_ATTRIBUTE_ID = 0x12
+    MAD_COMMMGTSEND = 0x3 # MAD_METHOD_SEND
+    MEMBERS = [('LCID',32,1), ('RCID',32,1), ('messageRejected',2,1), ('reserved_66',6,1), ('rejectInfoLength',7,1), ('reserved_79',1,1), ('reason',16,1), ('ARI',576,1), ('privateData',1184,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.LCID = 0
+        self.RCID = 0
+        self.messageRejected = 0
+        self.reserved_66 = 0
+        self.rejectInfoLength = 0
+        self.reserved_79 = 0
+        self.reason = 0
+        self.ARI = bytearray(72)
+        self.privateData = bytearray(148)
+
+    def pack_into(self,buffer,offset=0):
+        buffer[offset + 12:offset + 84] = self.ARI
+        buffer[offset + 84:offset + 232] = self.privateData
+        _struct_LLL.pack_into(buffer,offset+0,self.LCID,self.RCID,((self.messageRejected & 0x3) << 30) | ((self.reserved_66 & 0x3F) << 24) | ((self.rejectInfoLength & 0x7F) << 17) | ((self.reserved_79 & 0x1) << 16) | (self.reason & 0xFFFF))
+
+    def unpack_from(self,buffer,offset=0):
+        self.ARI = bytearray(buffer[offset + 12:offset + 84])
+        self.privateData = bytearray(buffer[offset + 84:offset + 232])
+        (self.LCID,self.RCID,w0,) = _struct_LLL.unpack_from(buffer,offset+0)
+        self.messageRejected = w0 >> 30
+        self.reserved_66 = (w0 >> 24) & 0x3F
+        self.rejectInfoLength = (w0 >> 17) & 0x7F
+        self.reserved_79 = (w0 >> 16) & 0x1
+        self.reason = w0 & 0xFFFF
+
+class _CMREJView(rdma.binstruct.BinStructView,CMREJ):
+    '''Read only view of a packed :class:`CMREJ`'''
+    __slots__ = ('_buf','_off')
+    LCID = property(lambda self:_struct_L.unpack_from(self._buf,self._off)[0])
+    RCID = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 4)[0])
+    messageRejected = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 8)[0] >> 30)
+    reserved_66 = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 8)[0] >> 24) & 0x3F)
+    rejectInfoLength = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 8)[0] >> 17) & 0x7F)
+    reserved_79 = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 8)[0] >> 16) & 0x1)
+    reason = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 8)[0] & 0xFFFF)
+    ARI = property(lambda self:bytearray(self._buf[self._off + 12:self._off + 84]))
+    privateData = property(lambda self:bytearray(self._buf[self._off + 84:self._off + 232]))
+CMREJ.View = _CMREJView
+
+class CMREP(rdma.binstruct.BinStruct):
+    '''Reply To Request For Communication (section 12.6.8)'''
+    __slots__ = ('LCID','RCID','localQKey','localQPN','reserved_120','localEEContext','reserved_152','startingPSN','reserved_184','responderResources','initiatorDepth','targetACKDelay','failoverAccepted','flowControl','RNRRetryCount','reserved_219','LGUID','privateData')
+    MAD_LENGTH = 232
+    MAD_ATTRIBUTE_ID = 0x13
+    MAD_COMMMGTSEND = 0x3 # MAD_METHOD_SEND
+    MEMBERS = [('LCID',32,1), ('RCID',32,1), ('localQKey',32,1), ('localQPN',24,1), ('reserved_120',8,1), ('localEEContext',24,1), ('reserved_152',8,1), ('startingPSN',24,1), ('reserved_184',8,1), ('responderResources',8,1), ('initiatorDepth',8,1), ('targetACKDelay',5,1), ('failoverAccepted',2,1), ('flowControl',1,1), ('RNRRetryCount',3,1), ('reserved_219',5,1), ('LGUID',64,1), ('privateData',1568,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.LCID = 0
+        self.RCID = 0
+        self.localQKey = 0
+        self.localQPN = 0
+        self.reserved_120 = 0
+        self.localEEContext = 0
+        self.reserved_152 = 0
+        self.startingPSN = 0
+        self.reserved_184 = 0
+        self.responderResources = 0
+        self.initiatorDepth = 0
+        self.targetACKDelay = 0
+        self.failoverAccepted = 0
+        self.flowControl = 0
+        self.RNRRetryCount = 0
+        self.reserved_219 = 0
+        self.LGUID = IBA.GUID()
+        self.privateData = bytearray(196)
+
+    def pack_into(self,buffer,offset=0):
+        self.LGUID.pack_into(buffer,offset + 28)
+        buffer[offset + 36:offset + 232] = self.privateData
+        _struct_LLLLLLL.pack_into(buffer,offset+0,self.LCID,self.RCID,self.localQKey,((self.localQPN & 0xFFFFFF) << 8) | (self.reserved_120 & 0xFF),((self.localEEContext & 0xFFFFFF) << 8) | (self.reserved_152 & 0xFF),((self.startingPSN & 0xFFFFFF) << 8) | (self.reserved_184 & 0xFF),((self.responderResources & 0xFF) << 24) | ((self.initiatorDepth & 0xFF) << 16) | ((self.targetACKDelay & 0x1F) << 11) | ((self.failoverAccepted & 0x3) << 9) | ((self.flowControl & 0x1) << 8) | ((self.RNRRetryCount & 0x7) << 5) | (self.reserved_219 & 0x1F))
+
+    def unpack_from(self,buffer,offset=0):
+        self.LGUID = IBA.GUID(buffer[offset + 28:offset + 36],raw=True)
+        self.privateData = bytearray(buffer[offset + 36:offset + 232])
+        (self.LCID,self.RCID,self.localQKey,w0,w1,w2,w3,) = _struct_LLLLLLL.unpack_from(buffer,offset+0)
+        self.localQPN = w0 >> 8
+        self.reserved_120 = w0 & 0xFF
+        self.localEEContext = w1 >> 8
+        self.reserved_152 = w1 & 0xFF
+        self.startingPSN = w2 >> 8
+        self.reserved_184 = w2 & 0xFF
+        self.responderResources = w3 >> 24
+        self.initiatorDepth = (w3 >> 16) & 0xFF
+        self.targetACKDelay = (w3 >> 11) & 0x1F
+        self.failoverAccepted = (w3 >> 9) & 0x3
+        self.flowControl = (w3 >> 8) & 0x1
+        self.RNRRetryCount = (w3 >> 5) & 0x7
+        self.reserved_219 = w3 & 0x1F
+
+class _CMREPView(rdma.binstruct.BinStructView,CMREP):
+    '''Read only view of a packed :class:`CMREP`'''
+    __slots__ = ('_buf','_off')
+    LCID = property(lambda self:_struct_L.unpack_from(self._buf,self._off)[0])
+    RCID = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 4)[0])
+    localQKey = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 8)[0])
+    localQPN = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 12)[0] >> 8)
+    reserved_120 = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 12)[0] & 0xFF)
+    localEEContext = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 16)[0] >> 8)
+    reserved_152 = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 16)[0] & 0xFF)
+    startingPSN = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 20)[0] >> 8)
+    reserved_184 = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 20)[0] & 0xFF)
+    responderResources = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 24)[0] >> 24)
+    initiatorDepth = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 24)[0] >> 16) & 0xFF)
+    targetACKDelay = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 24)[0] >> 11) & 0x1F)
+    failoverAccepted = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 24)[0] >> 9) & 0x3)
+    flowControl = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 24)[0] >> 8) & 0x1)
+    RNRRetryCount = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 24)[0] >> 5) & 0x7)
+    reserved_219 = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 24)[0] & 0x1F)
+    LGUID = property(lambda self:IBA.GUID(self._buf[self._off + 28:self._off + 28 + 8],raw=True))
+    privateData = property(lambda self:bytearray(self._buf[self._off + 36:self._off + 232]))
+CMREP.View = _CMREPView
+
+class CMRTU(rdma.binstruct.BinStruct):
+    '''Ready To Use (section 12.6.9)'''
+    __slots__ = ('LCID','RCID','privateData')
+    MAD_LENGTH = 232
+    MAD_ATTRIBUTE_ID = 0x14
+    MAD_COMMMGTSEND = 0x3 # MAD_METHOD_SEND
+    MEMBERS = [('LCID',32,1), ('RCID',32,1), ('privateData',1792,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.LCID = 0
+        self.RCID = 0
+        self.privateData = bytearray(224)
+
+    def pack_into(self,buffer,offset=0):
+        buffer[offset + 8:offset + 232] = self.privateData
+        _struct_LL.pack_into(buffer,offset+0,self.LCID,self.RCID)
+
+    def unpack_from(self,buffer,offset=0):
+        self.privateData = bytearray(buffer[offset + 8:offset + 232])
+        (self.LCID,self.RCID,) = _struct_LL.unpack_from(buffer,offset+0)
+
+class _CMRTUView(rdma.binstruct.BinStructView,CMRTU):
+    '''Read only view of a packed :class:`CMRTU`'''
+    __slots__ = ('_buf','_off')
+    LCID = property(lambda self:_struct_L.unpack_from(self._buf,self._off)[0])
+    RCID = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 4)[0])
+    privateData = property(lambda self:bytearray(self._buf[self._off + 8:self._off + 232]))
+CMRTU.View = _CMRTUView
+
+class CMDREQ(rdma.binstruct.BinStruct):
+    '''Request For Communication Release (Disconnection Request) (section 12.6.10)'''
+    __slots__ = ('LCID','RCID','remoteQPN','reserved_88','privateData')
+    MAD_LENGTH = 232
+    MAD_ATTRIBUTE_ID = 0x15
+    MAD_COMMMGTSEND = 0x3 # MAD_METHOD_SEND
+    MEMBERS = [('LCID',32,1), ('RCID',32,1), ('remoteQPN',24,1), ('reserved_88',8,1), ('privateData',1760,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.LCID = 0
+        self.RCID = 0
+        self.remoteQPN = 0
+        self.reserved_88 = 0
+        self.privateData = bytearray(220)
+
+    def pack_into(self,buffer,offset=0):
+        buffer[offset + 12:offset + 232] = self.privateData
+        _struct_LLL.pack_into(buffer,offset+0,self.LCID,self.RCID,((self.remoteQPN & 0xFFFFFF) << 8) | (self.reserved_88 & 0xFF))
+
+    def unpack_from(self,buffer,offset=0):
+        self.privateData = bytearray(buffer[offset + 12:offset + 232])
+        (self.LCID,self.RCID,w0,) = _struct_LLL.unpack_from(buffer,offset+0)
+        self.remoteQPN = w0 >> 8
+        self.reserved_88 = w0 & 0xFF
+
+class _CMDREQView(rdma.binstruct.BinStructView,CMDREQ):
+    '''Read only view of a packed :class:`CMDREQ`'''
+    __slots__ = ('_buf','_off')
+    LCID = property(lambda self:_struct_L.unpack_from(self._buf,self._off)[0])
+    RCID = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 4)[0])
+    remoteQPN = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 8)[0] >> 8)
+    reserved_88 = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 8)[0] & 0xFF)
+    privateData = property(lambda self:bytearray(self._buf[self._off + 12:self._off + 232]))
+CMDREQ.View = _CMDREQView
+
+class CMDREP(rdma.binstruct.BinStruct):
+    '''Reply To Request For Communication Release (section 12.6.11)'''
+    __slots__ = ('LCID','RCID','privateData')
+    MAD_LENGTH = 232
+    MAD_ATTRIBUTE_ID = 0x16
+    MAD_COMMMGTSEND = 0x3 # MAD_METHOD_SEND
+    MEMBERS = [('LCID',32,1), ('RCID',32,1), ('privateData',1792,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.LCID = 0
+        self.RCID = 0
+        self.privateData = bytearray(224)
+
+    def pack_into(self,buffer,offset=0):
+        buffer[offset + 8:offset + 232] = self.privateData
+        _struct_LL.pack_into(buffer,offset+0,self.LCID,self.RCID)
+
+    def unpack_from(self,buffer,offset=0):
+        self.privateData = bytearray(buffer[offset + 8:offset + 232])
+        (self.LCID,self.RCID,) = _struct_LL.unpack_from(buffer,offset+0)
+
+class _CMDREPView(rdma.binstruct.BinStructView,CMDREP):
+    '''Read only view of a packed :class:`CMDREP`'''
+    __slots__ = ('_buf','_off')
+    LCID = property(lambda self:_struct_L.unpack_from(self._buf,self._off)[0])
+    RCID = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 4)[0])
+    privateData = property(lambda self:bytearray(self._buf[self._off + 8:self._off + 232]))
+CMDREP.View = _CMDREPView
+
+class CMLAP(rdma.binstruct.BinStruct):
+    '''Load Alternate Path (section 12.8.1)'''
+    __slots__ = ('LCID','RCID','QKey','RQPN','RCMTimeout','reserved_125','reserved_128','altSLID','altDLID','altSGID','altDGID','altFlowLabel','reserved_468','altTClass','altHopLimit','reserved_488','altIPD','altSL','altSubnetLocal','reserved_501','altLocalACKTimeout','reserved_509','privateData')
+    MAD_LENGTH = 232
+    MAD_ATTRIBUTE_ID = 0x19
+    MAD_COMMMGTSEND = 0x3 # MAD_METHOD_SEND
+    MEMBERS = [('LCID',32,1), ('RCID',32,1), ('QKey',32,1), ('RQPN',24,1), ('RCMTimeout',5,1), ('reserved_125',3,1), ('reserved_128',32,1), ('altSLID',16,1), ('altDLID',16,1), ('altSGID',128,1), ('altDGID',128,1), ('altFlowLabel',20,1), ('reserved_468',4,1), ('altTClass',8,1), ('altHopLimit',8,1), ('reserved_488',2,1), ('altIPD',6,1), ('altSL',4,1), ('altSubnetLocal',1,1), ('reserved_501',3,1), ('altLocalACKTimeout',5,1), ('reserved_509',3,1), ('privateData',1344,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.LCID = 0
+        self.RCID = 0
+        self.QKey = 0
+        self.RQPN = 0
+        self.RCMTimeout = 0
+        self.reserved_125 = 0
+        self.reserved_128 = 0
+        self.altSLID = 0
+        self.altDLID = 0
+        self.altSGID = IBA.GID()
+        self.altDGID = IBA.GID()
+        self.altFlowLabel = 0
+        self.reserved_468 = 0
+        self.altTClass = 0
+        self.altHopLimit = 0
+        self.reserved_488 = 0
+        self.altIPD = 0
+        self.altSL = 0
+        self.altSubnetLocal = 0
+        self.reserved_501 = 0
+        self.altLocalACKTimeout = 0
+        self.reserved_509 = 0
+        self.privateData = bytearray(168)
+
+    def pack_into(self,buffer,offset=0):
+        self.altSGID.pack_into(buffer,offset + 24)
+        self.altDGID.pack_into(buffer,offset + 40)
+        buffer[offset + 64:offset + 232] = self.privateData
+        _struct_LLLLLHH.pack_into(buffer,offset+0,self.LCID,self.RCID,self.QKey,((self.RQPN & 0xFFFFFF) << 8) | ((self.RCMTimeout & 0x1F) << 3) | (self.reserved_125 & 0x7),self.reserved_128,self.altSLID,self.altDLID)
+        _struct_LL.pack_into(buffer,offset+56,((self.altFlowLabel & 0xFFFFF) << 12) | ((self.reserved_468 & 0xF) << 8) | (self.altTClass & 0xFF),((self.altHopLimit & 0xFF) << 24) | ((self.reserved_488 & 0x3) << 22) | ((self.altIPD & 0x3F) << 16) | ((self.altSL & 0xF) << 12) | ((self.altSubnetLocal & 0x1) << 11) | ((self.reserved_501 & 0x7) << 8) | ((self.altLocalACKTimeout & 0x1F) << 3) | (self.reserved_509 & 0x7))
+
+    def unpack_from(self,buffer,offset=0):
+        self.altSGID = IBA.GID(buffer[offset + 24:offset + 40],raw=True)
+        self.altDGID = IBA.GID(buffer[offset + 40:offset + 56],raw=True)
+        self.privateData = bytearray(buffer[offset + 64:offset + 232])
+        (self.LCID,self.RCID,self.QKey,w0,self.reserved_128,self.altSLID,self.altDLID,) = _struct_LLLLLHH.unpack_from(buffer,offset+0)
+        self.RQPN = w0 >> 8
+        self.RCMTimeout = (w0 >> 3) & 0x1F
+        self.reserved_125 = w0 & 0x7
+        (w1,w2,) = _struct_LL.unpack_from(buffer,offset+56)
+        self.altFlowLabel = w1 >> 12
+        self.reserved_468 = (w1 >> 8) & 0xF
+        self.altTClass = w1 & 0xFF
+        self.altHopLimit = w2 >> 24
+        self.reserved_488 = (w2 >> 22) & 0x3
+        self.altIPD = (w2 >> 16) & 0x3F
+        self.altSL = (w2 >> 12) & 0xF
+        self.altSubnetLocal = (w2 >> 11) & 0x1
+        self.reserved_501 = (w2 >> 8) & 0x7
+        self.altLocalACKTimeout = (w2 >> 3) & 0x1F
+        self.reserved_509 = w2 & 0x7
+
+class _CMLAPView(rdma.binstruct.BinStructView,CMLAP):
+    '''Read only view of a packed :class:`CMLAP`'''
+    __slots__ = ('_buf','_off')
+    LCID = property(lambda self:_struct_L.unpack_from(self._buf,self._off)[0])
+    RCID = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 4)[0])
+    QKey = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 8)[0])
+    RQPN = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 12)[0] >> 8)
+    RCMTimeout = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 12)[0] >> 3) & 0x1F)
+    reserved_125 = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 12)[0] & 0x7)
+    reserved_128 = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 16)[0])
+    altSLID = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 20)[0])
+    altDLID = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 22)[0])
+    altSGID = property(lambda self:IBA.GID(self._buf[self._off + 24:self._off + 24 + 16],raw=True))
+    altDGID = property(lambda self:IBA.GID(self._buf[self._off + 40:self._off + 40 + 16],raw=True))
+    altFlowLabel = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 56)[0] >> 12)
+    reserved_468 = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 56)[0] >> 8) & 0xF)
+    altTClass = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 56)[0] & 0xFF)
+    altHopLimit = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 60)[0] >> 24)
+    reserved_488 = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 60)[0] >> 22) & 0x3)
+    altIPD = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 60)[0] >> 16) & 0x3F)
+    altSL = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 60)[0] >> 12) & 0xF)
+    altSubnetLocal = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 60)[0] >> 11) & 0x1)
+    reserved_501 = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 60)[0] >> 8) & 0x7)
+    altLocalACKTimeout = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 60)[0] >> 3) & 0x1F)
+    reserved_509 = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 60)[0] & 0x7)
+    privateData = property(lambda self:bytearray(self._buf[self._off + 64:self._off + 232]))
+CMLAP.View = _CMLAPView
+
+class CMAPR(rdma.binstruct.BinStruct):
+    '''Alternate Path Response (section 12.8.2)'''
+    __slots__ = ('LCID','RCID','additionalInfoLength','APstatus','reserved_80','additionalInfo','privateData')
+    MAD_LENGTH = 232
+    MAD_ATTRIBUTE_ID = 0x1a
+    MAD_COMMMGTSEND = 0x3 # MAD_METHOD_SEND
+    MEMBERS = [('LCID',32,1), ('RCID',32,1), ('additionalInfoLength',8,1), ('APstatus',8,1), ('reserved_80',16,1), ('additionalInfo',576,1), ('privateData',1184,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.LCID = 0
+        self.RCID = 0
+        self.additionalInfoLength = 0
+        self.APstatus = 0
+        self.reserved_80 = 0
+        self.additionalInfo = bytearray(72)
+        self.privateData = bytearray(148)
+
+    def pack_into(self,buffer,offset=0):
+        buffer[offset + 12:offset + 84] = self.additionalInfo
+        buffer[offset + 84:offset + 232] = self.privateData
+        _struct_LLBBH.pack_into(buffer,offset+0,self.LCID,self.RCID,self.additionalInfoLength,self.APstatus,self.reserved_80)
+
+    def unpack_from(self,buffer,offset=0):
+        self.additionalInfo = bytearray(buffer[offset + 12:offset + 84])
+        self.privateData = bytearray(buffer[offset + 84:offset + 232])
+        (self.LCID,self.RCID,self.additionalInfoLength,self.APstatus,self.reserved_80,) = _struct_LLBBH.unpack_from(buffer,offset+0)
+
+class _CMAPRView(rdma.binstruct.BinStructView,CMAPR):
+    '''Read only view of a packed :class:`CMAPR`'''
+    __slots__ = ('_buf','_off')
+    LCID = property(lambda self:_struct_L.unpack_from(self._buf,self._off)[0])
+    RCID = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 4)[0])
+    additionalInfoLength = property(lambda self:self._buf[self._off + 8])
+    APstatus = property(lambda self:self._buf[self._off + 9])
+    reserved_80 = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 10)[0])
+    additionalInfo = property(lambda self:bytearray(self._buf[self._off + 12:self._off + 84]))
+    privateData = property(lambda self:bytearray(self._buf[self._off + 84:self._off + 232]))
+CMAPR.View = _CMAPRView
+
+class CMSIDR_REQ(rdma.binstruct.BinStruct):
+    '''Service ID Resolution Request (section 12.11.1)'''
+    __slots__ = ('requestID','reserved_32','serviceID','privateData')
+    MAD_LENGTH = 232
+    MAD_ATTRIBUTE_ID = 0x17
+    MAD_COMMMGTSEND = 0x3 # MAD_METHOD_SEND
+    MEMBERS = [('requestID',32,1), ('reserved_32',32,1), ('serviceID',64,1), ('privateData',1728,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.requestID = 0
+        self.reserved_32 = 0
+        self.serviceID = 0
+        self.privateData = bytearray(216)
+
+    def pack_into(self,buffer,offset=0):
+        buffer[offset + 16:offset + 232] = self.privateData
+        _struct_LLQ.pack_into(buffer,offset+0,self.requestID,self.reserved_32,self.serviceID)
+
+    def unpack_from(self,buffer,offset=0):
+        self.privateData = bytearray(buffer[offset + 16:offset + 232])
+        (self.requestID,self.reserved_32,self.serviceID,) = _struct_LLQ.unpack_from(buffer,offset+0)
+
+class _CMSIDR_REQView(rdma.binstruct.BinStructView,CMSIDR_REQ):
+    '''Read only view of a packed :class:`CMSIDR_REQ`'''
+    __slots__ = ('_buf','_off')
+    requestID = property(lambda self:_struct_L.unpack_from(self._buf,self._off)[0])
+    reserved_32 = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 4)[0])
+    serviceID = property(lambda self:_struct_Q.unpack_from(self._buf,self._off + 8)[0])
+    privateData = property(lambda self:bytearray(self._buf[self._off + 16:self._off + 232]))
+CMSIDR_REQ.View = _CMSIDR_REQView
+
+class CMSIDR_REP(rdma.binstruct.BinStruct):
+    '''Service ID Resolution Response (section 12.11.2)'''
+    __slots__ = ('requestID','QPN','status','serviceID','QKey','classPortinfo','privateData')
+    MAD_LENGTH = 232
+    MAD_ATTRIBUTE_ID = 0x18
+    MAD_COMMMGTSEND = 0x3 # MAD_METHOD_SEND
+    MEMBERS = [('requestID',32,1), ('QPN',24,1), ('status',8,1), ('serviceID',64,1), ('QKey',32,1), ('classPortinfo',576,1), ('privateData',1120,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        self.classPortinfo = IBA.MADClassPortInfo()
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.requestID = 0
+        self.QPN = 0
+        self.status = 0
+        self.serviceID = 0
+        self.QKey = 0
+        self.classPortinfo = IBA.MADClassPortInfo()
+        self.privateData = bytearray(140)
+
+    def pack_into(self,buffer,offset=0):
+        self.classPortinfo.pack_into(buffer,offset + 20)
+        buffer[offset + 92:offset + 232] = self.privateData
+        _struct_LLQL.pack_into(buffer,offset+0,self.requestID,((self.QPN & 0xFFFFFF) << 8) | (self.status & 0xFF),self.serviceID,self.QKey)
+
+    def unpack_from(self,buffer,offset=0):
+        self.classPortinfo.unpack_from(buffer,offset + 20)
+        self.privateData = bytearray(buffer[offset + 92:offset + 232])
+        (self.requestID,w0,self.serviceID,self.QKey,) = _struct_LLQL.unpack_from(buffer,offset+0)
+        self.QPN = w0 >> 8
+        self.status = w0 & 0xFF
+
+class _CMSIDR_REPView(rdma.binstruct.BinStructView,CMSIDR_REP):
+    '''Read only view of a packed :class:`CMSIDR_REP`'''
+    __slots__ = ('_buf','_off')
+    requestID = property(lambda self:_struct_L.unpack_from(self._buf,self._off)[0])
+    QPN = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 4)[0] >> 8)
+    status = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 4)[0] & 0xFF)
+    serviceID = property(lambda self:_struct_Q.unpack_from(self._buf,self._off + 8)[0])
+    QKey = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 16)[0])
+    classPortinfo = property(lambda self:IBA.MADClassPortInfo.View(self._buf,self._off + 20))
+    privateData = property(lambda self:bytearray(self._buf[self._off + 92:self._off + 232]))
+CMSIDR_REP.View = _CMSIDR_REPView
+
@@ -0,0 +1,282 @@
+import rdma.binstruct
+import struct
+import rdma.IBA as IBA
+
+_struct_BBBBHHQHHL = struct.Struct('>BBBBHHQHHL')
+_struct_BBBBLQHHL = struct.Struct('>BBBBLQHHL')
+_struct_BBHL = struct.Struct('>BBHL')
+_struct_H = struct.Struct('>H')
+_struct_HHHBBHHLL = struct.Struct('>HHHBBHHLL')
+_struct_L = struct.Struct('>L')
+_struct_LHHLL = struct.Struct('>LHHLL')
+_struct_Q = struct.Struct('>Q')
+
+class MADHeader(rdma.binstruct.BinStruct):
+    '''MAD Base Header (section 13.4.3)'''
+    __slots__ = ('baseVersion','mgmtClass','classVersion','method','status','classSpecific','transactionID','attributeID','reserved_144','attributeModifier')
+    MAD_LENGTH = 24
+    MEMBERS = [('baseVersion',8,1), ('mgmtClass',8,1), ('classVersion',8,1), ('method',8,1), ('status',16,1), ('classSpecific',16,1), ('transactionID',64,1), ('attributeID',16,1), ('reserved_144',16,1), ('attributeModifier',32,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.baseVersion = 0
+        self.mgmtClass = 0
+        self.classVersion = 0
+        self.method = 0
+        self.status = 0
+        self.classSpecific = 0
+        self.transactionID = 0
+        self.attributeID = 0
+        self.reserved_144 = 0
+        self.attributeModifier = 0
+
+    def pack_into(self,buffer,offset=0):
+        _struct_BBBBHHQHHL.pack_into(buffer,offset+0,self.baseVersion,self.mgmtClass,self.classVersion,self.method,self.status,self.classSpecific,self.transactionID,self.attributeID,self.reserved_144,self.attributeModifier)
+
+    def unpack_from(self,buffer,offset=0):
+        (self.baseVersion,self.mgmtClass,self.classVersion,self.method,self.status,self.classSpecific,self.transactionID,self.attributeID,self.reserved_144,self.attributeModifier,) = _struct_BBBBHHQHHL.unpack_from(buffer,offset+0)
+
+class _MADHeaderView(rdma.binstruct.BinStructView,MADHeader):
+    '''Read only view of a packed :class:`MADHeader`'''
+    __slots__ = ('_buf','_off')
+    baseVersion = property(lambda self:self._buf[self._off])
+    mgmtClass = property(lambda self:self._buf[self._off + 1])
+    classVersion = property(lambda self:self._buf[self._off + 2])
+    method = property(lambda self:self._buf[self._off + 3])
+    status = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 4)[0])
+    classSpecific = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 6)[0])
+    transactionID = property(lambda self:_struct_Q.unpack_from(self._buf,self._off + 8)[0])
+    attributeID = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 16)[0])
+    reserved_144 = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 18)[0])
+    attributeModifier = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 20)[0])
+MADHeader.View = _MADHeaderView
+
+class MADHeaderDirected(rdma.binstruct.BinStruct):
+    '''MAD Base Header Directed (section 13.4.3)'''
+    __slots__ = ('baseVersion','mgmtClass','classVersion','method','D','status','hopPointer','hopCount','transactionID','attributeID','reserved_144','attributeModifier')
+    MAD_LENGTH = 24
+    MEMBERS = [('baseVersion',8,1), ('mgmtClass',8,1), ('classVersion',8,1), ('method',8,1), ('D',1,1), ('status',15,1), ('hopPointer',8,1), ('hopCount',8,1), ('transactionID',64,1), ('attributeID',16,1), ('reserved_144',16,1), ('attributeModifier',32,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.baseVersion = 0
+        self.mgmtClass = 0
+        self.classVersion = 0
+        self.method = 0
+        self.D = 0
+        self.status = 0
+        self.hopPointer = 0
+        self.hopCount = 0
+        self.transactionID = 0
+        self.attributeID = 0
+        self.reserved_144 = 0
+        self.attributeModifier = 0
+
+    def pack_into(self,buffer,offset=0):
+        _struct_BBBBLQHHL.pack_into(buffer,offset+0,self.baseVersion,self.mgmtClass,self.classVersion,self.method,((self.D & 0x1) << 31) | ((self.status & 0x7FFF) << 16) | ((self.hopPointer & 0xFF) << 8) | (self.hopCount & 0xFF),self.transactionID,self.attributeID,self.reserved_144,self.attributeModifier)
+
+    def unpack_from(self,buffer,offset=0):
+        (self.baseVersion,self.mgmtClass,self.classVersion,self.method,w0,self.transactionID,self.attributeID,self.reserved_144,self.attributeModifier,) = _struct_BBBBLQHHL.unpack_from(buffer,offset+0)
+        self.D = w0 >> 31
+        self.status = (w0 >> 16) & 0x7FFF
+        self.hopPointer = (w0 >> 8) & 0xFF
+        self.hopCount = w0 & 0xFF
+
+class _MADHeaderDirectedView(rdma.binstruct.BinStructView,MADHeaderDirected):
+    '''Read only view of a packed :class:`MADHeaderDirected`'''
+    __slots__ = ('_buf','_off')
+    baseVersion = property(lambda self:self._buf[self._off])
+    mgmtClass = property(lambda self:self._buf[self._off + 1])
+    classVersion = property(lambda self:self._buf[self._off + 2])
+    method = property(lambda self:self._buf[self._off + 3])
+    D = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 4)[0] >> 31)
+    status = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 4)[0] >> 16) & 0x7FFF)
+    hopPointer = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 4)[0] >> 8) & 0xFF)
+    hopCount = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 4)[0] & 0xFF)
+    transactionID = property(lambda self:_struct_Q.unpack_from(self._buf,self._off + 8)[0])
+    attributeID = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 16)[0])
+    reserved_144 = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 18)[0])
+    attributeModifier = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 20)[0])
+MADHeaderDirected.View = _MADHeaderDirectedView
+
+class MADClassPortInfo(rdma.binstruct.BinStruct):
+    '''Class Port Info (section 13.4.8.1)'''
+    __slots__ = ('baseVersion','classVersion','capabilityMask','capabilityMask2','respTimeValue','redirectGID','redirectTC','redirectSL','redirectFL','redirectLID','redirectPKey','reserved_256','redirectQP','redirectQKey','trapGID','trapTC','trapSL','trapFL','trapLID','trapPKey','trapHL','trapQP','trapQKey')
+    MAD_LENGTH = 72
+    MAD_ATTRIBUTE_ID = 0x1
+    MAD_BMGET = 0x1 # MAD_METHOD_GET
+    MAD_BMSET = 0x2 # MAD_METHOD_SET
+    MAD_COMMMGTGET = 0x1 # MAD_METHOD_GET
+    MAD_COMMMGTSET = 0x2 # MAD_METHOD_SET
+    MAD_DEVMGTGET = 0x1 # MAD_METHOD_GET
+    MAD_DEVMGTSET = 0x2 # MAD_METHOD_SET
+    MAD_PERFORMANCEGET = 0x1 # MAD_METHOD_GET
+    MAD_SNMPGET = 0x1 # MAD_METHOD_GET
+    MAD_SUBNADMGET = 0x1 # MAD_METHOD_GET
+    COMPONENT_MASK = {'baseVersion':0, 'classVersion':1, 'capabilityMask':2, 'capabilityMask2':3, 'respTimeValue':4, 'redirectGID':5, 'redirectTC':6, 'redirectSL':7, 'redirectFL':8, 'redirectLID':9, 'redirectPKey':10, 'reserved_256':11, 'redirectQP':12, 'redirectQKey':13, 'trapGID':14, 'trapTC':15, 'trapSL':16, 'trapFL':17, 'trapLID':18, 'trapPKey':19, 'trapHL':20, 'trapQP':21, 'trapQKey':22}
+    MEMBERS = [('baseVersion',8,1), ('classVersion',8,1), ('capabilityMask',16,1), ('capabilityMask2',27,1), ('respTimeValue',5,1), ('redirectGID',128,1), ('redirectTC',8,1), ('redirectSL',4,1), ('redirectFL',20,1), ('redirectLID',16,1), ('redirectPKey',16,1), ('reserved_256',8,1), ('redirectQP',24,1), ('redirectQKey',32,1), ('trapGID',128,1), ('trapTC',8,1), ('trapSL',4,1), ('trapFL',20,1), ('trapLID',16,1), ('trapPKey',16,1), ('trapHL',8,1), ('trapQP',24,1), ('trapQKey',32,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.baseVersion = 0
+        self.classVersion = 0
+        self.capabilityMask = 0
+        self.capabilityMask2 = 0
+        self.respTimeValue = 0
+        self.redirectGID = IBA.GID()
+        self.redirectTC = 0
+        self.redirectSL = 0
+        self.redirectFL = 0
+        self.redirectLID = 0
+        self.redirectPKey = 0
+        self.reserved_256 = 0
+        self.redirectQP = 0
+        self.redirectQKey = 0
+        self.trapGID = IBA.GID()
+        self.trapTC = 0
+        self.trapSL = 0
+        self.trapFL = 0
+        self.trapLID = 0
+        self.trapPKey = 0
+        self.trapHL = 0
+        self.trapQP = 0
+        self.trapQKey = 0
+
+    def pack_into(self,buffer,offset=0):
+        self.redirectGID.pack_into(buffer,offset + 8)
+        self.trapGID.pack_into(buffer,offset + 40)
+        _struct_BBHL.pack_into(buffer,offset+0,self.baseVersion,self.classVersion,self.capabilityMask,((self.capabilityMask2 & 0x7FFFFFF) << 5) | (self.respTimeValue & 0x1F))
+        _struct_LHHLL.pack_into(buffer,offset+24,((self.redirectTC & 0xFF) << 24) | ((self.redirectSL & 0xF) << 20) | (self.redirectFL & 0xFFFFF),self.redirectLID,self.redirectPKey,((self.reserved_256 & 0xFF) << 24) | (self.redirectQP & 0xFFFFFF),self.redirectQKey)
+        _struct_LHHLL.pack_into(buffer,offset+56,((self.trapTC & 0xFF) << 24) | ((self.trapSL & 0xF) << 20) | (self.trapFL & 0xFFFFF),self.trapLID,self.trapPKey,((self.trapHL & 0xFF) << 24) | (self.trapQP & 0xFFFFFF),self.trapQKey)
+
+    def unpack_from(self,buffer,offset=0):
+        self.redirectGID = IBA.GID(buffer[offset + 8:offset + 24],raw=True)
+        self.trapGID = IBA.GID(buffer[offset + 40:offset + 56],raw=True)
+        (self.baseVersion,self.classVersion,self.capabilityMask,w0,) = _struct_BBHL.unpack_from(buffer,offset+0)
+        self.capabilityMask2 = w0 >> 5
+        self.respTimeValue = w0 & 0x1F
+        (w1,self.redirectLID,self.redirectPKey,w2,self.redirectQKey,) = _struct_LHHLL.unpack_from(buffer,offset+24)
+        self.redirectTC = w1 >> 24
+        self.redirectSL = (w1 >> 20) & 0xF
+        self.redirectFL = w1 & 0xFFFFF
+        self.reserved_256 = w2 >> 24
+        self.redirectQP = w2 & 0xFFFFFF
+        (w3,self.trapLID,self.trapPKey,w4,self.trapQKey,) = _struct_LHHLL.unpack_from(buffer,offset+56)
+        self.trapTC = w3 >> 24
+        self.trapSL = (w3 >> 20) & 0xF
+        self.trapFL = w3 & 0xFFFFF
+        self.trapHL = w4 >> 24
+        self.trapQP = w4 & 0xFFFFFF
+
+class _MADClassPortInfoView(rdma.binstruct.BinStructView,MADClassPortInfo):
+    '''Read only view of a packed :class:`MADClassPortInfo`'''
+    __slots__ = ('_buf','_off')
+    baseVersion = property(lambda self:self._buf[self._off])
+    classVersion = property(lambda self:self._buf[self._off + 1])
+    capabilityMask = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 2)[0])
+    capabilityMask2 = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 4)[0] >> 5)
+    respTimeValue = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 4)[0] & 0x1F)
+    redirectGID = property(lambda self:IBA.GID(self._buf[self._off + 8:self._off + 8 + 16],raw=True))
+    redirectTC = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 24)[0] >> 24)
+    redirectSL = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 24)[0] >> 20) & 0xF)
+    redirectFL = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 24)[0] & 0xFFFFF)
+    redirectLID = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 28)[0])
+    redirectPKey = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 30)[0])
+    reserved_256 = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 32)[0] >> 24)
+    redirectQP = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 32)[0] & 0xFFFFFF)
+    redirectQKey = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 36)[0])
+    trapGID = property(lambda self:IBA.GID(self._buf[self._off + 40:self._off + 40 + 16],raw=True))
+    trapTC = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 56)[0] >> 24)
+    trapSL = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 56)[0] >> 20) & 0xF)
+    trapFL = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 56)[0] & 0xFFFFF)
+    trapLID = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 60)[0])
+    trapPKey = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 62)[0])
+    trapHL = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 64)[0] >> 24)
+    trapQP = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 64)[0] & 0xFFFFFF)
+    trapQKey = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 68)[0])
+MADClassPortInfo.View = _MADClassPortInfoView
+
+class MADInformInfo(rdma.binstruct.BinStruct):
+    '''InformInfo (section 13.4.8.3)'''
+    __slots__ = ('GID','LIDRangeBegin','LIDRangeEnd','reserved_160','isGeneric','subscribe','type','trapNumber','QPN','reserved_248','respTimeValue','reserved_256','producerType')
+    MAD_LENGTH = 36
+    MAD_ATTRIBUTE_ID = 0x3
+    MAD_SUBNADMSET = 0x2 # MAD_METHOD_SET
+    COMPONENT_MASK = {'GID':0, 'LIDRangeBegin':1, 'LIDRangeEnd':2, 'reserved_160':3, 'isGeneric':4, 'subscribe':5, 'type':6, 'trapNumber':7, 'QPN':8, 'reserved_248':9, 'respTimeValue':10, 'reserved_256':11, 'producerType':12}
+    MEMBERS = [('GID',128,1), ('LIDRangeBegin',16,1), ('LIDRangeEnd',16,1), ('reserved_160',16,1), ('isGeneric',8,1), ('subscribe',8,1), ('type',16,1), ('trapNumber',16,1), ('QPN',24,1), ('reserved_248',3,1), ('respTimeValue',5,1), ('reserved_256',8,1), ('producerType',24,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.GID = IBA.GID()
+        self.LIDRangeBegin = 0
+        self.LIDRangeEnd = 0
+        self.reserved_160 = 0
+        self.isGeneric = 0
+        self.subscribe = 0
+        self.type = 0
+        self.trapNumber = 0
+        self.QPN = 0
+        self.reserved_248 = 0
+        self.respTimeValue = 0
+        self.reserved_256 = 0
+        self.producerType = 0
+
+    def pack_into(self,buffer,offset=0):
+        self.GID.pack_into(buffer,offset + 0)
+        _struct_HHHBBHHLL.pack_into(buffer,offset+16,self.LIDRangeBegin,self.LIDRangeEnd,self.reserved_160,self.isGeneric,self.subscribe,self.type,self.trapNumber,((self.QPN & 0xFFFFFF) << 8) | ((self.reserved_248 & 0x7) << 5) | (self.respTimeValue & 0x1F),((self.reserved_256 & 0xFF) << 24) | (self.producerType & 0xFFFFFF))
+
+    def unpack_from(self,buffer,offset=0):
+        self.GID = IBA.GID(buffer[offset + 0:offset + 16],raw=True)
+        (self.LIDRangeBegin,self.LIDRangeEnd,self.reserved_160,self.isGeneric,self.subscribe,self.type,self.trapNumber,w0,w1,) = _struct_HHHBBHHLL.unpack_from(buffer,offset+16)
+        self.QPN = w0 >> 8
+        self.reserved_248 = (w0 >> 5) & 0x7
+        self.respTimeValue = w0 & 0x1F
+        self.reserved_256 = w1 >> 24
+        self.producerType = w1 & 0xFFFFFF
+
+class _MADInformInfoView(rdma.binstruct.BinStructView,MADInformInfo):
+    '''Read only view of a packed :class:`MADInformInfo`'''
+    __slots__ = ('_buf','_off')
+    GID = property(lambda self:IBA.GID(self._buf[self._off:self._off + 16],raw=True))
+    LIDRangeBegin = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 16)[0])
+    LIDRangeEnd = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 18)[0])
+    reserved_160 = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 20)[0])
+    isGeneric = property(lambda self:self._buf[self._off + 22])
+    subscribe = property(lambda self:self._buf[self._off + 23])
+    type = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 24)[0])
+    trapNumber = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 26)[0])
+    QPN = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 28)[0] >> 8)
+    reserved_248 = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 28)[0] >> 5) & 0x7)
+    respTimeValue = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 28)[0] & 0x1F)
+    reserved_256 = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 32)[0] >> 24)
+    producerType = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 32)[0] & 0xFFFFFF)
+MADInformInfo.View = _MADInformInfoView
+
@@ -0,0 +1,266 @@
+import rdma.binstruct
+import struct
+import rdma.IBA as IBA
+
+_struct_L = struct.Struct('>L')
+_struct_LL = struct.Struct('>LL')
+_struct_LLL = struct.Struct('>LLL')
+
+class RMPPHeader(rdma.binstruct.BinStruct):
+    '''RMPP Header Fields (section 13.6.2.1)'''
+    __slots__ = ('MADHeader','RMPPVersion','RMPPType','RRespTime','RMPPFlags','RMPPStatus','data1','data2')
+    MAD_LENGTH = 36
+    MEMBERS = [('MADHeader',192,1), ('RMPPVersion',8,1), ('RMPPType',8,1), ('RRespTime',5,1), ('RMPPFlags',3,1), ('RMPPStatus',8,1), ('data1',32,1), ('data2',32,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        self.MADHeader = IBA.MADHeader()
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.MADHeader = IBA.MADHeader()
+        self.RMPPVersion = 0
+        self.RMPPType = 0
+        self.RRespTime = 0
+        self.RMPPFlags = 0
+        self.RMPPStatus = 0
+        self.data1 = 0
+        self.data2 = 0
+
+    def pack_into(self,buffer,offset=0):
+        self.MADHeader.pack_into(buffer,offset + 0)
+        _struct_LLL.pack_into(buffer,offset+24,((self.RMPPVersion & 0xFF) << 24) | ((self.RMPPType & 0xFF) << 16) | ((self.RRespTime & 0x1F) << 11) | ((self.RMPPFlags & 0x7) << 8) | (self.RMPPStatus & 0xFF),self.data1,self.data2)
+
+    def unpack_from(self,buffer,offset=0):
+        self.MADHeader.unpack_from(buffer,offset + 0)
+        (w0,self.data1,self.data2,) = _struct_LLL.unpack_from(buffer,offset+24)
+        self.RMPPVersion = w0 >> 24
+        self.RMPPType = (w0 >> 16) & 0xFF
+        self.RRespTime = (w0 >> 11) & 0x1F
+        self.RMPPFlags = (w0 >> 8) & 0x7
+        self.RMPPStatus = w0 & 0xFF
+
+class _RMPPHeaderView(rdma.binstruct.BinStructView,RMPPHeader):
+    '''Read only view of a packed :class:`RMPPHeader`'''
+    __slots__ = ('_buf','_off')
+    MADHeader = property(lambda self:IBA.MADHeader.View(self._buf,self._off))
+    RMPPVersion = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 24)[0] >> 24)
+    RMPPType = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 24)[0] >> 16) & 0xFF)
+    RRespTime = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 24)[0] >> 11) & 0x1F)
+    RMPPFlags = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 24)[0] >> 8) & 0x7)
+    RMPPStatus = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 24)[0] & 0xFF)
+    data1 = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 28)[0])
+    data2 = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 32)[0])
+RMPPHeader.View = _RMPPHeaderView
+
+class RMPPShortHeader(rdma.binstruct.BinStruct):
+    '''RMPP Header Fields (section 13.6.2.1)'''
+    __slots__ = ('MADHeader','RMPPVersion','RMPPType','RRespTime','RMPPFlags','RMPPStatus')
+    MAD_LENGTH = 28
+    MEMBERS = [('MADHeader',192,1), ('RMPPVersion',8,1), ('RMPPType',8,1), ('RRespTime',5,1), ('RMPPFlags',3,1), ('RMPPStatus',8,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        self.MADHeader = IBA.MADHeader()
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.MADHeader = IBA.MADHeader()
+        self.RMPPVersion = 0
+        self.RMPPType = 0
+        self.RRespTime = 0
+        self.RMPPFlags = 0
+        self.RMPPStatus = 0
+
+    def pack_into(self,buffer,offset=0):
+        self.MADHeader.pack_into(buffer,offset + 0)
+        _struct_L.pack_into(buffer,offset+24,((self.RMPPVersion & 0xFF) << 24) | ((self.RMPPType & 0xFF) << 16) | ((self.RRespTime & 0x1F) << 11) | ((self.RMPPFlags & 0x7) << 8) | (self.RMPPStatus & 0xFF))
+
+    def unpack_from(self,buffer,offset=0):
+        self.MADHeader.unpack_from(buffer,offset + 0)
+        (w0,) = _struct_L.unpack_from(buffer,offset+24)
+        self.RMPPVersion = w0 >> 24
+        self.RMPPType = (w0 >> 16) & 0xFF
+        self.RRespTime = (w0 >> 11) & 0x1F
+        self.RMPPFlags = (w0 >> 8) & 0x7
+        self.RMPPStatus = w0 & 0xFF
+
+class _RMPPShortHeaderView(rdma.binstruct.BinStructView,RMPPShortHeader):
+    '''Read only view of a packed :class:`RMPPShortHeader`'''
+    __slots__ = ('_buf','_off')
+    MADHeader = property(lambda self:IBA.MADHeader.View(self._buf,self._off))
+    RMPPVersion = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 24)[0] >> 24)
+    RMPPType = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 24)[0] >> 16) & 0xFF)
+    RRespTime = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 24)[0] >> 11) & 0x1F)
+    RMPPFlags = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 24)[0] >> 8) & 0x7)
+    RMPPStatus = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 24)[0] & 0xFF)
+RMPPShortHeader.View = _RMPPShortHeaderView
+
+class RMPPData(rdma.binstruct.BinStruct):
+    '''RMPP Data Packet (section 13.6.2.3)'''
+    __slots__ = ('RMPPHeader','segmentNumber','payLoadLength','data')
+    MAD_LENGTH = 256
+    MEMBERS = [('RMPPHeader',224,1), ('segmentNumber',32,1), ('payLoadLength',32,1), ('data',1760,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        self.RMPPHeader = RMPPShortHeader()
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.RMPPHeader = RMPPShortHeader()
+        self.segmentNumber = 0
+        self.payLoadLength = 0
+        self.data = bytearray(220)
+
+    def pack_into(self,buffer,offset=0):
+        self.RMPPHeader.pack_into(buffer,offset + 0)
+        buffer[offset + 36:offset + 256] = self.data
+        _struct_LL.pack_into(buffer,offset+28,self.segmentNumber,self.payLoadLength)
+
+    def unpack_from(self,buffer,offset=0):
+        self.RMPPHeader.unpack_from(buffer,offset + 0)
+        self.data = bytearray(buffer[offset + 36:offset + 256])
+        (self.segmentNumber,self.payLoadLength,) = _struct_LL.unpack_from(buffer,offset+28)
+
+class _RMPPDataView(rdma.binstruct.BinStructView,RMPPData):
+    '''Read only view of a packed :class:`RMPPData`'''
+    __slots__ = ('_buf','_off')
+    RMPPHeader = property(lambda self:RMPPShortHeader.View(self._buf,self._off))
+    segmentNumber = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 28)[0])
+    payLoadLength = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 32)[0])
+    data = property(lambda self:bytearray(self._buf[self._off + 36:self._off + 256]))
+RMPPData.View = _RMPPDataView
+
+class RMPPAck(rdma.binstruct.BinStruct):
+    '''RMPP Data Packet (section 13.6.2.3)'''
+    __slots__ = ('RMPPHeader','segmentNumber','newWindowLast','reserved_288')
+    MAD_LENGTH = 256
+    MEMBERS = [('RMPPHeader',224,1), ('segmentNumber',32,1), ('newWindowLast',32,1), ('reserved_288',1760,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        self.RMPPHeader = RMPPShortHeader()
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.RMPPHeader = RMPPShortHeader()
+        self.segmentNumber = 0
+        self.newWindowLast = 0
+        self.reserved_288 = bytearray(220)
+
+    def pack_into(self,buffer,offset=0):
+        self.RMPPHeader.pack_into(buffer,offset + 0)
+        buffer[offset + 36:offset + 256] = self.reserved_288
+        _struct_LL.pack_into(buffer,offset+28,self.segmentNumber,self.newWindowLast)
+
+    def unpack_from(self,buffer,offset=0):
+        self.RMPPHeader.unpack_from(buffer,offset + 0)
+        self.reserved_288 = bytearray(buffer[offset + 36:offset + 256])
+        (self.segmentNumber,self.newWindowLast,) = _struct_LL.unpack_from(buffer,offset+28)
+
+class _RMPPAckView(rdma.binstruct.BinStructView,RMPPAck):
+    '''Read only view of a packed :class:`RMPPAck`'''
+    __slots__ = ('_buf','_off')
+    RMPPHeader = property(lambda self:RMPPShortHeader.View(self._buf,self._off))
+    segmentNumber = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 28)[0])
+    newWindowLast = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 32)[0])
+    reserved_288 = property(lambda self:bytearray(self._buf[self._off + 36:self._off + 256]))
+RMPPAck.View = _RMPPAckView
+
+class RMPPAbort(rdma.binstruct.BinStruct):
+    '''RMPP Data Packet (section 13.6.2.3)'''
+    __slots__ = ('RMPPHeader','reserved_224','reserved_256','errorData')
+    MAD_LENGTH = 256
+    MEMBERS = [('RMPPHeader',224,1), ('reserved_224',32,1), ('reserved_256',32,1), ('errorData',1760,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        self.RMPPHeader = RMPPShortHeader()
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.RMPPHeader = RMPPShortHeader()
+        self.reserved_224 = 0
+        self.reserved_256 = 0
+        self.errorData = bytearray(220)
+
+    def pack_into(self,buffer,offset=0):
+        self.RMPPHeader.pack_into(buffer,offset + 0)
+        buffer[offset + 36:offset + 256] = self.errorData
+        _struct_LL.pack_into(buffer,offset+28,self.reserved_224,self.reserved_256)
+
+    def unpack_from(self,buffer,offset=0):
+        self.RMPPHeader.unpack_from(buffer,offset + 0)
+        self.errorData = bytearray(buffer[offset + 36:offset + 256])
+        (self.reserved_224,self.reserved_256,) = _struct_LL.unpack_from(buffer,offset+28)
+
+class _RMPPAbortView(rdma.binstruct.BinStructView,RMPPAbort):
+    '''Read only view of a packed :class:`RMPPAbort`'''
+    __slots__ = ('_buf','_off')
+    RMPPHeader = property(lambda self:RMPPShortHeader.View(self._buf,self._off))
+    reserved_224 = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 28)[0])
+    reserved_256 = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 32)[0])
+    errorData = property(lambda self:bytearray(self._buf[self._off + 36:self._off + 256]))
+RMPPAbort.View = _RMPPAbortView
+
+class RMPPStop(rdma.binstruct.BinStruct):
+    '''RMPP Data Packet (section 13.6.2.3)'''
+    __slots__ = ('RMPPHeader','reserved_224','reserved_256','errorData')
+    MAD_LENGTH = 256
+    MEMBERS = [('RMPPHeader',224,1), ('reserved_224',32,1), ('reserved_256',32,1), ('errorData',1760,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        self.RMPPHeader = RMPPShortHeader()
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.RMPPHeader = RMPPShortHeader()
+        self.reserved_224 = 0
+        self.reserved_256 = 0
+        self.errorData = bytearray(220)
+
+    def pack_into(self,buffer,offset=0):
+        self.RMPPHeader.pack_into(buffer,offset + 0)
+        buffer[offset + 36:offset + 256] = self.errorData
+        _struct_LL.pack_into(buffer,offset+28,self.reserved_224,self.reserved_256)
+
+    def unpack_from(self,buffer,offset=0):
+        self.RMPPHeader.unpack_from(buffer,offset + 0)
+        self.errorData = bytearray(buffer[offset + 36:offset + 256])
+        (self.reserved_224,self.reserved_256,) = _struct_LL.unpack_from(buffer,offset+28)
+
+class _RMPPStopView(rdma.binstruct.BinStructView,RMPPStop):
+    '''Read only view of a packed :class:`RMPPStop`'''
+    __slots__ = ('_buf','_off')
+    RMPPHeader = property(lambda self:RMPPShortHeader.View(self._buf,self._off))
+    reserved_224 = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 28)[0])
+    reserved_256 = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 32)[0])
+    errorData = property(lambda self:bytearray(self._buf[self._off + 36:self._off + 256]))
+RMPPStop.View = _RMPPStopView
+
@@ -0,0 +1,969 @@
+import rdma.binstruct
+import struct
+import rdma.IBA as IBA
+
+_struct_BBBB = struct.Struct('>BBBB')
+_struct_BBBBHHQHHLQ = struct.Struct('>BBBBHHQHHLQ')
+_struct_BBBBLQHHLQHH = struct.Struct('>BBBBLQHHLQHH')
+_struct_H = struct.Struct('>H')
+_struct_HH = struct.Struct('>HH')
+_struct_HHHHHHHHHHHHHHHHHHHHHHHHHH = struct.Struct('>HHHHHHHHHHHHHHHHHHHHHHHHHH')
+_struct_HHHHHHHHHHHHHHHHHHHHHHHHHHHHHHHH = struct.Struct('>HHHHHHHHHHHHHHHHHHHHHHHHHHHHHHHH')
+_struct_HHHHLHHL = struct.Struct('>HHHHLHHL')
+_struct_HHLL = struct.Struct('>HHLL')
+_struct_L = struct.Struct('>L')
+_struct_LHHLHHHHHHHHHHHHHHHHHHHHHHHHHH = struct.Struct('>LHHLHHHHHHHHHHHHHHHHHHHHHHHHHH')
+_struct_Q = struct.Struct('>Q')
+_struct_QLL = struct.Struct('>QLL')
+_struct_QQHHLHHBBBBLLLHHLLLL = struct.Struct('>QQHHLHHBBBBLLLHHLLLL')
+
+class SMPLIDPortBlock(rdma.binstruct.BinStruct):
+    '''LID/Port Block Element (section 14.2.5.11)'''
+    __slots__ = ('LID','valid','LMC','reserved_20','port')
+    MAD_LENGTH = 4
+    MEMBERS = [('LID',16,1), ('valid',1,1), ('LMC',3,1), ('reserved_20',4,1), ('port',8,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.LID = 0
+        self.valid = 0
+        self.LMC = 0
+        self.reserved_20 = 0
+        self.port = 0
+
+    def pack_into(self,buffer,offset=0):
+        _struct_L.pack_into(buffer,offset+0,((self.LID & 0xFFFF) << 16) | ((self.valid & 0x1) << 15) | ((self.LMC & 0x7) << 12) | ((self.reserved_20 & 0xF) << 8) | (self.port & 0xFF))
+
+    def unpack_from(self,buffer,offset=0):
+        (w0,) = _struct_L.unpack_from(buffer,offset+0)
+        self.LID = w0 >> 16
+        self.valid = (w0 >> 15) & 0x1
+        self.LMC = (w0 >> 12) & 0x7
+        self.reserved_20 = (w0 >> 8) & 0xF
+        self.port = w0 & 0xFF
+
+class _SMPLIDPortBlockView(rdma.binstruct.BinStructView,SMPLIDPortBlock):
+    '''Read only view of a packed :class:`SMPLIDPortBlock`'''
+    __slots__ = ('_buf','_off')
+    LID = property(lambda self:_struct_L.unpack_from(self._buf,self._off)[0] >> 16)
+    valid = property(lambda self:(_struct_L.unpack_from(self._buf,self._off)[0] >> 15) & 0x1)
+    LMC = property(lambda self:(_struct_L.unpack_from(self._buf,self._off)[0] >> 12) & 0x7)
+    reserved_20 = property(lambda self:(_struct_L.unpack_from(self._buf,self._off)[0] >> 8) & 0xF)
+    port = property(lambda self:_struct_L.unpack_from(self._buf,self._off)[0] & 0xFF)
+SMPLIDPortBlock.View = _SMPLIDPortBlockView
+
+class SMPFormat(rdma.binstruct.BinFormat):
+    '''SMP Format - LID Routed (section 14.2.1.1)'''
+    __slots__ = ('baseVersion','mgmtClass','classVersion','method','status','classSpecific','transactionID','attributeID','reserved_144','attributeModifier','MKey','reserved_256','data','reserved_1024')
+    MAD_LENGTH = 256
+    MAD_CLASS = 0x1
+    MAD_CLASS_VERSION = 0x1
+    MEMBERS = [('baseVersion',8,1), ('mgmtClass',8,1), ('classVersion',8,1), ('method',8,1), ('status',16,1), ('classSpecific',16,1), ('transactionID',64,1), ('attributeID',16,1), ('reserved_144',16,1), ('attributeModifier',32,1), ('MKey',64,1), ('reserved_256',256,1), ('data',512,1), ('reserved_1024',1024,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.baseVersion = 0
+        self.mgmtClass = 0
+        self.classVersion = 0
+        self.method = 0
+        self.status = 0
+        self.classSpecific = 0
+        self.transactionID = 0
+        self.attributeID = 0
+        self.reserved_144 = 0
+        self.attributeModifier = 0
+        self.MKey = 0
+        self.reserved_256 = bytearray(32)
+        self.data = bytearray(64)
+        self.reserved_1024 = bytearray(128)
+
+    def pack_into(self,buffer,offset=0):
+        buffer[offset + 32:offset + 64] = self.reserved_256
+        buffer[offset + 64:offset + 128] = self.data
+        buffer[offset + 128:offset + 256] = self.reserved_1024
+        _struct_BBBBHHQHHLQ.pack_into(buffer,offset+0,self.baseVersion,self.mgmtClass,self.classVersion,self.method,self.status,self.classSpecific,self.transactionID,self.attributeID,self.reserved_144,self.attributeModifier,self.MKey)
+
+    def unpack_from(self,buffer,offset=0):
+        self.reserved_256 = bytearray(buffer[offset + 32:offset + 64])
+        self.data = bytearray(buffer[offset + 64:offset + 128])
+        self.reserved_1024 = bytearray(buffer[offset + 128:offset + 256])
+        (self.baseVersion,self.mgmtClass,self.classVersion,self.method,self.status,self.classSpecific,self.transactionID,self.attributeID,self.reserved_144,self.attributeModifier,self.MKey,) = _struct_BBBBHHQHHLQ.unpack_from(buffer,offset+0)
+
+class SMPFormatDirected(rdma.binstruct.BinFormat):
+    '''SMP Format - Direct Routed (section 14.2.1.2)'''
+    __slots__ = ('baseVersion','mgmtClass','classVersion','method','D','status','hopPointer','hopCount','transactionID','attributeID','reserved_144','attributeModifier','MKey','drSLID','drDLID','reserved_288','data','initialPath','returnPath')
+    MAD_LENGTH = 256
+    MAD_CLASS = 0x81
+    MAD_CLASS_VERSION = 0x1
+    MEMBERS = [('baseVersion',8,1), ('mgmtClass',8,1), ('classVersion',8,1), ('method',8,1), ('D',1,1), ('status',15,1), ('hopPointer',8,1), ('hopCount',8,1), ('transactionID',64,1), ('attributeID',16,1), ('reserved_144',16,1), ('attributeModifier',32,1), ('MKey',64,1), ('drSLID',16,1), ('drDLID',16,1), ('reserved_288',224,1), ('data',512,1), ('initialPath',8,64), ('returnPath',8,64)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.baseVersion = 0
+        self.mgmtClass = 0
+        self.classVersion = 0
+        self.method = 0
+        self.D = 0
+        self.status = 0
+        self.hopPointer = 0
+        self.hopCount = 0
+        self.transactionID = 0
+        self.attributeID = 0
+        self.reserved_144 = 0
+        self.attributeModifier = 0
+        self.MKey = 0
+        self.drSLID = 0
+        self.drDLID = 0
+        self.reserved_288 = bytearray(28)
+        self.data = bytearray(64)
+        self.initialPath = bytearray(64)
+        self.returnPath = bytearray(64)
+
+    def pack_into(self,buffer,offset=0):
+        buffer[offset + 36:offset + 64] = self.reserved_288
+        buffer[offset + 64:offset + 128] = self.data
+        buffer[offset + 128:offset + 192] = self.initialPath
+        buffer[offset + 192:offset + 256] = self.returnPath
+        _struct_BBBBLQHHLQHH.pack_into(buffer,offset+0,self.baseVersion,self.mgmtClass,self.classVersion,self.method,((self.D & 0x1) << 31) | ((self.status & 0x7FFF) << 16) | ((self.hopPointer & 0xFF) << 8) | (self.hopCount & 0xFF),self.transactionID,self.attributeID,self.reserved_144,self.attributeModifier,self.MKey,self.drSLID,self.drDLID)
+
+    def unpack_from(self,buffer,offset=0):
+        self.reserved_288 = bytearray(buffer[offset + 36:offset + 64])
+        self.data = bytearray(buffer[offset + 64:offset + 128])
+        self.initialPath = bytearray(buffer[offset + 128:offset + 192])
+        self.returnPath = bytearray(buffer[offset + 192:offset + 256])
+        (self.baseVersion,self.mgmtClass,self.classVersion,self.method,w0,self.transactionID,self.attributeID,self.reserved_144,self.attributeModifier,self.MKey,self.drSLID,self.drDLID,) = _struct_BBBBLQHHLQHH.unpack_from(buffer,offset+0)
+        self.D = w0 >> 31
+        self.status = (w0 >> 16) & 0x7FFF
+        self.hopPointer = (w0 >> 8) & 0xFF
+        self.hopCount = w0 & 0xFF
+
+class SMPNodeDescription(rdma.binstruct.BinStruct):
+    '''Node Description String (section 14.2.5.2)'''
+    __slots__ = ('nodeString')
+    MAD_LENGTH = 64
+    MAD_ATTRIBUTE_ID = 0x10
+    MAD_SUBNGET = 0x1 # MAD_METHOD_GET
+    MEMBERS = [('nodeString',8,64)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.nodeString = bytearray(64)
+
+    def pack_into(self,buffer,offset=0):
+        buffer[offset + 0:offset + 64] = self.nodeString
+
+    def unpack_from(self,buffer,offset=0):
+        self.nodeString = bytearray(buffer[offset + 0:offset + 64])
+
+class _SMPNodeDescriptionView(rdma.binstruct.BinStructView,SMPNodeDescription):
+    '''Read only view of a packed :class:`SMPNodeDescription`'''
+    __slots__ = ('_buf','_off')
+    nodeString = property(lambda self:bytearray(self._buf[self._off:self._off + 64]))
+SMPNodeDescription.View = _SMPNodeDescriptionView
+
+class SMPNodeInfo(rdma.binstruct.BinStruct):
+    '''Generic Node Data (section 14.2.5.3)'''
+    __slots__ = ('baseVersion','classVersion','nodeType','numPorts','systemImageGUID','nodeGUID','portGUID','partitionCap','deviceID','revision','localPortNum','vendorID')
+    MAD_LENGTH = 40
+    MAD_ATTRIBUTE_ID = 0x11
+    MAD_SUBNGET = 0x1 # MAD_METHOD_GET
+    MEMBERS = [('baseVersion',8,1), ('classVersion',8,1), ('nodeType',8,1), ('numPorts',8,1), ('systemImageGUID',64,1), ('nodeGUID',64,1), ('portGUID',64,1), ('partitionCap',16,1), ('deviceID',16,1), ('revision',32,1), ('localPortNum',8,1), ('vendorID',24,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.baseVersion = 0
+        self.classVersion = 0
+        self.nodeType = 0
+        self.numPorts = 0
+        self.systemImageGUID = IBA.GUID()
+        self.nodeGUID = IBA.GUID()
+        self.portGUID = IBA.GUID()
+        self.partitionCap = 0
+        self.deviceID = 0
+        self.revision = 0
+        self.localPortNum = 0
+        self.vendorID = 0
+
+    def pack_into(self,buffer,offset=0):
+        self.systemImageGUID.pack_into(buffer,offset + 4)
+        self.nodeGUID.pack_into(buffer,offset + 12)
+        self.portGUID.pack_into(buffer,offset + 20)
+        _struct_BBBB.pack_into(buffer,offset+0,self.baseVersion,self.classVersion,self.nodeType,self.numPorts)
+        _struct_HHLL.pack_into(buffer,offset+28,self.partitionCap,self.deviceID,self.revision,((self.localPortNum & 0xFF) << 24) | (self.vendorID & 0xFFFFFF))
+
+    def unpack_from(self,buffer,offset=0):
+        self.systemImageGUID = IBA.GUID(buffer[offset + 4:offset + 12],raw=True)
+        self.nodeGUID = IBA.GUID(buffer[offset + 12:offset + 20],raw=True)
+        self.portGUID = IBA.GUID(buffer[offset + 20:offset + 28],raw=True)
+        (self.baseVersion,self.classVersion,self.nodeType,self.numPorts,) = _struct_BBBB.unpack_from(buffer,offset+0)
+        (self.partitionCap,self.deviceID,self.revision,w0,) = _struct_HHLL.unpack_from(buffer,offset+28)
+        self.localPortNum = w0 >> 24
+        self.vendorID = w0 & 0xFFFFFF
+
+class _SMPNodeInfoView(rdma.binstruct.BinStructView,SMPNodeInfo):
+    '''Read only view of a packed :class:`SMPNodeInfo`'''
+    __slots__ = ('_buf','_off')
+    baseVersion = property(lambda self:self._buf[self._off])
+    classVersion = property(lambda self:self._buf[self._off + 1])
+    nodeType = property(lambda self:self._buf[self._off + 2])
+    numPorts = property(lambda self:self._buf[self._off + 3])
+    systemImageGUID = property(lambda self:IBA.GUID(self._buf[self._off + 4:self._off + 4 + 8],raw=True))
+    nodeGUID = property(lambda self:IBA.GUID(self._buf[self._off + 12:self._off + 12 + 8],raw=True))
+    portGUID = property(lambda self:IBA.GUID(self._buf[self._off + 20:self._off + 20 + 8],raw=True))
+    partitionCap = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 28)[0])
+    deviceID = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 30)[0])
+    revision = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 32)[0])
+    localPortNum = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 36)[0] >> 24)
+    vendorID = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 36)[0] & 0xFFFFFF)
+SMPNodeInfo.View = _SMPNodeInfoView
+
+class SMPSwitchInfo(rdma.binstruct.BinStruct):
+    '''Switch Information (section 14.2.5.4)'''
+    __slots__ = ('linearFDBCap','randomFDBCap','multicastFDBCap','linearFDBTop','defaultPort','defaultMulticastPrimaryPort','defaultMulticastNotPrimaryPort','lifeTimeValue','portStateChange','optimizedSLtoVLMappingProgramming','LIDsPerPort','partitionEnforcementCap','inboundEnforcementCap','outboundEnforcementCap','filterRawInboundCap','filterRawOutboundCap','enhancedPort0','reserved_133','reserved_136','multicastFDBTop')
+    MAD_LENGTH = 20
+    MAD_ATTRIBUTE_ID = 0x12
+    MAD_SUBNGET = 0x1 # MAD_METHOD_GET
+    MAD_SUBNSET = 0x2 # MAD_METHOD_SET
+    MEMBERS = [('linearFDBCap',16,1), ('randomFDBCap',16,1), ('multicastFDBCap',16,1), ('linearFDBTop',16,1), ('defaultPort',8,1), ('defaultMulticastPrimaryPort',8,1), ('defaultMulticastNotPrimaryPort',8,1), ('lifeTimeValue',5,1), ('portStateChange',1,1), ('optimizedSLtoVLMappingProgramming',2,1), ('LIDsPerPort',16,1), ('partitionEnforcementCap',16,1), ('inboundEnforcementCap',1,1), ('outboundEnforcementCap',1,1), ('filterRawInboundCap',1,1), ('filterRawOutboundCap',1,1), ('enhancedPort0',1,1), ('reserved_133',3,1), ('reserved_136',8,1), ('multicastFDBTop',16,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.linearFDBCap = 0
+        self.randomFDBCap = 0
+        self.multicastFDBCap = 0
+        self.linearFDBTop = 0
+        self.defaultPort = 0
+        self.defaultMulticastPrimaryPort = 0
+        self.defaultMulticastNotPrimaryPort = 0
+        self.lifeTimeValue = 0
+        self.portStateChange = 0
+        self.optimizedSLtoVLMappingProgramming = 0
+        self.LIDsPerPort = 0
+        self.partitionEnforcementCap = 0
+        self.inboundEnforcementCap = 0
+        self.outboundEnforcementCap = 0
+        self.filterRawInboundCap = 0
+        self.filterRawOutboundCap = 0
+        self.enhancedPort0 = 0
+        self.reserved_133 = 0
+        self.reserved_136 = 0
+        self.multicastFDBTop = 0
+
+    def pack_into(self,buffer,offset=0):
+        _struct_HHHHLHHL.pack_into(buffer,offset+0,self.linearFDBCap,self.randomFDBCap,self.multicastFDBCap,self.linearFDBTop,((self.defaultPort & 0xFF) << 24) | ((self.defaultMulticastPrimaryPort & 0xFF) << 16) | ((self.defaultMulticastNotPrimaryPort & 0xFF) << 8) | ((self.lifeTimeValue & 0x1F) << 3) | ((self.portStateChange & 0x1) << 2) | (self.optimizedSLtoVLMappingProgramming & 0x3),self.LIDsPerPort,self.partitionEnforcementCap,((self.inboundEnforcementCap & 0x1) << 31) | ((self.outboundEnforcementCap & 0x1) << 30) | ((self.filterRawInboundCap & 0x1) << 29) | ((self.filterRawOutboundCap & 0x1) << 28) | ((self.enhancedPort0 & 0x1) << 27) | ((self.reserved_133 & 0x7) << 24) | ((self.reserved_136 & 0xFF) << 16) | (self.multicastFDBTop & 0xFFFF))
+
+    def unpack_from(self,buffer,offset=0):
+        (self.linearFDBCap,self.randomFDBCap,self.multicastFDBCap,self.linearFDBTop,w0,self.LIDsPerPort,self.partitionEnforcementCap,w1,) = _struct_HHHHLHHL.unpack_from(buffer,offset+0)
+        self.defaultPort = w0 >> 24
+        self.defaultMulticastPrimaryPort = (w0 >> 16) & 0xFF
+        self.defaultMulticastNotPrimaryPort = (w0 >> 8) & 0xFF
+        self.lifeTimeValue = (w0 >> 3) & 0x1F
+        self.portStateChange = (w0 >> 2) & 0x1
+        self.optimizedSLtoVLMappingProgramming = w0 & 0x3
+        self.inboundEnforcementCap = w1 >> 31
+        self.outboundEnforcementCap = (w1 >> 30) & 0x1
+        self.filterRawInboundCap = (w1 >> 29) & 0x1
+        self.filterRawOutboundCap = (w1 >> 28) & 0x1
+        self.enhancedPort0 = (w1 >> 27) & 0x1
+        self.reserved_133 = (w1 >> 24) & 0x7
+        self.reserved_136 = (w1 >> 16) & 0xFF
+        self.multicastFDBTop = w1 & 0xFFFF
+
+class _SMPSwitchInfoView(rdma.binstruct.BinStructView,SMPSwitchInfo):
+    '''Read only view of a packed :class:`SMPSwitchInfo`'''
+    __slots__ = ('_buf','_off')
+    linearFDBCap = property(lambda self:_struct_H.unpack_from(self._buf,self._off)[0])
+    randomFDBCap = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 2)[0])
+    multicastFDBCap = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 4)[0])
+    linearFDBTop = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 6)[0])
+    defaultPort = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 8)[0] >> 24)
+    defaultMulticastPrimaryPort = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 8)[0] >> 16) & 0xFF)
+    defaultMulticastNotPrimaryPort = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 8)[0] >> 8) & 0xFF)
+    lifeTimeValue = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 8)[0] >> 3) & 0x1F)
+    portStateChange = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 8)[0] >> 2) & 0x1)
+    optimizedSLtoVLMappingProgramming = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 8)[0] & 0x3)
+    LIDsPerPort = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 12)[0])
+    partitionEnforcementCap = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 14)[0])
+    inboundEnforcementCap = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 16)[0] >> 31)
+    outboundEnforcementCap = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 16)[0] >> 30) & 0x1)
+    filterRawInboundCap = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 16)[0] >> 29) & 0x1)
+    filterRawOutboundCap = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 16)[0] >> 28) & 0x1)
+    enhancedPort0 = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 16)[0] >> 27) & 0x1)
+    reserved_133 = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 16)[0] >> 24) & 0x7)
+    reserved_136 = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 16)[0] >> 16) & 0xFF)
+    multicastFDBTop = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 16)[0] & 0xFFFF)
+SMPSwitchInfo.View = _SMPSwitchInfoView
+
+class SMPGUIDInfo(rdma.binstruct.BinStruct):
+    '''Assigned GUIDs (section 14.2.5.5)'''
+    __slots__ = ('GUIDBlock')
+    MAD_LENGTH = 64
+    MAD_ATTRIBUTE_ID = 0x14
+    MAD_SUBNGET = 0x1 # MAD_METHOD_GET
+    MAD_SUBNSET = 0x2 # MAD_METHOD_SET
+    MEMBERS = [('GUIDBlock',64,8)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        self.GUIDBlock = [IBA.GUID() for I in range(8)]
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.GUIDBlock = [IBA.GUID() for I in range(8)]
+
+    def pack_into(self,buffer,offset=0):
+        self.GUIDBlock[0].pack_into(buffer,offset + 0)
+        self.GUIDBlock[1].pack_into(buffer,offset + 8)
+        self.GUIDBlock[2].pack_into(buffer,offset + 16)
+        self.GUIDBlock[3].pack_into(buffer,offset + 24)
+        self.GUIDBlock[4].pack_into(buffer,offset + 32)
+        self.GUIDBlock[5].pack_into(buffer,offset + 40)
+        self.GUIDBlock[6].pack_into(buffer,offset + 48)
+        self.GUIDBlock[7].pack_into(buffer,offset + 56)
+
+    def unpack_from(self,buffer,offset=0):
+        self.GUIDBlock[0] = IBA.GUID(buffer[offset + 0:offset + 8],raw=True)
+        self.GUIDBlock[1] = IBA.GUID(buffer[offset + 8:offset + 16],raw=True)
+        self.GUIDBlock[2] = IBA.GUID(buffer[offset + 16:offset + 24],raw=True)
+        self.GUIDBlock[3] = IBA.GUID(buffer[offset + 24:offset + 32],raw=True)
+        self.GUIDBlock[4] = IBA.GUID(buffer[offset + 32:offset + 40],raw=True)
+        self.GUIDBlock[5] = IBA.GUID(buffer[offset + 40:offset + 48],raw=True)
+        self.GUIDBlock[6] = IBA.GUID(buffer[offset + 48:offset + 56],raw=True)
+        self.GUIDBlock[7] = IBA.GUID(buffer[offset + 56:offset + 64],raw=True)
+
+class _SMPGUIDInfoView(rdma.binstruct.BinStructView,SMPGUIDInfo):
+    '''Read only view of a packed :class:`SMPGUIDInfo`'''
+    __slots__ = ('_buf','_off')
+    GUIDBlock = property(lambda self:[IBA.GUID(self._buf[self._off + I*8:self._off + I*8 + 8],raw=True) for I in range(8)])
+SMPGUIDInfo.View = _SMPGUIDInfoView
+
+class SMPPortInfo(rdma.binstruct.BinStruct):
+    '''Port Information (section 14.2.5.6)'''
+    __slots__ = ('MKey','GIDPrefix','LID','masterSMLID','capabilityMask','diagCode','MKeyLeasePeriod','localPortNum','linkWidthEnabled','linkWidthSupported','linkWidthActive','linkSpeedSupported','portState','portPhysicalState','linkDownDefaultState','MKeyProtectBits','reserved_274','LMC','linkSpeedActive','linkSpeedEnabled','neighborMTU','masterSMSL','VLCap','initType','VLHighLimit','VLArbitrationHighCap','VLArbitrationLowCap','initTypeReply','MTUCap','VLStallCount','HOQLife','operationalVLs','partitionEnforcementInbound','partitionEnforcementOutbound','filterRawInbound','filterRawOutbound','MKeyViolations','PKeyViolations','QKeyViolations','GUIDCap','clientReregister','multicastPKeyTrapSuppressionEnabled','subnetTimeOut','reserved_416','respTimeValue','localPhyErrors','overrunErrors','maxCreditHint','reserved_448','linkRoundTripLatency','capabilityMask2','linkSpeedExtActive','linkSpeedExtSupported','reserved_504','linkSpeedExtEnabled')
+    MAD_LENGTH = 64
+    MAD_ATTRIBUTE_ID = 0x15
+    MAD_SUBNGET = 0x1 # MAD_METHOD_GET
+    MAD_SUBNSET = 0x2 # MAD_METHOD_SET
+    MEMBERS = [('MKey',64,1), ('GIDPrefix',64,1), ('LID',16,1), ('masterSMLID',16,1), ('capabilityMask',32,1), ('diagCode',16,1), ('MKeyLeasePeriod',16,1), ('localPortNum',8,1), ('linkWidthEnabled',8,1), ('linkWidthSupported',8,1), ('linkWidthActive',8,1), ('linkSpeedSupported',4,1), ('portState',4,1), ('portPhysicalState',4,1), ('linkDownDefaultState',4,1), ('MKeyProtectBits',2,1), ('reserved_274',3,1), ('LMC',3,1), ('linkSpeedActive',4,1), ('linkSpeedEnabled',4,1), ('neighborMTU',4,1), ('masterSMSL',4,1), ('VLCap',4,1), ('initType',4,1), ('VLHighLimit',8,1), ('VLArbitrationHighCap',8,1), ('VLArbitrationLowCap',8,1), ('initTypeReply',4,1), ('MTUCap',4,1), ('VLStallCount',3,1), ('HOQLife',5,1), ('operationalVLs',4,1), ('partitionEnforcementInbound',1,1), ('partitionEnforcementOutbound',1,1), ('filterRawInbound',1,1), ('filterRawOutbound',1,1), ('MKeyViolations',16,1), ('PKeyViolations',16,1), ('QKeyViolations',16,1), ('GUIDCap',8,1), ('clientReregister',1,1), ('multicastPKeyTrapSuppressionEnabled',2,1), ('subnetTimeOut',5,1), ('reserved_416',3,1), ('respTimeValue',5,1), ('localPhyErrors',4,1), ('overrunErrors',4,1), ('maxCreditHint',16,1), ('reserved_448',8,1), ('linkRoundTripLatency',24,1), ('capabilityMask2',16,1), ('linkSpeedExtActive',4,1), ('linkSpeedExtSupported',4,1), ('reserved_504',3,1), ('linkSpeedExtEnabled',5,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.MKey = 0
+        self.GIDPrefix = 0
+        self.LID = 0
+        self.masterSMLID = 0
+        self.capabilityMask = 0
+        self.diagCode = 0
+        self.MKeyLeasePeriod = 0
+        self.localPortNum = 0
+        self.linkWidthEnabled = 0
+        self.linkWidthSupported = 0
+        self.linkWidthActive = 0
+        self.linkSpeedSupported = 0
+        self.portState = 0
+        self.portPhysicalState = 0
+        self.linkDownDefaultState = 0
+        self.MKeyProtectBits = 0
+        self.reserved_274 = 0
+        self.LMC = 0
+        self.linkSpeedActive = 0
+        self.linkSpeedEnabled = 0
+        self.neighborMTU = 0
+        self.masterSMSL = 0
+        self.VLCap = 0
+        self.initType = 0
+        self.VLHighLimit = 0
+        self.VLArbitrationHighCap = 0
+        self.VLArbitrationLowCap = 0
+        self.initTypeReply = 0
+        self.MTUCap = 0
+        self.VLStallCount = 0
+        self.HOQLife = 0
+        self.operationalVLs = 0
+        self.partitionEnforcementInbound = 0
+        self.partitionEnforcementOutbound = 0
+        self.filterRawInbound = 0
+        self.filterRawOutbound = 0
+        self.MKeyViolations = 0
+        self.PKeyViolations = 0
+        self.QKeyViolations = 0
+        self.GUIDCap = 0
+        self.clientReregister = 0
+        self.multicastPKeyTrapSuppressionEnabled = 0
+        self.subnetTimeOut = 0
+        self.reserved_416 = 0
+        self.respTimeValue = 0
+        self.localPhyErrors = 0
+        self.overrunErrors = 0
+        self.maxCreditHint = 0
+        self.reserved_448 = 0
+        self.linkRoundTripLatency = 0
+        self.capabilityMask2 = 0
+        self.linkSpeedExtActive = 0
+        self.linkSpeedExtSupported = 0
+        self.reserved_504 = 0
+        self.linkSpeedExtEnabled = 0
+
+    def pack_into(self,buffer,offset=0):
+        _struct_QQHHLHHBBBBLLLHHLLLL.pack_into(buffer,offset+0,self.MKey,self.GIDPrefix,self.LID,self.masterSMLID,self.capabilityMask,self.diagCode,self.MKeyLeasePeriod,self.localPortNum,self.linkWidthEnabled,self.linkWidthSupported,self.linkWidthActive,((self.linkSpeedSupported & 0xF) << 28) | ((self.portState & 0xF) << 24) | ((self.portPhysicalState & 0xF) << 20) | ((self.linkDownDefaultState & 0xF) << 16) | ((self.MKeyProtectBits & 0x3) << 14) | ((self.reserved_274 & 0x7) << 11) | ((self.LMC & 0x7) << 8) | ((self.linkSpeedActive & 0xF) << 4) | (self.linkSpeedEnabled & 0xF),((self.neighborMTU & 0xF) << 28) | ((self.masterSMSL & 0xF) << 24) | ((self.VLCap & 0xF) << 20) | ((self.initType & 0xF) << 16) | ((self.VLHighLimit & 0xFF) << 8) | (self.VLArbitrationHighCap & 0xFF),((self.VLArbitrationLowCap & 0xFF) << 24) | ((self.initTypeReply & 0xF) << 20) | ((self.MTUCap & 0xF) << 16) | ((self.VLStallCount & 0x7) << 13) | ((self.HOQLife & 0x1F) << 8) | ((self.operationalVLs & 0xF) << 4) | ((self.partitionEnforcementInbound & 0x1) << 3) | ((self.partitionEnforcementOutbound & 0x1) << 2) | ((self.filterRawInbound & 0x1) << 1) | (self.filterRawOutbound & 0x1),self.MKeyViolations,self.PKeyViolations,((self.QKeyViolations & 0xFFFF) << 16) | ((self.GUIDCap & 0xFF) << 8) | ((self.clientReregister & 0x1) << 7) | ((self.multicastPKeyTrapSuppressionEnabled & 0x3) << 5) | (self.subnetTimeOut & 0x1F),((self.reserved_416 & 0x7) << 29) | ((self.respTimeValue & 0x1F) << 24) | ((self.localPhyErrors & 0xF) << 20) | ((self.overrunErrors & 0xF) << 16) | (self.maxCreditHint & 0xFFFF),((self.reserved_448 & 0xFF) << 24) | (self.linkRoundTripLatency & 0xFFFFFF),((self.capabilityMask2 & 0xFFFF) << 16) | ((self.linkSpeedExtActive & 0xF) << 12) | ((self.linkSpeedExtSupported & 0xF) << 8) | ((self.reserved_504 & 0x7) << 5) | (self.linkSpeedExtEnabled & 0x1F))
+
+    def unpack_from(self,buffer,offset=0):
+        (self.MKey,self.GIDPrefix,self.LID,self.masterSMLID,self.capabilityMask,self.diagCode,self.MKeyLeasePeriod,self.localPortNum,self.linkWidthEnabled,self.linkWidthSupported,self.linkWidthActive,w0,w1,w2,self.MKeyViolations,self.PKeyViolations,w3,w4,w5,w6,) = _struct_QQHHLHHBBBBLLLHHLLLL.unpack_from(buffer,offset+0)
+        self.linkSpeedSupported = w0 >> 28
+        self.portState = (w0 >> 24) & 0xF
+        self.portPhysicalState = (w0 >> 20) & 0xF
+        self.linkDownDefaultState = (w0 >> 16) & 0xF
+        self.MKeyProtectBits = (w0 >> 14) & 0x3
+        self.reserved_274 = (w0 >> 11) & 0x7
+        self.LMC = (w0 >> 8) & 0x7
+        self.linkSpeedActive = (w0 >> 4) & 0xF
+        self.linkSpeedEnabled = w0 & 0xF
+        self.neighborMTU = w1 >> 28
+        self.masterSMSL = (w1 >> 24) & 0xF
+        self.VLCap = (w1 >> 20) & 0xF
+        self.initType = (w1 >> 16) & 0xF
+        self.VLHighLimit = (w1 >> 8) & 0xFF
+        self.VLArbitrationHighCap = w1 & 0xFF
+        self.VLArbitrationLowCap = w2 >> 24
+        self.initTypeReply = (w2 >> 20) & 0xF
+        self.MTUCap = (w2 >> 16) & 0xF
+        self.VLStallCount = (w2 >> 13) & 0x7
+        self.HOQLife = (w2 >> 8) & 0x1F
+        self.operationalVLs = (w2 >> 4) & 0xF
+        self.partitionEnforcementInbound = (w2 >> 3) & 0x1
+        self.partitionEnforcementOutbound = (w2 >> 2) & 0x1
+        self.filterRawInbound = (w2 >> 1) & 0x1
+        self.filterRawOutbound = w2 & 0x1
+        self.QKeyViolations = w3 >> 16
+        self.GUIDCap = (w3 >> 8) & 0xFF
+        self.clientReregister = (w3 >> 7) & 0x1
+        self.multicastPKeyTrapSuppressionEnabled = (w3 >> 5) & 0x3
+        self.subnetTimeOut = w3 & 0x1F
+        self.reserved_416 = w4 >> 29
+        self.respTimeValue = (w4 >> 24) & 0x1F
+        self.localPhyErrors = (w4 >> 20) & 0xF
+        self.overrunErrors = (w4 >> 16) & 0xF
+        self.maxCreditHint = w4 & 0xFFFF
+        self.reserved_448 = w5 >> 24
+        self.linkRoundTripLatency = w5 & 0xFFFFFF
+        self.capabilityMask2 = w6 >> 16
+        self.linkSpeedExtActive = (w6 >> 12) & 0xF
+        self.linkSpeedExtSupported = (w6 >> 8) & 0xF
+        self.reserved_504 = (w6 >> 5) & 0x7
+        self.linkSpeedExtEnabled = w6 & 0x1F
+
+class _SMPPortInfoView(rdma.binstruct.BinStructView,SMPPortInfo):
+    '''Read only view of a packed :class:`SMPPortInfo`'''
+    __slots__ = ('_buf','_off')
+    MKey = property(lambda self:_struct_Q.unpack_from(self._buf,self._off)[0])
+    GIDPrefix = property(lambda self:_struct_Q.unpack_from(self._buf,self._off + 8)[0])
+    LID = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 16)[0])
+    masterSMLID = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 18)[0])
+    capabilityMask = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 20)[0])
+    diagCode = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 24)[0])
+    MKeyLeasePeriod = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 26)[0])
+    localPortNum = property(lambda self:self._buf[self._off + 28])
+    linkWidthEnabled = property(lambda self:self._buf[self._off + 29])
+    linkWidthSupported = property(lambda self:self._buf[self._off + 30])
+    linkWidthActive = property(lambda self:self._buf[self._off + 31])
+    linkSpeedSupported = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 32)[0] >> 28)
+    portState = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 32)[0] >> 24) & 0xF)
+    portPhysicalState = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 32)[0] >> 20) & 0xF)
+    linkDownDefaultState = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 32)[0] >> 16) & 0xF)
+    MKeyProtectBits = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 32)[0] >> 14) & 0x3)
+    reserved_274 = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 32)[0] >> 11) & 0x7)
+    LMC = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 32)[0] >> 8) & 0x7)
+    linkSpeedActive = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 32)[0] >> 4) & 0xF)
+    linkSpeedEnabled = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 32)[0] & 0xF)
+    neighborMTU = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 36)[0] >> 28)
+    masterSMSL = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 36)[0] >> 24) & 0xF)
+    VLCap = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 36)[0] >> 20) & 0xF)
+    initType = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 36)[0] >> 16) & 0xF)
+    VLHighLimit = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 36)[0] >> 8) & 0xFF)
+    VLArbitrationHighCap = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 36)[0] & 0xFF)
+    VLArbitrationLowCap = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 40)[0] >> 24)
+    initTypeReply = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 40)[0] >> 20) & 0xF)
+    MTUCap = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 40)[0] >> 16) & 0xF)
+    VLStallCount = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 40)[0] >> 13) & 0x7)
+    HOQLife = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 40)[0] >> 8) & 0x1F)
+    operationalVLs = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 40)[0] >> 4) & 0xF)
+    partitionEnforcementInbound = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 40)[0] >> 3) & 0x1)
+    partitionEnforcementOutbound = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 40)[0] >> 2) & 0x1)
+    filterRawInbound = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 40)[0] >> 1) & 0x1)
+    filterRawOutbound = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 40)[0] & 0x1)
+    MKeyViolations = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 44)[0])
+    PKeyViolations = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 46)[0])
+    QKeyViolations = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 48)[0] >> 16)
+    GUIDCap = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 48)[0] >> 8) & 0xFF)
+    clientReregister = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 48)[0] >> 7) & 0x1)
+    multicastPKeyTrapSuppressionEnabled = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 48)[0] >> 5) & 0x3)
+    subnetTimeOut = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 48)[0] & 0x1F)
+    reserved_416 = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 52)[0] >> 29)
+    respTimeValue = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 52)[0] >> 24) & 0x1F)
+    localPhyErrors = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 52)[0] >> 20) & 0xF)
+    overrunErrors = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 52)[0] >> 16) & 0xF)
+    maxCreditHint = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 52)[0] & 0xFFFF)
+    reserved_448 = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 56)[0] >> 24)
+    linkRoundTripLatency = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 56)[0] & 0xFFFFFF)
+    capabilityMask2 = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 60)[0] >> 16)
+    linkSpeedExtActive = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 60)[0] >> 12) & 0xF)
+    linkSpeedExtSupported = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 60)[0] >> 8) & 0xF)
+    reserved_504 = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 60)[0] >> 5) & 0x7)
+    linkSpeedExtEnabled = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 60)[0] & 0x1F)
+SMPPortInfo.View = _SMPPortInfoView
+
+class SMPPKeyTable(rdma.binstruct.BinStruct):
+    '''Partition Table (section 14.2.5.7)'''
+    __slots__ = ('PKeyBlock')
+    MAD_LENGTH = 64
+    MAD_ATTRIBUTE_ID = 0x16
+    MAD_SUBNGET = 0x1 # MAD_METHOD_GET
+    MAD_SUBNSET = 0x2 # MAD_METHOD_SET
+    MEMBERS = [('PKeyBlock',16,32)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        self.PKeyBlock = [0]*32
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.PKeyBlock = [0]*32
+
+    def pack_into(self,buffer,offset=0):
+        _struct_HHHHHHHHHHHHHHHHHHHHHHHHHHHHHHHH.pack_into(buffer,offset+0,self.PKeyBlock[0],self.PKeyBlock[1],self.PKeyBlock[2],self.PKeyBlock[3],self.PKeyBlock[4],self.PKeyBlock[5],self.PKeyBlock[6],self.PKeyBlock[7],self.PKeyBlock[8],self.PKeyBlock[9],self.PKeyBlock[10],self.PKeyBlock[11],self.PKeyBlock[12],self.PKeyBlock[13],self.PKeyBlock[14],self.PKeyBlock[15],self.PKeyBlock[16],self.PKeyBlock[17],self.PKeyBlock[18],self.PKeyBlock[19],self.PKeyBlock[20],self.PKeyBlock[21],self.PKeyBlock[22],self.PKeyBlock[23],self.PKeyBlock[24],self.PKeyBlock[25],self.PKeyBlock[26],self.PKeyBlock[27],self.PKeyBlock[28],self.PKeyBlock[29],self.PKeyBlock[30],self.PKeyBlock[31])
+
+    def unpack_from(self,buffer,offset=0):
+        (self.PKeyBlock[0],self.PKeyBlock[1],self.PKeyBlock[2],self.PKeyBlock[3],self.PKeyBlock[4],self.PKeyBlock[5],self.PKeyBlock[6],self.PKeyBlock[7],self.PKeyBlock[8],self.PKeyBlock[9],self.PKeyBlock[10],self.PKeyBlock[11],self.PKeyBlock[12],self.PKeyBlock[13],self.PKeyBlock[14],self.PKeyBlock[15],self.PKeyBlock[16],self.PKeyBlock[17],self.PKeyBlock[18],self.PKeyBlock[19],self.PKeyBlock[20],self.PKeyBlock[21],self.PKeyBlock[22],self.PKeyBlock[23],self.PKeyBlock[24],self.PKeyBlock[25],self.PKeyBlock[26],self.PKeyBlock[27],self.PKeyBlock[28],self.PKeyBlock[29],self.PKeyBlock[30],self.PKeyBlock[31],) = _struct_HHHHHHHHHHHHHHHHHHHHHHHHHHHHHHHH.unpack_from(buffer,offset+0)
+
+class _SMPPKeyTableView(rdma.binstruct.BinStructView,SMPPKeyTable):
+    '''Read only view of a packed :class:`SMPPKeyTable`'''
+    __slots__ = ('_buf','_off')
+    PKeyBlock = property(lambda self:list(_struct_HHHHHHHHHHHHHHHHHHHHHHHHHHHHHHHH.unpack_from(self._buf,self._off)))
+SMPPKeyTable.View = _SMPPKeyTableView
+
+class SMPSLToVLMappingTable(rdma.binstruct.BinStruct):
+    '''Service Level to Virtual Lane mapping Information (section 14.2.5.8)'''
+    __slots__ = ('SLtoVL')
+    MAD_LENGTH = 8
+    MAD_ATTRIBUTE_ID = 0x17
+    MAD_SUBNGET = 0x1 # MAD_METHOD_GET
+    MAD_SUBNSET = 0x2 # MAD_METHOD_SET
+    MEMBERS = [('SLtoVL',4,16)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        self.SLtoVL = [0]*16
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.SLtoVL = [0]*16
+
+    def pack_into(self,buffer,offset=0):
+        rdma.binstruct.pack_array8(buffer,offset+0,4,16,self.SLtoVL)
+
+    def unpack_from(self,buffer,offset=0):
+        rdma.binstruct.unpack_array8(buffer,offset+0,4,16,self.SLtoVL)
+
+class _SMPSLToVLMappingTableView(rdma.binstruct.BinStructView,SMPSLToVLMappingTable):
+    '''Read only view of a packed :class:`SMPSLToVLMappingTable`'''
+    __slots__ = ('_buf','_off')
+    SLtoVL = property(lambda self:rdma.binstruct.unpack_array8(self._buf,self._off,4,16,[0]*16))
+SMPSLToVLMappingTable.View = _SMPSLToVLMappingTableView
+
+class SMPVLArbitrationTable(rdma.binstruct.BinStruct):
+    '''List of Weights (section 14.2.5.9)'''
+    __slots__ = ('VLWeightBlock')
+    MAD_LENGTH = 64
+    MAD_ATTRIBUTE_ID = 0x18
+    MAD_SUBNGET = 0x1 # MAD_METHOD_GET
+    MAD_SUBNSET = 0x2 # MAD_METHOD_SET
+    MEMBERS = [('VLWeightBlock',16,32)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        self.VLWeightBlock = [0]*32
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.VLWeightBlock = [0]*32
+
+    def pack_into(self,buffer,offset=0):
+        _struct_HHHHHHHHHHHHHHHHHHHHHHHHHHHHHHHH.pack_into(buffer,offset+0,self.VLWeightBlock[0],self.VLWeightBlock[1],self.VLWeightBlock[2],self.VLWeightBlock[3],self.VLWeightBlock[4],self.VLWeightBlock[5],self.VLWeightBlock[6],self.VLWeightBlock[7],self.VLWeightBlock[8],self.VLWeightBlock[9],self.VLWeightBlock[10],self.VLWeightBlock[11],self.VLWeightBlock[12],self.VLWeightBlock[13],self.VLWeightBlock[14],self.VLWeightBlock[15],self.VLWeightBlock[16],self.VLWeightBlock[17],self.VLWeightBlock[18],self.VLWeightBlock[19],self.VLWeightBlock[20],self.VLWeightBlock[21],self.VLWeightBlock[22],self.VLWeightBlock[23],self.VLWeightBlock[24],self.VLWeightBlock[25],self.VLWeightBlock[26],self.VLWeightBlock[27],self.VLWeightBlock[28],self.VLWeightBlock[29],self.VLWeightBlock[30],self.VLWeightBlock[31])
+
+    def unpack_from(self,buffer,offset=0):
+        (self.VLWeightBlock[0],self.VLWeightBlock[1],self.VLWeightBlock[2],self.VLWeightBlock[3],self.VLWeightBlock[4],self.VLWeightBlock[5],self.VLWeightBlock[6],self.VLWeightBlock[7],self.VLWeightBlock[8],self.VLWeightBlock[9],self.VLWeightBlock[10],self.VLWeightBlock[11],self.VLWeightBlock[12],self.VLWeightBlock[13],self.VLWeightBlock[14],self.VLWeightBlock[15],self.VLWeightBlock[16],self.VLWeightBlock[17],self.VLWeightBlock[18],self.VLWeightBlock[19],self.VLWeightBlock[20],self.VLWeightBlock[21],self.VLWeightBlock[22],self.VLWeightBlock[23],self.VLWeightBlock[24],self.VLWeightBlock[25],self.VLWeightBlock[26],self.VLWeightBlock[27],self.VLWeightBlock[28],self.VLWeightBlock[29],self.VLWeightBlock[30],self.VLWeightBlock[31],) = _struct_HHHHHHHHHHHHHHHHHHHHHHHHHHHHHHHH.unpack_from(buffer,offset+0)
+
+class _SMPVLArbitrationTableView(rdma.binstruct.BinStructView,SMPVLArbitrationTable):
+    '''Read only view of a packed :class:`SMPVLArbitrationTable`'''
+    __slots__ = ('_buf','_off')
+    VLWeightBlock = property(lambda self:list(_struct_HHHHHHHHHHHHHHHHHHHHHHHHHHHHHHHH.unpack_from(self._buf,self._off)))
+SMPVLArbitrationTable.View = _SMPVLArbitrationTableView
+
+class SMPLinearForwardingTable(rdma.binstruct.BinStruct):
+    '''Linear Forwarding Table Information (section 14.2.5.10)'''
+    __slots__ = ('portBlock')
+    MAD_LENGTH = 64
+    MAD_ATTRIBUTE_ID = 0x19
+    MAD_SUBNGET = 0x1 # MAD_METHOD_GET
+    MAD_SUBNSET = 0x2 # MAD_METHOD_SET
+    MEMBERS = [('portBlock',8,64)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.portBlock = bytearray(64)
+
+    def pack_into(self,buffer,offset=0):
+        buffer[offset + 0:offset + 64] = self.portBlock
+
+    def unpack_from(self,buffer,offset=0):
+        self.portBlock = bytearray(buffer[offset + 0:offset + 64])
+
+class _SMPLinearForwardingTableView(rdma.binstruct.BinStructView,SMPLinearForwardingTable):
+    '''Read only view of a packed :class:`SMPLinearForwardingTable`'''
+    __slots__ = ('_buf','_off')
+    portBlock = property(lambda self:bytearray(self._buf[self._off:self._off + 64]))
+SMPLinearForwardingTable.View = _SMPLinearForwardingTableView
+
+class SMPRandomForwardingTable(rdma.binstruct.BinStruct):
+    '''Random Forwarding Table Information (section 14.2.5.11)'''
+    __slots__ = ('LIDPortBlock')
+    MAD_LENGTH = 64
+    MAD_ATTRIBUTE_ID = 0x1a
+    MAD_SUBNGET = 0x1 # MAD_METHOD_GET
+    MAD_SUBNSET = 0x2 # MAD_METHOD_SET
+    MEMBERS = [('LIDPortBlock',32,16)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        self.LIDPortBlock = [SMPLIDPortBlock() for I in range(16)]
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.LIDPortBlock = [SMPLIDPortBlock() for I in range(16)]
+
+    def pack_into(self,buffer,offset=0):
+        self.LIDPortBlock[0].pack_into(buffer,offset + 0)
+        self.LIDPortBlock[1].pack_into(buffer,offset + 4)
+        self.LIDPortBlock[2].pack_into(buffer,offset + 8)
+        self.LIDPortBlock[3].pack_into(buffer,offset + 12)
+        self.LIDPortBlock[4].pack_into(buffer,offset + 16)
+        self.LIDPortBlock[5].pack_into(buffer,offset + 20)
+        self.LIDPortBlock[6].pack_into(buffer,offset + 24)
+        self.LIDPortBlock[7].pack_into(buffer,offset + 28)
+        self.LIDPortBlock[8].pack_into(buffer,offset + 32)
+        self.LIDPortBlock[9].pack_into(buffer,offset + 36)
+        self.LIDPortBlock[10].pack_into(buffer,offset + 40)
+        self.LIDPortBlock[11].pack_into(buffer,offset + 44)
+        self.LIDPortBlock[12].pack_into(buffer,offset + 48)
+        self.LIDPortBlock[13].pack_into(buffer,offset + 52)
+        self.LIDPortBlock[14].pack_into(buffer,offset + 56)
+        self.LIDPortBlock[15].pack_into(buffer,offset + 60)
+
+    def unpack_from(self,buffer,offset=0):
+        self.LIDPortBlock[0].unpack_from(buffer,offset + 0)
+        self.LIDPortBlock[1].unpack_from(buffer,offset + 4)
+        self.LIDPortBlock[2].unpack_from(buffer,offset + 8)
+        self.LIDPortBlock[3].unpack_from(buffer,offset + 12)
+        self.LIDPortBlock[4].unpack_from(buffer,offset + 16)
+        self.LIDPortBlock[5].unpack_from(buffer,offset + 20)
+        self.LIDPortBlock[6].unpack_from(buffer,offset + 24)
+        self.LIDPortBlock[7].unpack_from(buffer,offset + 28)
+        self.LIDPortBlock[8].unpack_from(buffer,offset + 32)
+        self.LIDPortBlock[9].unpack_from(buffer,offset + 36)
+        self.LIDPortBlock[10].unpack_from(buffer,offset + 40)
+        self.LIDPortBlock[11].unpack_from(buffer,offset + 44)
+        self.LIDPortBlock[12].unpack_from(buffer,offset + 48)
+        self.LIDPortBlock[13].unpack_from(buffer,offset + 52)
+        self.LIDPortBlock[14].unpack_from(buffer,offset + 56)
+        self.LIDPortBlock[15].unpack_from(buffer,offset + 60)
+
+class _SMPRandomForwardingTableView(rdma.binstruct.BinStructView,SMPRandomForwardingTable):
+    '''Read only view of a packed :class:`SMPRandomForwardingTable`'''
+    __slots__ = ('_buf','_off')
+    LIDPortBlock = property(lambda self:[SMPLIDPortBlock.View(self._buf,self._off + I*4) for I in range(16)])
+SMPRandomForwardingTable.View = _SMPRandomForwardingTableView
+
+class SMPMulticastForwardingTable(rdma.binstruct.BinStruct):
+    '''Multicast Forwarding Table Information (section 14.2.5.12)'''
+    __slots__ = ('portMaskBlock')
+    MAD_LENGTH = 64
+    MAD_ATTRIBUTE_ID = 0x1b
+    MAD_SUBNGET = 0x1 # MAD_METHOD_GET
+    MAD_SUBNSET = 0x2 # MAD_METHOD_SET
+    MEMBERS = [('portMaskBlock',16,32)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        self.portMaskBlock = [0]*32
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.portMaskBlock = [0]*32
+
+    def pack_into(self,buffer,offset=0):
+        _struct_HHHHHHHHHHHHHHHHHHHHHHHHHHHHHHHH.pack_into(buffer,offset+0,self.portMaskBlock[0],self.portMaskBlock[1],self.portMaskBlock[2],self.portMaskBlock[3],self.portMaskBlock[4],self.portMaskBlock[5],self.portMaskBlock[6],self.portMaskBlock[7],self.portMaskBlock[8],self.portMaskBlock[9],self.portMaskBlock[10],self.portMaskBlock[11],self.portMaskBlock[12],self.portMaskBlock[13],self.portMaskBlock[14],self.portMaskBlock[15],self.portMaskBlock[16],self.portMaskBlock[17],self.portMaskBlock[18],self.portMaskBlock[19],self.portMaskBlock[20],self.portMaskBlock[21],self.portMaskBlock[22],self.portMaskBlock[23],self.portMaskBlock[24],self.portMaskBlock[25],self.portMaskBlock[26],self.portMaskBlock[27],self.portMaskBlock[28],self.portMaskBlock[29],self.portMaskBlock[30],self.portMaskBlock[31])
+
+    def unpack_from(self,buffer,offset=0):
+        (self.portMaskBlock[0],self.portMaskBlock[1],self.portMaskBlock[2],self.portMaskBlock[3],self.portMaskBlock[4],self.portMaskBlock[5],self.portMaskBlock[6],self.portMaskBlock[7],self.portMaskBlock[8],self.portMaskBlock[9],self.portMaskBlock[10],self.portMaskBlock[11],self.portMaskBlock[12],self.portMaskBlock[13],self.portMaskBlock[14],self.portMaskBlock[15],self.portMaskBlock[16],self.portMaskBlock[17],self.portMaskBlock[18],self.portMaskBlock[19],self.portMaskBlock[20],self.portMaskBlock[21],self.portMaskBlock[22],self.portMaskBlock[23],self.portMaskBlock[24],self.portMaskBlock[25],self.portMaskBlock[26],self.portMaskBlock[27],self.portMaskBlock[28],self.portMaskBlock[29],self.portMaskBlock[30],self.portMaskBlock[31],) = _struct_HHHHHHHHHHHHHHHHHHHHHHHHHHHHHHHH.unpack_from(buffer,offset+0)
+
+class _SMPMulticastForwardingTableView(rdma.binstruct.BinStructView,SMPMulticastForwardingTable):
+    '''Read only view of a packed :class:`SMPMulticastForwardingTable`'''
+    __slots__ = ('_buf','_off')
+    portMaskBlock = property(lambda self:list(_struct_HHHHHHHHHHHHHHHHHHHHHHHHHHHHHHHH.unpack_from(self._buf,self._off)))
+SMPMulticastForwardingTable.View = _SMPMulticastForwardingTableView
+
+class SMPSMInfo(rdma.binstruct.BinStruct):
+    '''Subnet Management Information (section 14.2.5.13)'''
+    __slots__ = ('GUID','SMKey','actCount','priority','SMState','reserved_168')
+    MAD_LENGTH = 24
+    MAD_ATTRIBUTE_ID = 0x20
+    MAD_SUBNGET = 0x1 # MAD_METHOD_GET
+    MAD_SUBNSET = 0x2 # MAD_METHOD_SET
+    MEMBERS = [('GUID',64,1), ('SMKey',64,1), ('actCount',32,1), ('priority',4,1), ('SMState',4,1), ('reserved_168',24,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.GUID = IBA.GUID()
+        self.SMKey = 0
+        self.actCount = 0
+        self.priority = 0
+        self.SMState = 0
+        self.reserved_168 = 0
+
+    def pack_into(self,buffer,offset=0):
+        self.GUID.pack_into(buffer,offset + 0)
+        _struct_QLL.pack_into(buffer,offset+8,self.SMKey,self.actCount,((self.priority & 0xF) << 28) | ((self.SMState & 0xF) << 24) | (self.reserved_168 & 0xFFFFFF))
+
+    def unpack_from(self,buffer,offset=0):
+        self.GUID = IBA.GUID(buffer[offset + 0:offset + 8],raw=True)
+        (self.SMKey,self.actCount,w0,) = _struct_QLL.unpack_from(buffer,offset+8)
+        self.priority = w0 >> 28
+        self.SMState = (w0 >> 24) & 0xF
+        self.reserved_168 = w0 & 0xFFFFFF
+
+class _SMPSMInfoView(rdma.binstruct.BinStructView,SMPSMInfo):
+    '''Read only view of a packed :class:`SMPSMInfo`'''
+    __slots__ = ('_buf','_off')
+    GUID = property(lambda self:IBA.GUID(self._buf[self._off:self._off + 8],raw=True))
+    SMKey = property(lambda self:_struct_Q.unpack_from(self._buf,self._off + 8)[0])
+    actCount = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 16)[0])
+    priority = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 20)[0] >> 28)
+    SMState = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 20)[0] >> 24) & 0xF)
+    reserved_168 = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 20)[0] & 0xFFFFFF)
+SMPSMInfo.View = _SMPSMInfoView
+
+class SMPVendorDiag(rdma.binstruct.BinStruct):
+    '''Vendor Specific Diagnostic (section 14.2.5.14)'''
+    __slots__ = ('nextIndex','reserved_16','diagData')
+    MAD_LENGTH = 64
+    MAD_ATTRIBUTE_ID = 0x30
+    MAD_SUBNGET = 0x1 # MAD_METHOD_GET
+    MEMBERS = [('nextIndex',16,1), ('reserved_16',16,1), ('diagData',480,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.nextIndex = 0
+        self.reserved_16 = 0
+        self.diagData = bytearray(60)
+
+    def pack_into(self,buffer,offset=0):
+        buffer[offset + 4:offset + 64] = self.diagData
+        _struct_HH.pack_into(buffer,offset+0,self.nextIndex,self.reserved_16)
+
+    def unpack_from(self,buffer,offset=0):
+        self.diagData = bytearray(buffer[offset + 4:offset + 64])
+        (self.nextIndex,self.reserved_16,) = _struct_HH.unpack_from(buffer,offset+0)
+
+class _SMPVendorDiagView(rdma.binstruct.BinStructView,SMPVendorDiag):
+    '''Read only view of a packed :class:`SMPVendorDiag`'''
+    __slots__ = ('_buf','_off')
+    nextIndex = property(lambda self:_struct_H.unpack_from(self._buf,self._off)[0])
+    reserved_16 = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 2)[0])
+    diagData = property(lambda self:bytearray(self._buf[self._off + 4:self._off + 64]))
+SMPVendorDiag.View = _SMPVendorDiagView
+
+class SMPLedInfo(rdma.binstruct.BinStruct):
+    '''Turn on/off LED (section 14.2.5.15)'''
+    __slots__ = ('ledMask','reserved_1')
+    MAD_LENGTH = 4
+    MAD_ATTRIBUTE_ID = 0x31
+    MAD_SUBNGET = 0x1 # MAD_METHOD_GET
+    MAD_SUBNSET = 0x2 # MAD_METHOD_SET
+    MEMBERS = [('ledMask',1,1), ('reserved_1',31,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.ledMask = 0
+        self.reserved_1 = 0
+
+    def pack_into(self,buffer,offset=0):
+        _struct_L.pack_into(buffer,offset+0,((self.ledMask & 0x1) << 31) | (self.reserved_1 & 0x7FFFFFFF))
+
+    def unpack_from(self,buffer,offset=0):
+        (w0,) = _struct_L.unpack_from(buffer,offset+0)
+        self.ledMask = w0 >> 31
+        self.reserved_1 = w0 & 0x7FFFFFFF
+
+class _SMPLedInfoView(rdma.binstruct.BinStructView,SMPLedInfo):
+    '''Read only view of a packed :class:`SMPLedInfo`'''
+    __slots__ = ('_buf','_off')
+    ledMask = property(lambda self:_struct_L.unpack_from(self._buf,self._off)[0] >> 31)
+    reserved_1 = property(lambda self:_struct_L.unpack_from(self._buf,self._off)[0] & 0x7FFFFFFF)
+SMPLedInfo.View = _SMPLedInfoView
+
+class SMPNoticeTrap(rdma.binstruct.BinStruct):
+    '''Notice (section 13.4.8.2)'''
+    __slots__ = ('isGeneric','noticeType','nodeType','trapNumber','issuerLID','noticeToggle','noticeCount','dataDetails','dataDetails2')
+    MAD_LENGTH = 64
+    MAD_ATTRIBUTE_ID = 0x2
+    MAD_SUBNTRAP = 0x5 # MAD_METHOD_TRAP
+    MAD_SUBNTRAPREPRESS = 0x7 # MAD_METHOD_TRAP_REPRESS
+    MEMBERS = [('isGeneric',1,1), ('noticeType',7,1), ('nodeType',24,1), ('trapNumber',16,1), ('issuerLID',16,1), ('noticeToggle',1,1), ('noticeCount',15,1), ('dataDetails',16,1), ('dataDetails2',16,26)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        self.dataDetails2 = [0]*26
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.isGeneric = 0
+        self.noticeType = 0
+        self.nodeType = 0
+        self.trapNumber = 0
+        self.issuerLID = 0
+        self.noticeToggle = 0
+        self.noticeCount = 0
+        self.dataDetails = 0
+        self.dataDetails2 = [0]*26
+
+    def pack_into(self,buffer,offset=0):
+        _struct_LHHLHHHHHHHHHHHHHHHHHHHHHHHHHH.pack_into(buffer,offset+0,((self.isGeneric & 0x1) << 31) | ((self.noticeType & 0x7F) << 24) | (self.nodeType & 0xFFFFFF),self.trapNumber,self.issuerLID,((self.noticeToggle & 0x1) << 31) | ((self.noticeCount & 0x7FFF) << 16) | (self.dataDetails & 0xFFFF),self.dataDetails2[0],self.dataDetails2[1],self.dataDetails2[2],self.dataDetails2[3],self.dataDetails2[4],self.dataDetails2[5],self.dataDetails2[6],self.dataDetails2[7],self.dataDetails2[8],self.dataDetails2[9],self.dataDetails2[10],self.dataDetails2[11],self.dataDetails2[12],self.dataDetails2[13],self.dataDetails2[14],self.dataDetails2[15],self.dataDetails2[16],self.dataDetails2[17],self.dataDetails2[18],self.dataDetails2[19],self.dataDetails2[20],self.dataDetails2[21],self.dataDetails2[22],self.dataDetails2[23],self.dataDetails2[24],self.dataDetails2[25])
+
+    def unpack_from(self,buffer,offset=0):
+        (w0,self.trapNumber,self.issuerLID,w1,self.dataDetails2[0],self.dataDetails2[1],self.dataDetails2[2],self.dataDetails2[3],self.dataDetails2[4],self.dataDetails2[5],self.dataDetails2[6],self.dataDetails2[7],self.dataDetails2[8],self.dataDetails2[9],self.dataDetails2[10],self.dataDetails2[11],self.dataDetails2[12],self.dataDetails2[13],self.dataDetails2[14],self.dataDetails2[15],self.dataDetails2[16],self.dataDetails2[17],self.dataDetails2[18],self.dataDetails2[19],self.dataDetails2[20],self.dataDetails2[21],self.dataDetails2[22],self.dataDetails2[23],self.dataDetails2[24],self.dataDetails2[25],) = _struct_LHHLHHHHHHHHHHHHHHHHHHHHHHHHHH.unpack_from(buffer,offset+0)
+        self.isGeneric = w0 >> 31
+        self.noticeType = (w0 >> 24) & 0x7F
+        self.nodeType = w0 & 0xFFFFFF
+        self.noticeToggle = w1 >> 31
+        self.noticeCount = (w1 >> 16) & 0x7FFF
+        self.dataDetails = w1 & 0xFFFF
+
+class _SMPNoticeTrapView(rdma.binstruct.BinStructView,SMPNoticeTrap):
+    '''Read only view of a packed :class:`SMPNoticeTrap`'''
+    __slots__ = ('_buf','_off')
+    isGeneric = property(lambda self:_struct_L.unpack_from(self._buf,self._off)[0] >> 31)
+    noticeType = property(lambda self:(_struct_L.unpack_from(self._buf,self._off)[0] >> 24) & 0x7F)
+    nodeType = property(lambda self:_struct_L.unpack_from(self._buf,self._off)[0] & 0xFFFFFF)
+    trapNumber = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 4)[0])
+    issuerLID = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 6)[0])
+    noticeToggle = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 8)[0] >> 31)
+    noticeCount = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 8)[0] >> 16) & 0x7FFF)
+    dataDetails = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 8)[0] & 0xFFFF)
+    dataDetails2 = property(lambda self:list(_struct_HHHHHHHHHHHHHHHHHHHHHHHHHH.unpack_from(self._buf,self._off + 12)))
+SMPNoticeTrap.View = _SMPNoticeTrapView
+
@@ -0,0 +1,1183 @@
+import rdma.binstruct
+import struct
+import rdma.IBA as IBA
+
+_struct_BBBBHHQHHLLLLQHHQ = struct.Struct('>BBBBHHQHHLLLLQHHQ')
+_struct_H = struct.Struct('>H')
+_struct_HBB = struct.Struct('>HBB')
+_struct_HBBHH = struct.Struct('>HBBHH')
+_struct_HBBL = struct.Struct('>HBBL')
+_struct_HH = struct.Struct('>HH')
+_struct_HHHHHHHH = struct.Struct('>HHHHHHHH')
+_struct_HHHHHHHHLLLL = struct.Struct('>HHHHHHHHLLLL')
+_struct_HHL = struct.Struct('>HHL')
+_struct_HHLLLLL = struct.Struct('>HHLLLLL')
+_struct_L = struct.Struct('>L')
+_struct_LL = struct.Struct('>LL')
+_struct_LLLL = struct.Struct('>LLLL')
+_struct_LLLLL = struct.Struct('>LLLLL')
+_struct_LLLLLL = struct.Struct('>LLLLLL')
+_struct_Q = struct.Struct('>Q')
+_struct_QHBBQQQQBBH = struct.Struct('>QHBBQQQQBBH')
+
+class SAHeader(rdma.binstruct.BinStruct):
+    '''SA Header (section 15.2.1.1)'''
+    __slots__ = ('baseVersion','mgmtClass','classVersion','method','status','classSpecific','transactionID','attributeID','reserved_144','attributeModifier','RMPPVersion','RMPPType','RRespTime','RMPPFlags','RMPPStatus','data1','data2','SMKey','attributeOffset','reserved_368','componentMask')
+    MAD_LENGTH = 56
+    MAD_CLASS = 0x3
+    MAD_CLASS_VERSION = 0x2
+    MEMBERS = [('baseVersion',8,1), ('mgmtClass',8,1), ('classVersion',8,1), ('method',8,1), ('status',16,1), ('classSpecific',16,1), ('transactionID',64,1), ('attributeID',16,1), ('reserved_144',16,1), ('attributeModifier',32,1), ('RMPPVersion',8,1), ('RMPPType',8,1), ('RRespTime',5,1), ('RMPPFlags',3,1), ('RMPPStatus',8,1), ('data1',32,1), ('data2',32,1), ('SMKey',64,1), ('attributeOffset',16,1), ('reserved_368',16,1), ('componentMask',64,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.baseVersion = 0
+        self.mgmtClass = 0
+        self.classVersion = 0
+        self.method = 0
+        self.status = 0
+        self.classSpecific = 0
+        self.transactionID = 0
+        self.attributeID = 0
+        self.reserved_144 = 0
+        self.attributeModifier = 0
+        self.RMPPVersion = 0
+        self.RMPPType = 0
+        self.RRespTime = 0
+        self.RMPPFlags = 0
+        self.RMPPStatus = 0
+        self.data1 = 0
+        self.data2 = 0
+        self.SMKey = 0
+        self.attributeOffset = 0
+        self.reserved_368 = 0
+        self.componentMask = 0
+
+    def pack_into(self,buffer,offset=0):
+        _struct_BBBBHHQHHLLLLQHHQ.pack_into(buffer,offset+0,self.baseVersion,self.mgmtClass,self.classVersion,self.method,self.status,self.classSpecific,self.transactionID,self.attributeID,self.reserved_144,self.attributeModifier,((self.RMPPVersion & 0xFF) << 24) | ((self.RMPPType & 0xFF) << 16) | ((self.RRespTime & 0x1F) << 11) | ((self.RMPPFlags & 0x7) << 8) | (self.RMPPStatus & 0xFF),self.data1,self.data2,self.SMKey,self.attributeOffset,self.reserved_368,self.componentMask)
+
+    def unpack_from(self,buffer,offset=0):
+        (self.baseVersion,self.mgmtClass,self.classVersion,self.method,self.status,self.classSpecific,self.transactionID,self.attributeID,self.reserved_144,self.attributeModifier,w0,self.data1,self.data2,self.SMKey,self.attributeOffset,self.reserved_368,self.componentMask,) = _struct_BBBBHHQHHLLLLQHHQ.unpack_from(buffer,offset+0)
+        self.RMPPVersion = w0 >> 24
+        self.RMPPType = (w0 >> 16) & 0xFF
+        self.RRespTime = (w0 >> 11) & 0x1F
+        self.RMPPFlags = (w0 >> 8) & 0x7
+        self.RMPPStatus = w0 & 0xFF
+
+class _SAHeaderView(rdma.binstruct.BinStructView,SAHeader):
+    '''Read only view of a packed :class:`SAHeader`'''
+    __slots__ = ('_buf','_off')
+    baseVersion = property(lambda self:self._buf[self._off])
+    mgmtClass = property(lambda self:self._buf[self._off + 1])
+    classVersion = property(lambda self:self._buf[self._off + 2])
+    method = property(lambda self:self._buf[self._off + 3])
+    status = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 4)[0])
+    classSpecific = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 6)[0])
+    transactionID = property(lambda self:_struct_Q.unpack_from(self._buf,self._off + 8)[0])
+    attributeID = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 16)[0])
+    reserved_144 = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 18)[0])
+    attributeModifier = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 20)[0])
+    RMPPVersion = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 24)[0] >> 24)
+    RMPPType = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 24)[0] >> 16) & 0xFF)
+    RRespTime = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 24)[0] >> 11) & 0x1F)
+    RMPPFlags = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 24)[0] >> 8) & 0x7)
+    RMPPStatus = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 24)[0] & 0xFF)
+    data1 = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 28)[0])
+    data2 = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 32)[0])
+    SMKey = property(lambda self:_struct_Q.unpack_from(self._buf,self._off + 36)[0])
+    attributeOffset = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 44)[0])
+    reserved_368 = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 46)[0])
+    componentMask = property(lambda self:_struct_Q.unpack_from(self._buf,self._off + 48)[0])
+SAHeader.View = _SAHeaderView
+
+class SAFormat(rdma.binstruct.BinFormat):
+    '''SA Format (section 15.2.1.1)'''
+    __slots__ = ('baseVersion','mgmtClass','classVersion','method','status','classSpecific','transactionID','attributeID','reserved_144','attributeModifier','RMPPVersion','RMPPType','RRespTime','RMPPFlags','RMPPStatus','data1','data2','SMKey','attributeOffset','reserved_368','componentMask','data')
+    MAD_LENGTH = 256
+    MAD_CLASS = 0x3
+    MAD_CLASS_VERSION = 0x2
+    MEMBERS = [('baseVersion',8,1), ('mgmtClass',8,1), ('classVersion',8,1), ('method',8,1), ('status',16,1), ('classSpecific',16,1), ('transactionID',64,1), ('attributeID',16,1), ('reserved_144',16,1), ('attributeModifier',32,1), ('RMPPVersion',8,1), ('RMPPType',8,1), ('RRespTime',5,1), ('RMPPFlags',3,1), ('RMPPStatus',8,1), ('data1',32,1), ('data2',32,1), ('SMKey',64,1), ('attributeOffset',16,1), ('reserved_368',16,1), ('componentMask',64,1), ('data',1600,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.baseVersion = 0
+        self.mgmtClass = 0
+        self.classVersion = 0
+        self.method = 0
+        self.status = 0
+        self.classSpecific = 0
+        self.transactionID = 0
+        self.attributeID = 0
+        self.reserved_144 = 0
+        self.attributeModifier = 0
+        self.RMPPVersion = 0
+        self.RMPPType = 0
+        self.RRespTime = 0
+        self.RMPPFlags = 0
+        self.RMPPStatus = 0
+        self.data1 = 0
+        self.data2 = 0
+        self.SMKey = 0
+        self.attributeOffset = 0
+        self.reserved_368 = 0
+        self.componentMask = 0
+        self.data = bytearray(200)
+
+    def pack_into(self,buffer,offset=0):
+        buffer[offset + 56:offset + 256] = self.data
+        _struct_BBBBHHQHHLLLLQHHQ.pack_into(buffer,offset+0,self.baseVersion,self.mgmtClass,self.classVersion,self.method,self.status,self.classSpecific,self.transactionID,self.attributeID,self.reserved_144,self.attributeModifier,((self.RMPPVersion & 0xFF) << 24) | ((self.RMPPType & 0xFF) << 16) | ((self.RRespTime & 0x1F) << 11) | ((self.RMPPFlags & 0x7) << 8) | (self.RMPPStatus & 0xFF),self.data1,self.data2,self.SMKey,self.attributeOffset,self.reserved_368,self.componentMask)
+
+    def unpack_from(self,buffer,offset=0):
+        self.data = bytearray(buffer[offset + 56:offset + 256])
+        (self.baseVersion,self.mgmtClass,self.classVersion,self.method,self.status,self.classSpecific,self.transactionID,self.attributeID,self.reserved_144,self.attributeModifier,w0,self.data1,self.data2,self.SMKey,self.attributeOffset,self.reserved_368,self.componentMask,) = _struct_BBBBHHQHHLLLLQHHQ.unpack_from(buffer,offset+0)
+        self.RMPPVersion = w0 >> 24
+        self.RMPPType = (w0 >> 16) & 0xFF
+        self.RRespTime = (w0 >> 11) & 0x1F
+        self.RMPPFlags = (w0 >> 8) & 0x7
+        self.RMPPStatus = w0 & 0xFF
+
+class SANodeRecord(rdma.binstruct.BinStruct):
+    '''Container for NodeInfo (section 15.2.5.2)'''
+    __slots__ = ('LID','reserved_16','nodeInfo','nodeDescription')
+    MAD_LENGTH = 108
+    MAD_ATTRIBUTE_ID = 0x11
+    MAD_SUBNADMGET = 0x1 # MAD_METHOD_GET
+    MAD_SUBNADMGETTABLE = 0x12 # MAD_METHOD_GET_TABLE
+    COMPONENT_MASK = {'LID':0, 'reserved_16':1, 'nodeInfo.baseVersion':2, 'nodeInfo.classVersion':3, 'nodeInfo.nodeType':4, 'nodeInfo.numPorts':5, 'nodeInfo.systemImageGUID':6, 'nodeInfo.nodeGUID':7, 'nodeInfo.portGUID':8, 'nodeInfo.partitionCap':9, 'nodeInfo.deviceID':10, 'nodeInfo.revision':11, 'nodeInfo.localPortNum':12, 'nodeInfo.vendorID':13, 'nodeDescription.nodeString':14}
+    MEMBERS = [('LID',16,1), ('reserved_16',16,1), ('nodeInfo',320,1), ('nodeDescription',512,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        self.nodeInfo = IBA.SMPNodeInfo()
+        self.nodeDescription = IBA.SMPNodeDescription()
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.LID = 0
+        self.reserved_16 = 0
+        self.nodeInfo = IBA.SMPNodeInfo()
+        self.nodeDescription = IBA.SMPNodeDescription()
+
+    def pack_into(self,buffer,offset=0):
+        self.nodeInfo.pack_into(buffer,offset + 4)
+        self.nodeDescription.pack_into(buffer,offset + 44)
+        _struct_HH.pack_into(buffer,offset+0,self.LID,self.reserved_16)
+
+    def unpack_from(self,buffer,offset=0):
+        self.nodeInfo.unpack_from(buffer,offset + 4)
+        self.nodeDescription.unpack_from(buffer,offset + 44)
+        (self.LID,self.reserved_16,) = _struct_HH.unpack_from(buffer,offset+0)
+
+class _SANodeRecordView(rdma.binstruct.BinStructView,SANodeRecord):
+    '''Read only view of a packed :class:`SANodeRecord`'''
+    __slots__ = ('_buf','_off')
+    LID = property(lambda self:_struct_H.unpack_from(self._buf,self._off)[0])
+    reserved_16 = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 2)[0])
+    nodeInfo = property(lambda self:IBA.SMPNodeInfo.View(self._buf,self._off + 4))
+    nodeDescription = property(lambda self:IBA.SMPNodeDescription.View(self._buf,self._off + 44))
+SANodeRecord.View = _SANodeRecordView
+
+class SAPortInfoRecord(rdma.binstruct.BinStruct):
+    '''Container for PortInfo (section 15.2.5.3)'''
+    __slots__ = ('endportLID','portNum','reserved_24','portInfo')
+    MAD_LENGTH = 68
+    MAD_ATTRIBUTE_ID = 0x12
+    MAD_SUBNADMGET = 0x1 # MAD_METHOD_GET
+    MAD_SUBNADMGETTABLE = 0x12 # MAD_METHOD_GET_TABLE
+    COMPONENT_MASK = {'endportLID':0, 'portNum':1, 'reserved_24':2, 'portInfo.MKey':3, 'portInfo.GIDPrefix':4, 'portInfo.LID':5, 'portInfo.masterSMLID':6, 'portInfo.capabilityMask':7, 'portInfo.diagCode':8, 'portInfo.MKeyLeasePeriod':9, 'portInfo.localPortNum':10, 'portInfo.linkWidthEnabled':11, 'portInfo.linkWidthSupported':12, 'portInfo.linkWidthActive':13, 'portInfo.linkSpeedSupported':14, 'portInfo.portState':15, 'portInfo.portPhysicalState':16, 'portInfo.linkDownDefaultState':17, 'portInfo.MKeyProtectBits':18, 'portInfo.reserved_274':19, 'portInfo.LMC':20, 'portInfo.linkSpeedActive':21, 'portInfo.linkSpeedEnabled':22, 'portInfo.neighborMTU':23, 'portInfo.masterSMSL':24, 'portInfo.VLCap':25, 'portInfo.initType':26, 'portInfo.VLHighLimit':27, 'portInfo.VLArbitrationHighCap':28, 'portInfo.VLArbitrationLowCap':29, 'portInfo.initTypeReply':30, 'portInfo.MTUCap':31, 'portInfo.VLStallCount':32, 'portInfo.HOQLife':33, 'portInfo.operationalVLs':34, 'portInfo.partitionEnforcementInbound':35, 'portInfo.partitionEnforcementOutbound':36, 'portInfo.filterRawInbound':37, 'portInfo.filterRawOutbound':38, 'portInfo.MKeyViolations':39, 'portInfo.PKeyViolations':40, 'portInfo.QKeyViolations':41, 'portInfo.GUIDCap':42, 'portInfo.clientReregister':43, 'portInfo.multicastPKeyTrapSuppressionEnabled':44, 'portInfo.subnetTimeOut':45, 'portInfo.reserved_416':46, 'portInfo.respTimeValue':47, 'portInfo.localPhyErrors':48, 'portInfo.overrunErrors':49, 'portInfo.maxCreditHint':50, 'portInfo.reserved_448':51, 'portInfo.linkRoundTripLatency':52, 'portInfo.capabilityMask2':53, 'portInfo.linkSpeedExtActive':54, 'portInfo.linkSpeedExtSupported':55, 'portInfo.reserved_504':56, 'portInfo.linkSpeedExtEnabled':57}
+    MEMBERS = [('endportLID',16,1), ('portNum',8,1), ('reserved_24',8,1), ('portInfo',512,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        self.portInfo = IBA.SMPPortInfo()
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.endportLID = 0
+        self.portNum = 0
+        self.reserved_24 = 0
+        self.portInfo = IBA.SMPPortInfo()
+
+    def pack_into(self,buffer,offset=0):
+        self.portInfo.pack_into(buffer,offset + 4)
+        _struct_HBB.pack_into(buffer,offset+0,self.endportLID,self.portNum,self.reserved_24)
+
+    def unpack_from(self,buffer,offset=0):
+        self.portInfo.unpack_from(buffer,offset + 4)
+        (self.endportLID,self.portNum,self.reserved_24,) = _struct_HBB.unpack_from(buffer,offset+0)
+
+class _SAPortInfoRecordView(rdma.binstruct.BinStructView,SAPortInfoRecord):
+    '''Read only view of a packed :class:`SAPortInfoRecord`'''
+    __slots__ = ('_buf','_off')
+    endportLID = property(lambda self:_struct_H.unpack_from(self._buf,self._off)[0])
+    portNum = property(lambda self:self._buf[self._off + 2])
+    reserved_24 = property(lambda self:self._buf[self._off + 3])
+    portInfo = property(lambda self:IBA.SMPPortInfo.View(self._buf,self._off + 4))
+SAPortInfoRecord.View = _SAPortInfoRecordView
+
+class SASLToVLMappingTableRecord(rdma.binstruct.BinStruct):
+    '''Container for SLtoVLMappingTable entry (section 15.2.5.4)'''
+    __slots__ = ('LID','inputPortNum','outputPortNum','reserved_32','SLToVLMappingTable')
+    MAD_LENGTH = 16
+    MAD_ATTRIBUTE_ID = 0x13
+    MAD_SUBNADMGET = 0x1 # MAD_METHOD_GET
+    MAD_SUBNADMGETTABLE = 0x12 # MAD_METHOD_GET_TABLE
+    COMPONENT_MASK = {'LID':0, 'inputPortNum':1, 'outputPortNum':2, 'reserved_32':3, 'SLToVLMappingTable.SLtoVL':4}
+    MEMBERS = [('LID',16,1), ('inputPortNum',8,1), ('outputPortNum',8,1), ('reserved_32',32,1), ('SLToVLMappingTable',64,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        self.SLToVLMappingTable = IBA.SMPSLToVLMappingTable()
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.LID = 0
+        self.inputPortNum = 0
+        self.outputPortNum = 0
+        self.reserved_32 = 0
+        self.SLToVLMappingTable = IBA.SMPSLToVLMappingTable()
+
+    def pack_into(self,buffer,offset=0):
+        self.SLToVLMappingTable.pack_into(buffer,offset + 8)
+        _struct_HBBL.pack_into(buffer,offset+0,self.LID,self.inputPortNum,self.outputPortNum,self.reserved_32)
+
+    def unpack_from(self,buffer,offset=0):
+        self.SLToVLMappingTable.unpack_from(buffer,offset + 8)
+        (self.LID,self.inputPortNum,self.outputPortNum,self.reserved_32,) = _struct_HBBL.unpack_from(buffer,offset+0)
+
+class _SASLToVLMappingTableRecordView(rdma.binstruct.BinStructView,SASLToVLMappingTableRecord):
+    '''Read only view of a packed :class:`SASLToVLMappingTableRecord`'''
+    __slots__ = ('_buf','_off')
+    LID = property(lambda self:_struct_H.unpack_from(self._buf,self._off)[0])
+    inputPortNum = property(lambda self:self._buf[self._off + 2])
+    outputPortNum = property(lambda self:self._buf[self._off + 3])
+    reserved_32 = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 4)[0])
+    SLToVLMappingTable = property(lambda self:IBA.SMPSLToVLMappingTable.View(self._buf,self._off + 8))
+SASLToVLMappingTableRecord.View = _SASLToVLMappingTableRecordView
+
+class SASwitchInfoRecord(rdma.binstruct.BinStruct):
+    '''Container for SwitchInfo (section 15.2.5.5)'''
+    __slots__ = ('LID','reserved_16','switchInfo')
+    MAD_LENGTH = 24
+    MAD_ATTRIBUTE_ID = 0x14
+    MAD_SUBNADMGET = 0x1 # MAD_METHOD_GET
+    MAD_SUBNADMGETTABLE = 0x12 # MAD_METHOD_GET_TABLE
+    COMPONENT_MASK = {'LID':0, 'reserved_16':1, 'switchInfo.linearFDBCap':2, 'switchInfo.randomFDBCap':3, 'switchInfo.multicastFDBCap':4, 'switchInfo.linearFDBTop':5, 'switchInfo.defaultPort':6, 'switchInfo.defaultMulticastPrimaryPort':7, 'switchInfo.defaultMulticastNotPrimaryPort':8, 'switchInfo.lifeTimeValue':9, 'switchInfo.portStateChange':10, 'switchInfo.optimizedSLtoVLMappingProgramming':11, 'switchInfo.LIDsPerPort':12, 'switchInfo.partitionEnforcementCap':13, 'switchInfo.inboundEnforcementCap':14, 'switchInfo.outboundEnforcementCap':15, 'switchInfo.filterRawInboundCap':16, 'switchInfo.filterRawOutboundCap':17, 'switchInfo.enhancedPort0':18, 'switchInfo.reserved_133':19, 'switchInfo.reserved_136':20, 'switchInfo.multicastFDBTop':21}
+    MEMBERS = [('LID',16,1), ('reserved_16',16,1), ('switchInfo',160,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        self.switchInfo = IBA.SMPSwitchInfo()
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.LID = 0
+        self.reserved_16 = 0
+        self.switchInfo = IBA.SMPSwitchInfo()
+
+    def pack_into(self,buffer,offset=0):
+        self.switchInfo.pack_into(buffer,offset + 4)
+        _struct_HH.pack_into(buffer,offset+0,self.LID,self.reserved_16)
+
+    def unpack_from(self,buffer,offset=0):
+        self.switchInfo.unpack_from(buffer,offset + 4)
+        (self.LID,self.reserved_16,) = _struct_HH.unpack_from(buffer,offset+0)
+
+class _SASwitchInfoRecordView(rdma.binstruct.BinStructView,SASwitchInfoRecord):
+    '''Read only view of a packed :class:`SASwitchInfoRecord`'''
+    __slots__ = ('_buf','_off')
+    LID = property(lambda self:_struct_H.unpack_from(self._buf,self._off)[0])
+    reserved_16 = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 2)[0])
+    switchInfo = property(lambda self:IBA.SMPSwitchInfo.View(self._buf,self._off + 4))
+SASwitchInfoRecord.View = _SASwitchInfoRecordView
+
+class SALinearForwardingTableRecord(rdma.binstruct.BinStruct):
+    '''Container for LinearForwardingTable entry (section 15.2.5.6)'''
+    __slots__ = ('LID','blockNum','reserved_32','linearForwardingTable')
+    MAD_LENGTH = 72
+    MAD_ATTRIBUTE_ID = 0x15
+    MAD_SUBNADMGET = 0x1 # MAD_METHOD_GET
+    MAD_SUBNADMGETTABLE = 0x12 # MAD_METHOD_GET_TABLE
+    COMPONENT_MASK = {'LID':0, 'blockNum':1, 'reserved_32':2, 'linearForwardingTable.portBlock':3}
+    MEMBERS = [('LID',16,1), ('blockNum',16,1), ('reserved_32',32,1), ('linearForwardingTable',512,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        self.linearForwardingTable = IBA.SMPLinearForwardingTable()
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.LID = 0
+        self.blockNum = 0
+        self.reserved_32 = 0
+        self.linearForwardingTable = IBA.SMPLinearForwardingTable()
+
+    def pack_into(self,buffer,offset=0):
+        self.linearForwardingTable.pack_into(buffer,offset + 8)
+        _struct_HHL.pack_into(buffer,offset+0,self.LID,self.blockNum,self.reserved_32)
+
+    def unpack_from(self,buffer,offset=0):
+        self.linearForwardingTable.unpack_from(buffer,offset + 8)
+        (self.LID,self.blockNum,self.reserved_32,) = _struct_HHL.unpack_from(buffer,offset+0)
+
+class _SALinearForwardingTableRecordView(rdma.binstruct.BinStructView,SALinearForwardingTableRecord):
+    '''Read only view of a packed :class:`SALinearForwardingTableRecord`'''
+    __slots__ = ('_buf','_off')
+    LID = property(lambda self:_struct_H.unpack_from(self._buf,self._off)[0])
+    blockNum = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 2)[0])
+    reserved_32 = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 4)[0])
+    linearForwardingTable = property(lambda self:IBA.SMPLinearForwardingTable.View(self._buf,self._off + 8))
+SALinearForwardingTableRecord.View = _SALinearForwardingTableRecordView
+
+class SARandomForwardingTableRecord(rdma.binstruct.BinStruct):
+    '''Container for RandomForwardingTable entry (section 15.2.5.7)'''
+    __slots__ = ('LID','blockNum','reserved_32','randomForwardingTable')
+    MAD_LENGTH = 72
+    MAD_ATTRIBUTE_ID = 0x16
+    MAD_SUBNADMGET = 0x1 # MAD_METHOD_GET
+    MAD_SUBNADMGETTABLE = 0x12 # MAD_METHOD_GET_TABLE
+    COMPONENT_MASK = {'LID':0, 'blockNum':1, 'reserved_32':2, 'randomForwardingTable.LIDPortBlock':3}
+    MEMBERS = [('LID',16,1), ('blockNum',16,1), ('reserved_32',32,1), ('randomForwardingTable',512,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        self.randomForwardingTable = IBA.SMPRandomForwardingTable()
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.LID = 0
+        self.blockNum = 0
+        self.reserved_32 = 0
+        self.randomForwardingTable = IBA.SMPRandomForwardingTable()
+
+    def pack_into(self,buffer,offset=0):
+        self.randomForwardingTable.pack_into(buffer,offset + 8)
+        _struct_HHL.pack_into(buffer,offset+0,self.LID,self.blockNum,self.reserved_32)
+
+    def unpack_from(self,buffer,offset=0):
+        self.randomForwardingTable.unpack_from(buffer,offset + 8)
+        (self.LID,self.blockNum,self.reserved_32,) = _struct_HHL.unpack_from(buffer,offset+0)
+
+class _SARandomForwardingTableRecordView(rdma.binstruct.BinStructView,SARandomForwardingTableRecord):
+    '''Read only view of a packed :class:`SARandomForwardingTableRecord`'''
+    __slots__ = ('_buf','_off')
+    LID = property(lambda self:_struct_H.unpack_from(self._buf,self._off)[0])
+    blockNum = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 2)[0])
+    reserved_32 = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 4)[0])
+    randomForwardingTable = property(lambda self:IBA.SMPRandomForwardingTable.View(self._buf,self._off + 8))
+SARandomForwardingTableRecord.View = _SARandomForwardingTableRecordView
+
+class SAMulticastForwardingTableRecord(rdma.binstruct.BinStruct):
+    '''Container for MulticastForwardingTable entry (section 15.2.5.8)'''
+    __slots__ = ('LID','reserved_16','position','blockNum','reserved_32','multicastForwardingTable')
+    MAD_LENGTH = 72
+    MAD_ATTRIBUTE_ID = 0x17
+    MAD_SUBNADMGET = 0x1 # MAD_METHOD_GET
+    MAD_SUBNADMGETTABLE = 0x12 # MAD_METHOD_GET_TABLE
+    COMPONENT_MASK = {'LID':0, 'reserved_16':1, 'position':2, 'blockNum':3, 'reserved_32':4, 'multicastForwardingTable.portMaskBlock':5}
+    MEMBERS = [('LID',16,1), ('reserved_16',2,1), ('position',4,1), ('blockNum',10,1), ('reserved_32',32,1), ('multicastForwardingTable',512,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        self.multicastForwardingTable = IBA.SMPMulticastForwardingTable()
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.LID = 0
+        self.reserved_16 = 0
+        self.position = 0
+        self.blockNum = 0
+        self.reserved_32 = 0
+        self.multicastForwardingTable = IBA.SMPMulticastForwardingTable()
+
+    def pack_into(self,buffer,offset=0):
+        self.multicastForwardingTable.pack_into(buffer,offset + 8)
+        _struct_LL.pack_into(buffer,offset+0,((self.LID & 0xFFFF) << 16) | ((self.reserved_16 & 0x3) << 14) | ((self.position & 0xF) << 10) | (self.blockNum & 0x3FF),self.reserved_32)
+
+    def unpack_from(self,buffer,offset=0):
+        self.multicastForwardingTable.unpack_from(buffer,offset + 8)
+        (w0,self.reserved_32,) = _struct_LL.unpack_from(buffer,offset+0)
+        self.LID = w0 >> 16
+        self.reserved_16 = (w0 >> 14) & 0x3
+        self.position = (w0 >> 10) & 0xF
+        self.blockNum = w0 & 0x3FF
+
+class _SAMulticastForwardingTableRecordView(rdma.binstruct.BinStructView,SAMulticastForwardingTableRecord):
+    '''Read only view of a packed :class:`SAMulticastForwardingTableRecord`'''
+    __slots__ = ('_buf','_off')
+    LID = property(lambda self:_struct_L.unpack_from(self._buf,self._off)[0] >> 16)
+    reserved_16 = property(lambda self:(_struct_L.unpack_from(self._buf,self._off)[0] >> 14) & 0x3)
+    position = property(lambda self:(_struct_L.unpack_from(self._buf,self._off)[0] >> 10) & 0xF)
+    blockNum = property(lambda self:_struct_L.unpack_from(self._buf,self._off)[0] & 0x3FF)
+    reserved_32 = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 4)[0])
+    multicastForwardingTable = property(lambda self:IBA.SMPMulticastForwardingTable.View(self._buf,self._off + 8))
+SAMulticastForwardingTableRecord.View = _SAMulticastForwardingTableRecordView
+
+class SAVLArbitrationTableRecord(rdma.binstruct.BinStruct):
+    '''Container for VLArbitrationTable entry (section 15.2.5.9)'''
+    __slots__ = ('LID','outputPortNum','blockNum','reserved_32','VLArbitrationTable')
+    MAD_LENGTH = 72
+    MAD_ATTRIBUTE_ID = 0x36
+    MAD_SUBNADMGET = 0x1 # MAD_METHOD_GET
+    MAD_SUBNADMGETTABLE = 0x12 # MAD_METHOD_GET_TABLE
+    COMPONENT_MASK = {'LID':0, 'outputPortNum':1, 'blockNum':2, 'reserved_32':3, 'VLArbitrationTable.VLWeightBlock':4}
+    MEMBERS = [('LID',16,1), ('outputPortNum',8,1), ('blockNum',8,1), ('reserved_32',32,1), ('VLArbitrationTable',512,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        self.VLArbitrationTable = IBA.SMPVLArbitrationTable()
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.LID = 0
+        self.outputPortNum = 0
+        self.blockNum = 0
+        self.reserved_32 = 0
+        self.VLArbitrationTable = IBA.SMPVLArbitrationTable()
+
+    def pack_into(self,buffer,offset=0):
+        self.VLArbitrationTable.pack_into(buffer,offset + 8)
+        _struct_HBBL.pack_into(buffer,offset+0,self.LID,self.outputPortNum,self.blockNum,self.reserved_32)
+
+    def unpack_from(self,buffer,offset=0):
+        self.VLArbitrationTable.unpack_from(buffer,offset + 8)
+        (self.LID,self.outputPortNum,self.blockNum,self.reserved_32,) = _struct_HBBL.unpack_from(buffer,offset+0)
+
+class _SAVLArbitrationTableRecordView(rdma.binstruct.BinStructView,SAVLArbitrationTableRecord):
+    '''Read only view of a packed :class:`SAVLArbitrationTableRecord`'''
+    __slots__ = ('_buf','_off')
+    LID = property(lambda self:_struct_H.unpack_from(self._buf,self._off)[0])
+    outputPortNum = property(lambda self:self._buf[self._off + 2])
+    blockNum = property(lambda self:self._buf[self._off + 3])
+    reserved_32 = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 4)[0])
+    VLArbitrationTable = property(lambda self:IBA.SMPVLArbitrationTable.View(self._buf,self._off + 8))
+SAVLArbitrationTableRecord.View = _SAVLArbitrationTableRecordView
+
+class SASMInfoRecord(rdma.binstruct.BinStruct):
+    '''Container for SMInfo (section 15.2.5.10)'''
+    __slots__ = ('LID','reserved_16','SMInfo')
+    MAD_LENGTH = 28
+    MAD_ATTRIBUTE_ID = 0x18
+    MAD_SUBNADMGET = 0x1 # MAD_METHOD_GET
+    MAD_SUBNADMGETTABLE = 0x12 # MAD_METHOD_GET_TABLE
+    COMPONENT_MASK = {'LID':0, 'reserved_16':1, 'SMInfo.GUID':2, 'SMInfo.SMKey':3, 'SMInfo.actCount':4, 'SMInfo.priority':5, 'SMInfo.SMState':6, 'SMInfo.reserved_168':7}
+    MEMBERS = [('LID',16,1), ('reserved_16',16,1), ('SMInfo',192,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        self.SMInfo = IBA.SMPSMInfo()
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.LID = 0
+        self.reserved_16 = 0
+        self.SMInfo = IBA.SMPSMInfo()
+
+    def pack_into(self,buffer,offset=0):
+        self.SMInfo.pack_into(buffer,offset + 4)
+        _struct_HH.pack_into(buffer,offset+0,self.LID,self.reserved_16)
+
+    def unpack_from(self,buffer,offset=0):
+        self.SMInfo.unpack_from(buffer,offset + 4)
+        (self.LID,self.reserved_16,) = _struct_HH.unpack_from(buffer,offset+0)
+
+class _SASMInfoRecordView(rdma.binstruct.BinStructView,SASMInfoRecord):
+    '''Read only view of a packed :class:`SASMInfoRecord`'''
+    __slots__ = ('_buf','_off')
+    LID = property(lambda self:_struct_H.unpack_from(self._buf,self._off)[0])
+    reserved_16 = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 2)[0])
+    SMInfo = property(lambda self:IBA.SMPSMInfo.View(self._buf,self._off + 4))
+SASMInfoRecord.View = _SASMInfoRecordView
+
+class SAInformInfoRecord(rdma.binstruct.BinStruct):
+    '''Container for InformInfo (section 15.2.5.12)'''
+    __slots__ = ('subscriberGID','enumeration','reserved_144','reserved_160','informInfo','reserved_480')
+    MAD_LENGTH = 80
+    MAD_ATTRIBUTE_ID = 0xf3
+    MAD_SUBNADMGET = 0x1 # MAD_METHOD_GET
+    MAD_SUBNADMGETTABLE = 0x12 # MAD_METHOD_GET_TABLE
+    COMPONENT_MASK = {'subscriberGID':0, 'enumeration':1, 'reserved_144':2, 'informInfo.GID':3, 'informInfo.LIDRangeBegin':4, 'informInfo.LIDRangeEnd':5, 'informInfo.reserved_160':6, 'informInfo.isGeneric':7, 'informInfo.subscribe':8, 'informInfo.type':9, 'informInfo.trapNumber':10, 'informInfo.QPN':11, 'informInfo.reserved_248':12, 'informInfo.respTimeValue':13, 'informInfo.reserved_256':14, 'informInfo.producerType':15, 'reserved_480':16}
+    MEMBERS = [('subscriberGID',128,1), ('enumeration',16,1), ('reserved_144',16,1), ('reserved_160',32,1), ('informInfo',288,1), ('reserved_480',160,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        self.informInfo = IBA.MADInformInfo()
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.subscriberGID = IBA.GID()
+        self.enumeration = 0
+        self.reserved_144 = 0
+        self.reserved_160 = 0
+        self.informInfo = IBA.MADInformInfo()
+        self.reserved_480 = bytearray(20)
+
+    def pack_into(self,buffer,offset=0):
+        self.subscriberGID.pack_into(buffer,offset + 0)
+        self.informInfo.pack_into(buffer,offset + 24)
+        buffer[offset + 60:offset + 80] = self.reserved_480
+        _struct_HHL.pack_into(buffer,offset+16,self.enumeration,self.reserved_144,self.reserved_160)
+
+    def unpack_from(self,buffer,offset=0):
+        self.subscriberGID = IBA.GID(buffer[offset + 0:offset + 16],raw=True)
+        self.informInfo.unpack_from(buffer,offset + 24)
+        self.reserved_480 = bytearray(buffer[offset + 60:offset + 80])
+        (self.enumeration,self.reserved_144,self.reserved_160,) = _struct_HHL.unpack_from(buffer,offset+16)
+
+class _SAInformInfoRecordView(rdma.binstruct.BinStructView,SAInformInfoRecord):
+    '''Read only view of a packed :class:`SAInformInfoRecord`'''
+    __slots__ = ('_buf','_off')
+    subscriberGID = property(lambda self:IBA.GID(self._buf[self._off:self._off + 16],raw=True))
+    enumeration = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 16)[0])
+    reserved_144 = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 18)[0])
+    reserved_160 = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 20)[0])
+    informInfo = property(lambda self:IBA.MADInformInfo.View(self._buf,self._off + 24))
+    reserved_480 = property(lambda self:bytearray(self._buf[self._off + 60:self._off + 80]))
+SAInformInfoRecord.View = _SAInformInfoRecordView
+
+class SALinkRecord(rdma.binstruct.BinStruct):
+    '''Inter-node linkage information (section 15.2.5.13)'''
+    __slots__ = ('fromLID','fromPort','toPort','toLID','reserved_48')
+    MAD_LENGTH = 8
+    MAD_ATTRIBUTE_ID = 0x20
+    MAD_SUBNADMGET = 0x1 # MAD_METHOD_GET
+    MAD_SUBNADMGETTABLE = 0x12 # MAD_METHOD_GET_TABLE
+    COMPONENT_MASK = {'fromLID':0, 'fromPort':1, 'toPort':2, 'toLID':3, 'reserved_48':4}
+    MEMBERS = [('fromLID',16,1), ('fromPort',8,1), ('toPort',8,1), ('toLID',16,1), ('reserved_48',16,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.fromLID = 0
+        self.fromPort = 0
+        self.toPort = 0
+        self.toLID = 0
+        self.reserved_48 = 0
+
+    def pack_into(self,buffer,offset=0):
+        _struct_HBBHH.pack_into(buffer,offset+0,self.fromLID,self.fromPort,self.toPort,self.toLID,self.reserved_48)
+
+    def unpack_from(self,buffer,offset=0):
+        (self.fromLID,self.fromPort,self.toPort,self.toLID,self.reserved_48,) = _struct_HBBHH.unpack_from(buffer,offset+0)
+
+class _SALinkRecordView(rdma.binstruct.BinStructView,SALinkRecord):
+    '''Read only view of a packed :class:`SALinkRecord`'''
+    __slots__ = ('_buf','_off')
+    fromLID = property(lambda self:_struct_H.unpack_from(self._buf,self._off)[0])
+    fromPort = property(lambda self:self._buf[self._off + 2])
+    toPort = property(lambda self:self._buf[self._off + 3])
+    toLID = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 4)[0])
+    reserved_48 = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 6)[0])
+SALinkRecord.View = _SALinkRecordView
+
+class SAGUIDInfoRecord(rdma.binstruct.BinStruct):
+    '''Container for port GUIDInfo (section 15.2.5.18)'''
+    __slots__ = ('LID','blockNum','reserved_24','reserved_32','GUIDInfo')
+    MAD_LENGTH = 72
+    MAD_ATTRIBUTE_ID = 0x30
+    MAD_SUBNADMDELETE = 0x15 # MAD_METHOD_DELETE
+    MAD_SUBNADMGET = 0x1 # MAD_METHOD_GET
+    MAD_SUBNADMGETTABLE = 0x12 # MAD_METHOD_GET_TABLE
+    MAD_SUBNADMSET = 0x2 # MAD_METHOD_SET
+    COMPONENT_MASK = {'LID':0, 'blockNum':1, 'reserved_24':2, 'reserved_32':3, 'GUIDInfo.GUIDBlock':4}
+    MEMBERS = [('LID',16,1), ('blockNum',8,1), ('reserved_24',8,1), ('reserved_32',32,1), ('GUIDInfo',512,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        self.GUIDInfo = IBA.SMPGUIDInfo()
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.LID = 0
+        self.blockNum = 0
+        self.reserved_24 = 0
+        self.reserved_32 = 0
+        self.GUIDInfo = IBA.SMPGUIDInfo()
+
+    def pack_into(self,buffer,offset=0):
+        self.GUIDInfo.pack_into(buffer,offset + 8)
+        _struct_HBBL.pack_into(buffer,offset+0,self.LID,self.blockNum,self.reserved_24,self.reserved_32)
+
+    def unpack_from(self,buffer,offset=0):
+        self.GUIDInfo.unpack_from(buffer,offset + 8)
+        (self.LID,self.blockNum,self.reserved_24,self.reserved_32,) = _struct_HBBL.unpack_from(buffer,offset+0)
+
+class _SAGUIDInfoRecordView(rdma.binstruct.BinStructView,SAGUIDInfoRecord):
+    '''Read only view of a packed :class:`SAGUIDInfoRecord`'''
+    __slots__ = ('_buf','_off')
+    LID = property(lambda self:_struct_H.unpack_from(self._buf,self._off)[0])
+    blockNum = property(lambda self:self._buf[self._off + 2])
+    reserved_24 = property(lambda self:self._buf[self._off + 3])
+    reserved_32 = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 4)[0])
+    GUIDInfo = property(lambda self:IBA.SMPGUIDInfo.View(self._buf,self._off + 8))
+SAGUIDInfoRecord.View = _SAGUIDInfoRecordView
+
+class SAServiceRecord(rdma.binstruct.BinStruct):
+    '''Information on advertised services (section 15.2.5.14)'''
+    __slots__ = ('serviceID','serviceGID','servicePKey','reserved_208','serviceLease','serviceKey','serviceName','serviceData8','serviceData16','serviceData32','serviceData64')
+    MAD_LENGTH = 176
+    MAD_ATTRIBUTE_ID = 0x31
+    MAD_SUBNADMDELETE = 0x15 # MAD_METHOD_DELETE
+    MAD_SUBNADMGET = 0x1 # MAD_METHOD_GET
+    MAD_SUBNADMGETTABLE = 0x12 # MAD_METHOD_GET_TABLE
+    MAD_SUBNADMSET = 0x2 # MAD_METHOD_SET
+    COMPONENT_MASK = {'serviceID':0, 'serviceGID':1, 'servicePKey':2, 'reserved_208':3, 'serviceLease':4, 'serviceKey':5, 'serviceName':6, 'serviceData8_0':7, 'serviceData8_1':8, 'serviceData8_2':9, 'serviceData8_3':10, 'serviceData8_4':11, 'serviceData8_5':12, 'serviceData8_6':13, 'serviceData8_7':14, 'serviceData8_8':15, 'serviceData8_9':16, 'serviceData8_10':17, 'serviceData8_11':18, 'serviceData8_12':19, 'serviceData8_13':20, 'serviceData8_14':21, 'serviceData8_15':22, 'serviceData16_0':23, 'serviceData16_1':24, 'serviceData16_2':25, 'serviceData16_3':26, 'serviceData16_4':27, 'serviceData16_5':28, 'serviceData16_6':29, 'serviceData16_7':30, 'serviceData32_0':31, 'serviceData32_1':32, 'serviceData32_2':33, 'serviceData32_3':34, 'serviceData64_0':35, 'serviceData64_1':36}
+    MEMBERS = [('serviceID',64,1), ('serviceGID',128,1), ('servicePKey',16,1), ('reserved_208',16,1), ('serviceLease',32,1), ('serviceKey',128,1), ('serviceName',8,64), ('serviceData8',8,16), ('serviceData16',16,8), ('serviceData32',32,4), ('serviceData64',64,2)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        self.serviceData16 = [0]*8
+        self.serviceData32 = [0]*4
+        self.serviceData64 = [0]*2
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.serviceID = 0
+        self.serviceGID = IBA.GID()
+        self.servicePKey = 0
+        self.reserved_208 = 0
+        self.serviceLease = 0
+        self.serviceKey = IBA.GID()
+        self.serviceName = bytearray(64)
+        self.serviceData8 = bytearray(16)
+        self.serviceData16 = [0]*8
+        self.serviceData32 = [0]*4
+        self.serviceData64 = [0]*2
+
+    def pack_into(self,buffer,offset=0):
+        self.serviceGID.pack_into(buffer,offset + 8)
+        self.serviceKey.pack_into(buffer,offset + 32)
+        buffer[offset + 48:offset + 112] = self.serviceName
+        buffer[offset + 112:offset + 128] = self.serviceData8
+        rdma.binstruct.pack_array8(buffer,offset+160,64,2,self.serviceData64)
+        _struct_Q.pack_into(buffer,offset+0,self.serviceID)
+        _struct_HHL.pack_into(buffer,offset+24,self.servicePKey,self.reserved_208,self.serviceLease)
+        _struct_HHHHHHHHLLLL.pack_into(buffer,offset+128,self.serviceData16[0],self.serviceData16[1],self.serviceData16[2],self.serviceData16[3],self.serviceData16[4],self.serviceData16[5],self.serviceData16[6],self.serviceData16[7],self.serviceData32[0],self.serviceData32[1],self.serviceData32[2],self.serviceData32[3])
+
+    def unpack_from(self,buffer,offset=0):
+        self.serviceGID = IBA.GID(buffer[offset + 8:offset + 24],raw=True)
+        self.serviceKey = IBA.GID(buffer[offset + 32:offset + 48],raw=True)
+        self.serviceName = bytearray(buffer[offset + 48:offset + 112])
+        self.serviceData8 = bytearray(buffer[offset + 112:offset + 128])
+        rdma.binstruct.unpack_array8(buffer,offset+160,64,2,self.serviceData64)
+        (self.serviceID,) = _struct_Q.unpack_from(buffer,offset+0)
+        (self.servicePKey,self.reserved_208,self.serviceLease,) = _struct_HHL.unpack_from(buffer,offset+24)
+        (self.serviceData16[0],self.serviceData16[1],self.serviceData16[2],self.serviceData16[3],self.serviceData16[4],self.serviceData16[5],self.serviceData16[6],self.serviceData16[7],self.serviceData32[0],self.serviceData32[1],self.serviceData32[2],self.serviceData32[3],) = _struct_HHHHHHHHLLLL.unpack_from(buffer,offset+128)
+
+class _SAServiceRecordView(rdma.binstruct.BinStructView,SAServiceRecord):
+    '''Read only view of a packed :class:`SAServiceRecord`'''
+    __slots__ = ('_buf','_off')
+    serviceID = property(lambda self:_struct_Q.unpack_from(self._buf,self._off)[0])
+    serviceGID = property(lambda self:IBA.GID(self._buf[self._off + 8:self._off + 8 + 16],raw=True))
+    servicePKey = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 24)[0])
+    reserved_208 = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 26)[0])
+    serviceLease = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 28)[0])
+    serviceKey = property(lambda self:IBA.GID(self._buf[self._off + 32:self._off + 32 + 16],raw=True))
+    serviceName = property(lambda self:bytearray(self._buf[self._off + 48:self._off + 112]))
+    serviceData8 = property(lambda self:bytearray(self._buf[self._off + 112:self._off + 128]))
+    serviceData16 = property(lambda self:list(_struct_HHHHHHHH.unpack_from(self._buf,self._off + 128)))
+    serviceData32 = property(lambda self:list(_struct_LLLL.unpack_from(self._buf,self._off + 144)))
+    serviceData64 = property(lambda self:rdma.binstruct.unpack_array8(self._buf,self._off + 160,64,2,[0]*2))
+SAServiceRecord.View = _SAServiceRecordView
+
+class SAPKeyTableRecord(rdma.binstruct.BinStruct):
+    '''Container for P_Key Table (section 15.2.5.11)'''
+    __slots__ = ('LID','blockNum','portNum','reserved_40','PKeyTable')
+    MAD_LENGTH = 72
+    MAD_ATTRIBUTE_ID = 0x33
+    MAD_SUBNADMGET = 0x1 # MAD_METHOD_GET
+    MAD_SUBNADMGETTABLE = 0x12 # MAD_METHOD_GET_TABLE
+    COMPONENT_MASK = {'LID':0, 'blockNum':1, 'portNum':2, 'reserved_40':3, 'PKeyTable.PKeyBlock':4}
+    MEMBERS = [('LID',16,1), ('blockNum',16,1), ('portNum',8,1), ('reserved_40',24,1), ('PKeyTable',512,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        self.PKeyTable = IBA.SMPPKeyTable()
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.LID = 0
+        self.blockNum = 0
+        self.portNum = 0
+        self.reserved_40 = 0
+        self.PKeyTable = IBA.SMPPKeyTable()
+
+    def pack_into(self,buffer,offset=0):
+        self.PKeyTable.pack_into(buffer,offset + 8)
+        _struct_HHL.pack_into(buffer,offset+0,self.LID,self.blockNum,((self.portNum & 0xFF) << 24) | (self.reserved_40 & 0xFFFFFF))
+
+    def unpack_from(self,buffer,offset=0):
+        self.PKeyTable.unpack_from(buffer,offset + 8)
+        (self.LID,self.blockNum,w0,) = _struct_HHL.unpack_from(buffer,offset+0)
+        self.portNum = w0 >> 24
+        self.reserved_40 = w0 & 0xFFFFFF
+
+class _SAPKeyTableRecordView(rdma.binstruct.BinStructView,SAPKeyTableRecord):
+    '''Read only view of a packed :class:`SAPKeyTableRecord`'''
+    __slots__ = ('_buf','_off')
+    LID = property(lambda self:_struct_H.unpack_from(self._buf,self._off)[0])
+    blockNum = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 2)[0])
+    portNum = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 4)[0] >> 24)
+    reserved_40 = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 4)[0] & 0xFFFFFF)
+    PKeyTable = property(lambda self:IBA.SMPPKeyTable.View(self._buf,self._off + 8))
+SAPKeyTableRecord.View = _SAPKeyTableRecordView
+
+class SAPathRecord(rdma.binstruct.BinStruct):
+    '''Information on paths through the subnet (section 15.2.5.16)'''
+    __slots__ = ('serviceID','DGID','SGID','DLID','SLID','rawTraffic','reserved_353','flowLabel','hopLimit','TClass','reversible','numbPath','PKey','QOSClass','SL','MTUSelector','MTU','rateSelector','rate','packetLifeTimeSelector','packetLifeTime','preference','reversePathPKeyMemberBit','reserved_466','reserved_480')
+    MAD_LENGTH = 64
+    MAD_ATTRIBUTE_ID = 0x35
+    MAD_SUBNADMGET = 0x1 # MAD_METHOD_GET
+    MAD_SUBNADMGETTABLE = 0x12 # MAD_METHOD_GET_TABLE
+    COMPONENT_MASK = {'serviceID':0, 'serviceID56LSB':1, 'DGID':2, 'SGID':3, 'DLID':4, 'SLID':5, 'rawTraffic':6, 'reserved_353':7, 'flowLabel':8, 'hopLimit':9, 'TClass':10, 'reversible':11, 'numbPath':12, 'PKey':13, 'QOSClass':14, 'SL':15, 'MTUSelector':16, 'MTU':17, 'rateSelector':18, 'rate':19, 'packetLifeTimeSelector':20, 'packetLifeTime':21, 'preference':22, 'reversePathPKeyMemberBit':23, 'reserved_466':24, 'reserved_480':25}
+    MEMBERS = [('serviceID',64,1), ('DGID',128,1), ('SGID',128,1), ('DLID',16,1), ('SLID',16,1), ('rawTraffic',1,1), ('reserved_353',3,1), ('flowLabel',20,1), ('hopLimit',8,1), ('TClass',8,1), ('reversible',1,1), ('numbPath',7,1), ('PKey',16,1), ('QOSClass',12,1), ('SL',4,1), ('MTUSelector',2,1), ('MTU',6,1), ('rateSelector',2,1), ('rate',6,1), ('packetLifeTimeSelector',2,1), ('packetLifeTime',6,1), ('preference',8,1), ('reversePathPKeyMemberBit',2,1), ('reserved_466',14,1), ('reserved_480',32,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.serviceID = 0
+        self.DGID = IBA.GID()
+        self.SGID = IBA.GID()
+        self.DLID = 0
+        self.SLID = 0
+        self.rawTraffic = 0
+        self.reserved_353 = 0
+        self.flowLabel = 0
+        self.hopLimit = 0
+        self.TClass = 0
+        self.reversible = 0
+        self.numbPath = 0
+        self.PKey = 0
+        self.QOSClass = 0
+        self.SL = 0
+        self.MTUSelector = 0
+        self.MTU = 0
+        self.rateSelector = 0
+        self.rate = 0
+        self.packetLifeTimeSelector = 0
+        self.packetLifeTime = 0
+        self.preference = 0
+        self.reversePathPKeyMemberBit = 0
+        self.reserved_466 = 0
+        self.reserved_480 = 0
+
+    def pack_into(self,buffer,offset=0):
+        self.DGID.pack_into(buffer,offset + 8)
+        self.SGID.pack_into(buffer,offset + 24)
+        _struct_Q.pack_into(buffer,offset+0,self.serviceID)
+        _struct_HHLLLLL.pack_into(buffer,offset+40,self.DLID,self.SLID,((self.rawTraffic & 0x1) << 31) | ((self.reserved_353 & 0x7) << 28) | ((self.flowLabel & 0xFFFFF) << 8) | (self.hopLimit & 0xFF),((self.TClass & 0xFF) << 24) | ((self.reversible & 0x1) << 23) | ((self.numbPath & 0x7F) << 16) | (self.PKey & 0xFFFF),((self.QOSClass & 0xFFF) << 20) | ((self.SL & 0xF) << 16) | ((self.MTUSelector & 0x3) << 14) | ((self.MTU & 0x3F) << 8) | ((self.rateSelector & 0x3) << 6) | (self.rate & 0x3F),((self.packetLifeTimeSelector & 0x3) << 30) | ((self.packetLifeTime & 0x3F) << 24) | ((self.preference & 0xFF) << 16) | ((self.reversePathPKeyMemberBit & 0x3) << 14) | (self.reserved_466 & 0x3FFF),self.reserved_480)
+
+    def unpack_from(self,buffer,offset=0):
+        self.DGID = IBA.GID(buffer[offset + 8:offset + 24],raw=True)
+        self.SGID = IBA.GID(buffer[offset + 24:offset + 40],raw=True)
+        (self.serviceID,) = _struct_Q.unpack_from(buffer,offset+0)
+        (self.DLID,self.SLID,w0,w1,w2,w3,self.reserved_480,) = _struct_HHLLLLL.unpack_from(buffer,offset+40)
+        self.rawTraffic = w0 >> 31
+        self.reserved_353 = (w0 >> 28) & 0x7
+        self.flowLabel = (w0 >> 8) & 0xFFFFF
+        self.hopLimit = w0 & 0xFF
+        self.TClass = w1 >> 24
+        self.reversible = (w1 >> 23) & 0x1
+        self.numbPath = (w1 >> 16) & 0x7F
+        self.PKey = w1 & 0xFFFF
+        self.QOSClass = w2 >> 20
+        self.SL = (w2 >> 16) & 0xF
+        self.MTUSelector = (w2 >> 14) & 0x3
+        self.MTU = (w2 >> 8) & 0x3F
+        self.rateSelector = (w2 >> 6) & 0x3
+        self.rate = w2 & 0x3F
+        self.packetLifeTimeSelector = w3 >> 30
+        self.packetLifeTime = (w3 >> 24) & 0x3F
+        self.preference = (w3 >> 16) & 0xFF
+        self.reversePathPKeyMemberBit = (w3 >> 14) & 0x3
+        self.reserved_466 = w3 & 0x3FFF
+
+class _SAPathRecordView(rdma.binstruct.BinStructView,SAPathRecord):
+    '''Read only view of a packed :class:`SAPathRecord`'''
+    __slots__ = ('_buf','_off')
+    serviceID = property(lambda self:_struct_Q.unpack_from(self._buf,self._off)[0])
+    DGID = property(lambda self:IBA.GID(self._buf[self._off + 8:self._off + 8 + 16],raw=True))
+    SGID = property(lambda self:IBA.GID(self._buf[self._off + 24:self._off + 24 + 16],raw=True))
+    DLID = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 40)[0])
+    SLID = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 42)[0])
+    rawTraffic = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 44)[0] >> 31)
+    reserved_353 = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 44)[0] >> 28) & 0x7)
+    flowLabel = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 44)[0] >> 8) & 0xFFFFF)
+    hopLimit = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 44)[0] & 0xFF)
+    TClass = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 48)[0] >> 24)
+    reversible = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 48)[0] >> 23) & 0x1)
+    numbPath = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 48)[0] >> 16) & 0x7F)
+    PKey = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 48)[0] & 0xFFFF)
+    QOSClass = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 52)[0] >> 20)
+    SL = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 52)[0] >> 16) & 0xF)
+    MTUSelector = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 52)[0] >> 14) & 0x3)
+    MTU = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 52)[0] >> 8) & 0x3F)
+    rateSelector = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 52)[0] >> 6) & 0x3)
+    rate = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 52)[0] & 0x3F)
+    packetLifeTimeSelector = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 56)[0] >> 30)
+    packetLifeTime = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 56)[0] >> 24) & 0x3F)
+    preference = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 56)[0] >> 16) & 0xFF)
+    reversePathPKeyMemberBit = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 56)[0] >> 14) & 0x3)
+    reserved_466 = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 56)[0] & 0x3FFF)
+    reserved_480 = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 60)[0])
+SAPathRecord.View = _SAPathRecordView
+
+class SAMCMemberRecord(rdma.binstruct.BinStruct):
+    '''Multicast member attribute (section 15.2.5.17)'''
+    __slots__ = ('MGID','portGID','QKey','MLID','MTUSelector','MTU','TClass','PKey','rateSelector','rate','packetLifeTimeSelector','packetLifeTime','SL','flowLabel','hopLimit','scope','joinState','proxyJoin','reserved_393')
+    MAD_LENGTH = 52
+    MAD_ATTRIBUTE_ID = 0x38
+    MAD_SUBNADMDELETE = 0x15 # MAD_METHOD_DELETE
+    MAD_SUBNADMGET = 0x1 # MAD_METHOD_GET
+    MAD_SUBNADMGETTABLE = 0x12 # MAD_METHOD_GET_TABLE
+    MAD_SUBNADMSET = 0x2 # MAD_METHOD_SET
+    COMPONENT_MASK = {'MGID':0, 'portGID':1, 'QKey':2, 'MLID':3, 'MTUSelector':4, 'MTU':5, 'TClass':6, 'PKey':7, 'rateSelector':8, 'rate':9, 'packetLifeTimeSelector':10, 'packetLifeTime':11, 'SL':12, 'flowLabel':13, 'hopLimit':14, 'scope':15, 'joinState':16, 'proxyJoin':17, 'reserved_393':18}
+    MEMBERS = [('MGID',128,1), ('portGID',128,1), ('QKey',32,1), ('MLID',16,1), ('MTUSelector',2,1), ('MTU',6,1), ('TClass',8,1), ('PKey',16,1), ('rateSelector',2,1), ('rate',6,1), ('packetLifeTimeSelector',2,1), ('packetLifeTime',6,1), ('SL',4,1), ('flowLabel',20,1), ('hopLimit',8,1), ('scope',4,1), ('joinState',4,1), ('proxyJoin',1,1), ('reserved_393',23,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.MGID = IBA.GID()
+        self.portGID = IBA.GID()
+        self.QKey = 0
+        self.MLID = 0
+        self.MTUSelector = 0
+        self.MTU = 0
+        self.TClass = 0
+        self.PKey = 0
+        self.rateSelector = 0
+        self.rate = 0
+        self.packetLifeTimeSelector = 0
+        self.packetLifeTime = 0
+        self.SL = 0
+        self.flowLabel = 0
+        self.hopLimit = 0
+        self.scope = 0
+        self.joinState = 0
+        self.proxyJoin = 0
+        self.reserved_393 = 0
+
+    def pack_into(self,buffer,offset=0):
+        self.MGID.pack_into(buffer,offset + 0)
+        self.portGID.pack_into(buffer,offset + 16)
+        _struct_LLLLL.pack_into(buffer,offset+32,self.QKey,((self.MLID & 0xFFFF) << 16) | ((self.MTUSelector & 0x3) << 14) | ((self.MTU & 0x3F) << 8) | (self.TClass & 0xFF),((self.PKey & 0xFFFF) << 16) | ((self.rateSelector & 0x3) << 14) | ((self.rate & 0x3F) << 8) | ((self.packetLifeTimeSelector & 0x3) << 6) | (self.packetLifeTime & 0x3F),((self.SL & 0xF) << 28) | ((self.flowLabel & 0xFFFFF) << 8) | (self.hopLimit & 0xFF),((self.scope & 0xF) << 28) | ((self.joinState & 0xF) << 24) | ((self.proxyJoin & 0x1) << 23) | (self.reserved_393 & 0x7FFFFF))
+
+    def unpack_from(self,buffer,offset=0):
+        self.MGID = IBA.GID(buffer[offset + 0:offset + 16],raw=True)
+        self.portGID = IBA.GID(buffer[offset + 16:offset + 32],raw=True)
+        (self.QKey,w0,w1,w2,w3,) = _struct_LLLLL.unpack_from(buffer,offset+32)
+        self.MLID = w0 >> 16
+        self.MTUSelector = (w0 >> 14) & 0x3
+        self.MTU = (w0 >> 8) & 0x3F
+        self.TClass = w0 & 0xFF
+        self.PKey = w1 >> 16
+        self.rateSelector = (w1 >> 14) & 0x3
+        self.rate = (w1 >> 8) & 0x3F
+        self.packetLifeTimeSelector = (w1 >> 6) & 0x3
+        self.packetLifeTime = w1 & 0x3F
+        self.SL = w2 >> 28
+        self.flowLabel = (w2 >> 8) & 0xFFFFF
+        self.hopLimit = w2 & 0xFF
+        self.scope = w3 >> 28
+        self.joinState = (w3 >> 24) & 0xF
+        self.proxyJoin = (w3 >> 23) & 0x1
+        self.reserved_393 = w3 & 0x7FFFFF
+
+class _SAMCMemberRecordView(rdma.binstruct.BinStructView,SAMCMemberRecord):
+    '''Read only view of a packed :class:`SAMCMemberRecord`'''
+    __slots__ = ('_buf','_off')
+    MGID = property(lambda self:IBA.GID(self._buf[self._off:self._off + 16],raw=True))
+    portGID = property(lambda self:IBA.GID(self._buf[self._off + 16:self._off + 16 + 16],raw=True))
+    QKey = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 32)[0])
+    MLID = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 36)[0] >> 16)
+    MTUSelector = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 36)[0] >> 14) & 0x3)
+    MTU = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 36)[0] >> 8) & 0x3F)
+    TClass = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 36)[0] & 0xFF)
+    PKey = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 40)[0] >> 16)
+    rateSelector = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 40)[0] >> 14) & 0x3)
+    rate = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 40)[0] >> 8) & 0x3F)
+    packetLifeTimeSelector = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 40)[0] >> 6) & 0x3)
+    packetLifeTime = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 40)[0] & 0x3F)
+    SL = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 44)[0] >> 28)
+    flowLabel = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 44)[0] >> 8) & 0xFFFFF)
+    hopLimit = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 44)[0] & 0xFF)
+    scope = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 48)[0] >> 28)
+    joinState = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 48)[0] >> 24) & 0xF)
+    proxyJoin = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 48)[0] >> 23) & 0x1)
+    reserved_393 = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 48)[0] & 0x7FFFFF)
+SAMCMemberRecord.View = _SAMCMemberRecordView
+
+class SATraceRecord(rdma.binstruct.BinStruct):
+    '''Path trace information (section 15.2.5.19)'''
+    __slots__ = ('GIDPrefix','IDGeneration','reserved_80','nodeType','nodeID','chassisID','entryPortID','exitPortID','entryPort','exitPort','reserved_368')
+    MAD_LENGTH = 48
+    MAD_ATTRIBUTE_ID = 0x39
+    MAD_SUBNADMGETTRACETABLE = 0x13 # MAD_METHOD_GET_TRACE_TABLE
+    COMPONENT_MASK = {'GIDPrefix':0, 'IDGeneration':1, 'reserved_80':2, 'nodeType':3, 'nodeID':4, 'chassisID':5, 'entryPortID':6, 'exitPortID':7, 'entryPort':8, 'exitPort':9, 'reserved_368':10}
+    MEMBERS = [('GIDPrefix',64,1), ('IDGeneration',16,1), ('reserved_80',8,1), ('nodeType',8,1), ('nodeID',64,1), ('chassisID',64,1), ('entryPortID',64,1), ('exitPortID',64,1), ('entryPort',8,1), ('exitPort',8,1), ('reserved_368',16,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.GIDPrefix = 0
+        self.IDGeneration = 0
+        self.reserved_80 = 0
+        self.nodeType = 0
+        self.nodeID = 0
+        self.chassisID = 0
+        self.entryPortID = 0
+        self.exitPortID = 0
+        self.entryPort = 0
+        self.exitPort = 0
+        self.reserved_368 = 0
+
+    def pack_into(self,buffer,offset=0):
+        _struct_QHBBQQQQBBH.pack_into(buffer,offset+0,self.GIDPrefix,self.IDGeneration,self.reserved_80,self.nodeType,self.nodeID,self.chassisID,self.entryPortID,self.exitPortID,self.entryPort,self.exitPort,self.reserved_368)
+
+    def unpack_from(self,buffer,offset=0):
+        (self.GIDPrefix,self.IDGeneration,self.reserved_80,self.nodeType,self.nodeID,self.chassisID,self.entryPortID,self.exitPortID,self.entryPort,self.exitPort,self.reserved_368,) = _struct_QHBBQQQQBBH.unpack_from(buffer,offset+0)
+
+class _SATraceRecordView(rdma.binstruct.BinStructView,SATraceRecord):
+    '''Read only view of a packed :class:`SATraceRecord`'''
+    __slots__ = ('_buf','_off')
+    GIDPrefix = property(lambda self:_struct_Q.unpack_from(self._buf,self._off)[0])
+    IDGeneration = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 8)[0])
+    reserved_80 = property(lambda self:self._buf[self._off + 10])
+    nodeType = property(lambda self:self._buf[self._off + 11])
+    nodeID = property(lambda self:_struct_Q.unpack_from(self._buf,self._off + 12)[0])
+    chassisID = property(lambda self:_struct_Q.unpack_from(self._buf,self._off + 20)[0])
+    entryPortID = property(lambda self:_struct_Q.unpack_from(self._buf,self._off + 28)[0])
+    exitPortID = property(lambda self:_struct_Q.unpack_from(self._buf,self._off + 36)[0])
+    entryPort = property(lambda self:self._buf[self._off + 44])
+    exitPort = property(lambda self:self._buf[self._off + 45])
+    reserved_368 = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 46)[0])
+SATraceRecord.View = _SATraceRecordView
+
+class SAMultiPathRecord(rdma.binstruct.BinStruct):
+    '''Request for multiple paths (section 15.2.5.20)'''
+    __slots__ = ('rawTraffic','reserved_1','flowLabel','hopLimit','TClass','reversible','numbPath','PKey','reserved_64','SL','MTUSelector','MTU','rateSelector','rate','packetLifeTimeSelector','packetLifeTime','reserved_104','independenceSelector','reserved_114','SGIDCount','DGIDCount','reserved_136','reserved_160','SDGID')
+    MAD_LENGTH = 40
+    MAD_ATTRIBUTE_ID = 0x3a
+    MAD_SUBNADMGETMULTI = 0x14 # MAD_METHOD_GET_MULTI
+    COMPONENT_MASK = {'rawTraffic':0, 'reserved_1':1, 'flowLabel':2, 'hopLimit':3, 'TClass':4, 'reversible':5, 'numbPath':6, 'PKey':7, 'reserved_64':8, 'SL':9, 'MTUSelector':10, 'MTU':11, 'rateSelector':12, 'rate':13, 'packetLifeTimeSelector':14, 'packetLifeTime':15, 'reserved_104':16, 'independenceSelector':17, 'reserved_114':18, 'SGIDCount':19, 'DGIDCount':20, 'reserved_136':21, 'reserved_160':22, 'SDGID':23}
+    MEMBERS = [('rawTraffic',1,1), ('reserved_1',3,1), ('flowLabel',20,1), ('hopLimit',8,1), ('TClass',8,1), ('reversible',1,1), ('numbPath',7,1), ('PKey',16,1), ('reserved_64',12,1), ('SL',4,1), ('MTUSelector',2,1), ('MTU',6,1), ('rateSelector',2,1), ('rate',6,1), ('packetLifeTimeSelector',2,1), ('packetLifeTime',6,1), ('reserved_104',8,1), ('independenceSelector',2,1), ('reserved_114',6,1), ('SGIDCount',8,1), ('DGIDCount',8,1), ('reserved_136',24,1), ('reserved_160',32,1), ('SDGID',128,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.rawTraffic = 0
+        self.reserved_1 = 0
+        self.flowLabel = 0
+        self.hopLimit = 0
+        self.TClass = 0
+        self.reversible = 0
+        self.numbPath = 0
+        self.PKey = 0
+        self.reserved_64 = 0
+        self.SL = 0
+        self.MTUSelector = 0
+        self.MTU = 0
+        self.rateSelector = 0
+        self.rate = 0
+        self.packetLifeTimeSelector = 0
+        self.packetLifeTime = 0
+        self.reserved_104 = 0
+        self.independenceSelector = 0
+        self.reserved_114 = 0
+        self.SGIDCount = 0
+        self.DGIDCount = 0
+        self.reserved_136 = 0
+        self.reserved_160 = 0
+        self.SDGID = IBA.GID()
+
+    def pack_into(self,buffer,offset=0):
+        self.SDGID.pack_into(buffer,offset + 24)
+        _struct_LLLLLL.pack_into(buffer,offset+0,((self.rawTraffic & 0x1) << 31) | ((self.reserved_1 & 0x7) << 28) | ((self.flowLabel & 0xFFFFF) << 8) | (self.hopLimit & 0xFF),((self.TClass & 0xFF) << 24) | ((self.reversible & 0x1) << 23) | ((self.numbPath & 0x7F) << 16) | (self.PKey & 0xFFFF),((self.reserved_64 & 0xFFF) << 20) | ((self.SL & 0xF) << 16) | ((self.MTUSelector & 0x3) << 14) | ((self.MTU & 0x3F) << 8) | ((self.rateSelector & 0x3) << 6) | (self.rate & 0x3F),((self.packetLifeTimeSelector & 0x3) << 30) | ((self.packetLifeTime & 0x3F) << 24) | ((self.reserved_104 & 0xFF) << 16) | ((self.independenceSelector & 0x3) << 14) | ((self.reserved_114 & 0x3F) << 8) | (self.SGIDCount & 0xFF),((self.DGIDCount & 0xFF) << 24) | (self.reserved_136 & 0xFFFFFF),self.reserved_160)
+
+    def unpack_from(self,buffer,offset=0):
+        self.SDGID = IBA.GID(buffer[offset + 24:offset + 40],raw=True)
+        (w0,w1,w2,w3,w4,self.reserved_160,) = _struct_LLLLLL.unpack_from(buffer,offset+0)
+        self.rawTraffic = w0 >> 31
+        self.reserved_1 = (w0 >> 28) & 0x7
+        self.flowLabel = (w0 >> 8) & 0xFFFFF
+        self.hopLimit = w0 & 0xFF
+        self.TClass = w1 >> 24
+        self.reversible = (w1 >> 23) & 0x1
+        self.numbPath = (w1 >> 16) & 0x7F
+        self.PKey = w1 & 0xFFFF
+        self.reserved_64 = w2 >> 20
+        self.SL = (w2 >> 16) & 0xF
+        self.MTUSelector = (w2 >> 14) & 0x3
+        self.MTU = (w2 >> 8) & 0x3F
+        self.rateSelector = (w2 >> 6) & 0x3
+        self.rate = w2 & 0x3F
+        self.packetLifeTimeSelector = w3 >> 30
+        self.packetLifeTime = (w3 >> 24) & 0x3F
+        self.reserved_104 = (w3 >> 16) & 0xFF
+        self.independenceSelector = (w3 >> 14) & 0x3
+        self.reserved_114 = (w3 >> 8) & 0x3F
+        self.SGIDCount = w3 & 0xFF
+        self.DGIDCount = w4 >> 24
+        self.reserved_136 = w4 & 0xFFFFFF
+
+class _SAMultiPathRecordView(rdma.binstruct.BinStructView,SAMultiPathRecord):
+    '''Read only view of a packed :class:`SAMultiPathRecord`'''
+    __slots__ = ('_buf','_off')
+    rawTraffic = property(lambda self:_struct_L.unpack_from(self._buf,self._off)[0] >> 31)
+    reserved_1 = property(lambda self:(_struct_L.unpack_from(self._buf,self._off)[0] >> 28) & 0x7)
+    flowLabel = property(lambda self:(_struct_L.unpack_from(self._buf,self._off)[0] >> 8) & 0xFFFFF)
+    hopLimit = property(lambda self:_struct_L.unpack_from(self._buf,self._off)[0] & 0xFF)
+    TClass = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 4)[0] >> 24)
+    reversible = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 4)[0] >> 23) & 0x1)
+    numbPath = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 4)[0] >> 16) & 0x7F)
+    PKey = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 4)[0] & 0xFFFF)
+    reserved_64 = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 8)[0] >> 20)
+    SL = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 8)[0] >> 16) & 0xF)
+    MTUSelector = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 8)[0] >> 14) & 0x3)
+    MTU = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 8)[0] >> 8) & 0x3F)
+    rateSelector = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 8)[0] >> 6) & 0x3)
+    rate = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 8)[0] & 0x3F)
+    packetLifeTimeSelector = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 12)[0] >> 30)
+    packetLifeTime = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 12)[0] >> 24) & 0x3F)
+    reserved_104 = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 12)[0] >> 16) & 0xFF)
+    independenceSelector = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 12)[0] >> 14) & 0x3)
+    reserved_114 = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 12)[0] >> 8) & 0x3F)
+    SGIDCount = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 12)[0] & 0xFF)
+    DGIDCount = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 16)[0] >> 24)
+    reserved_136 = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 16)[0] & 0xFFFFFF)
+    reserved_160 = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 20)[0])
+    SDGID = property(lambda self:IBA.GID(self._buf[self._off + 24:self._off + 24 + 16],raw=True))
+SAMultiPathRecord.View = _SAMultiPathRecordView
+
+class SAServiceAssociationRecord(rdma.binstruct.BinStruct):
+    '''ServiceRecord ServiceName/ServiceKey association (section 15.2.5.15)'''
+    __slots__ = ('serviceKey','serviceName')
+    MAD_LENGTH = 80
+    MAD_ATTRIBUTE_ID = 0x3b
+    MAD_SUBNADMGET = 0x1 # MAD_METHOD_GET
+    MAD_SUBNADMGETTABLE = 0x12 # MAD_METHOD_GET_TABLE
+    COMPONENT_MASK = {'serviceKey':0, 'serviceName':1}
+    MEMBERS = [('serviceKey',128,1), ('serviceName',8,64)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.serviceKey = IBA.GID()
+        self.serviceName = bytearray(64)
+
+    def pack_into(self,buffer,offset=0):
+        self.serviceKey.pack_into(buffer,offset + 0)
+        buffer[offset + 16:offset + 80] = self.serviceName
+
+    def unpack_from(self,buffer,offset=0):
+        self.serviceKey = IBA.GID(buffer[offset + 0:offset + 16],raw=True)
+        self.serviceName = bytearray(buffer[offset + 16:offset + 80])
+
+class _SAServiceAssociationRecordView(rdma.binstruct.BinStructView,SAServiceAssociationRecord):
+    '''Read only view of a packed :class:`SAServiceAssociationRecord`'''
+    __slots__ = ('_buf','_off')
+    serviceKey = property(lambda self:IBA.GID(self._buf[self._off:self._off + 16],raw=True))
+    serviceName = property(lambda self:bytearray(self._buf[self._off + 16:self._off + 80]))
+SAServiceAssociationRecord.View = _SAServiceAssociationRecordView
+
@@ -0,0 +1,886 @@
+import rdma.binstruct
+import struct
+import rdma.IBA as IBA
+
+_struct_BBBBHHQHHL = struct.Struct('>BBBBHHQHHL')
+_struct_BBH = struct.Struct('>BBH')
+_struct_BBHHBBHHHHLHHLLLLL = struct.Struct('>BBHHBBHHHHLHHLLLLL')
+_struct_BBHHHHH = struct.Struct('>BBHHHHH')
+_struct_BBHHHHHHH = struct.Struct('>BBHHHHHHH')
+_struct_BBHHHHHHHHHHHHHHHHH = struct.Struct('>BBHHHHHHHHHHHHHHHHH')
+_struct_BBHLL = struct.Struct('>BBHLL')
+_struct_BBHLLLLLLLLLLLLLLLL = struct.Struct('>BBHLLLLLLLLLLLLLLLL')
+_struct_BBHLQQQQQQQQ = struct.Struct('>BBHLQQQQQQQQ')
+_struct_H = struct.Struct('>H')
+_struct_HHHHHHHHHHHHHHHH = struct.Struct('>HHHHHHHHHHHHHHHH')
+_struct_L = struct.Struct('>L')
+_struct_LL = struct.Struct('>LL')
+_struct_LLLLLLLLLLLLLLL = struct.Struct('>LLLLLLLLLLLLLLL')
+_struct_LLLLLLLLLLLLLLLL = struct.Struct('>LLLLLLLLLLLLLLLL')
+_struct_LLLQQLLHHHHHHHHHHHHHHHHLQ = struct.Struct('>LLLQQLLHHHHHHHHHHHHHHHHLQ')
+_struct_Q = struct.Struct('>Q')
+
+class PMFormat(rdma.binstruct.BinFormat):
+    '''Performance Management MAD Format (section 16.1.1)'''
+    __slots__ = ('baseVersion','mgmtClass','classVersion','method','status','classSpecific','transactionID','attributeID','reserved_144','attributeModifier','reserved_192','data')
+    MAD_LENGTH = 256
+    MAD_CLASS = 0x4
+    MAD_CLASS_VERSION = 0x1
+    MEMBERS = [('baseVersion',8,1), ('mgmtClass',8,1), ('classVersion',8,1), ('method',8,1), ('status',16,1), ('classSpecific',16,1), ('transactionID',64,1), ('attributeID',16,1), ('reserved_144',16,1), ('attributeModifier',32,1), ('reserved_192',320,1), ('data',1536,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.baseVersion = 0
+        self.mgmtClass = 0
+        self.classVersion = 0
+        self.method = 0
+        self.status = 0
+        self.classSpecific = 0
+        self.transactionID = 0
+        self.attributeID = 0
+        self.reserved_144 = 0
+        self.attributeModifier = 0
+        self.reserved_192 = bytearray(40)
+        self.data = bytearray(192)
+
+    def pack_into(self,buffer,offset=0):
+        buffer[offset + 24:offset + 64] = self.reserved_192
+        buffer[offset + 64:offset + 256] = self.data
+        _struct_BBBBHHQHHL.pack_into(buffer,offset+0,self.baseVersion,self.mgmtClass,self.classVersion,self.method,self.status,self.classSpecific,self.transactionID,self.attributeID,self.reserved_144,self.attributeModifier)
+
+    def unpack_from(self,buffer,offset=0):
+        self.reserved_192 = bytearray(buffer[offset + 24:offset + 64])
+        self.data = bytearray(buffer[offset + 64:offset + 256])
+        (self.baseVersion,self.mgmtClass,self.classVersion,self.method,self.status,self.classSpecific,self.transactionID,self.attributeID,self.reserved_144,self.attributeModifier,) = _struct_BBBBHHQHHL.unpack_from(buffer,offset+0)
+
+class PMPortSamplesCtl(rdma.binstruct.BinStruct):
+    '''Port Performance Data Sampling Control (section 16.1.3.2)'''
+    __slots__ = ('opCode','portSelect','tick','reserved_24','counterWidth','reserved_32','counterMask0','counterMask1','counterMask2','counterMask3','counterMask4','counterMask5','counterMask6','counterMask7','counterMask8','counterMask9','reserved_64','counterMask10','counterMask11','counterMask12','counterMask13','counterMask14','sampleMechanisms','reserved_88','sampleStatus','optionMask','vendorMask','sampleStart','sampleInterval','tag','counterSelect0','counterSelect1','counterSelect2','counterSelect3','counterSelect4','counterSelect5','counterSelect6','counterSelect7','counterSelect8','counterSelect9','counterSelect10','counterSelect11','counterSelect12','counterSelect13','counterSelect14','reserved_544','samplesOnlyOptionMask','reserved_640')
+    MAD_LENGTH = 192
+    MAD_ATTRIBUTE_ID = 0x10
+    MAD_PERFORMANCEGET = 0x1 # MAD_METHOD_GET
+    MAD_PERFORMANCESET = 0x2 # MAD_METHOD_SET
+    MEMBERS = [('opCode',8,1), ('portSelect',8,1), ('tick',8,1), ('reserved_24',5,1), ('counterWidth',3,1), ('reserved_32',2,1), ('counterMask0',3,1), ('counterMask1',3,1), ('counterMask2',3,1), ('counterMask3',3,1), ('counterMask4',3,1), ('counterMask5',3,1), ('counterMask6',3,1), ('counterMask7',3,1), ('counterMask8',3,1), ('counterMask9',3,1), ('reserved_64',1,1), ('counterMask10',3,1), ('counterMask11',3,1), ('counterMask12',3,1), ('counterMask13',3,1), ('counterMask14',3,1), ('sampleMechanisms',8,1), ('reserved_88',6,1), ('sampleStatus',2,1), ('optionMask',64,1), ('vendorMask',64,1), ('sampleStart',32,1), ('sampleInterval',32,1), ('tag',16,1), ('counterSelect0',16,1), ('counterSelect1',16,1), ('counterSelect2',16,1), ('counterSelect3',16,1), ('counterSelect4',16,1), ('counterSelect5',16,1), ('counterSelect6',16,1), ('counterSelect7',16,1), ('counterSelect8',16,1), ('counterSelect9',16,1), ('counterSelect10',16,1), ('counterSelect11',16,1), ('counterSelect12',16,1), ('counterSelect13',16,1), ('counterSelect14',16,1), ('reserved_544',32,1), ('samplesOnlyOptionMask',64,1), ('reserved_640',896,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.opCode = 0
+        self.portSelect = 0
+        self.tick = 0
+        self.reserved_24 = 0
+        self.counterWidth = 0
+        self.reserved_32 = 0
+        self.counterMask0 = 0
+        self.counterMask1 = 0
+        self.counterMask2 = 0
+        self.counterMask3 = 0
+        self.counterMask4 = 0
+        self.counterMask5 = 0
+        self.counterMask6 = 0
+        self.counterMask7 = 0
+        self.counterMask8 = 0
+        self.counterMask9 = 0
+        self.reserved_64 = 0
+        self.counterMask10 = 0
+        self.counterMask11 = 0
+        self.counterMask12 = 0
+        self.counterMask13 = 0
+        self.counterMask14 = 0
+        self.sampleMechanisms = 0
+        self.reserved_88 = 0
+        self.sampleStatus = 0
+        self.optionMask = 0
+        self.vendorMask = 0
+        self.sampleStart = 0
+        self.sampleInterval = 0
+        self.tag = 0
+        self.counterSelect0 = 0
+        self.counterSelect1 = 0
+        self.counterSelect2 = 0
+        self.counterSelect3 = 0
+        self.counterSelect4 = 0
+        self.counterSelect5 = 0
+        self.counterSelect6 = 0
+        self.counterSelect7 = 0
+        self.counterSelect8 = 0
+        self.counterSelect9 = 0
+        self.counterSelect10 = 0
+        self.counterSelect11 = 0
+        self.counterSelect12 = 0
+        self.counterSelect13 = 0
+        self.counterSelect14 = 0
+        self.reserved_544 = 0
+        self.samplesOnlyOptionMask = 0
+        self.reserved_640 = bytearray(112)
+
+    def pack_into(self,buffer,offset=0):
+        buffer[offset + 80:offset + 192] = self.reserved_640
+        _struct_LLLQQLLHHHHHHHHHHHHHHHHLQ.pack_into(buffer,offset+0,((self.opCode & 0xFF) << 24) | ((self.portSelect & 0xFF) << 16) | ((self.tick & 0xFF) << 8) | ((self.reserved_24 & 0x1F) << 3) | (self.counterWidth & 0x7),((self.reserved_32 & 0x3) << 30) | ((self.counterMask0 & 0x7) << 27) | ((self.counterMask1 & 0x7) << 24) | ((self.counterMask2 & 0x7) << 21) | ((self.counterMask3 & 0x7) << 18) | ((self.counterMask4 & 0x7) << 15) | ((self.counterMask5 & 0x7) << 12) | ((self.counterMask6 & 0x7) << 9) | ((self.counterMask7 & 0x7) << 6) | ((self.counterMask8 & 0x7) << 3) | (self.counterMask9 & 0x7),((self.reserved_64 & 0x1) << 31) | ((self.counterMask10 & 0x7) << 28) | ((self.counterMask11 & 0x7) << 25) | ((self.counterMask12 & 0x7) << 22) | ((self.counterMask13 & 0x7) << 19) | ((self.counterMask14 & 0x7) << 16) | ((self.sampleMechanisms & 0xFF) << 8) | ((self.reserved_88 & 0x3F) << 2) | (self.sampleStatus & 0x3),self.optionMask,self.vendorMask,self.sampleStart,self.sampleInterval,self.tag,self.counterSelect0,self.counterSelect1,self.counterSelect2,self.counterSelect3,self.counterSelect4,self.counterSelect5,self.counterSelect6,self.counterSelect7,self.counterSelect8,self.counterSelect9,self.counterSelect10,self.counterSelect11,self.counterSelect12,self.counterSelect13,self.counterSelect14,self.reserved_544,self.samplesOnlyOptionMask)
+
+    def unpack_from(self,buffer,offset=0):
+        self.reserved_640 = bytearray(buffer[offset + 80:offset + 192])
+        (w0,w1,w2,self.optionMask,self.vendorMask,self.sampleStart,self.sampleInterval,self.tag,self.counterSelect0,self.counterSelect1,self.counterSelect2,self.counterSelect3,self.counterSelect4,self.counterSelect5,self.counterSelect6,self.counterSelect7,self.counterSelect8,self.counterSelect9,self.counterSelect10,self.counterSelect11,self.counterSelect12,self.counterSelect13,self.counterSelect14,self.reserved_544,self.samplesOnlyOptionMask,) = _struct_LLLQQLLHHHHHHHHHHHHHHHHLQ.unpack_from(buffer,offset+0)
+        self.opCode = w0 >> 24
+        self.portSelect = (w0 >> 16) & 0xFF
+        self.tick = (w0 >> 8) & 0xFF
+        self.reserved_24 = (w0 >> 3) & 0x1F
+        self.counterWidth = w0 & 0x7
+        self.reserved_32 = w1 >> 30
+        self.counterMask0 = (w1 >> 27) & 0x7
+        self.counterMask1 = (w1 >> 24) & 0x7
+        self.counterMask2 = (w1 >> 21) & 0x7
+        self.counterMask3 = (w1 >> 18) & 0x7
+        self.counterMask4 = (w1 >> 15) & 0x7
+        self.counterMask5 = (w1 >> 12) & 0x7
+        self.counterMask6 = (w1 >> 9) & 0x7
+        self.counterMask7 = (w1 >> 6) & 0x7
+        self.counterMask8 = (w1 >> 3) & 0x7
+        self.counterMask9 = w1 & 0x7
+        self.reserved_64 = w2 >> 31
+        self.counterMask10 = (w2 >> 28) & 0x7
+        self.counterMask11 = (w2 >> 25) & 0x7
+        self.counterMask12 = (w2 >> 22) & 0x7
+        self.counterMask13 = (w2 >> 19) & 0x7
+        self.counterMask14 = (w2 >> 16) & 0x7
+        self.sampleMechanisms = (w2 >> 8) & 0xFF
+        self.reserved_88 = (w2 >> 2) & 0x3F
+        self.sampleStatus = w2 & 0x3
+
+class _PMPortSamplesCtlView(rdma.binstruct.BinStructView,PMPortSamplesCtl):
+    '''Read only view of a packed :class:`PMPortSamplesCtl`'''
+    __slots__ = ('_buf','_off')
+    opCode = property(lambda self:_struct_L.unpack_from(self._buf,self._off)[0] >> 24)
+    portSelect = property(lambda self:(_struct_L.unpack_from(self._buf,self._off)[0] >> 16) & 0xFF)
+    tick = property(lambda self:(_struct_L.unpack_from(self._buf,self._off)[0] >> 8) & 0xFF)
+    reserved_24 = property(lambda self:(_struct_L.unpack_from(self._buf,self._off)[0] >> 3) & 0x1F)
+    counterWidth = property(lambda self:_struct_L.unpack_from(self._buf,self._off)[0] & 0x7)
+    reserved_32 = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 4)[0] >> 30)
+    counterMask0 = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 4)[0] >> 27) & 0x7)
+    counterMask1 = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 4)[0] >> 24) & 0x7)
+    counterMask2 = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 4)[0] >> 21) & 0x7)
+    counterMask3 = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 4)[0] >> 18) & 0x7)
+    counterMask4 = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 4)[0] >> 15) & 0x7)
+    counterMask5 = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 4)[0] >> 12) & 0x7)
+    counterMask6 = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 4)[0] >> 9) & 0x7)
+    counterMask7 = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 4)[0] >> 6) & 0x7)
+    counterMask8 = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 4)[0] >> 3) & 0x7)
+    counterMask9 = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 4)[0] & 0x7)
+    reserved_64 = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 8)[0] >> 31)
+    counterMask10 = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 8)[0] >> 28) & 0x7)
+    counterMask11 = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 8)[0] >> 25) & 0x7)
+    counterMask12 = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 8)[0] >> 22) & 0x7)
+    counterMask13 = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 8)[0] >> 19) & 0x7)
+    counterMask14 = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 8)[0] >> 16) & 0x7)
+    sampleMechanisms = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 8)[0] >> 8) & 0xFF)
+    reserved_88 = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 8)[0] >> 2) & 0x3F)
+    sampleStatus = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 8)[0] & 0x3)
+    optionMask = property(lambda self:_struct_Q.unpack_from(self._buf,self._off + 12)[0])
+    vendorMask = property(lambda self:_struct_Q.unpack_from(self._buf,self._off + 20)[0])
+    sampleStart = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 28)[0])
+    sampleInterval = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 32)[0])
+    tag = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 36)[0])
+    counterSelect0 = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 38)[0])
+    counterSelect1 = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 40)[0])
+    counterSelect2 = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 42)[0])
+    counterSelect3 = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 44)[0])
+    counterSelect4 = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 46)[0])
+    counterSelect5 = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 48)[0])
+    counterSelect6 = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 50)[0])
+    counterSelect7 = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 52)[0])
+    counterSelect8 = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 54)[0])
+    counterSelect9 = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 56)[0])
+    counterSelect10 = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 58)[0])
+    counterSelect11 = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 60)[0])
+    counterSelect12 = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 62)[0])
+    counterSelect13 = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 64)[0])
+    counterSelect14 = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 66)[0])
+    reserved_544 = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 68)[0])
+    samplesOnlyOptionMask = property(lambda self:_struct_Q.unpack_from(self._buf,self._off + 72)[0])
+    reserved_640 = property(lambda self:bytearray(self._buf[self._off + 80:self._off + 192]))
+PMPortSamplesCtl.View = _PMPortSamplesCtlView
+
+class PMPortSamplesRes(rdma.binstruct.BinStruct):
+    '''Port Performance Data Sampling Results (section 16.1.3.4)'''
+    __slots__ = ('tag','reserved_16','sampleStatus','counter')
+    MAD_LENGTH = 64
+    MAD_ATTRIBUTE_ID = 0x11
+    MAD_PERFORMANCEGET = 0x1 # MAD_METHOD_GET
+    MEMBERS = [('tag',16,1), ('reserved_16',14,1), ('sampleStatus',2,1), ('counter',32,15)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        self.counter = [0]*15
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.tag = 0
+        self.reserved_16 = 0
+        self.sampleStatus = 0
+        self.counter = [0]*15
+
+    def pack_into(self,buffer,offset=0):
+        _struct_LLLLLLLLLLLLLLLL.pack_into(buffer,offset+0,((self.tag & 0xFFFF) << 16) | ((self.reserved_16 & 0x3FFF) << 2) | (self.sampleStatus & 0x3),self.counter[0],self.counter[1],self.counter[2],self.counter[3],self.counter[4],self.counter[5],self.counter[6],self.counter[7],self.counter[8],self.counter[9],self.counter[10],self.counter[11],self.counter[12],self.counter[13],self.counter[14])
+
+    def unpack_from(self,buffer,offset=0):
+        (w0,self.counter[0],self.counter[1],self.counter[2],self.counter[3],self.counter[4],self.counter[5],self.counter[6],self.counter[7],self.counter[8],self.counter[9],self.counter[10],self.counter[11],self.counter[12],self.counter[13],self.counter[14],) = _struct_LLLLLLLLLLLLLLLL.unpack_from(buffer,offset+0)
+        self.tag = w0 >> 16
+        self.reserved_16 = (w0 >> 2) & 0x3FFF
+        self.sampleStatus = w0 & 0x3
+
+class _PMPortSamplesResView(rdma.binstruct.BinStructView,PMPortSamplesRes):
+    '''Read only view of a packed :class:`PMPortSamplesRes`'''
+    __slots__ = ('_buf','_off')
+    tag = property(lambda self:_struct_L.unpack_from(self._buf,self._off)[0] >> 16)
+    reserved_16 = property(lambda self:(_struct_L.unpack_from(self._buf,self._off)[0] >> 2) & 0x3FFF)
+    sampleStatus = property(lambda self:_struct_L.unpack_from(self._buf,self._off)[0] & 0x3)
+    counter = property(lambda self:list(_struct_LLLLLLLLLLLLLLL.unpack_from(self._buf,self._off + 4)))
+PMPortSamplesRes.View = _PMPortSamplesResView
+
+class PMPortCounters(rdma.binstruct.BinStruct):
+    '''Port Basic Performance and Error Counters (section 16.1.3.5)'''
+    __slots__ = ('reserved_0','portSelect','counterSelect','symbolErrorCounter','linkErrorRecoveryCounter','linkDownedCounter','portRcvErrors','portRcvRemotePhysicalErrors','portRcvSwitchRelayErrors','portXmitDiscards','portXmitConstraintErrors','portRcvConstraintErrors','counterSelect2','localLinkIntegrityErrors','excessiveBufferOverrunErrors','reserved_160','VL15Dropped','portXmitData','portRcvData','portXmitPkts','portRcvPkts','portXmitWait')
+    MAD_LENGTH = 44
+    MAD_ATTRIBUTE_ID = 0x12
+    MAD_PERFORMANCEGET = 0x1 # MAD_METHOD_GET
+    MAD_PERFORMANCESET = 0x2 # MAD_METHOD_SET
+    MEMBERS = [('reserved_0',8,1), ('portSelect',8,1), ('counterSelect',16,1), ('symbolErrorCounter',16,1), ('linkErrorRecoveryCounter',8,1), ('linkDownedCounter',8,1), ('portRcvErrors',16,1), ('portRcvRemotePhysicalErrors',16,1), ('portRcvSwitchRelayErrors',16,1), ('portXmitDiscards',16,1), ('portXmitConstraintErrors',8,1), ('portRcvConstraintErrors',8,1), ('counterSelect2',8,1), ('localLinkIntegrityErrors',4,1), ('excessiveBufferOverrunErrors',4,1), ('reserved_160',16,1), ('VL15Dropped',16,1), ('portXmitData',32,1), ('portRcvData',32,1), ('portXmitPkts',32,1), ('portRcvPkts',32,1), ('portXmitWait',32,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.reserved_0 = 0
+        self.portSelect = 0
+        self.counterSelect = 0
+        self.symbolErrorCounter = 0
+        self.linkErrorRecoveryCounter = 0
+        self.linkDownedCounter = 0
+        self.portRcvErrors = 0
+        self.portRcvRemotePhysicalErrors = 0
+        self.portRcvSwitchRelayErrors = 0
+        self.portXmitDiscards = 0
+        self.portXmitConstraintErrors = 0
+        self.portRcvConstraintErrors = 0
+        self.counterSelect2 = 0
+        self.localLinkIntegrityErrors = 0
+        self.excessiveBufferOverrunErrors = 0
+        self.reserved_160 = 0
+        self.VL15Dropped = 0
+        self.portXmitData = 0
+        self.portRcvData = 0
+        self.portXmitPkts = 0
+        self.portRcvPkts = 0
+        self.portXmitWait = 0
+
+    def pack_into(self,buffer,offset=0):
+        _struct_BBHHBBHHHHLHHLLLLL.pack_into(buffer,offset+0,self.reserved_0,self.portSelect,self.counterSelect,self.symbolErrorCounter,self.linkErrorRecoveryCounter,self.linkDownedCounter,self.portRcvErrors,self.portRcvRemotePhysicalErrors,self.portRcvSwitchRelayErrors,self.portXmitDiscards,((self.portXmitConstraintErrors & 0xFF) << 24) | ((self.portRcvConstraintErrors & 0xFF) << 16) | ((self.counterSelect2 & 0xFF) << 8) | ((self.localLinkIntegrityErrors & 0xF) << 4) | (self.excessiveBufferOverrunErrors & 0xF),self.reserved_160,self.VL15Dropped,self.portXmitData,self.portRcvData,self.portXmitPkts,self.portRcvPkts,self.portXmitWait)
+
+    def unpack_from(self,buffer,offset=0):
+        (self.reserved_0,self.portSelect,self.counterSelect,self.symbolErrorCounter,self.linkErrorRecoveryCounter,self.linkDownedCounter,self.portRcvErrors,self.portRcvRemotePhysicalErrors,self.portRcvSwitchRelayErrors,self.portXmitDiscards,w0,self.reserved_160,self.VL15Dropped,self.portXmitData,self.portRcvData,self.portXmitPkts,self.portRcvPkts,self.portXmitWait,) = _struct_BBHHBBHHHHLHHLLLLL.unpack_from(buffer,offset+0)
+        self.portXmitConstraintErrors = w0 >> 24
+        self.portRcvConstraintErrors = (w0 >> 16) & 0xFF
+        self.counterSelect2 = (w0 >> 8) & 0xFF
+        self.localLinkIntegrityErrors = (w0 >> 4) & 0xF
+        self.excessiveBufferOverrunErrors = w0 & 0xF
+
+class _PMPortCountersView(rdma.binstruct.BinStructView,PMPortCounters):
+    '''Read only view of a packed :class:`PMPortCounters`'''
+    __slots__ = ('_buf','_off')
+    reserved_0 = property(lambda self:self._buf[self._off])
+    portSelect = property(lambda self:self._buf[self._off + 1])
+    counterSelect = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 2)[0])
+    symbolErrorCounter = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 4)[0])
+    linkErrorRecoveryCounter = property(lambda self:self._buf[self._off + 6])
+    linkDownedCounter = property(lambda self:self._buf[self._off + 7])
+    portRcvErrors = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 8)[0])
+    portRcvRemotePhysicalErrors = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 10)[0])
+    portRcvSwitchRelayErrors = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 12)[0])
+    portXmitDiscards = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 14)[0])
+    portXmitConstraintErrors = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 16)[0] >> 24)
+    portRcvConstraintErrors = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 16)[0] >> 16) & 0xFF)
+    counterSelect2 = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 16)[0] >> 8) & 0xFF)
+    localLinkIntegrityErrors = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 16)[0] >> 4) & 0xF)
+    excessiveBufferOverrunErrors = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 16)[0] & 0xF)
+    reserved_160 = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 20)[0])
+    VL15Dropped = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 22)[0])
+    portXmitData = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 24)[0])
+    portRcvData = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 28)[0])
+    portXmitPkts = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 32)[0])
+    portRcvPkts = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 36)[0])
+    portXmitWait = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 40)[0])
+PMPortCounters.View = _PMPortCountersView
+
+class PMPortRcvErrorDetails(rdma.binstruct.BinStruct):
+    '''Port Detailed Error Counters (section 16.1.4.1)'''
+    __slots__ = ('reserved_0','portSelect','counterSelect','portLocalPhysicalErrors','portMalformedPacketErrors','portBufferOverrunErrors','portDLIDMappingErrors','portVLMappingErrors','portLoopingErrors')
+    MAD_LENGTH = 16
+    MAD_ATTRIBUTE_ID = 0x15
+    MAD_PERFORMANCEGET = 0x1 # MAD_METHOD_GET
+    MAD_PERFORMANCESET = 0x2 # MAD_METHOD_SET
+    MEMBERS = [('reserved_0',8,1), ('portSelect',8,1), ('counterSelect',16,1), ('portLocalPhysicalErrors',16,1), ('portMalformedPacketErrors',16,1), ('portBufferOverrunErrors',16,1), ('portDLIDMappingErrors',16,1), ('portVLMappingErrors',16,1), ('portLoopingErrors',16,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.reserved_0 = 0
+        self.portSelect = 0
+        self.counterSelect = 0
+        self.portLocalPhysicalErrors = 0
+        self.portMalformedPacketErrors = 0
+        self.portBufferOverrunErrors = 0
+        self.portDLIDMappingErrors = 0
+        self.portVLMappingErrors = 0
+        self.portLoopingErrors = 0
+
+    def pack_into(self,buffer,offset=0):
+        _struct_BBHHHHHHH.pack_into(buffer,offset+0,self.reserved_0,self.portSelect,self.counterSelect,self.portLocalPhysicalErrors,self.portMalformedPacketErrors,self.portBufferOverrunErrors,self.portDLIDMappingErrors,self.portVLMappingErrors,self.portLoopingErrors)
+
+    def unpack_from(self,buffer,offset=0):
+        (self.reserved_0,self.portSelect,self.counterSelect,self.portLocalPhysicalErrors,self.portMalformedPacketErrors,self.portBufferOverrunErrors,self.portDLIDMappingErrors,self.portVLMappingErrors,self.portLoopingErrors,) = _struct_BBHHHHHHH.unpack_from(buffer,offset+0)
+
+class _PMPortRcvErrorDetailsView(rdma.binstruct.BinStructView,PMPortRcvErrorDetails):
+    '''Read only view of a packed :class:`PMPortRcvErrorDetails`'''
+    __slots__ = ('_buf','_off')
+    reserved_0 = property(lambda self:self._buf[self._off])
+    portSelect = property(lambda self:self._buf[self._off + 1])
+    counterSelect = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 2)[0])
+    portLocalPhysicalErrors = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 4)[0])
+    portMalformedPacketErrors = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 6)[0])
+    portBufferOverrunErrors = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 8)[0])
+    portDLIDMappingErrors = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 10)[0])
+    portVLMappingErrors = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 12)[0])
+    portLoopingErrors = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 14)[0])
+PMPortRcvErrorDetails.View = _PMPortRcvErrorDetailsView
+
+class PMPortXmitDiscardDetails(rdma.binstruct.BinStruct):
+    '''Port Transmit Discard Counters (section 16.1.4.2)'''
+    __slots__ = ('reserved_0','portSelect','counterSelect','portInactiveDiscards','portNeighborMTUDiscards','portSwLifetimeLimitDiscards','portSwHOQLimitDiscards')
+    MAD_LENGTH = 12
+    MAD_ATTRIBUTE_ID = 0x16
+    MAD_PERFORMANCEGET = 0x1 # MAD_METHOD_GET
+    MAD_PERFORMANCESET = 0x2 # MAD_METHOD_SET
+    MEMBERS = [('reserved_0',8,1), ('portSelect',8,1), ('counterSelect',16,1), ('portInactiveDiscards',16,1), ('portNeighborMTUDiscards',16,1), ('portSwLifetimeLimitDiscards',16,1), ('portSwHOQLimitDiscards',16,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.reserved_0 = 0
+        self.portSelect = 0
+        self.counterSelect = 0
+        self.portInactiveDiscards = 0
+        self.portNeighborMTUDiscards = 0
+        self.portSwLifetimeLimitDiscards = 0
+        self.portSwHOQLimitDiscards = 0
+
+    def pack_into(self,buffer,offset=0):
+        _struct_BBHHHHH.pack_into(buffer,offset+0,self.reserved_0,self.portSelect,self.counterSelect,self.portInactiveDiscards,self.portNeighborMTUDiscards,self.portSwLifetimeLimitDiscards,self.portSwHOQLimitDiscards)
+
+    def unpack_from(self,buffer,offset=0):
+        (self.reserved_0,self.portSelect,self.counterSelect,self.portInactiveDiscards,self.portNeighborMTUDiscards,self.portSwLifetimeLimitDiscards,self.portSwHOQLimitDiscards,) = _struct_BBHHHHH.unpack_from(buffer,offset+0)
+
+class _PMPortXmitDiscardDetailsView(rdma.binstruct.BinStructView,PMPortXmitDiscardDetails):
+    '''Read only view of a packed :class:`PMPortXmitDiscardDetails`'''
+    __slots__ = ('_buf','_off')
+    reserved_0 = property(lambda self:self._buf[self._off])
+    portSelect = property(lambda self:self._buf[self._off + 1])
+    counterSelect = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 2)[0])
+    portInactiveDiscards = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 4)[0])
+    portNeighborMTUDiscards = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 6)[0])
+    portSwLifetimeLimitDiscards = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 8)[0])
+    portSwHOQLimitDiscards = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 10)[0])
+PMPortXmitDiscardDetails.View = _PMPortXmitDiscardDetailsView
+
+class PMPortOpRcvCounters(rdma.binstruct.BinStruct):
+    '''Port Receive Counters per Op Code (section 16.1.4.3)'''
+    __slots__ = ('opCode','portSelect','counterSelect','portOpRcvPkts','portOpRcvData')
+    MAD_LENGTH = 12
+    MAD_ATTRIBUTE_ID = 0x17
+    MAD_PERFORMANCEGET = 0x1 # MAD_METHOD_GET
+    MAD_PERFORMANCESET = 0x2 # MAD_METHOD_SET
+    MEMBERS = [('opCode',8,1), ('portSelect',8,1), ('counterSelect',16,1), ('portOpRcvPkts',32,1), ('portOpRcvData',32,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.opCode = 0
+        self.portSelect = 0
+        self.counterSelect = 0
+        self.portOpRcvPkts = 0
+        self.portOpRcvData = 0
+
+    def pack_into(self,buffer,offset=0):
+        _struct_BBHLL.pack_into(buffer,offset+0,self.opCode,self.portSelect,self.counterSelect,self.portOpRcvPkts,self.portOpRcvData)
+
+    def unpack_from(self,buffer,offset=0):
+        (self.opCode,self.portSelect,self.counterSelect,self.portOpRcvPkts,self.portOpRcvData,) = _struct_BBHLL.unpack_from(buffer,offset+0)
+
+class _PMPortOpRcvCountersView(rdma.binstruct.BinStructView,PMPortOpRcvCounters):
+    '''Read only view of a packed :class:`PMPortOpRcvCounters`'''
+    __slots__ = ('_buf','_off')
+    opCode = property(lambda self:self._buf[self._off])
+    portSelect = property(lambda self:self._buf[self._off + 1])
+    counterSelect = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 2)[0])
+    portOpRcvPkts = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 4)[0])
+    portOpRcvData = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 8)[0])
+PMPortOpRcvCounters.View = _PMPortOpRcvCountersView
+
+class PMPortFlowCtlCounters(rdma.binstruct.BinStruct):
+    '''Port Flow Control Counters (section 16.1.4.4)'''
+    __slots__ = ('reserved_0','portSelect','counterSelect','portXmitFlowPkts','portRcvFlowPkts')
+    MAD_LENGTH = 12
+    MAD_ATTRIBUTE_ID = 0x18
+    MAD_PERFORMANCEGET = 0x1 # MAD_METHOD_GET
+    MAD_PERFORMANCESET = 0x2 # MAD_METHOD_SET
+    MEMBERS = [('reserved_0',8,1), ('portSelect',8,1), ('counterSelect',16,1), ('portXmitFlowPkts',32,1), ('portRcvFlowPkts',32,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.reserved_0 = 0
+        self.portSelect = 0
+        self.counterSelect = 0
+        self.portXmitFlowPkts = 0
+        self.portRcvFlowPkts = 0
+
+    def pack_into(self,buffer,offset=0):
+        _struct_BBHLL.pack_into(buffer,offset+0,self.reserved_0,self.portSelect,self.counterSelect,self.portXmitFlowPkts,self.portRcvFlowPkts)
+
+    def unpack_from(self,buffer,offset=0):
+        (self.reserved_0,self.portSelect,self.counterSelect,self.portXmitFlowPkts,self.portRcvFlowPkts,) = _struct_BBHLL.unpack_from(buffer,offset+0)
+
+class _PMPortFlowCtlCountersView(rdma.binstruct.BinStructView,PMPortFlowCtlCounters):
+    '''Read only view of a packed :class:`PMPortFlowCtlCounters`'''
+    __slots__ = ('_buf','_off')
+    reserved_0 = property(lambda self:self._buf[self._off])
+    portSelect = property(lambda self:self._buf[self._off + 1])
+    counterSelect = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 2)[0])
+    portXmitFlowPkts = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 4)[0])
+    portRcvFlowPkts = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 8)[0])
+PMPortFlowCtlCounters.View = _PMPortFlowCtlCountersView
+
+class PMPortVLOpPackets(rdma.binstruct.BinStruct):
+    '''Port Packets Received per Op Code per VL (section 16.1.4.5)'''
+    __slots__ = ('opCode','portSelect','counterSelect','portVLOpPackets')
+    MAD_LENGTH = 36
+    MAD_ATTRIBUTE_ID = 0x19
+    MAD_PERFORMANCEGET = 0x1 # MAD_METHOD_GET
+    MAD_PERFORMANCESET = 0x2 # MAD_METHOD_SET
+    MEMBERS = [('opCode',8,1), ('portSelect',8,1), ('counterSelect',16,1), ('portVLOpPackets',16,16)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        self.portVLOpPackets = [0]*16
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.opCode = 0
+        self.portSelect = 0
+        self.counterSelect = 0
+        self.portVLOpPackets = [0]*16
+
+    def pack_into(self,buffer,offset=0):
+        _struct_BBHHHHHHHHHHHHHHHHH.pack_into(buffer,offset+0,self.opCode,self.portSelect,self.counterSelect,self.portVLOpPackets[0],self.portVLOpPackets[1],self.portVLOpPackets[2],self.portVLOpPackets[3],self.portVLOpPackets[4],self.portVLOpPackets[5],self.portVLOpPackets[6],self.portVLOpPackets[7],self.portVLOpPackets[8],self.portVLOpPackets[9],self.portVLOpPackets[10],self.portVLOpPackets[11],self.portVLOpPackets[12],self.portVLOpPackets[13],self.portVLOpPackets[14],self.portVLOpPackets[15])
+
+    def unpack_from(self,buffer,offset=0):
+        (self.opCode,self.portSelect,self.counterSelect,self.portVLOpPackets[0],self.portVLOpPackets[1],self.portVLOpPackets[2],self.portVLOpPackets[3],self.portVLOpPackets[4],self.portVLOpPackets[5],self.portVLOpPackets[6],self.portVLOpPackets[7],self.portVLOpPackets[8],self.portVLOpPackets[9],self.portVLOpPackets[10],self.portVLOpPackets[11],self.portVLOpPackets[12],self.portVLOpPackets[13],self.portVLOpPackets[14],self.portVLOpPackets[15],) = _struct_BBHHHHHHHHHHHHHHHHH.unpack_from(buffer,offset+0)
+
+class _PMPortVLOpPacketsView(rdma.binstruct.BinStructView,PMPortVLOpPackets):
+    '''Read only view of a packed :class:`PMPortVLOpPackets`'''
+    __slots__ = ('_buf','_off')
+    opCode = property(lambda self:self._buf[self._off])
+    portSelect = property(lambda self:self._buf[self._off + 1])
+    counterSelect = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 2)[0])
+    portVLOpPackets = property(lambda self:list(_struct_HHHHHHHHHHHHHHHH.unpack_from(self._buf,self._off + 4)))
+PMPortVLOpPackets.View = _PMPortVLOpPacketsView
+
+class PMPortVLOpData(rdma.binstruct.BinStruct):
+    '''Port Kilobytes Received per Op Code per VL (section 16.1.4.6)'''
+    __slots__ = ('opCode','portSelect','counterSelect','portVLOpData')
+    MAD_LENGTH = 68
+    MAD_ATTRIBUTE_ID = 0x1a
+    MAD_PERFORMANCEGET = 0x1 # MAD_METHOD_GET
+    MAD_PERFORMANCESET = 0x2 # MAD_METHOD_SET
+    MEMBERS = [('opCode',8,1), ('portSelect',8,1), ('counterSelect',16,1), ('portVLOpData',32,16)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        self.portVLOpData = [0]*16
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.opCode = 0
+        self.portSelect = 0
+        self.counterSelect = 0
+        self.portVLOpData = [0]*16
+
+    def pack_into(self,buffer,offset=0):
+        _struct_BBHLLLLLLLLLLLLLLLL.pack_into(buffer,offset+0,self.opCode,self.portSelect,self.counterSelect,self.portVLOpData[0],self.portVLOpData[1],self.portVLOpData[2],self.portVLOpData[3],self.portVLOpData[4],self.portVLOpData[5],self.portVLOpData[6],self.portVLOpData[7],self.portVLOpData[8],self.portVLOpData[9],self.portVLOpData[10],self.portVLOpData[11],self.portVLOpData[12],self.portVLOpData[13],self.portVLOpData[14],self.portVLOpData[15])
+
+    def unpack_from(self,buffer,offset=0):
+        (self.opCode,self.portSelect,self.counterSelect,self.portVLOpData[0],self.portVLOpData[1],self.portVLOpData[2],self.portVLOpData[3],self.portVLOpData[4],self.portVLOpData[5],self.portVLOpData[6],self.portVLOpData[7],self.portVLOpData[8],self.portVLOpData[9],self.portVLOpData[10],self.portVLOpData[11],self.portVLOpData[12],self.portVLOpData[13],self.portVLOpData[14],self.portVLOpData[15],) = _struct_BBHLLLLLLLLLLLLLLLL.unpack_from(buffer,offset+0)
+
+class _PMPortVLOpDataView(rdma.binstruct.BinStructView,PMPortVLOpData):
+    '''Read only view of a packed :class:`PMPortVLOpData`'''
+    __slots__ = ('_buf','_off')
+    opCode = property(lambda self:self._buf[self._off])
+    portSelect = property(lambda self:self._buf[self._off + 1])
+    counterSelect = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 2)[0])
+    portVLOpData = property(lambda self:list(_struct_LLLLLLLLLLLLLLLL.unpack_from(self._buf,self._off + 4)))
+PMPortVLOpData.View = _PMPortVLOpDataView
+
+class PMPortVLXmitFlowCtlUpdateErrors(rdma.binstruct.BinStruct):
+    '''Port Flow Control update errors per VL (section 16.1.4.7)'''
+    __slots__ = ('reserved_0','portSelect','counterSelect','portVLXmitFlowCtlUpdateErrors')
+    MAD_LENGTH = 8
+    MAD_ATTRIBUTE_ID = 0x1b
+    MAD_PERFORMANCEGET = 0x1 # MAD_METHOD_GET
+    MAD_PERFORMANCESET = 0x2 # MAD_METHOD_SET
+    MEMBERS = [('reserved_0',8,1), ('portSelect',8,1), ('counterSelect',16,1), ('portVLXmitFlowCtlUpdateErrors',2,16)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        self.portVLXmitFlowCtlUpdateErrors = [0]*16
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.reserved_0 = 0
+        self.portSelect = 0
+        self.counterSelect = 0
+        self.portVLXmitFlowCtlUpdateErrors = [0]*16
+
+    def pack_into(self,buffer,offset=0):
+        rdma.binstruct.pack_array8(buffer,offset+4,2,16,self.portVLXmitFlowCtlUpdateErrors)
+        _struct_BBH.pack_into(buffer,offset+0,self.reserved_0,self.portSelect,self.counterSelect)
+
+    def unpack_from(self,buffer,offset=0):
+        rdma.binstruct.unpack_array8(buffer,offset+4,2,16,self.portVLXmitFlowCtlUpdateErrors)
+        (self.reserved_0,self.portSelect,self.counterSelect,) = _struct_BBH.unpack_from(buffer,offset+0)
+
+class _PMPortVLXmitFlowCtlUpdateErrorsView(rdma.binstruct.BinStructView,PMPortVLXmitFlowCtlUpdateErrors):
+    '''Read only view of a packed :class:`PMPortVLXmitFlowCtlUpdateErrors`'''
+    __slots__ = ('_buf','_off')
+    reserved_0 = property(lambda self:self._buf[self._off])
+    portSelect = property(lambda self:self._buf[self._off + 1])
+    counterSelect = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 2)[0])
+    portVLXmitFlowCtlUpdateErrors = property(lambda self:rdma.binstruct.unpack_array8(self._buf,self._off + 4,2,16,[0]*16))
+PMPortVLXmitFlowCtlUpdateErrors.View = _PMPortVLXmitFlowCtlUpdateErrorsView
+
+class PMPortVLXmitWaitCounters(rdma.binstruct.BinStruct):
+    '''Port Ticks Waiting to Transmit Counters per VL (section 16.1.4.8)'''
+    __slots__ = ('reserved_0','portSelect','counterSelect','portVLXmitWait')
+    MAD_LENGTH = 36
+    MAD_ATTRIBUTE_ID = 0x1c
+    MAD_PERFORMANCEGET = 0x1 # MAD_METHOD_GET
+    MAD_PERFORMANCESET = 0x2 # MAD_METHOD_SET
+    MEMBERS = [('reserved_0',8,1), ('portSelect',8,1), ('counterSelect',16,1), ('portVLXmitWait',16,16)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        self.portVLXmitWait = [0]*16
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.reserved_0 = 0
+        self.portSelect = 0
+        self.counterSelect = 0
+        self.portVLXmitWait = [0]*16
+
+    def pack_into(self,buffer,offset=0):
+        _struct_BBHHHHHHHHHHHHHHHHH.pack_into(buffer,offset+0,self.reserved_0,self.portSelect,self.counterSelect,self.portVLXmitWait[0],self.portVLXmitWait[1],self.portVLXmitWait[2],self.portVLXmitWait[3],self.portVLXmitWait[4],self.portVLXmitWait[5],self.portVLXmitWait[6],self.portVLXmitWait[7],self.portVLXmitWait[8],self.portVLXmitWait[9],self.portVLXmitWait[10],self.portVLXmitWait[11],self.portVLXmitWait[12],self.portVLXmitWait[13],self.portVLXmitWait[14],self.portVLXmitWait[15])
+
+    def unpack_from(self,buffer,offset=0):
+        (self.reserved_0,self.portSelect,self.counterSelect,self.portVLXmitWait[0],self.portVLXmitWait[1],self.portVLXmitWait[2],self.portVLXmitWait[3],self.portVLXmitWait[4],self.portVLXmitWait[5],self.portVLXmitWait[6],self.portVLXmitWait[7],self.portVLXmitWait[8],self.portVLXmitWait[9],self.portVLXmitWait[10],self.portVLXmitWait[11],self.portVLXmitWait[12],self.portVLXmitWait[13],self.portVLXmitWait[14],self.portVLXmitWait[15],) = _struct_BBHHHHHHHHHHHHHHHHH.unpack_from(buffer,offset+0)
+
+class _PMPortVLXmitWaitCountersView(rdma.binstruct.BinStructView,PMPortVLXmitWaitCounters):
+    '''Read only view of a packed :class:`PMPortVLXmitWaitCounters`'''
+    __slots__ = ('_buf','_off')
+    reserved_0 = property(lambda self:self._buf[self._off])
+    portSelect = property(lambda self:self._buf[self._off + 1])
+    counterSelect = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 2)[0])
+    portVLXmitWait = property(lambda self:list(_struct_HHHHHHHHHHHHHHHH.unpack_from(self._buf,self._off + 4)))
+PMPortVLXmitWaitCounters.View = _PMPortVLXmitWaitCountersView
+
+class PMSwPortVLCongestion(rdma.binstruct.BinStruct):
+    '''Switch Port Congestion per VL (section 16.1.4.9)'''
+    __slots__ = ('reserved_0','portSelect','counterSelect','swPortVLCongestion')
+    MAD_LENGTH = 36
+    MAD_ATTRIBUTE_ID = 0x30
+    MAD_PERFORMANCEGET = 0x1 # MAD_METHOD_GET
+    MAD_PERFORMANCESET = 0x2 # MAD_METHOD_SET
+    MEMBERS = [('reserved_0',8,1), ('portSelect',8,1), ('counterSelect',16,1), ('swPortVLCongestion',16,16)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        self.swPortVLCongestion = [0]*16
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.reserved_0 = 0
+        self.portSelect = 0
+        self.counterSelect = 0
+        self.swPortVLCongestion = [0]*16
+
+    def pack_into(self,buffer,offset=0):
+        _struct_BBHHHHHHHHHHHHHHHHH.pack_into(buffer,offset+0,self.reserved_0,self.portSelect,self.counterSelect,self.swPortVLCongestion[0],self.swPortVLCongestion[1],self.swPortVLCongestion[2],self.swPortVLCongestion[3],self.swPortVLCongestion[4],self.swPortVLCongestion[5],self.swPortVLCongestion[6],self.swPortVLCongestion[7],self.swPortVLCongestion[8],self.swPortVLCongestion[9],self.swPortVLCongestion[10],self.swPortVLCongestion[11],self.swPortVLCongestion[12],self.swPortVLCongestion[13],self.swPortVLCongestion[14],self.swPortVLCongestion[15])
+
+    def unpack_from(self,buffer,offset=0):
+        (self.reserved_0,self.portSelect,self.counterSelect,self.swPortVLCongestion[0],self.swPortVLCongestion[1],self.swPortVLCongestion[2],self.swPortVLCongestion[3],self.swPortVLCongestion[4],self.swPortVLCongestion[5],self.swPortVLCongestion[6],self.swPortVLCongestion[7],self.swPortVLCongestion[8],self.swPortVLCongestion[9],self.swPortVLCongestion[10],self.swPortVLCongestion[11],self.swPortVLCongestion[12],self.swPortVLCongestion[13],self.swPortVLCongestion[14],self.swPortVLCongestion[15],) = _struct_BBHHHHHHHHHHHHHHHHH.unpack_from(buffer,offset+0)
+
+class _PMSwPortVLCongestionView(rdma.binstruct.BinStructView,PMSwPortVLCongestion):
+    '''Read only view of a packed :class:`PMSwPortVLCongestion`'''
+    __slots__ = ('_buf','_off')
+    reserved_0 = property(lambda self:self._buf[self._off])
+    portSelect = property(lambda self:self._buf[self._off + 1])
+    counterSelect = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 2)[0])
+    swPortVLCongestion = property(lambda self:list(_struct_HHHHHHHHHHHHHHHH.unpack_from(self._buf,self._off + 4)))
+PMSwPortVLCongestion.View = _PMSwPortVLCongestionView
+
+class PMPortSamplesResExt(rdma.binstruct.BinStruct):
+    '''Extended Port Samples Result (section 16.1.4.10)'''
+    __slots__ = ('tag','reserved_16','sampleStatus','extendedWidth','reserved_34','counter')
+    MAD_LENGTH = 128
+    MAD_ATTRIBUTE_ID = 0x1e
+    MAD_PERFORMANCEGET = 0x1 # MAD_METHOD_GET
+    MAD_PERFORMANCESET = 0x2 # MAD_METHOD_SET
+    MEMBERS = [('tag',16,1), ('reserved_16',14,1), ('sampleStatus',2,1), ('extendedWidth',2,1), ('reserved_34',30,1), ('counter',64,15)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        self.counter = [0]*15
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.tag = 0
+        self.reserved_16 = 0
+        self.sampleStatus = 0
+        self.extendedWidth = 0
+        self.reserved_34 = 0
+        self.counter = [0]*15
+
+    def pack_into(self,buffer,offset=0):
+        rdma.binstruct.pack_array8(buffer,offset+8,64,15,self.counter)
+        _struct_LL.pack_into(buffer,offset+0,((self.tag & 0xFFFF) << 16) | ((self.reserved_16 & 0x3FFF) << 2) | (self.sampleStatus & 0x3),((self.extendedWidth & 0x3) << 30) | (self.reserved_34 & 0x3FFFFFFF))
+
+    def unpack_from(self,buffer,offset=0):
+        rdma.binstruct.unpack_array8(buffer,offset+8,64,15,self.counter)
+        (w0,w1,) = _struct_LL.unpack_from(buffer,offset+0)
+        self.tag = w0 >> 16
+        self.reserved_16 = (w0 >> 2) & 0x3FFF
+        self.sampleStatus = w0 & 0x3
+        self.extendedWidth = w1 >> 30
+        self.reserved_34 = w1 & 0x3FFFFFFF
+
+class _PMPortSamplesResExtView(rdma.binstruct.BinStructView,PMPortSamplesResExt):
+    '''Read only view of a packed :class:`PMPortSamplesResExt`'''
+    __slots__ = ('_buf','_off')
+    tag = property(lambda self:_struct_L.unpack_from(self._buf,self._off)[0] >> 16)
+    reserved_16 = property(lambda self:(_struct_L.unpack_from(self._buf,self._off)[0] >> 2) & 0x3FFF)
+    sampleStatus = property(lambda self:_struct_L.unpack_from(self._buf,self._off)[0] & 0x3)
+    extendedWidth = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 4)[0] >> 30)
+    reserved_34 = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 4)[0] & 0x3FFFFFFF)
+    counter = property(lambda self:rdma.binstruct.unpack_array8(self._buf,self._off + 8,64,15,[0]*15))
+PMPortSamplesResExt.View = _PMPortSamplesResExtView
+
+class PMPortCountersExt(rdma.binstruct.BinStruct):
+    '''Extended Port Counters (section 16.1.4.11)'''
+    __slots__ = ('reserved_0','portSelect','counterSelect','reserved_32','portXmitData','portRcvData','portXmitPkts','portRcvPkts','portUnicastXmitPkts','portUnicastRcvPkts','portMulticastXmitPkts','portMulticastRcvPkts')
+    MAD_LENGTH = 72
+    MAD_ATTRIBUTE_ID = 0x1d
+    MAD_PERFORMANCEGET = 0x1 # MAD_METHOD_GET
+    MAD_PERFORMANCESET = 0x2 # MAD_METHOD_SET
+    MEMBERS = [('reserved_0',8,1), ('portSelect',8,1), ('counterSelect',16,1), ('reserved_32',32,1), ('portXmitData',64,1), ('portRcvData',64,1), ('portXmitPkts',64,1), ('portRcvPkts',64,1), ('portUnicastXmitPkts',64,1), ('portUnicastRcvPkts',64,1), ('portMulticastXmitPkts',64,1), ('portMulticastRcvPkts',64,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.reserved_0 = 0
+        self.portSelect = 0
+        self.counterSelect = 0
+        self.reserved_32 = 0
+        self.portXmitData = 0
+        self.portRcvData = 0
+        self.portXmitPkts = 0
+        self.portRcvPkts = 0
+        self.portUnicastXmitPkts = 0
+        self.portUnicastRcvPkts = 0
+        self.portMulticastXmitPkts = 0
+        self.portMulticastRcvPkts = 0
+
+    def pack_into(self,buffer,offset=0):
+        _struct_BBHLQQQQQQQQ.pack_into(buffer,offset+0,self.reserved_0,self.portSelect,self.counterSelect,self.reserved_32,self.portXmitData,self.portRcvData,self.portXmitPkts,self.portRcvPkts,self.portUnicastXmitPkts,self.portUnicastRcvPkts,self.portMulticastXmitPkts,self.portMulticastRcvPkts)
+
+    def unpack_from(self,buffer,offset=0):
+        (self.reserved_0,self.portSelect,self.counterSelect,self.reserved_32,self.portXmitData,self.portRcvData,self.portXmitPkts,self.portRcvPkts,self.portUnicastXmitPkts,self.portUnicastRcvPkts,self.portMulticastXmitPkts,self.portMulticastRcvPkts,) = _struct_BBHLQQQQQQQQ.unpack_from(buffer,offset+0)
+
+class _PMPortCountersExtView(rdma.binstruct.BinStructView,PMPortCountersExt):
+    '''Read only view of a packed :class:`PMPortCountersExt`'''
+    __slots__ = ('_buf','_off')
+    reserved_0 = property(lambda self:self._buf[self._off])
+    portSelect = property(lambda self:self._buf[self._off + 1])
+    counterSelect = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 2)[0])
+    reserved_32 = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 4)[0])
+    portXmitData = property(lambda self:_struct_Q.unpack_from(self._buf,self._off + 8)[0])
+    portRcvData = property(lambda self:_struct_Q.unpack_from(self._buf,self._off + 16)[0])
+    portXmitPkts = property(lambda self:_struct_Q.unpack_from(self._buf,self._off + 24)[0])
+    portRcvPkts = property(lambda self:_struct_Q.unpack_from(self._buf,self._off + 32)[0])
+    portUnicastXmitPkts = property(lambda self:_struct_Q.unpack_from(self._buf,self._off + 40)[0])
+    portUnicastRcvPkts = property(lambda self:_struct_Q.unpack_from(self._buf,self._off + 48)[0])
+    portMulticastXmitPkts = property(lambda self:_struct_Q.unpack_from(self._buf,self._off + 56)[0])
+    portMulticastRcvPkts = property(lambda self:_struct_Q.unpack_from(self._buf,self._off + 64)[0])
+PMPortCountersExt.View = _PMPortCountersExtView
+
+class PMPortXmitDataSL(rdma.binstruct.BinStruct):
+    '''Transmit SL Port Counters (section A13.6.5)'''
+    __slots__ = ('reserved_0','portSelect','counterSelect','portXmitDataSL')
+    MAD_LENGTH = 68
+    MAD_ATTRIBUTE_ID = 0x36
+    MAD_PERFORMANCEGET = 0x1 # MAD_METHOD_GET
+    MAD_PERFORMANCESET = 0x2 # MAD_METHOD_SET
+    MEMBERS = [('reserved_0',8,1), ('portSelect',8,1), ('counterSelect',16,1), ('portXmitDataSL',32,16)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        self.portXmitDataSL = [0]*16
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.reserved_0 = 0
+        self.portSelect = 0
+        self.counterSelect = 0
+        self.portXmitDataSL = [0]*16
+
+    def pack_into(self,buffer,offset=0):
+        _struct_BBHLLLLLLLLLLLLLLLL.pack_into(buffer,offset+0,self.reserved_0,self.portSelect,self.counterSelect,self.portXmitDataSL[0],self.portXmitDataSL[1],self.portXmitDataSL[2],self.portXmitDataSL[3],self.portXmitDataSL[4],self.portXmitDataSL[5],self.portXmitDataSL[6],self.portXmitDataSL[7],self.portXmitDataSL[8],self.portXmitDataSL[9],self.portXmitDataSL[10],self.portXmitDataSL[11],self.portXmitDataSL[12],self.portXmitDataSL[13],self.portXmitDataSL[14],self.portXmitDataSL[15])
+
+    def unpack_from(self,buffer,offset=0):
+        (self.reserved_0,self.portSelect,self.counterSelect,self.portXmitDataSL[0],self.portXmitDataSL[1],self.portXmitDataSL[2],self.portXmitDataSL[3],self.portXmitDataSL[4],self.portXmitDataSL[5],self.portXmitDataSL[6],self.portXmitDataSL[7],self.portXmitDataSL[8],self.portXmitDataSL[9],self.portXmitDataSL[10],self.portXmitDataSL[11],self.portXmitDataSL[12],self.portXmitDataSL[13],self.portXmitDataSL[14],self.portXmitDataSL[15],) = _struct_BBHLLLLLLLLLLLLLLLL.unpack_from(buffer,offset+0)
+
+class _PMPortXmitDataSLView(rdma.binstruct.BinStructView,PMPortXmitDataSL):
+    '''Read only view of a packed :class:`PMPortXmitDataSL`'''
+    __slots__ = ('_buf','_off')
+    reserved_0 = property(lambda self:self._buf[self._off])
+    portSelect = property(lambda self:self._buf[self._off + 1])
+    counterSelect = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 2)[0])
+    portXmitDataSL = property(lambda self:list(_struct_LLLLLLLLLLLLLLLL.unpack_from(self._buf,self._off + 4)))
+PMPortXmitDataSL.View = _PMPortXmitDataSLView
+
+class PMPortRcvDataSL(rdma.binstruct.BinStruct):
+    '''Receive SL Port Counters (section A13.6.5)'''
+    __slots__ = ('reserved_0','portSelect','counterSelect','portRcvDataSL')
+    MAD_LENGTH = 68
+    MAD_ATTRIBUTE_ID = 0x37
+    MAD_PERFORMANCEGET = 0x1 # MAD_METHOD_GET
+    MAD_PERFORMANCESET = 0x2 # MAD_METHOD_SET
+    MEMBERS = [('reserved_0',8,1), ('portSelect',8,1), ('counterSelect',16,1), ('portRcvDataSL',32,16)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        self.portRcvDataSL = [0]*16
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.reserved_0 = 0
+        self.portSelect = 0
+        self.counterSelect = 0
+        self.portRcvDataSL = [0]*16
+
+    def pack_into(self,buffer,offset=0):
+        _struct_BBHLLLLLLLLLLLLLLLL.pack_into(buffer,offset+0,self.reserved_0,self.portSelect,self.counterSelect,self.portRcvDataSL[0],self.portRcvDataSL[1],self.portRcvDataSL[2],self.portRcvDataSL[3],self.portRcvDataSL[4],self.portRcvDataSL[5],self.portRcvDataSL[6],self.portRcvDataSL[7],self.portRcvDataSL[8],self.portRcvDataSL[9],self.portRcvDataSL[10],self.portRcvDataSL[11],self.portRcvDataSL[12],self.portRcvDataSL[13],self.portRcvDataSL[14],self.portRcvDataSL[15])
+
+    def unpack_from(self,buffer,offset=0):
+        (self.reserved_0,self.portSelect,self.counterSelect,self.portRcvDataSL[0],self.portRcvDataSL[1],self.portRcvDataSL[2],self.portRcvDataSL[3],self.portRcvDataSL[4],self.portRcvDataSL[5],self.portRcvDataSL[6],self.portRcvDataSL[7],self.portRcvDataSL[8],self.portRcvDataSL[9],self.portRcvDataSL[10],self.portRcvDataSL[11],self.portRcvDataSL[12],self.portRcvDataSL[13],self.portRcvDataSL[14],self.portRcvDataSL[15],) = _struct_BBHLLLLLLLLLLLLLLLL.unpack_from(buffer,offset+0)
+
+class _PMPortRcvDataSLView(rdma.binstruct.BinStructView,PMPortRcvDataSL):
+    '''Read only view of a packed :class:`PMPortRcvDataSL`'''
+    __slots__ = ('_buf','_off')
+    reserved_0 = property(lambda self:self._buf[self._off])
+    portSelect = property(lambda self:self._buf[self._off + 1])
+    counterSelect = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 2)[0])
+    portRcvDataSL = property(lambda self:list(_struct_LLLLLLLLLLLLLLLL.unpack_from(self._buf,self._off + 4)))
+PMPortRcvDataSL.View = _PMPortRcvDataSLView
+
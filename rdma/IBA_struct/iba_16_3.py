@@ -0,0 +1,363 @@
+import rdma.binstruct
+import struct
+import rdma.IBA as IBA
+
+_struct_BBBBHHQHHL = struct.Struct('>BBBBHHQHHL')
+_struct_H = struct.Struct('>H')
+_struct_HH = struct.Struct('>HH')
+_struct_L = struct.Struct('>L')
+_struct_LLHHLLHHHHHHHBBLLBBBBQ = struct.Struct('>LLHHLLHHHHHHHBBLLBBBBQ')
+_struct_Q = struct.Struct('>Q')
+
+class DMFormat(rdma.binstruct.BinFormat):
+    '''Device Management MAD Format (section 16.3.1)'''
+    __slots__ = ('baseVersion','mgmtClass','classVersion','method','status','classSpecific','transactionID','attributeID','reserved_144','attributeModifier','reserved_192','data')
+    MAD_LENGTH = 256
+    MAD_CLASS = 0x6
+    MAD_CLASS_VERSION = 0x1
+    MEMBERS = [('baseVersion',8,1), ('mgmtClass',8,1), ('classVersion',8,1), ('method',8,1), ('status',16,1), ('classSpecific',16,1), ('transactionID',64,1), ('attributeID',16,1), ('reserved_144',16,1), ('attributeModifier',32,1), ('reserved_192',320,1), ('data',1536,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.baseVersion = 0
+        self.mgmtClass = 0
+        self.classVersion = 0
+        self.method = 0
+        self.status = 0
+        self.classSpecific = 0
+        self.transactionID = 0
+        self.attributeID = 0
+        self.reserved_144 = 0
+        self.attributeModifier = 0
+        self.reserved_192 = bytearray(40)
+        self.data = bytearray(192)
+
+    def pack_into(self,buffer,offset=0):
+        buffer[offset + 24:offset + 64] = self.reserved_192
+        buffer[offset + 64:offset + 256] = self.data
+        _struct_BBBBHHQHHL.pack_into(buffer,offset+0,self.baseVersion,self.mgmtClass,self.classVersion,self.method,self.status,self.classSpecific,self.transactionID,self.attributeID,self.reserved_144,self.attributeModifier)
+
+    def unpack_from(self,buffer,offset=0):
+        self.reserved_192 = bytearray(buffer[offset + 24:offset + 64])
+        self.data = bytearray(buffer[offset + 64:offset + 256])
+        (self.baseVersion,self.mgmtClass,self.classVersion,self.method,self.status,self.classSpecific,self.transactionID,self.attributeID,self.reserved_144,self.attributeModifier,) = _struct_BBBBHHQHHL.unpack_from(buffer,offset+0)
+
+class DMServiceEntry(rdma.binstruct.BinStruct):
+    '''Service Entry (section 16.3.3)'''
+    __slots__ = ('serviceName','serviceID')
+    MAD_LENGTH = 48
+    MEMBERS = [('serviceName',8,40), ('serviceID',64,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.serviceName = bytearray(40)
+        self.serviceID = 0
+
+    def pack_into(self,buffer,offset=0):
+        buffer[offset + 0:offset + 40] = self.serviceName
+        _struct_Q.pack_into(buffer,offset+40,self.serviceID)
+
+    def unpack_from(self,buffer,offset=0):
+        self.serviceName = bytearray(buffer[offset + 0:offset + 40])
+        (self.serviceID,) = _struct_Q.unpack_from(buffer,offset+40)
+
+class _DMServiceEntryView(rdma.binstruct.BinStructView,DMServiceEntry):
+    '''Read only view of a packed :class:`DMServiceEntry`'''
+    __slots__ = ('_buf','_off')
+    serviceName = property(lambda self:bytearray(self._buf[self._off:self._off + 40]))
+    serviceID = property(lambda self:_struct_Q.unpack_from(self._buf,self._off + 40)[0])
+DMServiceEntry.View = _DMServiceEntryView
+
+class DMIOUnitInfo(rdma.binstruct.BinStruct):
+    '''List of all I/O Controllers in a I/O Unit (section 16.3.3.3)'''
+    __slots__ = ('changeID','maxControllers','reserved_24','diagDeviceID','optionROM','controllerList')
+    MAD_LENGTH = 132
+    MAD_ATTRIBUTE_ID = 0x10
+    MAD_DEVMGTGET = 0x1 # MAD_METHOD_GET
+    MEMBERS = [('changeID',16,1), ('maxControllers',8,1), ('reserved_24',6,1), ('diagDeviceID',1,1), ('optionROM',1,1), ('controllerList',1024,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.changeID = 0
+        self.maxControllers = 0
+        self.reserved_24 = 0
+        self.diagDeviceID = 0
+        self.optionROM = 0
+        self.controllerList = bytearray(128)
+
+    def pack_into(self,buffer,offset=0):
+        buffer[offset + 4:offset + 132] = self.controllerList
+        _struct_L.pack_into(buffer,offset+0,((self.changeID & 0xFFFF) << 16) | ((self.maxControllers & 0xFF) << 8) | ((self.reserved_24 & 0x3F) << 2) | ((self.diagDeviceID & 0x1) << 1) | (self.optionROM & 0x1))
+
+    def unpack_from(self,buffer,offset=0):
+        self.controllerList = bytearray(buffer[offset + 4:offset + 132])
+        (w0,) = _struct_L.unpack_from(buffer,offset+0)
+        self.changeID = w0 >> 16
+        self.maxControllers = (w0 >> 8) & 0xFF
+        self.reserved_24 = (w0 >> 2) & 0x3F
+        self.diagDeviceID = (w0 >> 1) & 0x1
+        self.optionROM = w0 & 0x1
+
+class _DMIOUnitInfoView(rdma.binstruct.BinStructView,DMIOUnitInfo):
+    '''Read only view of a packed :class:`DMIOUnitInfo`'''
+    __slots__ = ('_buf','_off')
+    changeID = property(lambda self:_struct_L.unpack_from(self._buf,self._off)[0] >> 16)
+    maxControllers = property(lambda self:(_struct_L.unpack_from(self._buf,self._off)[0] >> 8) & 0xFF)
+    reserved_24 = property(lambda self:(_struct_L.unpack_from(self._buf,self._off)[0] >> 2) & 0x3F)
+    diagDeviceID = property(lambda self:(_struct_L.unpack_from(self._buf,self._off)[0] >> 1) & 0x1)
+    optionROM = property(lambda self:_struct_L.unpack_from(self._buf,self._off)[0] & 0x1)
+    controllerList = property(lambda self:bytearray(self._buf[self._off + 4:self._off + 132]))
+DMIOUnitInfo.View = _DMIOUnitInfoView
+
+class DMIOControllerProfile(rdma.binstruct.BinStruct):
+    '''I/O Controller Profile Information (section 16.3.3.4)'''
+    __slots__ = ('GUID','vendorID','reserved_88','deviceID','deviceVersion','reserved_144','subsystemVendorID','reserved_184','subsystemID','IOClass','IOSubclass','protocol','protocolVersion','reserved_288','reserved_304','sendMessageDepth','reserved_336','RDMAReadDepth','sendMessageSize','RDMATransferSize','controllerOperationsMask','reserved_424','serviceEntries','reserved_440','reserved_448','IDString')
+    MAD_LENGTH = 128
+    MAD_ATTRIBUTE_ID = 0x11
+    MAD_DEVMGTGET = 0x1 # MAD_METHOD_GET
+    MEMBERS = [('GUID',64,1), ('vendorID',24,1), ('reserved_88',8,1), ('deviceID',32,1), ('deviceVersion',16,1), ('reserved_144',16,1), ('subsystemVendorID',24,1), ('reserved_184',8,1), ('subsystemID',32,1), ('IOClass',16,1), ('IOSubclass',16,1), ('protocol',16,1), ('protocolVersion',16,1), ('reserved_288',16,1), ('reserved_304',16,1), ('sendMessageDepth',16,1), ('reserved_336',8,1), ('RDMAReadDepth',8,1), ('sendMessageSize',32,1), ('RDMATransferSize',32,1), ('controllerOperationsMask',8,1), ('reserved_424',8,1), ('serviceEntries',8,1), ('reserved_440',8,1), ('reserved_448',64,1), ('IDString',8,64)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.GUID = IBA.GUID()
+        self.vendorID = 0
+        self.reserved_88 = 0
+        self.deviceID = 0
+        self.deviceVersion = 0
+        self.reserved_144 = 0
+        self.subsystemVendorID = 0
+        self.reserved_184 = 0
+        self.subsystemID = 0
+        self.IOClass = 0
+        self.IOSubclass = 0
+        self.protocol = 0
+        self.protocolVersion = 0
+        self.reserved_288 = 0
+        self.reserved_304 = 0
+        self.sendMessageDepth = 0
+        self.reserved_336 = 0
+        self.RDMAReadDepth = 0
+        self.sendMessageSize = 0
+        self.RDMATransferSize = 0
+        self.controllerOperationsMask = 0
+        self.reserved_424 = 0
+        self.serviceEntries = 0
+        self.reserved_440 = 0
+        self.reserved_448 = 0
+        self.IDString = bytearray(64)
+
+    def pack_into(self,buffer,offset=0):
+        self.GUID.pack_into(buffer,offset + 0)
+        buffer[offset + 64:offset + 128] = self.IDString
+        _struct_LLHHLLHHHHHHHBBLLBBBBQ.pack_into(buffer,offset+8,((self.vendorID & 0xFFFFFF) << 8) | (self.reserved_88 & 0xFF),self.deviceID,self.deviceVersion,self.reserved_144,((self.subsystemVendorID & 0xFFFFFF) << 8) | (self.reserved_184 & 0xFF),self.subsystemID,self.IOClass,self.IOSubclass,self.protocol,self.protocolVersion,self.reserved_288,self.reserved_304,self.sendMessageDepth,self.reserved_336,self.RDMAReadDepth,self.sendMessageSize,self.RDMATransferSize,self.controllerOperationsMask,self.reserved_424,self.serviceEntries,self.reserved_440,self.reserved_448)
+
+    def unpack_from(self,buffer,offset=0):
+        self.GUID = IBA.GUID(buffer[offset + 0:offset + 8],raw=True)
+        self.IDString = bytearray(buffer[offset + 64:offset + 128])
+        (w0,self.deviceID,self.deviceVersion,self.reserved_144,w1,self.subsystemID,self.IOClass,self.IOSubclass,self.protocol,self.protocolVersion,self.reserved_288,self.reserved_304,self.sendMessageDepth,self.reserved_336,self.RDMAReadDepth,self.sendMessageSize,self.RDMATransferSize,self.controllerOperationsMask,self.reserved_424,self.serviceEntries,self.reserved_440,self.reserved_448,) = _struct_LLHHLLHHHHHHHBBLLBBBBQ.unpack_from(buffer,offset+8)
+        self.vendorID = w0 >> 8
+        self.reserved_88 = w0 & 0xFF
+        self.subsystemVendorID = w1 >> 8
+        self.reserved_184 = w1 & 0xFF
+
+class _DMIOControllerProfileView(rdma.binstruct.BinStructView,DMIOControllerProfile):
+    '''Read only view of a packed :class:`DMIOControllerProfile`'''
+    __slots__ = ('_buf','_off')
+    GUID = property(lambda self:IBA.GUID(self._buf[self._off:self._off + 8],raw=True))
+    vendorID = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 8)[0] >> 8)
+    reserved_88 = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 8)[0] & 0xFF)
+    deviceID = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 12)[0])
+    deviceVersion = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 16)[0])
+    reserved_144 = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 18)[0])
+    subsystemVendorID = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 20)[0] >> 8)
+    reserved_184 = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 20)[0] & 0xFF)
+    subsystemID = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 24)[0])
+    IOClass = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 28)[0])
+    IOSubclass = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 30)[0])
+    protocol = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 32)[0])
+    protocolVersion = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 34)[0])
+    reserved_288 = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 36)[0])
+    reserved_304 = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 38)[0])
+    sendMessageDepth = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 40)[0])
+    reserved_336 = property(lambda self:self._buf[self._off + 42])
+    RDMAReadDepth = property(lambda self:self._buf[self._off + 43])
+    sendMessageSize = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 44)[0])
+    RDMATransferSize = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 48)[0])
+    controllerOperationsMask = property(lambda self:self._buf[self._off + 52])
+    reserved_424 = property(lambda self:self._buf[self._off + 53])
+    serviceEntries = property(lambda self:self._buf[self._off + 54])
+    reserved_440 = property(lambda self:self._buf[self._off + 55])
+    reserved_448 = property(lambda self:_struct_Q.unpack_from(self._buf,self._off + 56)[0])
+    IDString = property(lambda self:bytearray(self._buf[self._off + 64:self._off + 128]))
+DMIOControllerProfile.View = _DMIOControllerProfileView
+
+class DMServiceEntries(rdma.binstruct.BinStruct):
+    '''List of Supported Services and Their Associated Service IDs (section 16.3.3.5)'''
+    __slots__ = ('serviceEntry')
+    MAD_LENGTH = 192
+    MAD_ATTRIBUTE_ID = 0x12
+    MAD_DEVMGTGET = 0x1 # MAD_METHOD_GET
+    MEMBERS = [('serviceEntry',384,4)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        self.serviceEntry = [DMServiceEntry() for I in range(4)]
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.serviceEntry = [DMServiceEntry() for I in range(4)]
+
+    def pack_into(self,buffer,offset=0):
+        self.serviceEntry[0].pack_into(buffer,offset + 0)
+        self.serviceEntry[1].pack_into(buffer,offset + 48)
+        self.serviceEntry[2].pack_into(buffer,offset + 96)
+        self.serviceEntry[3].pack_into(buffer,offset + 144)
+
+    def unpack_from(self,buffer,offset=0):
+        self.serviceEntry[0].unpack_from(buffer,offset + 0)
+        self.serviceEntry[1].unpack_from(buffer,offset + 48)
+        self.serviceEntry[2].unpack_from(buffer,offset + 96)
+        self.serviceEntry[3].unpack_from(buffer,offset + 144)
+
+class _DMServiceEntriesView(rdma.binstruct.BinStructView,DMServiceEntries):
+    '''Read only view of a packed :class:`DMServiceEntries`'''
+    __slots__ = ('_buf','_off')
+    serviceEntry = property(lambda self:[DMServiceEntry.View(self._buf,self._off + I*48) for I in range(4)])
+DMServiceEntries.View = _DMServiceEntriesView
+
+class DMDiagnosticTimeout(rdma.binstruct.BinStruct):
+    '''Get the Maximum Time for Completion of a Diagnostic Test (section 16.3.3.6)'''
+    __slots__ = ('maxDiagTime')
+    MAD_LENGTH = 4
+    MAD_ATTRIBUTE_ID = 0x20
+    MAD_DEVMGTGET = 0x1 # MAD_METHOD_GET
+    MEMBERS = [('maxDiagTime',32,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.maxDiagTime = 0
+
+    def pack_into(self,buffer,offset=0):
+        _struct_L.pack_into(buffer,offset+0,self.maxDiagTime)
+
+    def unpack_from(self,buffer,offset=0):
+        (self.maxDiagTime,) = _struct_L.unpack_from(buffer,offset+0)
+
+class _DMDiagnosticTimeoutView(rdma.binstruct.BinStructView,DMDiagnosticTimeout):
+    '''Read only view of a packed :class:`DMDiagnosticTimeout`'''
+    __slots__ = ('_buf','_off')
+    maxDiagTime = property(lambda self:_struct_L.unpack_from(self._buf,self._off)[0])
+DMDiagnosticTimeout.View = _DMDiagnosticTimeoutView
+
+class DMPrepareToTest(rdma.binstruct.BinStruct):
+    '''Prepare Device for Test (section 16.3.3.7)'''
+    __slots__ = ()
+    MAD_LENGTH = 0
+    MAD_ATTRIBUTE_ID = 0x21
+    MAD_DEVMGTGET = 0x1 # MAD_METHOD_GET
+    MAD_DEVMGTSET = 0x2 # MAD_METHOD_SET
+    MEMBERS = []
+    def pack_into(self,buffer,offset=0):
+        return None
+
+    def unpack_from(self,buffer,offset=0):
+        return
+
+class DMTestDeviceOnce(rdma.binstruct.BinStruct):
+    '''Test Device Once (section 16.3.3.8)'''
+    __slots__ = ()
+    MAD_LENGTH = 0
+    MAD_ATTRIBUTE_ID = 0x22
+    MAD_DEVMGTSET = 0x2 # MAD_METHOD_SET
+    MEMBERS = []
+    def pack_into(self,buffer,offset=0):
+        return None
+
+    def unpack_from(self,buffer,offset=0):
+        return
+
+class DMTestDeviceLoop(rdma.binstruct.BinStruct):
+    '''Test Device Continuously (section 16.3.3.9)'''
+    __slots__ = ()
+    MAD_LENGTH = 0
+    MAD_ATTRIBUTE_ID = 0x23
+    MAD_DEVMGTSET = 0x2 # MAD_METHOD_SET
+    MEMBERS = []
+    def pack_into(self,buffer,offset=0):
+        return None
+
+    def unpack_from(self,buffer,offset=0):
+        return
+
+class DMDiagCode(rdma.binstruct.BinStruct):
+    '''Vendor-Specific Device Diagnostic Information (section 16.3.3.10)'''
+    __slots__ = ('diagCode','reserved_16')
+    MAD_LENGTH = 4
+    MAD_ATTRIBUTE_ID = 0x24
+    MAD_DEVMGTGET = 0x1 # MAD_METHOD_GET
+    MEMBERS = [('diagCode',16,1), ('reserved_16',16,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.diagCode = 0
+        self.reserved_16 = 0
+
+    def pack_into(self,buffer,offset=0):
+        _struct_HH.pack_into(buffer,offset+0,self.diagCode,self.reserved_16)
+
+    def unpack_from(self,buffer,offset=0):
+        (self.diagCode,self.reserved_16,) = _struct_HH.unpack_from(buffer,offset+0)
+
+class _DMDiagCodeView(rdma.binstruct.BinStructView,DMDiagCode):
+    '''Read only view of a packed :class:`DMDiagCode`'''
+    __slots__ = ('_buf','_off')
+    diagCode = property(lambda self:_struct_H.unpack_from(self._buf,self._off)[0])
+    reserved_16 = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 2)[0])
+DMDiagCode.View = _DMDiagCodeView
+
@@ -0,0 +1,115 @@
+import rdma.binstruct
+import struct
+import rdma.IBA as IBA
+
+_struct_BBBBHHQHHL = struct.Struct('>BBBBHHQHHL')
+_struct_LBBH = struct.Struct('>LBBH')
+
+class SNMPFormat(rdma.binstruct.BinFormat):
+    '''SNMP Tunneling MAD Format (section 16.4.1)'''
+    __slots__ = ('baseVersion','mgmtClass','classVersion','method','status','classSpecific','transactionID','attributeID','reserved_144','attributeModifier','reserved_192','RAddress','payloadLength','segmentNumber','sourceLID','data')
+    MAD_LENGTH = 256
+    MAD_CLASS = 0x8
+    MAD_CLASS_VERSION = 0x1
+    MEMBERS = [('baseVersion',8,1), ('mgmtClass',8,1), ('classVersion',8,1), ('method',8,1), ('status',16,1), ('classSpecific',16,1), ('transactionID',64,1), ('attributeID',16,1), ('reserved_144',16,1), ('attributeModifier',32,1), ('reserved_192',256,1), ('RAddress',32,1), ('payloadLength',8,1), ('segmentNumber',8,1), ('sourceLID',16,1), ('data',1536,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.baseVersion = 0
+        self.mgmtClass = 0
+        self.classVersion = 0
+        self.method = 0
+        self.status = 0
+        self.classSpecific = 0
+        self.transactionID = 0
+        self.attributeID = 0
+        self.reserved_144 = 0
+        self.attributeModifier = 0
+        self.reserved_192 = bytearray(32)
+        self.RAddress = 0
+        self.payloadLength = 0
+        self.segmentNumber = 0
+        self.sourceLID = 0
+        self.data = bytearray(192)
+
+    def pack_into(self,buffer,offset=0):
+        buffer[offset + 24:offset + 56] = self.reserved_192
+        buffer[offset + 64:offset + 256] = self.data
+        _struct_BBBBHHQHHL.pack_into(buffer,offset+0,self.baseVersion,self.mgmtClass,self.classVersion,self.method,self.status,self.classSpecific,self.transactionID,self.attributeID,self.reserved_144,self.attributeModifier)
+        _struct_LBBH.pack_into(buffer,offset+56,self.RAddress,self.payloadLength,self.segmentNumber,self.sourceLID)
+
+    def unpack_from(self,buffer,offset=0):
+        self.reserved_192 = bytearray(buffer[offset + 24:offset + 56])
+        self.data = bytearray(buffer[offset + 64:offset + 256])
+        (self.baseVersion,self.mgmtClass,self.classVersion,self.method,self.status,self.classSpecific,self.transactionID,self.attributeID,self.reserved_144,self.attributeModifier,) = _struct_BBBBHHQHHL.unpack_from(buffer,offset+0)
+        (self.RAddress,self.payloadLength,self.segmentNumber,self.sourceLID,) = _struct_LBBH.unpack_from(buffer,offset+56)
+
+class SNMPCommunityInfo(rdma.binstruct.BinStruct):
+    '''Community Name Data Store (section 16.4.3.2)'''
+    __slots__ = ('communityName')
+    MAD_LENGTH = 64
+    MAD_ATTRIBUTE_ID = 0x10
+    MAD_SNMPSEND = 0x3 # MAD_METHOD_SEND
+    MEMBERS = [('communityName',8,64)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.communityName = bytearray(64)
+
+    def pack_into(self,buffer,offset=0):
+        buffer[offset + 0:offset + 64] = self.communityName
+
+    def unpack_from(self,buffer,offset=0):
+        self.communityName = bytearray(buffer[offset + 0:offset + 64])
+
+class _SNMPCommunityInfoView(rdma.binstruct.BinStructView,SNMPCommunityInfo):
+    '''Read only view of a packed :class:`SNMPCommunityInfo`'''
+    __slots__ = ('_buf','_off')
+    communityName = property(lambda self:bytearray(self._buf[self._off:self._off + 64]))
+SNMPCommunityInfo.View = _SNMPCommunityInfoView
+
+class SNMPPDUInfo(rdma.binstruct.BinStruct):
+    '''Data Segment (section 16.4.3.3)'''
+    __slots__ = ('PDUData')
+    MAD_LENGTH = 192
+    MAD_ATTRIBUTE_ID = 0x11
+    MAD_SNMPSEND = 0x3 # MAD_METHOD_SEND
+    MEMBERS = [('PDUData',1536,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.PDUData = bytearray(192)
+
+    def pack_into(self,buffer,offset=0):
+        buffer[offset + 0:offset + 192] = self.PDUData
+
+    def unpack_from(self,buffer,offset=0):
+        self.PDUData = bytearray(buffer[offset + 0:offset + 192])
+
+class _SNMPPDUInfoView(rdma.binstruct.BinStructView,SNMPPDUInfo):
+    '''Read only view of a packed :class:`SNMPPDUInfo`'''
+    __slots__ = ('_buf','_off')
+    PDUData = property(lambda self:bytearray(self._buf[self._off:self._off + 192]))
+SNMPPDUInfo.View = _SNMPPDUInfoView
+
@@ -0,0 +1,97 @@
+import rdma.binstruct
+import struct
+import rdma.IBA as IBA
+
+_struct_BBBBHHQHHL = struct.Struct('>BBBBHHQHHL')
+_struct_BBBBHHQHHLLLLL = struct.Struct('>BBBBHHQHHLLLLL')
+
+class VendFormat(rdma.binstruct.BinFormat):
+    '''Vendor Specific Management MAD Format (section 16.5.1)'''
+    __slots__ = ('baseVersion','mgmtClass','classVersion','method','status','classSpecific','transactionID','attributeID','reserved_144','attributeModifier','data')
+    MAD_LENGTH = 256
+    MAD_CLASS = 0x9
+    MAD_CLASS_VERSION = 0x1
+    MEMBERS = [('baseVersion',8,1), ('mgmtClass',8,1), ('classVersion',8,1), ('method',8,1), ('status',16,1), ('classSpecific',16,1), ('transactionID',64,1), ('attributeID',16,1), ('reserved_144',16,1), ('attributeModifier',32,1), ('data',1856,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.baseVersion = 0
+        self.mgmtClass = 0
+        self.classVersion = 0
+        self.method = 0
+        self.status = 0
+        self.classSpecific = 0
+        self.transactionID = 0
+        self.attributeID = 0
+        self.reserved_144 = 0
+        self.attributeModifier = 0
+        self.data = bytearray(232)
+
+    def pack_into(self,buffer,offset=0):
+        buffer[offset + 24:offset + 256] = self.data
+        _struct_BBBBHHQHHL.pack_into(buffer,offset+0,self.baseVersion,self.mgmtClass,self.classVersion,self.method,self.status,self.classSpecific,self.transactionID,self.attributeID,self.reserved_144,self.attributeModifier)
+
+    def unpack_from(self,buffer,offset=0):
+        self.data = bytearray(buffer[offset + 24:offset + 256])
+        (self.baseVersion,self.mgmtClass,self.classVersion,self.method,self.status,self.classSpecific,self.transactionID,self.attributeID,self.reserved_144,self.attributeModifier,) = _struct_BBBBHHQHHL.unpack_from(buffer,offset+0)
+
+class VendOUIFormat(rdma.binstruct.BinFormat):
+    '''Vendor Specific Management MAD Format with OUI (section 16.5.1)'''
+    __slots__ = ('baseVersion','mgmtClass','classVersion','method','status','classSpecific','transactionID','attributeID','reserved_144','attributeModifier','RMPPVersion','RMPPType','RRespTime','RMPPFlags','RMPPStatus','data1','data2','reserved_288','OUI','data')
+    MAD_LENGTH = 256
+    MAD_CLASS = 0x30
+    MAD_CLASS_VERSION = 0x1
+    MEMBERS = [('baseVersion',8,1), ('mgmtClass',8,1), ('classVersion',8,1), ('method',8,1), ('status',16,1), ('classSpecific',16,1), ('transactionID',64,1), ('attributeID',16,1), ('reserved_144',16,1), ('attributeModifier',32,1), ('RMPPVersion',8,1), ('RMPPType',8,1), ('RRespTime',5,1), ('RMPPFlags',3,1), ('RMPPStatus',8,1), ('data1',32,1), ('data2',32,1), ('reserved_288',8,1), ('OUI',24,1), ('data',1728,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.baseVersion = 0
+        self.mgmtClass = 0
+        self.classVersion = 0
+        self.method = 0
+        self.status = 0
+        self.classSpecific = 0
+        self.transactionID = 0
+        self.attributeID = 0
+        self.reserved_144 = 0
+        self.attributeModifier = 0
+        self.RMPPVersion = 0
+        self.RMPPType = 0
+        self.RRespTime = 0
+        self.RMPPFlags = 0
+        self.RMPPStatus = 0
+        self.data1 = 0
+        self.data2 = 0
+        self.reserved_288 = 0
+        self.OUI = 0
+        self.data = bytearray(216)
+
+    def pack_into(self,buffer,offset=0):
+        buffer[offset + 40:offset + 256] = self.data
+        _struct_BBBBHHQHHLLLLL.pack_into(buffer,offset+0,self.baseVersion,self.mgmtClass,self.classVersion,self.method,self.status,self.classSpecific,self.transactionID,self.attributeID,self.reserved_144,self.attributeModifier,((self.RMPPVersion & 0xFF) << 24) | ((self.RMPPType & 0xFF) << 16) | ((self.RRespTime & 0x1F) << 11) | ((self.RMPPFlags & 0x7) << 8) | (self.RMPPStatus & 0xFF),self.data1,self.data2,((self.reserved_288 & 0xFF) << 24) | (self.OUI & 0xFFFFFF))
+
+    def unpack_from(self,buffer,offset=0):
+        self.data = bytearray(buffer[offset + 40:offset + 256])
+        (self.baseVersion,self.mgmtClass,self.classVersion,self.method,self.status,self.classSpecific,self.transactionID,self.attributeID,self.reserved_144,self.attributeModifier,w0,self.data1,self.data2,w1,) = _struct_BBBBHHQHHLLLLL.unpack_from(buffer,offset+0)
+        self.RMPPVersion = w0 >> 24
+        self.RMPPType = (w0 >> 16) & 0xFF
+        self.RRespTime = (w0 >> 11) & 0x1F
+        self.RMPPFlags = (w0 >> 8) & 0x7
+        self.RMPPStatus = w0 & 0xFF
+        self.reserved_288 = w1 >> 24
+        self.OUI = w1 & 0xFFFFFF
+
@@ -0,0 +1,507 @@
+import rdma.binstruct
+import struct
+import rdma.IBA as IBA
+
+_struct_H = struct.Struct('>H')
+_struct_HH = struct.Struct('>HH')
+_struct_L = struct.Struct('>L')
+_struct_LHBB = struct.Struct('>LHBB')
+_struct_LL = struct.Struct('>LL')
+_struct_LLL = struct.Struct('>LLL')
+_struct_Q = struct.Struct('>Q')
+_struct_QLL = struct.Struct('>QLL')
+_struct_QLQQ = struct.Struct('>QLQQ')
+
+class HdrLRH(rdma.binstruct.BinStruct):
+    '''Local Route Header (section 7.7)'''
+    __slots__ = ('VL','LVer','SL','reserved_12','LNH','DLID','reserved_32','pktLen','SLID')
+    MAD_LENGTH = 8
+    MEMBERS = [('VL',4,1), ('LVer',4,1), ('SL',4,1), ('reserved_12',2,1), ('LNH',2,1), ('DLID',16,1), ('reserved_32',5,1), ('pktLen',11,1), ('SLID',16,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.VL = 0
+        self.LVer = 0
+        self.SL = 0
+        self.reserved_12 = 0
+        self.LNH = 0
+        self.DLID = 0
+        self.reserved_32 = 0
+        self.pktLen = 0
+        self.SLID = 0
+
+    def pack_into(self,buffer,offset=0):
+        _struct_LL.pack_into(buffer,offset+0,((self.VL & 0xF) << 28) | ((self.LVer & 0xF) << 24) | ((self.SL & 0xF) << 20) | ((self.reserved_12 & 0x3) << 18) | ((self.LNH & 0x3) << 16) | (self.DLID & 0xFFFF),((self.reserved_32 & 0x1F) << 27) | ((self.pktLen & 0x7FF) << 16) | (self.SLID & 0xFFFF))
+
+    def unpack_from(self,buffer,offset=0):
+        (w0,w1,) = _struct_LL.unpack_from(buffer,offset+0)
+        self.VL = w0 >> 28
+        self.LVer = (w0 >> 24) & 0xF
+        self.SL = (w0 >> 20) & 0xF
+        self.reserved_12 = (w0 >> 18) & 0x3
+        self.LNH = (w0 >> 16) & 0x3
+        self.DLID = w0 & 0xFFFF
+        self.reserved_32 = w1 >> 27
+        self.pktLen = (w1 >> 16) & 0x7FF
+        self.SLID = w1 & 0xFFFF
+
+class _HdrLRHView(rdma.binstruct.BinStructView,HdrLRH):
+    '''Read only view of a packed :class:`HdrLRH`'''
+    __slots__ = ('_buf','_off')
+    VL = property(lambda self:_struct_L.unpack_from(self._buf,self._off)[0] >> 28)
+    LVer = property(lambda self:(_struct_L.unpack_from(self._buf,self._off)[0] >> 24) & 0xF)
+    SL = property(lambda self:(_struct_L.unpack_from(self._buf,self._off)[0] >> 20) & 0xF)
+    reserved_12 = property(lambda self:(_struct_L.unpack_from(self._buf,self._off)[0] >> 18) & 0x3)
+    LNH = property(lambda self:(_struct_L.unpack_from(self._buf,self._off)[0] >> 16) & 0x3)
+    DLID = property(lambda self:_struct_L.unpack_from(self._buf,self._off)[0] & 0xFFFF)
+    reserved_32 = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 4)[0] >> 27)
+    pktLen = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 4)[0] >> 16) & 0x7FF)
+    SLID = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 4)[0] & 0xFFFF)
+HdrLRH.View = _HdrLRHView
+
+class HdrRWH(rdma.binstruct.BinStruct):
+    '''Raw Header (section 5.3)'''
+    __slots__ = ('reserved_0','etherType')
+    MAD_LENGTH = 4
+    MEMBERS = [('reserved_0',16,1), ('etherType',16,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.reserved_0 = 0
+        self.etherType = 0
+
+    def pack_into(self,buffer,offset=0):
+        _struct_HH.pack_into(buffer,offset+0,self.reserved_0,self.etherType)
+
+    def unpack_from(self,buffer,offset=0):
+        (self.reserved_0,self.etherType,) = _struct_HH.unpack_from(buffer,offset+0)
+
+class _HdrRWHView(rdma.binstruct.BinStructView,HdrRWH):
+    '''Read only view of a packed :class:`HdrRWH`'''
+    __slots__ = ('_buf','_off')
+    reserved_0 = property(lambda self:_struct_H.unpack_from(self._buf,self._off)[0])
+    etherType = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 2)[0])
+HdrRWH.View = _HdrRWHView
+
+class HdrGRH(rdma.binstruct.BinStruct):
+    '''Global Route Header (section 8.3)'''
+    __slots__ = ('IPVer','TClass','flowLabel','payLen','nxtHdr','hopLmt','SGID','DGID')
+    MAD_LENGTH = 40
+    MEMBERS = [('IPVer',4,1), ('TClass',8,1), ('flowLabel',20,1), ('payLen',16,1), ('nxtHdr',8,1), ('hopLmt',8,1), ('SGID',128,1), ('DGID',128,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.IPVer = 0
+        self.TClass = 0
+        self.flowLabel = 0
+        self.payLen = 0
+        self.nxtHdr = 0
+        self.hopLmt = 0
+        self.SGID = IBA.GID()
+        self.DGID = IBA.GID()
+
+    def pack_into(self,buffer,offset=0):
+        self.SGID.pack_into(buffer,offset + 8)
+        self.DGID.pack_into(buffer,offset + 24)
+        _struct_LHBB.pack_into(buffer,offset+0,((self.IPVer & 0xF) << 28) | ((self.TClass & 0xFF) << 20) | (self.flowLabel & 0xFFFFF),self.payLen,self.nxtHdr,self.hopLmt)
+
+    def unpack_from(self,buffer,offset=0):
+        self.SGID = IBA.GID(buffer[offset + 8:offset + 24],raw=True)
+        self.DGID = IBA.GID(buffer[offset + 24:offset + 40],raw=True)
+        (w0,self.payLen,self.nxtHdr,self.hopLmt,) = _struct_LHBB.unpack_from(buffer,offset+0)
+        self.IPVer = w0 >> 28
+        self.TClass = (w0 >> 20) & 0xFF
+        self.flowLabel = w0 & 0xFFFFF
+
+class _HdrGRHView(rdma.binstruct.BinStructView,HdrGRH):
+    '''Read only view of a packed :class:`HdrGRH`'''
+    __slots__ = ('_buf','_off')
+    IPVer = property(lambda self:_struct_L.unpack_from(self._buf,self._off)[0] >> 28)
+    TClass = property(lambda self:(_struct_L.unpack_from(self._buf,self._off)[0] >> 20) & 0xFF)
+    flowLabel = property(lambda self:_struct_L.unpack_from(self._buf,self._off)[0] & 0xFFFFF)
+    payLen = property(lambda self:_struct_H.unpack_from(self._buf,self._off + 4)[0])
+    nxtHdr = property(lambda self:self._buf[self._off + 6])
+    hopLmt = property(lambda self:self._buf[self._off + 7])
+    SGID = property(lambda self:IBA.GID(self._buf[self._off + 8:self._off + 8 + 16],raw=True))
+    DGID = property(lambda self:IBA.GID(self._buf[self._off + 24:self._off + 24 + 16],raw=True))
+HdrGRH.View = _HdrGRHView
+
+class HdrBTH(rdma.binstruct.BinStruct):
+    '''Base Transport Header (section 9.2)'''
+    __slots__ = ('service','function','SE','migReq','padCnt','TVer','PKey','reserved_32','destQP','ackReq','reserved_65','PSN')
+    MAD_LENGTH = 12
+    MEMBERS = [('service',3,1), ('function',5,1), ('SE',1,1), ('migReq',1,1), ('padCnt',2,1), ('TVer',4,1), ('PKey',16,1), ('reserved_32',8,1), ('destQP',24,1), ('ackReq',1,1), ('reserved_65',7,1), ('PSN',24,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.service = 0
+        self.function = 0
+        self.SE = 0
+        self.migReq = 0
+        self.padCnt = 0
+        self.TVer = 0
+        self.PKey = 0
+        self.reserved_32 = 0
+        self.destQP = 0
+        self.ackReq = 0
+        self.reserved_65 = 0
+        self.PSN = 0
+
+    def pack_into(self,buffer,offset=0):
+        _struct_LLL.pack_into(buffer,offset+0,((self.service & 0x7) << 29) | ((self.function & 0x1F) << 24) | ((self.SE & 0x1) << 23) | ((self.migReq & 0x1) << 22) | ((self.padCnt & 0x3) << 20) | ((self.TVer & 0xF) << 16) | (self.PKey & 0xFFFF),((self.reserved_32 & 0xFF) << 24) | (self.destQP & 0xFFFFFF),((self.ackReq & 0x1) << 31) | ((self.reserved_65 & 0x7F) << 24) | (self.PSN & 0xFFFFFF))
+
+    def unpack_from(self,buffer,offset=0):
+        (w0,w1,w2,) = _struct_LLL.unpack_from(buffer,offset+0)
+        self.service = w0 >> 29
+        self.function = (w0 >> 24) & 0x1F
+        self.SE = (w0 >> 23) & 0x1
+        self.migReq = (w0 >> 22) & 0x1
+        self.padCnt = (w0 >> 20) & 0x3
+        self.TVer = (w0 >> 16) & 0xF
+        self.PKey = w0 & 0xFFFF
+        self.reserved_32 = w1 >> 24
+        self.destQP = w1 & 0xFFFFFF
+        self.ackReq = w2 >> 31
+        self.reserved_65 = (w2 >> 24) & 0x7F
+        self.PSN = w2 & 0xFFFFFF
+
+class _HdrBTHView(rdma.binstruct.BinStructView,HdrBTH):
+    '''Read only view of a packed :class:`HdrBTH`'''
+    __slots__ = ('_buf','_off')
+    service = property(lambda self:_struct_L.unpack_from(self._buf,self._off)[0] >> 29)
+    function = property(lambda self:(_struct_L.unpack_from(self._buf,self._off)[0] >> 24) & 0x1F)
+    SE = property(lambda self:(_struct_L.unpack_from(self._buf,self._off)[0] >> 23) & 0x1)
+    migReq = property(lambda self:(_struct_L.unpack_from(self._buf,self._off)[0] >> 22) & 0x1)
+    padCnt = property(lambda self:(_struct_L.unpack_from(self._buf,self._off)[0] >> 20) & 0x3)
+    TVer = property(lambda self:(_struct_L.unpack_from(self._buf,self._off)[0] >> 16) & 0xF)
+    PKey = property(lambda self:_struct_L.unpack_from(self._buf,self._off)[0] & 0xFFFF)
+    reserved_32 = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 4)[0] >> 24)
+    destQP = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 4)[0] & 0xFFFFFF)
+    ackReq = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 8)[0] >> 31)
+    reserved_65 = property(lambda self:(_struct_L.unpack_from(self._buf,self._off + 8)[0] >> 24) & 0x7F)
+    PSN = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 8)[0] & 0xFFFFFF)
+HdrBTH.View = _HdrBTHView
+
+class HdrRDETH(rdma.binstruct.BinStruct):
+    '''Reliable Datagram Extended Transport Header (section 9.3.1)'''
+    __slots__ = ('reserved_0','EEC')
+    MAD_LENGTH = 4
+    MEMBERS = [('reserved_0',8,1), ('EEC',24,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.reserved_0 = 0
+        self.EEC = 0
+
+    def pack_into(self,buffer,offset=0):
+        _struct_L.pack_into(buffer,offset+0,((self.reserved_0 & 0xFF) << 24) | (self.EEC & 0xFFFFFF))
+
+    def unpack_from(self,buffer,offset=0):
+        (w0,) = _struct_L.unpack_from(buffer,offset+0)
+        self.reserved_0 = w0 >> 24
+        self.EEC = w0 & 0xFFFFFF
+
+class _HdrRDETHView(rdma.binstruct.BinStructView,HdrRDETH):
+    '''Read only view of a packed :class:`HdrRDETH`'''
+    __slots__ = ('_buf','_off')
+    reserved_0 = property(lambda self:_struct_L.unpack_from(self._buf,self._off)[0] >> 24)
+    EEC = property(lambda self:_struct_L.unpack_from(self._buf,self._off)[0] & 0xFFFFFF)
+HdrRDETH.View = _HdrRDETHView
+
+class HdrDETH(rdma.binstruct.BinStruct):
+    '''Datagram Extended Transport Header (section 9.3.2)'''
+    __slots__ = ('QKey','reserved_32','srcQP')
+    MAD_LENGTH = 8
+    MEMBERS = [('QKey',32,1), ('reserved_32',8,1), ('srcQP',24,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.QKey = 0
+        self.reserved_32 = 0
+        self.srcQP = 0
+
+    def pack_into(self,buffer,offset=0):
+        _struct_LL.pack_into(buffer,offset+0,self.QKey,((self.reserved_32 & 0xFF) << 24) | (self.srcQP & 0xFFFFFF))
+
+    def unpack_from(self,buffer,offset=0):
+        (self.QKey,w0,) = _struct_LL.unpack_from(buffer,offset+0)
+        self.reserved_32 = w0 >> 24
+        self.srcQP = w0 & 0xFFFFFF
+
+class _HdrDETHView(rdma.binstruct.BinStructView,HdrDETH):
+    '''Read only view of a packed :class:`HdrDETH`'''
+    __slots__ = ('_buf','_off')
+    QKey = property(lambda self:_struct_L.unpack_from(self._buf,self._off)[0])
+    reserved_32 = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 4)[0] >> 24)
+    srcQP = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 4)[0] & 0xFFFFFF)
+HdrDETH.View = _HdrDETHView
+
+class HdrRETH(rdma.binstruct.BinStruct):
+    '''RDMA Extended Transport Header (section 9.3.3)'''
+    __slots__ = ('VA','RKey','DMALen')
+    MAD_LENGTH = 16
+    MEMBERS = [('VA',64,1), ('RKey',32,1), ('DMALen',32,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.VA = 0
+        self.RKey = 0
+        self.DMALen = 0
+
+    def pack_into(self,buffer,offset=0):
+        _struct_QLL.pack_into(buffer,offset+0,self.VA,self.RKey,self.DMALen)
+
+    def unpack_from(self,buffer,offset=0):
+        (self.VA,self.RKey,self.DMALen,) = _struct_QLL.unpack_from(buffer,offset+0)
+
+class _HdrRETHView(rdma.binstruct.BinStructView,HdrRETH):
+    '''Read only view of a packed :class:`HdrRETH`'''
+    __slots__ = ('_buf','_off')
+    VA = property(lambda self:_struct_Q.unpack_from(self._buf,self._off)[0])
+    RKey = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 8)[0])
+    DMALen = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 12)[0])
+HdrRETH.View = _HdrRETHView
+
+class HdrAtomicETH(rdma.binstruct.BinStruct):
+    '''Atomic Extended Transport Header (section 9.3.4)'''
+    __slots__ = ('VA','RKey','swapData','cmpData')
+    MAD_LENGTH = 28
+    MEMBERS = [('VA',64,1), ('RKey',32,1), ('swapData',64,1), ('cmpData',64,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.VA = 0
+        self.RKey = 0
+        self.swapData = 0
+        self.cmpData = 0
+
+    def pack_into(self,buffer,offset=0):
+        _struct_QLQQ.pack_into(buffer,offset+0,self.VA,self.RKey,self.swapData,self.cmpData)
+
+    def unpack_from(self,buffer,offset=0):
+        (self.VA,self.RKey,self.swapData,self.cmpData,) = _struct_QLQQ.unpack_from(buffer,offset+0)
+
+class _HdrAtomicETHView(rdma.binstruct.BinStructView,HdrAtomicETH):
+    '''Read only view of a packed :class:`HdrAtomicETH`'''
+    __slots__ = ('_buf','_off')
+    VA = property(lambda self:_struct_Q.unpack_from(self._buf,self._off)[0])
+    RKey = property(lambda self:_struct_L.unpack_from(self._buf,self._off + 8)[0])
+    swapData = property(lambda self:_struct_Q.unpack_from(self._buf,self._off + 12)[0])
+    cmpData = property(lambda self:_struct_Q.unpack_from(self._buf,self._off + 20)[0])
+HdrAtomicETH.View = _HdrAtomicETHView
+
+class HdrAETH(rdma.binstruct.BinStruct):
+    '''ACK Extended Transport Header (section 9.3.5)'''
+    __slots__ = ('syndrome','MSN')
+    MAD_LENGTH = 4
+    MEMBERS = [('syndrome',8,1), ('MSN',24,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.syndrome = 0
+        self.MSN = 0
+
+    def pack_into(self,buffer,offset=0):
+        _struct_L.pack_into(buffer,offset+0,((self.syndrome & 0xFF) << 24) | (self.MSN & 0xFFFFFF))
+
+    def unpack_from(self,buffer,offset=0):
+        (w0,) = _struct_L.unpack_from(buffer,offset+0)
+        self.syndrome = w0 >> 24
+        self.MSN = w0 & 0xFFFFFF
+
+class _HdrAETHView(rdma.binstruct.BinStructView,HdrAETH):
+    '''Read only view of a packed :class:`HdrAETH`'''
+    __slots__ = ('_buf','_off')
+    syndrome = property(lambda self:_struct_L.unpack_from(self._buf,self._off)[0] >> 24)
+    MSN = property(lambda self:_struct_L.unpack_from(self._buf,self._off)[0] & 0xFFFFFF)
+HdrAETH.View = _HdrAETHView
+
+class HdrAtomicAckETH(rdma.binstruct.BinStruct):
+    '''Atomic Acknowledge Extended Transport Header (section 9.5.3)'''
+    __slots__ = ('origRData')
+    MAD_LENGTH = 8
+    MEMBERS = [('origRData',64,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.origRData = 0
+
+    def pack_into(self,buffer,offset=0):
+        _struct_Q.pack_into(buffer,offset+0,self.origRData)
+
+    def unpack_from(self,buffer,offset=0):
+        (self.origRData,) = _struct_Q.unpack_from(buffer,offset+0)
+
+class _HdrAtomicAckETHView(rdma.binstruct.BinStructView,HdrAtomicAckETH):
+    '''Read only view of a packed :class:`HdrAtomicAckETH`'''
+    __slots__ = ('_buf','_off')
+    origRData = property(lambda self:_struct_Q.unpack_from(self._buf,self._off)[0])
+HdrAtomicAckETH.View = _HdrAtomicAckETHView
+
+class HdrImmDt(rdma.binstruct.BinStruct):
+    '''Immediate Extended Transport Header (section 9.3.6)'''
+    __slots__ = ('immediateData')
+    MAD_LENGTH = 4
+    MEMBERS = [('immediateData',32,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.immediateData = 0
+
+    def pack_into(self,buffer,offset=0):
+        _struct_L.pack_into(buffer,offset+0,self.immediateData)
+
+    def unpack_from(self,buffer,offset=0):
+        (self.immediateData,) = _struct_L.unpack_from(buffer,offset+0)
+
+class _HdrImmDtView(rdma.binstruct.BinStructView,HdrImmDt):
+    '''Read only view of a packed :class:`HdrImmDt`'''
+    __slots__ = ('_buf','_off')
+    immediateData = property(lambda self:_struct_L.unpack_from(self._buf,self._off)[0])
+HdrImmDt.View = _HdrImmDtView
+
+class HdrIETH(rdma.binstruct.BinStruct):
+    '''Invalidate Extended Transport Header (section 9.3.7)'''
+    __slots__ = ('RKey')
+    MAD_LENGTH = 4
+    MEMBERS = [('RKey',32,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.RKey = 0
+
+    def pack_into(self,buffer,offset=0):
+        _struct_L.pack_into(buffer,offset+0,self.RKey)
+
+    def unpack_from(self,buffer,offset=0):
+        (self.RKey,) = _struct_L.unpack_from(buffer,offset+0)
+
+class _HdrIETHView(rdma.binstruct.BinStructView,HdrIETH):
+    '''Read only view of a packed :class:`HdrIETH`'''
+    __slots__ = ('_buf','_off')
+    RKey = property(lambda self:_struct_L.unpack_from(self._buf,self._off)[0])
+HdrIETH.View = _HdrIETHView
+
+class HdrFlowControl(rdma.binstruct.BinStruct):
+    '''Flow Control Packet (section 7.9.4)'''
+    __slots__ = ('op','FCTBS','VL','FCCL')
+    MAD_LENGTH = 4
+    MEMBERS = [('op',4,1), ('FCTBS',12,1), ('VL',4,1), ('FCCL',12,1)]
+    def __init__(self,buf=None,offset=0):
+        if buf is None:
+            self.zero()
+            return
+        if buf.__class__ is bytes:
+            self.unpack_from(buf,offset)
+        else:
+            rdma.binstruct.BinStruct.__init__(self,buf,offset)
+
+    def zero(self):
+        self.op = 0
+        self.FCTBS = 0
+        self.VL = 0
+        self.FCCL = 0
+
+    def pack_into(self,buffer,offset=0):
+        _struct_L.pack_into(buffer,offset+0,((self.op & 0xF) << 28) | ((self.FCTBS & 0xFFF) << 16) | ((self.VL & 0xF) << 12) | (self.FCCL & 0xFFF))
+
+    def unpack_from(self,buffer,offset=0):
+        (w0,) = _struct_L.unpack_from(buffer,offset+0)
+        self.op = w0 >> 28
+        self.FCTBS = (w0 >> 16) & 0xFFF
+        self.VL = (w0 >> 12) & 0xF
+        self.FCCL = w0 & 0xFFF
+
+class _HdrFlowControlView(rdma.binstruct.BinStructView,HdrFlowControl):
+    '''Read only view of a packed :class:`HdrFlowControl`'''
+    __slots__ = ('_buf','_off')
+    op = property(lambda self:_struct_L.unpack_from(self._buf,self._off)[0] >> 28)
+    FCTBS = property(lambda self:(_struct_L.unpack_from(self._buf,self._off)[0] >> 16) & 0xFFF)
+    VL = property(lambda self:(_struct_L.unpack_from(self._buf,self._off)[0] >> 12) & 0xF)
+    FCCL = property(lambda self:_struct_L.unpack_from(self._buf,self._off)[0] & 0xFFF)
+HdrFlowControl.View = _HdrFlowControlView
+
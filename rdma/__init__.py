@@ -141,6 +141,10 @@ class MADClassError(MADError):
                               msg="RPC %s got class specific error %u"%(
                     req.describe(),code),**kwargs)
 
+class CancelledError(RDMAError):
+    '''Thrown into a :mod:`rdma.sched` coroutine when its context is cancelled
+    or its deadline passes.'''
+
 class SysError(RDMAError,OSError):
     '''Thrown when a system call fails. Inclues errno'''
     def __init__(self,errno,func,msg=None):
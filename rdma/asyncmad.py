@@ -0,0 +1,200 @@
+# Copyright 2011 Obsidian Research Corp. GPLv2, see COPYING.
+import asyncio
+import inspect
+import select
+import rdma,rdma.madtransactor
+
+class AsyncMAD(rdma.madtransactor.MADTransactor):
+    """This class provides a MADTransactor interface for :mod:`asyncio`. The
+    RPC functions return awaitables that resolve to the decoded reply, with
+    the same timeout, retry and error semantics as the synchronous
+    interface. Any number of RPCs can be outstanding at once and they share
+    the event loop with other I/O::
+
+        mad = rdma.asyncmad.AsyncMAD(umad)
+        ninfs = await asyncio.gather(*(mad.SubnGet(IBA.SMPNodeInfo,I)
+                                       for I in paths))
+
+    The file descriptor of the wrapped :class:`rdma.umad.UMAD` (or the
+    completion channel of a :class:`rdma.vmad.VMAD`) is registered with the
+    running loop while RPCs are outstanding. Like all transactors this is
+    not thread safe, only use it from the loop's thread."""
+
+    def __init__(self,umad):
+        """*umad* is a :class:`rdma.umad.UMAD` or :class:`rdma.vmad.VMAD`
+        instance which will be used to issue the MADs."""
+        rdma.madtransactor.MADTransactor.__init__(self)
+        self.end_port = umad.end_port
+        self.trace_func = umad.trace_func
+        self.rtt = getattr(umad,"rtt",None)
+        self.stats = getattr(umad,"stats",None)
+        redirects = getattr(umad,"_redirects",None)
+        if redirects is not None:
+            self._redirects = redirects
+        self._umad = umad
+        self._keys = {}
+        self._loop = None
+        self._cc = getattr(umad,"_cc",None)
+        if self._cc is not None:
+            self._fd = self._cc.fileno()
+        else:
+            self._fd = umad.dev.fileno()
+
+    @property
+    def is_async(self):
+        return True
+
+    def _start(self,loop):
+        if self._loop is None:
+            loop.add_reader(self._fd,self._on_readable)
+            self._loop = loop
+        elif self._loop is not loop:
+            raise rdma.RDMAError("%r is already in use by another event loop"%(self))
+
+    def _stop(self):
+        if self._loop is not None:
+            self._loop.remove_reader(self._fd)
+            self._loop = None
+
+    def _on_readable(self):
+        if self._cc is not None:
+            # Acknowledge the completion event, recvfrom re-arms the CQ
+            self._cc.check_poll((self._fd,select.POLLIN))
+        while True:
+            ret = self._umad.recvfrom(0)
+            if ret is None:
+                return
+            self._dispatch(ret)
+
+    def _dispatch(self,ret):
+        fut = self._keys.pop(self._get_match_key(ret[0]),None)
+        if fut is not None and not fut.done():
+            fut.set_result(ret)
+        else:
+            if self.trace_func is not None:
+                self.trace_func(self,rdma.madtransactor.TRACE_UNEXPECTED,
+                                ret=ret)
+            if self.stats is not None:
+                self.stats.unexpected_reply(*ret)
+
+    @staticmethod
+    def _expire(fut):
+        if not fut.done():
+            fut.set_result(None)
+
+    async def _transact(self,buf,fmt,path,newer,completer):
+        loop = asyncio.get_running_loop()
+        self._start(loop)
+        rmatch = self._get_reply_match_key(buf)
+        if rmatch in self._keys:
+            raise rdma.RDMAError("Duplicate MAD transaction ID for %r"%(path))
+        retries = path.retries
+        resends = 0
+        try:
+            while True:
+                fut = loop.create_future()
+                self._keys[rmatch] = fut
+                ret = self._umad._execute(buf,path,sendOnly=True)
+                if not ret:
+                    sent = loop.time()
+                    timer = loop.call_later(
+                        self._mad_timeout(buf,path,path.retries - retries),
+                        self._expire,fut)
+                    try:
+                        ret = await fut
+                    finally:
+                        timer.cancel()
+                    if ret is None:
+                        if retries == 0:
+                            break
+                        retries = retries - 1
+                        if self.trace_func is not None:
+                            self.trace_func(self,
+                                            rdma.madtransactor.TRACE_RECEIVE,
+                                            fmt=fmt,path=path)
+                        continue
+                    if retries == path.retries and self.rtt is not None:
+                        self.rtt.sample(path,buf[1],loop.time() - sent)
+                resend = self._check_resend(ret[0],fmt,path,resends)
+                if resend is None:
+                    break
+                resends = resends + 1
+                delay,path = resend
+                if delay:
+                    await asyncio.sleep(delay)
+        finally:
+            if self._keys.get(rmatch) is fut:
+                del self._keys[rmatch]
+            if not self._keys:
+                self._stop()
+        return self._completeMAD(ret,fmt,path,newer,completer)
+
+    async def run(self,op):
+        """Run the generator coroutine *op*, as would be used with
+        :class:`rdma.sched.MADSchedule`, to completion. RPC results yielded by
+        *op* are awaited and yielded generators are run as nested calls. The
+        result is the value of :attr:`result` when *op* finishes. The
+        :class:`~rdma.sched.MADSchedule` specific
+        :meth:`~rdma.sched.MADSchedule.queue` and
+        :meth:`~rdma.sched.MADSchedule.mqueue` are not available, use
+        :func:`asyncio.gather` instead."""
+        stack = []
+        result = None
+        exc = None
+        self.result = None
+        while True:
+            try:
+                if exc is not None:
+                    work = op.throw(exc)
+                    exc = None
+                else:
+                    work = op.send(result)
+            except StopIteration:
+                result = self.result
+                self.result = None
+                if not stack:
+                    return result
+                op = stack.pop()
+                continue
+            except Exception as e:
+                if not stack:
+                    raise
+                op = stack.pop()
+                exc = e
+                continue
+
+            result = None
+            if work is None:
+                result = self.result
+                self.result = None
+            elif inspect.isgenerator(work):
+                stack.append(op)
+                op = work
+            else:
+                try:
+                    result = await work
+                except Exception as e:
+                    exc = e
+
+    def close(self):
+        """Detach from the event loop, outstanding RPCs will time out."""
+        self._stop()
+
+    def __enter__(self):
+        return self
+    def __exit__(self,*exc_info):
+        self.close()
+
+    # Implement the MADTransactor interface. The RPC functions return
+    # awaitables for the result.
+    def _doMAD(self,fmt,payload,path,attributeModifier,method,completer=None):
+        path = self._redirected(fmt,path)
+        buf = self._prepareMAD(fmt,payload,attributeModifier,method,path)
+        newer = payload if isinstance(payload,type) else payload.__class__
+        return self._transact(buf,fmt,path,newer,completer)
+
+    async def _return_value(self,value):
+        return value
+
+    def _get_new_TID(self):
+        return self._umad._get_new_TID()
@@ -1,37 +1,125 @@
 # Copyright 2011 Obsidian Research Corp. GPLv2, see COPYING.
 import rdma
 import abc
+import collections.abc
 import struct
-from rdma import util
 
-uint32_t = struct.Struct('>L')
-uint64_t = struct.Struct('>Q')
+#: Arrays with at least this many sub-byte entries are converted with NumPy,
+#: when it is installed. NumPy is not imported until such an array is seen.
+NUMPY_MIN_COUNT = 256
+
+# The numpy module, False if it is not installed, None if not looked for yet
+_numpy = None
+
+def _get_numpy():
+    """Return the numpy module or None if it is not installed."""
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+            _numpy = numpy
+        except ImportError:
+            _numpy = False
+    return _numpy or None
+
+def _split_table(mlen):
+    """Return a list indexed by byte value of the tuple of *mlen* bit entries
+    stored in that byte, most significant first."""
+    per = 8//mlen
+    mask = (1 << mlen) - 1
+    return [tuple((I >> (8 - mlen*(J+1))) & mask for J in range(per))
+            for I in range(256)]
+
+# mlen -> byte value -> tuple of entries
+_split = dict((I,_split_table(I)) for I in (1,2,4))
+# Entry value -> digit, entries that do not fit in a hex digit are invalid
+_digits = b"0123456789abcdef" + b"z"*240
+# mlen -> struct format character of a whole word entry
+_words = {8: 'B',16: 'H',32: 'L',64: 'Q'}
+
+def _np_pack(mlen,count,inp):
+    """Return the packed bytes or None if NumPy is not installed."""
+    numpy = _get_numpy()
+    if numpy is None:
+        return None
+    vals = numpy.asarray(inp[:count])
+    if (len(vals) != count or
+        (count and (vals.min() < 0 or vals.max() >= 1 << mlen))):
+        raise ValueError("Array entries do not fit in %u bits"%(mlen))
+    per = 8//mlen
+    vals = vals.astype(numpy.uint8).reshape(-1,per)
+    res = vals[:,0] << (8 - mlen)
+    for I in range(1,per):
+        res = res | (vals[:,I] << (8 - mlen*(I+1)))
+    return res.tobytes()
+
+def _np_unpack(buf,offset,mlen,count):
+    """Return a list of the entries or None if NumPy is not installed."""
+    numpy = _get_numpy()
+    if numpy is None:
+        return None
+    data = numpy.frombuffer(buf,dtype=numpy.uint8,count=mlen*count//8,
+                            offset=offset)
+    if mlen == 1:
+        return numpy.unpackbits(data).tolist()
+    per = 8//mlen
+    res = numpy.empty((len(data),per),dtype=numpy.uint8)
+    for I in range(per):
+        res[:,I] = (data >> (8 - mlen*(I+1))) & ((1 << mlen) - 1)
+    return res.reshape(count).tolist()
 
 def pack_array8(buf,offset,mlen,count,inp):
+    """Starting at *offset* in *buf* store the first *count* entries of
+    *inp* each *mlen* bits wide, most significant first."""
+    fmt = _words.get(mlen)
+    if fmt is not None:
+        struct.pack_into('>%u%s'%(count,fmt),buf,offset,*inp[:count])
+        return
+
+    nbytes = mlen*count//8
+    if mlen in _split:
+        if count >= NUMPY_MIN_COUNT:
+            res = _np_pack(mlen,count,inp)
+            if res is not None:
+                buf[offset:offset+nbytes] = res
+                return
+        # Each entry is one digit of a base 2, 4 or 16 number
+        val = int(bytes(inp[:count]).translate(_digits),1 << mlen)
+        buf[offset:offset+nbytes] = val.to_bytes(nbytes,"big")
+        return
+
     val = 0
-    width = 0
     for I in range(count):
-        val = (val<<mlen) | inp[I]
-        width += mlen
-        if width == 64:
-            uint64_t.pack_into(buf, offset, val)
-            val = width = 0
-            offset += 8
-        elif width == 32:
-            uint32_t.pack_into(buf, offset, val)
-            val = width = 0
-            offset += 4
-
-    assert width == 0
+        val = (val << mlen) | inp[I]
+    buf[offset:offset+nbytes] = val.to_bytes(nbytes,"big")
 
 def unpack_array8(buf,offset,mlen,count,inp):
     """Starting at *offset* in *buf* assign *count* entries each *mlen* bits
-    wide to indexes in *inp*."""
-    # Sigh, so much overhead..
-    val = int(util.encode_hex(buf[offset:offset+(mlen*count)/8]),16)
+    wide to indexes in *inp*, which is returned."""
+    fmt = _words.get(mlen)
+    if fmt is not None:
+        inp[:count] = struct.unpack_from('>%u%s'%(count,fmt),buf,offset)
+        return inp
+
+    nbytes = mlen*count//8
+    split = _split.get(mlen)
+    if split is not None:
+        if count >= NUMPY_MIN_COUNT:
+            res = _np_unpack(buf,offset,mlen,count)
+            if res is not None:
+                inp[:count] = res
+                return inp
+        res = []
+        for I in buf[offset:offset+nbytes]:
+            res.extend(split[I])
+        inp[:count] = res
+        return inp
+
+    val = int.from_bytes(buf[offset:offset+nbytes],"big")
+    mask = (1 << mlen) - 1
     for I in range(count):
-        inp[I] = (val >> ((count - 1 - I)*mlen)) & ((1 << mlen) - 1)
-    return
+        inp[I] = (val >> ((count - 1 - I)*mlen)) & mask
+    return inp
 
 class BinStruct(object, metaclass=abc.ABCMeta):
     '''Base class for all binary structure objects (MADs, etc). When pickled
@@ -42,18 +130,17 @@ class BinStruct(object, metaclass=abc.ABCMeta):
     __slots__ = ()
 
     def __init__(self,buf = None,offset = 0):
-        """*buf* is either an instance of :class:`BinStruct` or a :class:`bytes`
+        """*buf* is either an instance of :class:`BinStruct` or a buffer
+        (:class:`bytes`, :class:`bytearray` or :class:`memoryview`)
         representing the data to unpack into the instance. *offset* is the
         starting offset in *buf* for unpacking. If no arguments are given then
         all attributes are set to 0."""
         if buf is not None:
             if isinstance(buf,BinStruct):
-                buf = bytearray(buf.MAD_LENGTH)
-                s.pack_into(buf)
-            if isinstance(buf,bytearray):
-                self.unpack_from(bytes(buf),offset)
-            else:
-                self.unpack_from(buf,offset)
+                tmp = bytearray(buf.MAD_LENGTH)
+                buf.pack_into(tmp)
+                buf = tmp
+            self.unpack_from(buf,offset)
         else:
             self.zero()
 
@@ -126,3 +213,93 @@ class BinFormat(BinStruct):
                                       self.mgmtClass,self.classVersion,
                                       '??' if attr is None else attr.__name__,
                                       self.attributeID)
+
+class BinStructView(object):
+    """Mixin for the read only views generated for every structure, available
+    as the :attr:`View` attribute of the structure class. A view is an
+    instance of its structure but holds only a buffer and an offset, each
+    member is decoded from the buffer every time it is read and members
+    that are structures return views of their own. Assigning to a member
+    raises :exc:`AttributeError`.
+
+    Views are cheap to create for records that are only partially
+    inspected, a copy that can be modified and does not keep the buffer
+    alive is made by passing the view to the structure's constructor, or by
+    :meth:`decode`."""
+    __slots__ = ()
+
+    def __init_subclass__(cls,**kwargs):
+        # Views print and pickle as the structure they wrap
+        super().__init_subclass__(**kwargs)
+        cls.STRUCT = cls.__bases__[-1]
+        cls.__name__ = cls.STRUCT.__name__
+
+    def __init__(self,buf,offset=0):
+        """*buf* is any object supporting the buffer protocol, usually a
+        :class:`memoryview` so slicing does not copy, and *offset* is where
+        the structure starts in it. *buf* must not change while the view is
+        used."""
+        self._buf = buf
+        self._off = offset
+
+    def zero(self):
+        raise AttributeError("%s views are read only"%(self.__class__.__name__))
+
+    def unpack_from(self,buf,offset=0):
+        """Point the view at the structure starting at *offset* in *buf*."""
+        self._buf = buf
+        self._off = offset
+
+    def pack_into(self,buf,offset=0):
+        buf[offset:offset + self.MAD_LENGTH] = \
+            self._buf[self._off:self._off + self.MAD_LENGTH]
+
+    def decode(self):
+        """Return a full instance of the structure with every member
+        decoded."""
+        return self.STRUCT(bytes(self._buf[self._off:self._off + self.MAD_LENGTH]))
+
+    def __reduce__(self):
+        return (self.STRUCT,(bytes(self._buf[self._off:self._off + self.MAD_LENGTH]),))
+
+class ViewList(collections.abc.Sequence):
+    """A read only list of *count* views of the structure class *cls* spaced
+    *step* bytes apart in *buf*, starting at *offset*. The views are created
+    as items are accessed so a large table costs only the one buffer."""
+    __slots__ = ('STRUCT','_view','_buf','_off','_step','_count')
+
+    def __init__(self,cls,buf,offset,step,count):
+        #: The structure class of the records
+        self.STRUCT = cls
+        self._view = cls.View
+        self._buf = buf
+        self._off = offset
+        self._step = step
+        self._count = count
+
+    def buffer_info(self):
+        """Return tuple(buf,offset,step,count) locating the records."""
+        return (self._buf,self._off,self._step,self._count)
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self,idx):
+        if isinstance(idx,slice):
+            return [self[I] for I in range(*idx.indices(self._count))]
+        if idx < 0:
+            idx = idx + self._count
+        if idx < 0 or idx >= self._count:
+            raise IndexError("ViewList index out of range")
+        return self._view(self._buf,self._off + self._step*idx)
+
+    def __iter__(self):
+        view = self._view
+        buf = self._buf
+        for off in range(self._off,self._off + self._step*self._count,
+                         self._step):
+            yield view(buf,off)
+
+    def __repr__(self):
+        return "<%s of %u %s>"%(self.__class__.__name__,self._count,
+                               self._view.__name__)
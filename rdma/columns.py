@@ -0,0 +1,182 @@
+# Copyright 2011 Obsidian Research Corp. GPLv2, see COPYING.
+"""Columnar decoding of tables of IBA structures, such as the result of
+:meth:`~rdma.madtransactor.MADTransactor.SubnAdmGetTable`.
+
+Every member of the record, including the members of embedded structures,
+becomes one column named with the dotted path used by
+:attr:`COMPONENT_MASK`, eg ``portInfo.linkWidthActive``. When NumPy is
+installed the columns are :class:`numpy.ndarray` decoded straight out of
+the RMPP reply buffer with vectorized operations, so whole table queries
+need no Python loop::
+
+    res = umad.SubnAdmGetTable(IBA.SAPortInfoRecord,views=True)
+    cols = rdma.columns.columns(res)
+    slow = cols["portInfo.linkWidthActive"] < cols["portInfo.linkWidthEnabled"]
+    for LID,port in zip(cols["endportLID"][slow],cols["portNum"][slow]):
+        print(LID,port)
+
+Without NumPy :func:`columns` returns a :class:`list` per column instead,
+built by reading each record."""
+import operator
+import rdma,rdma.binstruct
+import rdma.IBA as IBA
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# cls -> list of (name,off,bits,count,kind)
+_layouts = {}
+
+def layout(cls):
+    """Return the list of tuple(name,off,bits,count,kind) describing every
+    column of *cls*. *off* is the bit offset of the column, each of the
+    *count* elements is *bits* wide and *kind* is :class:`int` for integers
+    (including GUIDs) or :class:`bytes` for data that is not a number, like
+    GIDs and byte arrays."""
+    res = _layouts.get(cls)
+    if res is not None:
+        return res
+
+    res = []
+    obj = cls()
+    off = 0
+    for name,bits,count in cls.MEMBERS:
+        attr = getattr(obj,name)
+        if isinstance(attr,rdma.binstruct.BinStruct):
+            res.extend(("%s.%s"%(name,I[0]),off + I[1]) + I[2:]
+                       for I in layout(attr.__class__))
+        elif isinstance(attr,(bytes,bytearray)) and not \
+             isinstance(attr,IBA.GUID):
+            res.append((name,off,bits*count,1,bytes))
+        elif isinstance(attr,list) and attr and \
+             isinstance(attr[0],rdma.binstruct.BinStruct):
+            res.append((name,off,bits*count,1,bytes))
+        else:
+            res.append((name,off,bits,count,int))
+        off = off + bits*count
+    _layouts[cls] = res
+    return res
+
+def _select(cls,names):
+    lay = layout(cls)
+    if names is None:
+        return [I for I in lay if not I[0].rpartition(".")[2].startswith("reserved")]
+    idx = dict((I[0],I) for I in lay)
+    try:
+        return [idx[I] for I in names]
+    except KeyError as e:
+        raise rdma.RDMAError("%s has no member %s"%(cls.__name__,e))
+
+def _np_int(data,count,off,bits):
+    """Decode the *bits* wide big endian integer at bit *off* of every
+    record in the 2D byte array *data*."""
+    first = off//8
+    last = (off + bits - 1)//8
+    if bits <= 8:
+        dtype = numpy.uint8
+    elif bits <= 16:
+        dtype = numpy.uint16
+    elif bits <= 32:
+        dtype = numpy.uint32
+    else:
+        dtype = numpy.uint64
+    nbytes = last - first + 1
+    if nbytes in (1,2,4,8) and off % 8 == 0 and bits == nbytes*8:
+        return data[:,first:last + 1].copy().view(">u%u"%(nbytes)).reshape(
+            count).astype(dtype)
+
+    acc = numpy.zeros(count,dtype=numpy.uint64)
+    for I in range(first,last + 1):
+        acc = (acc << numpy.uint64(8)) | data[:,I].astype(numpy.uint64)
+    acc = acc >> numpy.uint64((last + 1)*8 - off - bits)
+    if bits < 64:
+        acc = acc & numpy.uint64((1 << bits) - 1)
+    return acc.astype(dtype)
+
+def _np_columns(buf,offset,step,count,cols):
+    data = numpy.frombuffer(buf,dtype=numpy.uint8,count=step*count,
+                            offset=offset).reshape(count,step)
+    res = {}
+    for name,off,bits,num,kind in cols:
+        if kind is bytes:
+            res[name] = data[:,off//8:(off + bits)//8].copy().view(
+                "V%u"%(bits//8)).reshape(count)
+        elif num == 1:
+            res[name] = _np_int(data,count,off,bits)
+        else:
+            res[name] = numpy.stack([_np_int(data,count,off + bits*I,bits)
+                                     for I in range(num)],axis=1)
+    return res
+
+def _struct(table):
+    if isinstance(table,rdma.binstruct.ViewList):
+        return table.STRUCT
+    if not len(table):
+        return None
+    cls = table[0].__class__
+    return getattr(cls,"STRUCT",cls)
+
+def columns(table,names=None):
+    """Decode the records in *table* into a :class:`dict` of column name to
+    column. *table* is a :class:`~rdma.binstruct.ViewList`, as returned for
+    RMPP replies with *views* set, or any sequence of structures of the same type. *names*
+    selects the columns to decode, by default every member except the
+    reserved ones.
+
+    With NumPy integer columns are unsigned arrays of the smallest type that
+    holds the member, arrays like ``portMaskBlock`` have one row per
+    record and other data, like GIDs, are fixed size void arrays. Otherwise
+    each column is a :class:`list` of the member values."""
+    cls = _struct(table)
+    if cls is None:
+        return {}
+    cols = _select(cls,names)
+
+    if numpy is None:
+        return dict((I[0],[get(rec) for rec in table])
+                    for I,get in ((I,operator.attrgetter(I[0])) for I in cols))
+
+    if isinstance(table,rdma.binstruct.ViewList):
+        buf,offset,step,count = table.buffer_info()
+    else:
+        step = cls.MAD_LENGTH
+        count = len(table)
+        buf = bytearray(step*count)
+        offset = 0
+        for I,rec in enumerate(table):
+            rec.pack_into(buf,step*I)
+    return _np_columns(buf,offset,step,count,cols)
+
+def dtype(cls,names=None):
+    """Return the :class:`numpy.dtype` of the structured array
+    :func:`structured` returns for *cls*. Requires NumPy."""
+    if numpy is None:
+        raise rdma.RDMAError("NumPy is required for structured arrays")
+    res = []
+    for name,off,bits,num,kind in _select(cls,names):
+        if kind is bytes:
+            res.append((name,"V%u"%(bits//8)))
+            continue
+        for size in (8,16,32,64):
+            if bits <= size:
+                break
+        if num == 1:
+            res.append((name,"u%u"%(size//8)))
+        else:
+            res.append((name,"u%u"%(size//8),(num,)))
+    return numpy.dtype(res)
+
+def structured(table,names=None):
+    """Decode the records in *table* into a NumPy structured array with a
+    field for each column :func:`columns` would return. Requires NumPy."""
+    if numpy is None:
+        raise rdma.RDMAError("NumPy is required for structured arrays")
+    cls = _struct(table)
+    if cls is None:
+        return numpy.zeros(0,dtype=numpy.dtype([]))
+    res = numpy.empty(len(table),dtype=dtype(cls,names))
+    for name,value in columns(table,names).items():
+        res[name] = value
+    return res
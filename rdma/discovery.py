@@ -8,8 +8,7 @@ import rdma.IBA as IBA
 def subnet_ninf_GUID(sched,sbn,node_guid):
     """Coroutine to fetch a :class:`~rmda.IBA.SMPNodeInfo` record from the
     SA for a specific GUID and store it in *sbn*."""
-    req = IBA.ComponentMask(IBA.SANodeRecord())
-    req.nodeInfo.nodeGUID = node_guid
+    req = IBA.sa_query(IBA.SANodeRecord,{"nodeInfo.nodeGUID": node_guid})
     res = yield sched.SubnAdmGetTable(req)
 
     # The SM can return multiple records that match a nodeGUID, one for each port
@@ -22,10 +21,11 @@ def subnet_ninf_GUID(sched,sbn,node_guid):
 def subnet_ninf_SA(sched,sbn,node_type=None):
     """Coroutine to fetch all :class:`~rmda.IBA.SMPNodeInfo` records from the
     SA and store them in *sbn*."""
-    req = IBA.ComponentMask(IBA.SANodeRecord())
     if node_type is not None:
-        req.nodeInfo.nodeType = node_type
-    res = yield sched.SubnAdmGetTable(IBA.SANodeRecord())
+        req = IBA.sa_query(IBA.SANodeRecord,{"nodeInfo.nodeType": node_type})
+    else:
+        req = IBA.SANodeRecord
+    res = yield sched.SubnAdmGetTable(req)
     if res:
         sbn.set_max_lid(max(I.LID for I in res))
     for I in res:
@@ -51,14 +51,13 @@ def subnet_swinf_SA(sched,sbn):
 
 def _subnet_fill_LIDs_SA(sched,sbn,LMC):
     """Coroutine to ask the SA for all the PortInfo's with LMC=LMC."""
-    pinf = IBA.ComponentMask(IBA.SAPortInfoRecord())
-    pinf.portInfo.LMC = LMC
-    res = yield sched.SubnAdmGetTable(pinf)
+    req = IBA.sa_query(IBA.SAPortInfoRecord,{"portInfo.LMC": LMC})
+    res = yield sched.SubnAdmGetTable(req)
     if res:
         sbn.set_max_lid(max(I.endportLID for I in res))
     for I in res:
         assert I.endportLID == I.portInfo.LID
-        sbn.get_port_pinf(pinf,portIdx=I.portNum)
+        sbn.get_port_pinf(I.portInfo,portIdx=I.portNum)
 
 def subnet_fill_LIDs_SA(sched,sbn):
     """Coroutine to fill in the LID mapping in *sbn* to compensate for LMC.
@@ -117,9 +116,8 @@ def subnet_ninf_SMP(sched,sbn,path,get_desc=True,use_sa=None,done_desc=None):
         use_sa = isinstance(sched,rdma.satransactor.SATransactor)
 
     if use_sa:
-        req = IBA.ComponentMask(IBA.SANodeRecord())
-        req.LID = yield sched.prepare_path_lid(path)
-        ret = yield sched.SubnAdmGet(req)
+        LID = yield sched.prepare_path_lid(path)
+        ret = yield sched.SubnAdmGet(IBA.sa_query(IBA.SANodeRecord,LID=LID))
         sched.result = sbn.get_node_ninf(ret.nodeInfo,path)
         sched.result[0].set_desc(ret.nodeDescription.nodeString)
         path._cached_node_type = ret.nodeInfo.nodeType
@@ -396,10 +394,10 @@ def topo_peer_SMP(sched,sbn,port,get_desc=True,path=None,
         if use_sa:
             if path is None:
                 path = sbn.get_path_smp(sched,port.to_end_port())
-            req = IBA.ComponentMask(IBA.SALinkRecord())
-            req.fromLID = yield sched.prepare_path_lid(path)
-            req.fromPort = portIdx
-            rep = yield sched.SubnAdmGet(req)
+            LID = yield sched.prepare_path_lid(path)
+            rep = yield sched.SubnAdmGet(IBA.sa_query(IBA.SALinkRecord,
+                                                      fromLID=LID,
+                                                      fromPort=portIdx))
             peer_path._cached_resolved_dlid = rep.toLID
             peer_port = sbn.get_port(portIdx=rep.toPort,LID=rep.toLID,
                                      path=peer_path)
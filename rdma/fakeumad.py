@@ -0,0 +1,130 @@
+# Copyright 2011 Obsidian Research Corp. GPLv2, see COPYING.
+"""A base for in-process stand ins for :class:`rdma.umad.UMAD`.
+
+:class:`FakeUMAD` provides the transport half of the UMAD interface -
+:meth:`~FakeUMAD.sendto`, :meth:`~FakeUMAD.recvfrom`,
+:meth:`~FakeUMAD.recvfrom_many` and the synchronous
+:meth:`~FakeUMAD._execute` - over a queue of replies held in memory.
+Derived classes only decide how each request is answered, see
+:class:`rdma.sim.SimUMAD` and :class:`rdma.madcapture.ReplayUMAD`."""
+import heapq
+import itertools
+import time
+import rdma,rdma.madtransactor,rdma.tools
+
+class FakeUMAD(rdma.madtransactor.MADTransactor):
+    """Answer MADs without a kernel interface. Derived classes implement
+    :meth:`_request`, which calls :meth:`_reply` for every reply the
+    request produces. Replies are returned by :meth:`recvfrom` in the order
+    of the time they are due, sleeping until then."""
+    trace_func = None
+
+    def __init__(self,end_port):
+        """*end_port* is the :class:`rdma.devices.EndPort` the MADs are
+        sent from."""
+        rdma.madtransactor.MADTransactor.__init__(self)
+        self.end_port = end_port
+        #: Number of MADs sent
+        self.sent = 0
+        self._tid = 0
+        self._pending = []
+        self._seq = itertools.count()
+
+    def _get_new_TID(self):
+        self._tid = (self._tid + 1) % (1 << 32)
+        return self._tid
+
+    def _request(self,buf,path):
+        """Answer the MAD *buf* sent to *path*."""
+        raise NotImplementedError()
+
+    def _reply(self,when,rbuf,rpath):
+        """Make the reply *rbuf* from *rpath* available to :meth:`recvfrom`
+        at the :func:`rdma.tools.clock_monotonic` time *when*."""
+        heapq.heappush(self._pending,(when,next(self._seq),rbuf,rpath))
+
+    def sendto(self,buf,path):
+        '''Send a MAD packet. *buf* is the raw MAD to send, starting with the first
+        byte of :class:`rdma.IBA.MADHeader`. *path* is the destination.'''
+        self.sent = self.sent + 1
+        if self.stats is not None:
+            self.stats.sent(buf,path)
+        self._request(buf,path)
+
+    def recvfrom(self,wakeat):
+        '''Receive a MAD packet. If the value of
+        :func:`rdma.tools.clock_monotonic()` exceeds *wakeat* then :class:`None`
+        is returned.
+
+        :returns: tuple(buf,path)'''
+        now = rdma.tools.clock_monotonic()
+        if self._pending:
+            when = self._pending[0][0]
+            if wakeat is None or when <= wakeat:
+                if when > now:
+                    time.sleep(when - now)
+                when,seq,rbuf,rpath = heapq.heappop(self._pending)
+                return (rbuf,rpath)
+        # Nothing more can arrive before wakeat
+        if wakeat is not None and wakeat > now:
+            time.sleep(wakeat - now)
+        return None
+
+    def recvfrom_many(self,wakeat,limit=None):
+        '''Receive every MAD packet that is ready, up to *limit*. This
+        sleeps like :meth:`recvfrom` until at least one MAD is available, an
+        empty list is returned if *wakeat* passes first.
+
+        :returns: list of tuple(buf,path)'''
+        ret = self.recvfrom(wakeat)
+        if ret is None:
+            return []
+        res = [ret]
+        now = rdma.tools.clock_monotonic()
+        while ((limit is None or len(res) < limit) and self._pending and
+               self._pending[0][0] <= now):
+            when,seq,rbuf,rpath = heapq.heappop(self._pending)
+            res.append((rbuf,rpath))
+        return res
+
+    def _execute(self,buf,path,sendOnly = False):
+        """Send the fully formed MAD in buf to path and copy the reply
+        into buf. Return path of the reply. This is a synchronous method, all
+        MADs received during this call are discarded until the reply is seen."""
+        self.sendto(buf,path)
+        if sendOnly:
+            return None
+        rmatch = self._get_reply_match_key(buf)
+        sent = rdma.tools.clock_monotonic()
+        expire = self._mad_timeout(buf,path) + sent
+        retries = path.retries
+        while True:
+            ret = self.recvfrom(expire)
+            if ret is None:
+                if retries == 0:
+                    return None
+                retries = retries - 1
+                self._execute(buf,path,True)
+
+                expire = (self._mad_timeout(buf,path,path.retries - retries) +
+                          rdma.tools.clock_monotonic())
+                continue
+            elif rmatch == self._get_match_key(ret[0]):
+                if retries == path.retries and self.rtt is not None:
+                    self.rtt.sample(path,buf[1],
+                                    rdma.tools.clock_monotonic() - sent)
+                return ret
+            else:
+                if self.trace_func is not None:
+                    self.trace_func(self,rdma.madtransactor.TRACE_UNEXPECTED,
+                                    path=path,ret=ret)
+                if self.stats is not None:
+                    self.stats.unexpected_reply(*ret)
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+    def __exit__(self,*exc_info):
+        self.close()
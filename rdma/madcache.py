@@ -0,0 +1,254 @@
+# Copyright 2011 Obsidian Research Corp. GPLv2, see COPYING.
+import collections
+import rdma,rdma.madtransactor,rdma.tools
+import rdma.IBA as IBA
+
+class MADCache(rdma.madtransactor.MADTransactor):
+    """This class wrappers another MADTransactor and remembers the replies to
+    Get RPCs for attributes that change slowly. A repeated Get to the same
+    destination, class, attribute and attribute modifier within the
+    attribute's time to live is answered without sending a MAD. Works with
+    both synchronous and asynchronous transactors::
+
+        mad = rdma.madcache.MADCache(umad)
+        ninf = mad.SubnGet(IBA.SMPNodeInfo,path)
+        ninf = mad.SubnGet(IBA.SMPNodeInfo,path) # No MAD sent
+
+    The reply payload is stored packed and each hit returns a new decoded
+    instance, so callers are free to modify what they get. A Set RPC through
+    the cache drops every cached value of that attribute at that destination,
+    and replies to Gets of it that were outstanding at the time are not
+    cached.
+
+    When used with :class:`~rdma.satransactor.SATransactor` the cache must be
+    the inner transactor, eg ``SATransactor(MADCache(umad))``.
+
+    It is also a context manager that wrappers the *parent*'s :meth:`close`."""
+
+    #: :class:`dict` of payload class to the number of seconds a reply
+    #: remains valid for. Attributes not listed are never cached.
+    ttl = {IBA.SMPNodeInfo: 60,
+           IBA.SMPNodeDescription: 60,
+           IBA.SMPSwitchInfo: 10,
+           IBA.MADClassPortInfo: 60}
+    #: Number of RPCs answered from the cache
+    hits = 0
+    #: Number of cacheable RPCs that had to send a MAD
+    misses = 0
+
+    def __init__(self,parent,ttl=None,max_entries=4096,max_bytes=1024*1024):
+        """*parent* is the :class:`~rdma.madtransactor.MADTransactor` we are
+        wrappering. *ttl* replaces :attr:`ttl`. The least recently used
+        replies are discarded once there are more than *max_entries* of
+        them or they use more than *max_bytes*."""
+        self._parent = parent
+        self.end_port = parent.end_port
+        if ttl is not None:
+            self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        # attribute key -> count of invalidations, a Get reply is only
+        # stored if no invalidation happened while it was outstanding
+        self._generations = {}
+        self._cleared = 0
+        self.clear()
+
+    def clear(self):
+        """Discard everything in the cache."""
+        self._entries = collections.OrderedDict()
+        self._attrs = {}
+        self._bytes = 0
+        self._cleared = self._cleared + 1
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def _attr_key(fmt,payload,path):
+        return (path.end_port,path.mad_target,fmt.MAD_CLASS,
+                payload.MAD_ATTRIBUTE_ID)
+
+    def _drop(self,key):
+        expires,data = self._entries.pop(key)
+        self._bytes = self._bytes - len(data)
+        keys = self._attrs[key[0]]
+        keys.discard(key)
+        if not keys:
+            del self._attrs[key[0]]
+
+    def invalidate(self,payload,path):
+        """Drop all cached replies for the attribute *payload* at *path*."""
+        for akey in [I for I in self._attrs
+                     if I[0] == path.end_port and I[1] == path.mad_target and
+                     I[3] == payload.MAD_ATTRIBUTE_ID]:
+            self._invalidate(akey)
+
+    def _invalidate(self,akey):
+        self._generations[akey] = self._generations.get(akey,0) + 1
+        for key in list(self._attrs.get(akey,())):
+            self._drop(key)
+
+    def _generation(self,key):
+        """Return a value that changes whenever the cached replies for the
+        attribute of *key* are invalidated."""
+        return (self._cleared,self._generations.get(key[0],0))
+
+    def _store(self,key,ttl,rpayload):
+        data = bytearray(rpayload.MAD_LENGTH)
+        rpayload.pack_into(data)
+        data = bytes(data)
+        if key in self._entries:
+            self._drop(key)
+        self._entries[key] = (rdma.tools.clock_monotonic() + ttl,data)
+        keys = self._attrs.get(key[0])
+        if keys is None:
+            keys = self._attrs[key[0]] = set()
+        keys.add(key)
+        self._bytes = self._bytes + len(data)
+        while (len(self._entries) > self.max_entries or
+               self._bytes > self.max_bytes):
+            self._drop(next(iter(self._entries)))
+
+    def _get_new_TID(self):
+        return self._parent._get_new_TID()
+
+    def _doMAD(self,fmt,payload,path,attributeModifier,method,completer=None):
+        if method == IBA.MAD_METHOD_SET:
+            self._invalidate(self._attr_key(fmt,payload,path))
+        elif method == IBA.MAD_METHOD_GET:
+            newer = payload if isinstance(payload,type) else payload.__class__
+            ttl = self.ttl.get(newer)
+            if ttl is not None:
+                return self._cached_get(fmt,payload,path,attributeModifier,
+                                        method,completer,newer,ttl)
+        return self._parent._doMAD(fmt,payload,path,attributeModifier,method,
+                                   completer)
+
+    def _get_key(self,fmt,payload,path,attributeModifier):
+        if isinstance(payload,type):
+            req = b""
+        else:
+            req = bytearray(payload.MAD_LENGTH)
+            payload.pack_into(req)
+            req = bytes(req).rstrip(b"\0")
+        return (self._attr_key(fmt,payload,path),attributeModifier,req,
+                getattr(fmt,"componentMask",None))
+
+    def _lookup(self,key,newer):
+        """Return a new *newer* decoded from the live entry for *key*, or
+        :data:`None`."""
+        ent = self._entries.get(key)
+        if ent is None:
+            return None
+        if ent[0] <= rdma.tools.clock_monotonic():
+            self._drop(key)
+            return None
+        self._entries.move_to_end(key)
+        self.hits = self.hits + 1
+        return newer(ent[1])
+
+    def _cached_get(self,fmt,payload,path,attributeModifier,method,completer,
+                    newer,ttl):
+        key = self._get_key(fmt,payload,path,attributeModifier)
+        rpayload = self._lookup(key,newer)
+        if rpayload is not None:
+            if completer:
+                # Completers expect the request to be set, like
+                # _completeMAD does. Wrappers find these through
+                # __getattr__ so they must not linger.
+                self.req_fmt = fmt
+                self.req_path = path
+                try:
+                    if isinstance(completer,tuple):
+                        rpayload = completer[0](rpayload)
+                    else:
+                        rpayload = completer(rpayload)
+                finally:
+                    del self.req_fmt
+                    del self.req_path
+            return self._parent._return_value(rpayload)
+
+        self.misses = self.misses + 1
+        failed = []
+        generation = self._generation(key)
+        def store(rpayload):
+            # A Set sent while this Get was outstanding makes the reply stale
+            if not failed and self._generation(key) == generation:
+                self._store(key,ttl,rpayload)
+            return rpayload
+        def error(rfmt,class_code):
+            # Values made up for class errors are not cached
+            failed.append(class_code)
+            return completer[1](rfmt,class_code)
+        if not completer:
+            ncompleter = store
+        elif isinstance(completer,tuple):
+            ncompleter = (lambda rpayload:completer[0](store(rpayload)),
+                          error)
+        else:
+            ncompleter = lambda rpayload:completer(store(rpayload))
+        return self._parent._doMAD(fmt,payload,path,attributeModifier,method,
+                                   ncompleter)
+
+    def execute_many(self,rpc,payload,requests,window=16,
+                     return_exceptions=False):
+        """As :meth:`rdma.madtransactor.MADTransactor.execute_many`. Cached
+        Gets are answered from the cache and the rest are sent with the
+        *parent*'s :meth:`~rdma.madtransactor.MADTransactor.execute_many`,
+        their replies are cached."""
+        fmt_func,meth = self._rpc_form(rpc)
+        method = getattr(payload,meth)
+        prpc = getattr(self._parent,rpc.__name__)
+        newer = payload if isinstance(payload,type) else payload.__class__
+        ttl = self.ttl.get(newer)
+        if method == IBA.MAD_METHOD_SET:
+            requests = list(requests)
+            for path,attributeModifier in requests:
+                self._invalidate(self._attr_key(fmt_func(self,payload,path),
+                                                payload,path))
+        if method != IBA.MAD_METHOD_GET or ttl is None:
+            return self._parent.execute_many(prpc,payload,requests,window,
+                                             return_exceptions)
+
+        res = []
+        misses = []
+        for path,attributeModifier in requests:
+            key = self._get_key(fmt_func(self,payload,path),payload,path,
+                                attributeModifier)
+            res.append(self._lookup(key,newer))
+            if res[-1] is None:
+                misses.append((len(res) - 1,key,self._generation(key),
+                               (path,attributeModifier)))
+        if not misses:
+            return res
+
+        self.misses = self.misses + len(misses)
+        rep = self._parent.execute_many(prpc,payload,[I[3] for I in misses],
+                                        window,return_exceptions)
+        for (idx,key,generation,req),rpayload in zip(misses,rep):
+            if (not isinstance(rpayload,rdma.MADError) and
+                self._generation(key) == generation):
+                self._store(key,ttl,rpayload)
+            res[idx] = rpayload
+        return res
+
+    def __getattr__(self,name):
+        """Let us wrapper things with additional members."""
+        return getattr(self._parent,name)
+
+    @property
+    def result(self):
+        return self._parent.result
+    @result.setter
+    def result(self,value):
+        self._parent.result = value
+    @property
+    def is_async(self):
+        return self._parent.is_async
+
+    def __enter__(self):
+        return self
+    def __exit__(self,*exc_info):
+        self._parent.close()
+    def close(self):
+        return self._parent.close()
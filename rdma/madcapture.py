@@ -0,0 +1,194 @@
+# Copyright 2011 Obsidian Research Corp. GPLv2, see COPYING.
+"""Record MAD traffic to a binary trace file and play it back.
+
+A trace file starts with :data:`MAGIC` followed by one record per MAD. Each
+record is a fixed size header giving the time since the capture started, the
+direction, the addressing of the path, a GID and the length of the MAD bytes
+that follow."""
+import collections
+import struct
+import rdma,rdma.fakeumad,rdma.path,rdma.tools
+import rdma.IBA as IBA
+
+MAGIC = b"PYRDMAC\x01"
+
+#: A MAD sent by the local end port.
+CAPTURE_SEND = 0
+#: A MAD received by the local end port.
+CAPTURE_RECV = 1
+
+# double time, uint8_t kind, uint8_t SL, uint16_t DLID, uint16_t SLID,
+# uint32_t dqpn, uint32_t sqpn, uint8_t gid[16], uint32_t length
+_record_t = struct.Struct("=dBBHHLL16sL")
+
+#: One MAD from a capture file. *gid* is the DGID of a sent MAD or the SGID of
+#: a received MAD, :data:`None` if there was no GRH.
+CaptureRecord = collections.namedtuple(
+    "CaptureRecord","time kind buf SL DLID SLID dqpn sqpn gid")
+
+class MADCapture(object):
+    """Write every MAD given to :meth:`sent` and :meth:`received` to a trace
+    file. Assign an instance to :attr:`rdma.umad.UMAD.capture` or
+    :attr:`rdma.vmad.VMAD.capture` to record everything that passes through
+    that interface::
+
+        with rdma.madcapture.MADCapture("sweep.cap") as cap:
+            umad.capture = cap
+            ...
+
+    This class supports the context manager protocol."""
+    def __init__(self,f):
+        """*f* is a file name or a file object opened for binary writing."""
+        if isinstance(f,str):
+            self._f = open(f,"wb")
+            self._close = True
+        else:
+            self._f = f
+            self._close = False
+        self._f.write(MAGIC)
+        self._start = rdma.tools.clock_monotonic()
+
+    def _write(self,kind,buf,path,gid):
+        if gid is None or not path.has_grh:
+            gid = bytes(16)
+        self._f.write(_record_t.pack(rdma.tools.clock_monotonic() - self._start,
+                                     kind,path.SL,path.DLID,path.SLID,
+                                     path.dqpn or 0,path.sqpn or 0,
+                                     bytes(gid),len(buf)))
+        self._f.write(bytes(buf))
+
+    def sent(self,buf,path):
+        """Record that the MAD *buf* was sent to *path*."""
+        self._write(CAPTURE_SEND,buf,path,path.DGID)
+
+    def received(self,buf,path):
+        """Record that the MAD *buf* was received from *path*."""
+        self._write(CAPTURE_RECV,buf,path,path.SGID)
+
+    def close(self):
+        """Flush the trace and close it if we opened it."""
+        if self._f is None:
+            return
+        if self._close:
+            self._f.close()
+        else:
+            self._f.flush()
+        self._f = None
+
+    def __enter__(self):
+        return self
+    def __exit__(self,*exc_info):
+        self.close()
+
+def read_capture(f):
+    """Generate a :class:`CaptureRecord` for every MAD in the trace file
+    *f*, which is a file name or a file object opened for binary reading.
+
+    :raises rdma.RDMAError: If *f* is not a trace file."""
+    if isinstance(f,str):
+        with open(f,"rb") as F:
+            for I in read_capture(F):
+                yield I
+        return
+
+    if f.read(len(MAGIC)) != MAGIC:
+        raise rdma.RDMAError("%r is not a MAD capture file"%(f))
+    while True:
+        hdr = f.read(_record_t.size)
+        if not hdr:
+            return
+        if len(hdr) != _record_t.size:
+            raise rdma.RDMAError("Truncated MAD capture file %r"%(f))
+        (when,kind,SL,DLID,SLID,dqpn,sqpn,gid,length) = _record_t.unpack(hdr)
+        buf = f.read(length)
+        if len(buf) != length:
+            raise rdma.RDMAError("Truncated MAD capture file %r"%(f))
+        if gid == bytes(16):
+            gid = None
+        else:
+            gid = IBA.GID(gid,raw=True)
+        yield CaptureRecord(when,kind,bytearray(buf),SL,DLID,SLID,dqpn,sqpn,
+                            gid)
+
+def _request_key(DLID,dqpn,gid,buf):
+    """The replay match key for a request, everything but the TID."""
+    return (DLID,dqpn,gid,bytes(buf[:8]),bytes(buf[16:]))
+
+class ReplayUMAD(rdma.fakeumad.FakeUMAD):
+    """A stand in for :class:`rdma.umad.UMAD` that answers MADs from a trace
+    recorded by :class:`MADCapture`. Requests are matched on everything but
+    the transaction ID. Each match is answered like the corresponding
+    request in the trace, in order: with the recorded reply after the
+    recorded latency multiplied by *scale*, or not at all if the recorded
+    request was lost. Once a request's recorded outcomes are used up the
+    last one is repeated. Requests that never appear in the trace are not
+    answered and are counted in :attr:`unmatched`.
+
+    This can be used directly as a synchronous transactor or passed to
+    :class:`rdma.sched.MADSchedule`, so tools can be benchmarked against a
+    production capture without any hardware::
+
+        umad = rdma.madcapture.ReplayUMAD(end_port,"sweep.cap",scale=0)
+        sched = rdma.sched.MADSchedule(umad)
+    """
+    #: Number of requests that did not appear in the trace
+    unmatched = 0
+
+    def __init__(self,end_port,f,scale=1.0):
+        """*end_port* is used to build the reply paths, *f* is the trace
+        file and *scale* multiplies every recorded latency."""
+        rdma.fakeumad.FakeUMAD.__init__(self,end_port)
+        self.scale = scale
+        self._outcomes = {}
+        self._load(f)
+
+    def _load(self,f):
+        outstanding = {}
+        for rec in read_capture(f):
+            if rec.kind == CAPTURE_SEND:
+                if rec.buf[3] & IBA.MAD_METHOD_RESPONSE:
+                    continue
+                rmatch = self._get_match_key(rec.buf)
+                old = outstanding.get(rmatch)
+                if old is not None:
+                    # Retry, the earlier send was lost
+                    old[0].append(None)
+                key = _request_key(rec.DLID,rec.dqpn,rec.gid,rec.buf)
+                outstanding[rmatch] = (self._outcomes.setdefault(key,[]),
+                                       rec.time)
+            elif rec.buf[3] & IBA.MAD_METHOD_RESPONSE:
+                old = outstanding.pop(self._get_match_key(rec.buf),None)
+                if old is not None:
+                    old[0].append((rec.time - old[1],rec))
+        for I in outstanding.values():
+            I[0].append(None)
+        self._outcomes = dict((key,collections.deque(value))
+                              for key,value in self._outcomes.items())
+
+    def _outcome(self,buf,path):
+        """Return the recorded (latency,record) that answers *buf* or
+        :data:`None` if it is lost."""
+        gid = path.DGID if path.has_grh else None
+        outcomes = self._outcomes.get(_request_key(path.DLID,path.dqpn or 0,
+                                                   gid,buf))
+        if outcomes is None:
+            self.unmatched = self.unmatched + 1
+            return None
+        if len(outcomes) > 1:
+            return outcomes.popleft()
+        return outcomes[0]
+
+    def _request(self,buf,path):
+        ret = self._outcome(buf,path)
+        if ret is None:
+            return
+        latency,rec = ret
+        rbuf = bytearray(rec.buf)
+        rbuf[8:16] = buf[8:16]
+        rpath = rdma.path.IBPath(self.end_port,SL=rec.SL,DLID=rec.DLID,
+                                 SLID=rec.SLID,dqpn=rec.dqpn,sqpn=rec.sqpn)
+        if rec.gid is not None:
+            rpath.has_grh = True
+            rpath.SGID = rec.gid
+        self._reply(rdma.tools.clock_monotonic() + latency*self.scale,rbuf,
+                    rpath)
@@ -0,0 +1,240 @@
+# Copyright 2011 Obsidian Research Corp. GPLv2, see COPYING.
+"""Low overhead MAD event recording and latency statistics."""
+import collections,struct,sys
+import rdma,rdma.madtransactor,rdma.tools
+import rdma.IBA as IBA
+
+EVENT_SEND = 0
+EVENT_COMPLETE = 1
+EVENT_TIMEOUT = 2
+EVENT_RETRY = 3
+EVENT_UNEXPECTED = 4
+
+#: One entry from :meth:`MADStats.events`. *LID* is the destination LID of
+#: a request or the source LID of an unexpected reply, *latency* is the
+#: seconds since the first send for :data:`EVENT_COMPLETE` and
+#: :data:`EVENT_TIMEOUT`.
+Event = collections.namedtuple("Event","time kind mgmtClass method "
+                               "attributeID attributeModifier LID latency")
+
+class AttrStats(object):
+    """Counters for one attribute of one management class. :attr:`hist` is a
+    log2 latency histogram, bucket *I* counts replies that took less than
+    2**I microseconds and at least half that."""
+    sent = 0
+    completed = 0
+    retries = 0
+    timeouts = 0
+    total_latency = 0
+    max_latency = 0
+
+    def __init__(self):
+        self.hist = [0]*32
+
+    def add(self,other):
+        """Accumulate *other* into this instance."""
+        self.sent = self.sent + other.sent
+        self.completed = self.completed + other.completed
+        self.retries = self.retries + other.retries
+        self.timeouts = self.timeouts + other.timeouts
+        self.total_latency = self.total_latency + other.total_latency
+        self.max_latency = max(self.max_latency,other.max_latency)
+        for I,count in enumerate(other.hist):
+            self.hist[I] = self.hist[I] + count
+
+    def percentile(self,pct):
+        """Return an upper bound in seconds on the latency of *pct* percent
+        of the completed MADs."""
+        want = self.completed*pct/100.
+        seen = 0
+        for I,count in enumerate(self.hist):
+            seen = seen + count
+            if count and seen >= want:
+                return min(2**I/1E6,self.max_latency)
+        return self.max_latency
+
+class MADStats(object):
+    """Record send, complete, timeout, retry and unexpected reply events for
+    MADs into a fixed size binary ring buffer and accumulate per attribute
+    latency histograms, retry counts and the peak number of outstanding
+    MADs.
+
+    An instance is attached to a transactor through its
+    :attr:`~rdma.madtransactor.MADTransactor.stats` attribute, a
+    :class:`~rdma.sched.MADSchedule` shares the one of the UMAD it is
+    created for. Setting the class attribute
+    :attr:`rdma.madtransactor.MADTransactor.stats` records every transactor
+    in the process. When no instance is attached the cost is a single
+    attribute test per MAD::
+
+        umad.stats = rdma.madstats.MADStats()
+        ...
+        umad.stats.summary()
+
+    The latency of a MAD is measured from its first send, so it includes
+    the time spent on retries."""
+
+    _event = struct.Struct("=dBBBHLHf")
+    # baseVersion,mgmtClass,classVersion,method,attributeID,attributeModifier
+    _hdr = struct.Struct(">BBBB12xH2xL")
+
+    def __init__(self,size=4096):
+        """*size* is the number of events kept in the ring buffer."""
+        self.size = size
+        self.clear()
+
+    def clear(self):
+        """Discard all the recorded events and counters."""
+        self._ring = bytearray(self._event.size*self.size)
+        self._pos = 0
+        #: Total number of events recorded, including overwritten ones
+        self.count = 0
+        #: Number of replies that matched no outstanding request
+        self.unexpected = 0
+        #: The most MADs that were outstanding at once
+        self.peak_outstanding = 0
+        #: :class:`dict` of (mgmtClass,classVersion,attributeID) to
+        #: :class:`AttrStats`
+        self.attrs = {}
+        # rmatch -> (first send time,LID,header,AttrStats)
+        self._pending = {}
+
+    def _record(self,now,kind,hdr,LID,latency):
+        self._event.pack_into(self._ring,self._pos,now,kind,hdr[1],hdr[3],
+                              hdr[4],hdr[5],LID & 0xFFFF,latency)
+        self._pos = self._pos + self._event.size
+        if self._pos >= len(self._ring):
+            self._pos = 0
+        self.count = self.count + 1
+
+    def sent(self,buf,path):
+        """Called when the request MAD *buf* is sent to *path*, resends of
+        an outstanding MAD are counted as retries."""
+        if buf[3] & IBA.MAD_METHOD_RESPONSE:
+            return
+        now = rdma.tools.clock_monotonic()
+        rmatch = rdma.madtransactor.MADTransactor._get_match_key(buf)
+        ent = self._pending.get(rmatch)
+        if ent is not None:
+            ent[3].retries = ent[3].retries + 1
+            self._record(now,EVENT_RETRY,ent[2],ent[1],0)
+            return
+
+        hdr = self._hdr.unpack_from(buf,0)
+        key = (hdr[1],(hdr[0] << 8) | hdr[2],hdr[4])
+        st = self.attrs.get(key)
+        if st is None:
+            st = self.attrs[key] = AttrStats()
+        st.sent = st.sent + 1
+        LID = getattr(path,"DLID",0)
+        self._pending[rmatch] = (now,LID,hdr,st)
+        if len(self._pending) > self.peak_outstanding:
+            self.peak_outstanding = len(self._pending)
+        self._record(now,EVENT_SEND,hdr,LID,0)
+
+    def completed(self,fmt,ret):
+        """Called when the request *fmt* finishes, *ret* is :data:`None` if it
+        timed out."""
+        ent = self._pending.pop((fmt.mgmtClass << 32) |
+                                (fmt.transactionID & 0xFFFFFFFF),None)
+        if ent is None:
+            return
+        now = rdma.tools.clock_monotonic()
+        latency = now - ent[0]
+        st = ent[3]
+        if ret is None:
+            st.timeouts = st.timeouts + 1
+            self._record(now,EVENT_TIMEOUT,ent[2],ent[1],latency)
+            return
+        st.completed = st.completed + 1
+        st.total_latency = st.total_latency + latency
+        if latency > st.max_latency:
+            st.max_latency = latency
+        bucket = min(31,int(latency*1E6).bit_length())
+        st.hist[bucket] = st.hist[bucket] + 1
+        self._record(now,EVENT_COMPLETE,ent[2],ent[1],latency)
+
+    def discard(self,rmatch):
+        """Called when the request with match key *rmatch* is given up on
+        without completing, eg because it was cancelled. Nothing is
+        recorded for it."""
+        self._pending.pop(rmatch,None)
+
+    def unexpected_reply(self,buf,path):
+        """Called when the reply *buf* from *path* matched no request."""
+        self.unexpected = self.unexpected + 1
+        if len(buf) < self._hdr.size:
+            return
+        self._record(rdma.tools.clock_monotonic(),EVENT_UNEXPECTED,
+                     self._hdr.unpack_from(buf,0),getattr(path,"SLID",0),0)
+
+    def events(self):
+        """Return a list of the :class:`Event` in the ring buffer, oldest
+        first."""
+        esize = self._event.size
+        if self.count < self.size:
+            data = self._ring[:self._pos]
+        else:
+            data = self._ring[self._pos:] + self._ring[:self._pos]
+        return [Event._make(self._event.unpack_from(data,I))
+                for I in range(0,len(data),esize)]
+
+    def classes(self):
+        """Return a :class:`dict` of mgmtClass to :class:`AttrStats` summed
+        over all the attributes of the class."""
+        res = {}
+        for key,st in self.attrs.items():
+            cst = res.get(key[0])
+            if cst is None:
+                cst = res[key[0]] = AttrStats()
+            cst.add(st)
+        return res
+
+    _class_names = {IBA.MAD_SUBNET: "MAD_SUBNET",
+                    IBA.MAD_SUBNET_DIRECTED: "MAD_SUBNET_DIRECTED",
+                    IBA.MAD_SUBNET_ADMIN: "MAD_SUBNET_ADMIN",
+                    IBA.MAD_COMMUNICATIONS: "MAD_COMMUNICATIONS",
+                    IBA.MAD_PERFORMANCE: "MAD_PERFORMANCE",
+                    IBA.MAD_DEVICE: "MAD_DEVICE",
+                    IBA.MAD_SNMP: "MAD_SNMP"}
+
+    @staticmethod
+    def _attr_name(key):
+        fmt,payload = IBA.get_fmt_payload(*key)
+        if payload is None:
+            return "attr(%u)"%(key[2])
+        return payload.__name__
+
+    @staticmethod
+    def _hist_str(st):
+        return "  ".join("<%uus:%u"%(2**I,count)
+                         for I,count in enumerate(st.hist) if count)
+
+    def summary(self,F=None):
+        """Print a table of the statistics to *F*, :data:`sys.stdout` by
+        default."""
+        if F is None:
+            F = sys.stdout
+        total = AttrStats()
+        for st in self.attrs.values():
+            total.add(st)
+        print("MADs: %u sent, %u completed, %u retries, %u timeouts, "
+              "%u unexpected, peak %u outstanding"%(
+                  total.sent,total.completed,total.retries,total.timeouts,
+                  self.unexpected,self.peak_outstanding),file=F)
+        print("%-30s %8s %7s %7s %9s %9s %9s"%(
+            "","sent","retries","timeout","avg us","p99 us","max us"),file=F)
+        def row(name,st):
+            avg = st.total_latency/st.completed if st.completed else 0
+            print("%-30s %8u %7u %7u %9.1f %9.1f %9.1f"%(
+                name,st.sent,st.retries,st.timeouts,avg*1E6,
+                st.percentile(99)*1E6,st.max_latency*1E6),file=F)
+        classes = self.classes()
+        for mgmtClass in sorted(classes):
+            row(self._class_names.get(mgmtClass,"class 0x%x"%(mgmtClass)),
+                classes[mgmtClass])
+            for key in sorted(I for I in self.attrs if I[0] == mgmtClass):
+                st = self.attrs[key]
+                row("  " + self._attr_name(key),st)
+                if st.completed:
+                    print("    " + self._hist_str(st),file=F)
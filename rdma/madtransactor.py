@@ -1,5 +1,6 @@
 # Copyright 2011 Obsidian Research Corp. GPLv2, see COPYING.
-import rdma,rdma.path,sys
+import rdma,rdma.binstruct,rdma.path,rdma.tools,sys
+import collections,heapq,random,time
 import rdma.IBA as IBA
 
 TRACE_SEND = 0
@@ -70,6 +71,11 @@ def dumper_tracer(mt,kind,fmt=None,path=None,ret=None):
             print(("D: Outgoing reply",fmt.describe()))
             fmt.printer(sys.stdout,header=False)
 
+def _table_views(rpayload):
+    """Completer used by :meth:`MADTransactor.SubnAdmGetTable` to have
+    :meth:`MADTransactor._completeMAD` return RMPP records as views."""
+    return rpayload
+
 class MADTransactor(object):
     """This class is a mixin for everything that implements a MAD RPC
     transaction interface. Derived classes must provide the :meth:`_execute`
@@ -93,8 +99,28 @@ class MADTransactor(object):
     #: The end_port this is associated with
     end_port = None
 
+    #: A :class:`rdma.rtt.RTTEstimator` used to pick MAD timeouts, if
+    #: :data:`None` (the default) then :attr:`rdma.path.IBPath.mad_timeout`
+    #: is used.
+    rtt = None
+    #: A :class:`rdma.madstats.MADStats` that records MAD events, or
+    #: :data:`None`.
+    stats = None
+    #: Number of times a MAD answered with BUSY or redirect is resent before
+    #: the reply is returned as an error. These resends do not use the
+    #: path's retries.
+    busy_retries = 8
+    #: Seconds to wait before resending a MAD answered with BUSY, doubled for
+    #: each further BUSY reply and jittered by +/- 50%
+    busy_delay = 0.01
+
     # Used when emulating an async interface in do_async
     result = None
+    # (end_port,mad_target,mgmtClass) -> dict of redirected path attributes
+    _redirects = None
+
+    def __init__(self):
+        self._redirects = {}
 
     @property
     def is_async(self):
@@ -110,6 +136,68 @@ class MADTransactor(object):
         """Override in derived classes."""
         pass
 
+    def _redirected(self,fmt,path):
+        """Return the path MADs of *fmt*'s class to *path* should be sent
+        on. If a redirect was seen before this is a copy of *path* with the
+        redirect applied."""
+        if not self._redirects:
+            return path
+        redirect = self._redirects.get((path.end_port,path.mad_target,
+                                        fmt.MAD_CLASS))
+        if redirect is None:
+            return path
+        return path.copy(**redirect)
+
+    def _check_resend(self,rbuf,fmt,path,count):
+        """Look at the status of the reply *rbuf* to the request *fmt* sent
+        to *path*. *count* is the number of times this has already asked
+        for the MAD to be resent. Returns :data:`None` if the reply should be
+        completed, otherwise tuple(delay,path) to send the MAD again to
+        *path* after *delay* seconds."""
+        if len(rbuf) < 6 or not rbuf[5] & (IBA.MAD_STATUS_BUSY |
+                                           IBA.MAD_STATUS_REDIRECT):
+            return None
+        if count >= self.busy_retries:
+            return None
+        if not rbuf[5] & IBA.MAD_STATUS_REDIRECT:
+            return (self.busy_delay*(2**count)*random.uniform(0.5,1.5),path)
+
+        # SMPs cannot be redirected, C13-13.1.2
+        if fmt.MAD_CLASS in (IBA.MAD_SUBNET,IBA.MAD_SUBNET_DIRECTED):
+            return None
+        try:
+            cpinf = IBA.MADClassPortInfo(fmt.__class__(rbuf).data)
+        except:
+            return None
+        # Only the addressing is remembered, every caller keeps the rest of
+        # its own path, eg the retries and timeouts.
+        redirect = {"dqpn": cpinf.redirectQP,"qkey": cpinf.redirectQKey,
+                    "pkey": cpinf.redirectPKey,"SL": cpinf.redirectSL}
+        if cpinf.redirectLID != 0:
+            redirect["DLID"] = cpinf.redirectLID
+        if cpinf.redirectGID != IBA.ZERO_GID:
+            redirect["has_grh"] = True
+            redirect["DGID"] = cpinf.redirectGID
+            redirect["traffic_class"] = cpinf.redirectTC
+            redirect["flow_label"] = cpinf.redirectFL
+        if self._redirects is not None:
+            self._redirects[(path.end_port,path.mad_target,
+                             fmt.MAD_CLASS)] = redirect
+        return (0,path.copy(**redirect))
+
+    def forget_redirects(self):
+        """Discard the cached redirect targets, the next MADs are sent to
+        their original paths."""
+        if self._redirects:
+            self._redirects.clear()
+
+    def _mad_timeout(self,buf,path,attempt=0):
+        """Return how long to wait for the reply to the MAD *buf* to *path*
+        that has been sent *attempt* times before."""
+        if self.rtt is None:
+            return path.mad_timeout
+        return self.rtt.timeout(path,buf[1],attempt)
+
     @staticmethod
     def _get_match_key(buf):
         """Return an integer that represents the 'key' for MAD buf.
@@ -178,6 +266,8 @@ class MADTransactor(object):
     def _completeMAD(self,ret,fmt,path,newer,completer):
         if self.trace_func is not None:
             self.trace_func(self,TRACE_COMPLETE,ret=ret,fmt=fmt,path=path)
+        if self.stats is not None:
+            self.stats.completed(fmt,ret)
 
         if ret is None:
             raise rdma.MADTimeoutError(req=fmt,path=path)
@@ -207,8 +297,8 @@ class MADTransactor(object):
         # Note that everything in get_reply_match_key has already been
         # checked
 
-        # FIXME: Handle BUSY
-        # FIXME: Handle redirect
+        # BUSY and redirect replies are resent by the transport using
+        # _check_resend, they only get here once it gives up.
         status = self.reply_fmt.status
         if status & 0x1F != 0:
             raise rdma.MADError(req=fmt,rep=self.reply_fmt,path=path,
@@ -256,8 +346,14 @@ class MADTransactor(object):
                         raise rdma.MADError(req=fmt,rep=self.reply_fmt,path=path,
                                             status=self.reply_fmt.status,
                                             msg="RMPP complete packet was too short.")
-                    rpayload = [newer(rbuf[start + step*I:start + step*(I+1)])
-                                for I in range(count)]
+                    if (completer is _table_views and
+                        getattr(newer,"View",None) is not None):
+                        # Records are decoded lazily straight out of rbuf
+                        rpayload = rdma.binstruct.ViewList(
+                            newer,memoryview(rbuf),start,step,count)
+                    else:
+                        rpayload = [newer(rbuf,start + step*I)
+                                    for I in range(count)]
             else:
                 rpayload = newer(self.reply_fmt.data)
         except rdma.MADError:
@@ -284,12 +380,39 @@ class MADTransactor(object):
         caller must always return _doMAD(). If for some reason there is some
         post-processing work to do then a completer function must be specified
         to do it."""
+        path = self._redirected(fmt,path)
         buf = self._prepareMAD(fmt,payload,attributeModifier,method,path)
-        ret = self._execute(buf,path)
+        count = 0
+        while True:
+            ret = self._execute(buf,path)
+            if ret is None:
+                break
+            resend = self._check_resend(ret[0],fmt,path,count)
+            if resend is None:
+                break
+            count = count + 1
+            delay,path = resend
+            if delay:
+                time.sleep(delay)
         newer = payload if isinstance(payload,type) else payload.__class__
         return self._completeMAD(ret,fmt,path,newer,completer)
 
-    def _subn_do(self,payload,path,attributeModifier,method):
+    _Pending = collections.namedtuple("_Pending","buf fmt path newer completer")
+
+    def _formMAD(self,fmt,payload,path,attributeModifier,method,completer=None):
+        """Build the MAD :meth:`_doMAD` would send, without sending it. Used
+        by :meth:`execute_many`."""
+        path = self._redirected(fmt,path)
+        buf = self._prepareMAD(fmt,payload,attributeModifier,method,path)
+        newer = payload if isinstance(payload,type) else payload.__class__
+        return self._Pending(buf,fmt,path,newer,completer)
+
+    def _return_value(self,value):
+        """Return *value* from a RPC wrapper without sending a MAD, in the
+        form the caller of this transactor expects an RPC result."""
+        return value
+
+    def _subn_fmt(self,payload,path):
         if isinstance(path,rdma.path.IBDRPath):
             fmt = IBA.SMPFormatDirected()
             fmt.drSLID = path.drSLID
@@ -299,7 +422,11 @@ class MADTransactor(object):
         else:
             fmt = IBA.SMPFormat()
         fmt.MKey = getattr(path,"MKey",0)
-        return self._doMAD(fmt,payload,path,attributeModifier,method)
+        return fmt
+
+    def _subn_do(self,payload,path,attributeModifier,method):
+        return self._doMAD(self._subn_fmt(payload,path),payload,path,
+                           attributeModifier,method)
 
     def SubnGet(self,payload,path,attributeModifier=0):
         return self._subn_do(payload,path,attributeModifier,
@@ -308,12 +435,15 @@ class MADTransactor(object):
         return self._subn_do(payload,path,attributeModifier,
                            payload.MAD_SUBNSET)
 
+    def _perf_fmt(self,payload,path):
+        return IBA.PMFormat()
+
     def PerformanceGet(self,payload,path,attributeModifier=0):
-        return self._doMAD(IBA.PMFormat(),payload,path,attributeModifier,
-                           payload.MAD_PERFORMANCEGET)
+        return self._doMAD(self._perf_fmt(payload,path),payload,path,
+                           attributeModifier,payload.MAD_PERFORMANCEGET)
     def PerformanceSet(self,payload,path,attributeModifier=0):
-        return self._doMAD(IBA.PMFormat(),payload,path,attributeModifier,
-                           payload.MAD_PERFORMANCESET)
+        return self._doMAD(self._perf_fmt(payload,path),payload,path,
+                           attributeModifier,payload.MAD_PERFORMANCESET)
 
     def _subn_adm_do(self,payload,path,attributeModifier,method,completer=None):
         if path is None:
@@ -328,16 +458,25 @@ class MADTransactor(object):
     def SubnAdmGet(self,payload,path=None,attributeModifier=0):
         return self._subn_adm_do(payload,path,attributeModifier,
                            payload.MAD_SUBNADMGET)
-    def SubnAdmGetTable(self,payload,path=None,attributeModifier=0):
+    def SubnAdmGetTable(self,payload,path=None,attributeModifier=0,
+                        views=False):
+        """Return the :class:`list` of records matching *payload*. If *views*
+        is :data:`True` the records are instead returned as a read only
+        :class:`rdma.binstruct.ViewList` of views into the reply, which are
+        only decoded as they are read."""
         return self._subn_adm_do(payload,path,attributeModifier,
-                                 payload.MAD_SUBNADMGETTABLE)
+                                 payload.MAD_SUBNADMGETTABLE,
+                                 _table_views if views else None)
     def SubnAdmSet(self,payload,path=None,attributeModifier=0):
         return self._subn_adm_do(payload,path,attributeModifier,
                            payload.MAD_SUBNADMSET)
 
+    def _vend_fmt(self,payload,path):
+        return payload.FORMAT()
+
     def _vend_do(self,payload,path,attributeModifier,method):
-        fmt = payload.FORMAT()
-        return self._doMAD(fmt,payload,path,attributeModifier,method)
+        return self._doMAD(self._vend_fmt(payload,path),payload,path,
+                           attributeModifier,method)
 
     def VendGet(self,payload,path,attributeModifier=0):
         return self._vend_do(payload,path,attributeModifier,
@@ -346,6 +485,166 @@ class MADTransactor(object):
         return self._vend_do(payload,path,attributeModifier,
                              payload.MAD_VENDSET)
 
+    # RPC name -> (function returning the format for (self,payload,path),
+    #              payload attribute holding the method)
+    _RPC_FORMS = {"SubnGet": (_subn_fmt,"MAD_SUBNGET"),
+                  "SubnSet": (_subn_fmt,"MAD_SUBNSET"),
+                  "PerformanceGet": (_perf_fmt,"MAD_PERFORMANCEGET"),
+                  "PerformanceSet": (_perf_fmt,"MAD_PERFORMANCESET"),
+                  "VendGet": (_vend_fmt,"MAD_VENDGET"),
+                  "VendSet": (_vend_fmt,"MAD_VENDSET")}
+
+    def _rpc_form(self,rpc):
+        """Return the (format function,method attribute) from
+        :attr:`_RPC_FORMS` for the bound RPC method *rpc*.
+
+        :raises rdma.RDMAError: If *rpc* cannot be pipelined."""
+        name = getattr(rpc,"__name__",None)
+        form = self._RPC_FORMS.get(name)
+        if (form is None or getattr(rpc,"__self__",None) is not self or
+            getattr(self.__class__,name) is not getattr(MADTransactor,name)):
+            raise rdma.RDMAError("execute_many does not support %r"%(rpc,))
+        return form
+
+    def execute_many(self,rpc,payload,requests,window=16,
+                     return_exceptions=False):
+        """Call the RPC method *rpc* of this instance, eg :meth:`SubnGet`,
+        with *payload* for every (path,attributeModifier) tuple in the
+        iterable *requests*, keeping up to *window* MADs outstanding at once.
+        Replies are matched to their requests by TID and each MAD is retried
+        on its own according to its path. BUSY and redirect replies are
+        handled as for a single RPC.
+
+        If *return_exceptions* is :data:`True` a MAD that fails has its
+        :exc:`rdma.MADError` placed in the result list, otherwise the first
+        failure is raised once it is seen and the remaining MADs are
+        abandoned.
+
+        *rpc* must be a Get or Set RPC for SMPs, the PMA or a vendor class
+        that is not overridden by a subclass.
+
+        :returns: A list of the results in the order of *requests*.
+        :raises rdma.MADError: If a MAD fails."""
+        if self.is_async:
+            raise rdma.RDMAError("execute_many needs a synchronous transactor")
+        fmt_func,meth = self._rpc_form(rpc)
+        method = getattr(payload,meth)
+        res = []
+        # rmatch -> [index,work,retries,expire,sent,resends,resend_due]
+        pending = {}
+        timers = []
+        requests = iter(requests)
+        clock = rdma.tools.clock_monotonic
+
+        def complete(idx,work,ret):
+            try:
+                res[idx] = self._completeMAD(ret,work.fmt,work.path,
+                                             work.newer,work.completer)
+            except rdma.MADError as e:
+                if not return_exceptions:
+                    raise
+                res[idx] = e
+
+        try:
+            while True:
+                while requests is not None and len(pending) < window:
+                    try:
+                        path,attributeModifier = next(requests)
+                    except StopIteration:
+                        requests = None
+                        break
+                    idx = len(res)
+                    res.append(None)
+                    work = self._formMAD(fmt_func(self,payload,path),payload,
+                                         path,attributeModifier,method)
+                    path = work.path
+                    ret = self._execute(work.buf,path,True)
+                    if ret is not None:
+                        complete(idx,work,ret)
+                        continue
+                    rmatch = self._get_reply_match_key(work.buf)
+                    sent = clock()
+                    expire = self._mad_timeout(work.buf,path) + sent
+                    pending[rmatch] = [idx,work,path.retries,expire,sent,0,
+                                       False]
+                    heapq.heappush(timers,(expire,idx,rmatch))
+
+                if not pending:
+                    return res
+
+                # Take every reply that is ready before looking at timers
+                ret = self.recvfrom(timers[0][0])
+                while ret is not None:
+                    rmatch = self._get_match_key(ret[0])
+                    entry = pending.pop(rmatch,None)
+                    if entry is None:
+                        if self.trace_func is not None:
+                            self.trace_func(self,TRACE_UNEXPECTED,ret=ret)
+                        if self.stats is not None:
+                            self.stats.unexpected_reply(*ret)
+                    else:
+                        work = entry[1]
+                        if (self.rtt is not None and
+                            entry[2] == work.path.retries):
+                            self.rtt.sample(work.path,work.buf[1],
+                                            clock() - entry[4])
+                        resend = self._check_resend(ret[0],work.fmt,work.path,
+                                                    entry[5])
+                        if resend is None:
+                            complete(entry[0],work,ret)
+                        else:
+                            delay,path = resend
+                            entry[1] = work._replace(path=path)
+                            entry[3] = expire = clock() + delay
+                            entry[5] = entry[5] + 1
+                            entry[6] = True
+                            pending[rmatch] = entry
+                            heapq.heappush(timers,(expire,entry[0],rmatch))
+                    ret = self.recvfrom(clock())
+
+                now = clock()
+                while timers and timers[0][0] <= now:
+                    expire,idx,rmatch = heapq.heappop(timers)
+                    entry = pending.get(rmatch)
+                    if entry is None or entry[3] != expire:
+                        continue
+                    work = entry[1]
+                    if entry[6]:
+                        entry[6] = False
+                    elif entry[2] == 0:
+                        del pending[rmatch]
+                        complete(idx,work,None)
+                        continue
+                    else:
+                        entry[2] = entry[2] - 1
+                    ret = self._execute(work.buf,work.path,True)
+                    if ret is not None:
+                        del pending[rmatch]
+                        complete(idx,work,ret)
+                        continue
+                    entry[4] = sent = clock()
+                    entry[3] = expire = sent + self._mad_timeout(
+                        work.buf,work.path,work.path.retries - entry[2])
+                    heapq.heappush(timers,(expire,idx,rmatch))
+        except:
+            # Whatever is still outstanding is never going to complete
+            if self.stats is not None:
+                for rmatch in pending:
+                    self.stats.discard(rmatch)
+            raise
+
+    def SubnGetMany(self,payload,requests,window=16,return_exceptions=False):
+        """:meth:`SubnGet` for every (path,attributeModifier) in *requests*,
+        see :meth:`execute_many`."""
+        return self.execute_many(self.SubnGet,payload,requests,window,
+                                 return_exceptions)
+    def PerformanceGetMany(self,payload,requests,window=16,
+                           return_exceptions=False):
+        """:meth:`PerformanceGet` for every (path,attributeModifier) in
+        *requests*, see :meth:`execute_many`."""
+        return self.execute_many(self.PerformanceGet,payload,requests,window,
+                                 return_exceptions)
+
     def parse_request(self,rbuf,path):
         """Parse a request packet into a format and data.
 
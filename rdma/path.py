@@ -281,6 +281,19 @@ class IBPath(Path):
                                                  2**self.resp_time)
             return self._cached_mad_timeout
 
+    @property
+    def mad_target(self):
+        """A hashable value that identifies the MAD agent this path is
+        addressed to. Paths with equal values reach the same agent."""
+        try:
+            return self._cached_mad_target
+        except AttributeError:
+            if self.has_grh:
+                self._cached_mad_target = (self.DLID,self.DGID)
+            else:
+                self._cached_mad_target = (self.DLID,None)
+            return self._cached_mad_target
+
     @property
     def qp_timeout(self):
         """The timeout to use for RC/RD connections. This is 2 *
@@ -372,7 +385,7 @@ class IBDRPath(IBPath):
         By default this class construct a DR path to the local port."""
         self.DLID = IBA.LID_PERMISSIVE
         self.SLID = IBA.LID_PERMISSIVE
-        self.drPath = bytes(chr(0))
+        self.drPath = b"\0"
         self.dqpn = 0
         self.sqpn = 0
         self.qkey = IBA.IB_DEFAULT_QP0_QKEY
@@ -391,13 +404,24 @@ class IBDRPath(IBPath):
     def complete(self):
         return Path.complete(self) and bool(self.drPath)
 
+    @property
+    def mad_target(self):
+        """A hashable value that identifies the SMA this path is addressed
+        to. This is the LID routed head of the path plus the directed route
+        hops."""
+        try:
+            return self._cached_mad_target
+        except AttributeError:
+            self._cached_mad_target = (self.DLID,self.drPath,self.drDLID)
+            return self._cached_mad_target
+
     @classmethod
     def _format_drPath(cls,v):
-        return ":".join("%u"%(ord(I)) for I in v) + ":"
+        return ":".join("%u"%(I) for I in v) + ":"
 
     def __str__(self):
         # No LID components
-        drPath = tuple(ord(I) for I in self.drPath)
+        drPath = tuple(self.drPath)
         if self.drDLID == IBA.LID_PERMISSIVE and self.drSLID == IBA.LID_PERMISSIVE:
             return "DR Path %r"%(drPath,)
         # LID route at the start
@@ -495,24 +519,21 @@ def _resolve_path_async(mad,path,reversible=False,properties=None):
     if path.end_port is None:
         path.end_port = mad.end_port
 
-    q = IBA.ComponentMask(IBA.SAPathRecord())
-    if reversible:
-        q.reversible = True
-    # FIXME: want to remove this line ...
-    q.reversible = True
+    # FIXME: want to only set reversible when it is asked for ...
+    q = {"reversible": True}
     if path.SGID is not None:
-        q.SGID = path.SGID
+        q["SGID"] = path.SGID
     else:
-        q.SGID = mad.end_port.default_gid
+        q["SGID"] = mad.end_port.default_gid
 
     if path.DGID is not None:
-        q.DGID = path.DGID
+        q["DGID"] = path.DGID
     else:
-        q.DLID = path.DLID
+        q["DLID"] = path.DLID
 
     if properties:
-        for k,v in list(properties.items()):
-            setattr(q,k,v)
+        q.update(properties)
+    q = IBA.sa_query(IBA.SAPathRecord,q)
 
     try:
         rep = yield mad.SubnAdmGet(q)
@@ -613,7 +634,7 @@ def from_spec_string(s):
                     raise ValueError("Invalid DR path specification %r"%(s,))
                 if dr[0] != 0:
                     raise ValueError("Invalid DR path specification %r"%(s,))
-            kwargs[k] = bytes("").join("%c"%(I) for I in dr)
+            kwargs[k] = bytes(dr)
         elif k == "end_port":
             if v[0] == '"' or v[0] == "'":
                 v = v[1:-1]
@@ -693,7 +714,7 @@ def from_string(s,default_end_port=None,require_dev=None,require_ep=None):
             raise ValueError("Invalid DR path specification %r"%(s,))
         if dr[0] != 0:
             raise ValueError("Invalid DR path specification %r"%(s,))
-        drPath = bytes("").join("%c"%(I) for I in dr)
+        drPath = bytes(dr)
         return IBDRPath(default_end_port,drPath=drPath)
 
     a = s.split('%')
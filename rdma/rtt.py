@@ -0,0 +1,74 @@
+# Copyright 2011 Obsidian Research Corp. GPLv2, see COPYING.
+"""Adaptive MAD timeouts from measured round trip times."""
+
+class RTTEstimator(object):
+    """Track the smoothed round trip time and its variance for every MAD
+    destination, the way TCP computes its retransmission timeout (RFC 6298),
+    and derive MAD timeouts from them.
+
+    The static :attr:`rdma.path.IBPath.mad_timeout` is the worst case the
+    agent is allowed to take and is always the upper bound, so a fast agent
+    gets its lost MADs retried quickly while a slow one is still given the
+    time it needs. The estimate is only used for sends that the path's
+    retries can recover from, the last send always waits for the full
+    :attr:`~rdma.path.IBPath.mad_timeout`. Only replies to MADs that were
+    not resent are sampled (Karn's algorithm) as a reply to a resent MAD
+    cannot be matched to a particular send.
+
+    Estimates are kept for each management class and QP of each
+    destination, as different agents on the same LID can answer at very
+    different speeds. A destination that has never answered uses the path's
+    static timeout."""
+
+    #: Gain applied to the smoothed RTT for each sample
+    alpha = 1/8.
+    #: Gain applied to the RTT variance for each sample
+    beta = 1/4.
+    #: Number of variances added to the smoothed RTT
+    k = 4
+    #: Shortest timeout that will be used, in seconds
+    min_timeout = 0.05
+
+    def __init__(self):
+        # key -> [srtt,rttvar]
+        self._est = {}
+
+    def clear(self):
+        """Forget every estimate."""
+        self._est = {}
+
+    @staticmethod
+    def _key(path,mgmt_class):
+        return (path.end_port,path.mad_target,mgmt_class,path.dqpn)
+
+    def sample(self,path,mgmt_class,rtt):
+        """Record that a MAD of *mgmt_class* sent once to *path* was answered
+        after *rtt* seconds."""
+        key = self._key(path,mgmt_class)
+        est = self._est.get(key)
+        if est is None:
+            self._est[key] = [rtt,rtt/2]
+            return
+        est[1] = est[1] + self.beta*(abs(est[0] - rtt) - est[1])
+        est[0] = est[0] + self.alpha*(rtt - est[0])
+
+    def get(self,path,mgmt_class):
+        """Return the tuple(srtt,rttvar) for MADs of *mgmt_class* to *path*,
+        or :data:`None` if nothing has been measured."""
+        est = self._est.get(self._key(path,mgmt_class))
+        if est is None:
+            return None
+        return tuple(est)
+
+    def timeout(self,path,mgmt_class,attempt=0):
+        """Return the timeout in seconds for sending a MAD of *mgmt_class* to
+        *path*. *attempt* is the number of times the MAD has already been
+        sent, each resend doubles the timeout."""
+        limit = path.mad_timeout
+        if attempt >= path.retries:
+            return limit
+        est = self._est.get(self._key(path,mgmt_class))
+        if est is None:
+            return limit
+        rto = max(self.min_timeout,est[0] + self.k*est[1])*(2**attempt)
+        return min(rto,limit)
@@ -74,7 +74,7 @@ class SATransactor(rdma.madtransactor.MADTransactor):
         req = IBA.ComponentMask(IBA.SALinkRecord())
         for I in path.drPath[1:]:
             req.fromLID = start_lid
-            req.fromPort = ord(I)
+            req.fromPort = I
             rep = yield self._parent.SubnAdmGet(req)
             start_lid = rep.toLID
         path._cached_resolved_dlid = start_lid
@@ -222,6 +222,23 @@ class SATransactor(rdma.madtransactor.MADTransactor):
 
         return self._parent.SubnGet(payload,path,attributeModifier)
 
+    def execute_many(self,rpc,payload,requests,window=16,
+                     return_exceptions=False):
+        """As :meth:`rdma.madtransactor.MADTransactor.execute_many`, but the
+        RPCs are made one at a time as each can turn into different SA
+        queries."""
+        if self.is_async:
+            raise rdma.RDMAError("execute_many needs a synchronous transactor")
+        res = []
+        for path,attributeModifier in requests:
+            try:
+                res.append(rpc(payload,path,attributeModifier))
+            except rdma.MADError as e:
+                if not return_exceptions:
+                    raise
+                res.append(e)
+        return res
+
     def __getattr__(self,name):
         """Let us wrapper things with additional members."""
         return getattr(self._parent,name)
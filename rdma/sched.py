@@ -1,6 +1,15 @@
 # Copyright 2011 Obsidian Research Corp. GPLv2, see COPYING.
-import collections,inspect,sys,bisect
-import rdma,rdma.madtransactor
+import collections,inspect,select,sys
+import rdma,rdma.madtransactor,rdma.tools
+import rdma.IBA as IBA
+
+#: Interactive work. It is stepped before anything else and may use the
+#: window slots held back by :attr:`MADSchedule.reserved_window`.
+PRIORITY_HIGH = 0
+#: The default priority.
+PRIORITY_NORMAL = 1
+#: Background work such as long sweeps.
+PRIORITY_LOW = 2
 
 class Context(object):
     _parent = None
@@ -9,25 +18,100 @@ class Context(object):
     _result = None
     _work = None
     _retries = 0
+    #: Number of times the MAD was resent due to BUSY or redirect
+    _resends = 0
+    #: True if the timer is for a BUSY resend, not a timeout
+    _resend_due = False
     _first = False
-
-    def __init__(self,op,gengen,parent=None):
+    _timer = None
+    _target = None
+    _sent = 0
+    _coalesce_key = None
+    _followers = None
+    _priority = PRIORITY_NORMAL
+    _rmatch = None
+    #: The target this context is parked on
+    _parked = None
+    #: The context whose MAD this context is coalesced onto
+    _leader = None
+    #: The context this context is yielding on
+    _waiting = None
+    _cancelled = False
+    _deadline = None
+    _bulk = False
+
+    def __init__(self,op,gengen,parent=None,priority=PRIORITY_NORMAL,
+                 sched=None):
         self._opstack = collections.deque()
         self._op = op
         self._gengen = gengen
+        self._priority = priority
+        self._sched = sched
         if gengen:
             self._children = set()
         if parent is not None:
             self._parent = parent
             self._parent._children.add(self)
+            self._priority = parent._priority
+            self._sched = parent._sched
+
+    def cancel(self):
+        """Stop this context. :exc:`rdma.CancelledError` is thrown into the
+        coroutine at its current ``yield`` and any MAD it is waiting on is
+        forgotten. If this context came from :meth:`MADSchedule.mqueue`
+        then the generator is closed and every coroutine it started is
+        cancelled. The cancellation happens the next time the scheduler
+        runs, cancelling a finished context does nothing."""
+        self._sched._cancel(self)
+
+class _BulkJob(Context):
+    """The context for :meth:`MADSchedule.get_many`. Each MAD in flight is a
+    :class:`_BulkMAD` child."""
+    _bulk = True
+
+    def __init__(self,sched,rpc,payload,requests,on_reply,on_error,priority):
+        Context.__init__(self,iter(requests),True,priority=priority,
+                         sched=sched)
+        self._rpc = rpc
+        self._payload = payload
+        self._on_reply = on_reply
+        self._on_error = on_error
+
+class _BulkMAD(Context):
+    """One MAD of a :class:`_BulkJob`. There is no coroutine behind this,
+    the reply is passed straight to the job's callback."""
+    _bulk = True
+    _gengen = False
+    _op = None
+
+    def __init__(self,job,req):
+        self._parent = job
+        self._priority = job._priority
+        self._sched = job._sched
+        self._req = req
+        job._children.add(self)
 
 class MADSchedule(rdma.madtransactor.MADTransactor):
     """This class provides a MADTransactor interface suitable for use by
     python coroutines. The implementation gets MAD parallelism by running
     multiple coroutines at once. coroutines are implemented as generators."""
 
-    #: Maximum number of outstanding MADs at any time.
-    max_outstanding = 4
+    #: Maximum number of outstanding MADs at any time. This is the upper
+    #: bound for the adaptive window.
+    max_outstanding = 64
+    #: Size of the adaptive window when :meth:`run` starts.
+    initial_window = 4
+    #: The adaptive window never shrinks below this.
+    min_window = 1
+    #: Maximum number of outstanding MADs to a single agent, as identified
+    #: by :attr:`rdma.path.IBPath.mad_target`.
+    max_per_target = 4
+    #: If set then a Get that is identical to one already outstanding is not
+    #: sent, instead it completes with the reply to the outstanding MAD.
+    coalesce = True
+    #: Number of window slots only :data:`PRIORITY_HIGH` work may use, so
+    #: that interactive requests are not stuck behind a sweep.
+    reserved_window = 1
     #: Set to return a result from a coroutine
     result = None
 
@@ -42,32 +126,218 @@ class MADSchedule(rdma.madtransactor.MADTransactor):
 
     def __init__(self,umad):
         """*umad* is a :class:`rdma.umad.UMAD` instance which will be used to
-        issue the MADs."""
+        issue the MADs. *umad* can also be a list of instances for different
+        end ports, each MAD is then sent through the instance for its
+        path's :attr:`~rdma.path.Path.end_port` and all of them are waited on
+        together. :attr:`end_port` is the first instance's end port."""
         rdma.madtransactor.MADTransactor.__init__(self)
+        if isinstance(umad,(list,tuple)):
+            umads = umad
+            umad = umads[0]
+        else:
+            umads = (umad,)
         self.end_port = umad.end_port
+        self.rtt = getattr(umad,"rtt",None)
+        self.stats = getattr(umad,"stats",None)
+        redirects = getattr(umad,"_redirects",None)
+        if redirects is not None:
+            self._redirects = redirects
         self._umad = umad
+        self._umads = {}
+        for I in umads:
+            if I.end_port in self._umads:
+                raise rdma.RDMAError("More than one MAD interface for end port %s"%(
+                    I.end_port))
+            self._umads[I.end_port] = I
+        self._poll = None
+        if len(umads) > 1:
+            self._poll = select.poll()
+            self._fds = {}
+            for I in umads:
+                cc = getattr(I,"_cc",None)
+                fd = cc.fileno() if cc is not None else I.dev.fileno()
+                self._fds[fd] = (I,cc)
+                self._poll.register(fd,select.POLLIN)
         self.trace_func = umad.trace_func
         self._keys = {}
-        self._timeouts = []
-        self._mqueue = collections.deque()
+        self._coalesced = {}
+        self._timers = rdma.tools.TimerHeap()
+        self._deadlines = rdma.tools.TimerHeap()
+        self._cancelq = collections.deque()
+        # One run queue per priority
+        self._mqueue = [collections.deque()
+                        for I in range(PRIORITY_LOW + 1)]
         self._replyqueue = collections.deque()
         self._ctx_waiters = collections.defaultdict(list)
+        self._reset_window()
+
+    @property
+    def window(self):
+        """The current size of the adaptive window. This grows by about one
+        MAD for every window worth of replies that arrive without a retry
+        and halves when MADs time out."""
+        return self._cwnd
+
+    def _reset_window(self):
+        self._cwnd = float(max(self.min_window,
+                               min(self.initial_window,self.max_outstanding)))
+        self._cwnd_cut = 0
+        self._targets = {}
+        self._parked = {}
+        self._ready = collections.deque()
+        self._nparked = 0
+
+    def _has_room(self,priority=PRIORITY_HIGH):
+        """True if another MAD of *priority* may be issued."""
+        limit = self._cwnd
+        if priority != PRIORITY_HIGH:
+            limit = max(self.min_window,limit - self.reserved_window)
+        return (len(self._keys) < limit and
+                self._nparked < self._cwnd)
+
+    def _runnable(self):
+        """Return the next context to step, or None if there is nothing to do
+        or no room to do it."""
+        for priority,runq in enumerate(self._mqueue):
+            if runq:
+                if not self._has_room(priority):
+                    return None
+                return runq.pop()
+        return None
+
+    def _window_grow(self):
+        self._cwnd = min(self.max_outstanding,self._cwnd + 1/self._cwnd)
+
+    def _window_cut(self,ctx):
+        """Halve the window, but only once for every window of MADs. MADs
+        sent before the last cut do not cut it again."""
+        if ctx._sent >= self._cwnd_cut:
+            self._cwnd = max(self.min_window,self._cwnd/2)
+            self._cwnd_cut = rdma.tools.clock_monotonic()
+
+    _coalesce_methods = frozenset((IBA.MAD_METHOD_GET,
+                                   IBA.MAD_METHOD_GET_TABLE))
+
+    def _submit(self,ctx,work):
+        """Issue *work* for *ctx*. If an identical Get is already in flight
+        then *ctx* waits on that MAD's reply instead."""
+        buf = work.buf
+        if self.coalesce and buf[3] in self._coalesce_methods:
+            path = work.path
+            # Everything but the TID has to match
+            key = (path.end_port,path.mad_target,path.dqpn,
+                   bytes(buf[:8]),bytes(buf[16:]))
+            first = self._coalesced.get(key)
+            if first is not None:
+                first._followers.append((ctx,work))
+                ctx._leader = first
+                return
+            self._coalesced[key] = ctx
+            ctx._coalesce_key = key
+            ctx._followers = []
+        try:
+            self._submit_target(ctx,work)
+        except:
+            self._uncoalesce(ctx)
+            raise
+
+    def _uncoalesce(self,ctx):
+        """Return the list of (ctx,work) waiting on the MAD for *ctx*, new
+        identical Gets will be sent again after this."""
+        if ctx._coalesce_key is None:
+            return ()
+        del self._coalesced[ctx._coalesce_key]
+        followers = ctx._followers
+        ctx._coalesce_key = None
+        ctx._followers = None
+        for fctx,fwork in followers:
+            fctx._leader = None
+        return followers
+
+    def _promote(self,ctx):
+        """*ctx* is cancelled, make the first context coalesced onto its MAD
+        the owner of the MAD. Returns that (ctx,work) or None."""
+        key = ctx._coalesce_key
+        followers = self._uncoalesce(ctx)
+        if not followers:
+            return None
+        nctx,nwork = followers[0]
+        nctx._coalesce_key = key
+        nctx._followers = followers[1:]
+        for fctx,fwork in nctx._followers:
+            fctx._leader = nctx
+        self._coalesced[key] = nctx
+        return (nctx,nwork)
+
+    def _submit_target(self,ctx,work):
+        """Send *work* for *ctx*, or park it if its target already has
+        :attr:`max_per_target` MADs outstanding."""
+        target = work.path.mad_target
+        count = self._targets.get(target,0)
+        if count >= self.max_per_target:
+            parked = self._parked.get(target)
+            if parked is None:
+                parked = self._parked[target] = collections.deque()
+            # Higher priority work goes ahead of lower priority work
+            idx = len(parked)
+            while idx and parked[idx-1][0]._priority > ctx._priority:
+                idx = idx - 1
+            # buf was formed for the path as it is now, discovery rewrites
+            # DR paths into LID paths in place while we wait.
+            parked.insert(idx,(ctx,work._replace(path=work.path.copy())))
+            ctx._parked = target
+            self._nparked = self._nparked + 1
+            return
+        self._sendMAD(ctx,work)
+        ctx._target = target
+        self._targets[target] = count + 1
+
+    def _release(self,ctx):
+        """*ctx* no longer has a MAD outstanding, let the next MAD parked
+        on the same target go."""
+        target = ctx._target
+        ctx._target = None
+        count = self._targets[target] - 1
+        if count:
+            self._targets[target] = count
+        else:
+            del self._targets[target]
+        parked = self._parked.get(target)
+        if parked:
+            self._ready.append(parked.popleft())
+            if not parked:
+                del self._parked[target]
+
+    def _send_ready(self):
+        """Issue parked MADs whose target has room again."""
+        while self._ready and len(self._keys) < self._cwnd:
+            ctx,work = self._ready.popleft()
+            ctx._parked = None
+            self._nparked = self._nparked - 1
+            try:
+                self._submit_target(ctx,work)
+            except:
+                ctx._exc = sys.exc_info()
+                for fctx,fwork in self._uncoalesce(ctx):
+                    fctx._exc = ctx._exc
+                    self._mqueue[fctx._priority].append(fctx)
+                self._step(ctx)
 
     def _sendMAD(self,ctx,work):
         buf = work.buf
         path = work.path
-        rep = self._umad._execute(buf,path,sendOnly=True)
+        rep = self._get_umad(path)._execute(buf,path,sendOnly=True)
         if rep:
             self._replyqueue.append(rep)
 
-        itm = (path.mad_timeout + rdma.tools.clock_monotonic(),ctx)
         ctx._work = work
         ctx._retries = path.retries
-        bisect.insort(self._timeouts,itm)
+        ctx._sent = now = rdma.tools.clock_monotonic()
+        ctx._timer = self._timers.add(self._mad_timeout(buf,path) + now,ctx)
 
         ctx._rmatch = rmatch = self._get_reply_match_key(buf)
         assert(rmatch not in self._keys)
-        self._keys[rmatch] = itm
+        self._keys[rmatch] = ctx
 
     def _finish_ctx(self,ctx):
         """Called when ctx is done and won't be called any more. This triggers
@@ -83,18 +353,138 @@ class MADSchedule(rdma.madtransactor.MADTransactor):
                 if not I._done:
                     return
 
+        if ctx._deadline is not None:
+            self._deadlines.cancel(ctx._deadline)
+            ctx._deadline = None
         waits = self._ctx_waiters.get(ctx)
         if waits is None:
             return
         del self._ctx_waiters[ctx]
         for I in waits:
-            self._mqueue.appendleft(I)
+            I._waiting = None
+            self._mqueue[I._priority].appendleft(I)
+
+    def _cancel(self,ctx):
+        if not ctx._cancelled:
+            ctx._cancelled = True
+            self._cancelq.append(ctx)
+
+    def _cancel_all(self):
+        """Cancel every context that has not finished."""
+        live = set(self._keys.values())
+        for I in self._mqueue:
+            live.update(I)
+        for I in self._parked.values():
+            live.update(ctx for ctx,work in I)
+        live.update(ctx for ctx,work in self._ready)
+        for I in list(live):
+            if I._followers:
+                live.update(ctx for ctx,work in I._followers)
+        for I in self._ctx_waiters.values():
+            live.update(I)
+        for I in live:
+            self._cancel(I)
+
+    def _do_cancel(self,ctx):
+        """Detach the cancelled *ctx* from whatever it is waiting for and
+        throw :exc:`rdma.CancelledError` into it."""
+        if ctx._gengen:
+            if not ctx._done:
+                self._unwait(ctx)
+                close = getattr(ctx._op,"close",None)
+                if close is not None:
+                    close()
+                self._finish_ctx(ctx)
+            for I in list(ctx._children):
+                self._cancel(I)
+            return
+        if ctx._done:
+            return
+        self._unwait(ctx)
+        ctx._exc = (rdma.CancelledError,
+                    rdma.CancelledError("Coroutine %r cancelled"%(ctx._op)),
+                    None)
+        self._step(ctx)
+
+    def _unwait(self,ctx):
+        """Remove *ctx* from everything it is queued on."""
+        runq = self._mqueue[ctx._priority]
+        if ctx in runq:
+            runq.remove(ctx)
+        if ctx._waiting is not None:
+            waits = self._ctx_waiters[ctx._waiting]
+            waits.remove(ctx)
+            if not waits:
+                del self._ctx_waiters[ctx._waiting]
+            ctx._waiting = None
+        if ctx._leader is not None:
+            leader = ctx._leader
+            leader._followers[:] = [I for I in leader._followers
+                                    if I[0] is not ctx]
+            ctx._leader = None
+        if ctx._parked is not None:
+            self._unpark(ctx)
+        elif ctx._rmatch is not None and self._keys.get(ctx._rmatch) is ctx:
+            self._abandon(ctx)
+
+    def _unpark(self,ctx):
+        """Remove the parked MAD of *ctx*, or hand it to a context
+        coalesced onto it."""
+        target = ctx._parked
+        ctx._parked = None
+        for parked in (self._parked.get(target),self._ready):
+            if not parked:
+                continue
+            for idx,(I,work) in enumerate(parked):
+                if I is ctx:
+                    break
+            else:
+                continue
+            promoted = self._promote(ctx)
+            if promoted is None:
+                del parked[idx]
+                self._nparked = self._nparked - 1
+                if not parked and parked is not self._ready:
+                    del self._parked[target]
+            else:
+                nctx,nwork = promoted
+                parked[idx] = (nctx,nwork._replace(path=work.path))
+                nctx._parked = target
+            return
+
+    def _abandon(self,ctx):
+        """Forget the outstanding MAD of *ctx*. If other contexts are
+        coalesced onto it the MAD is handed to them instead."""
+        del self._keys[ctx._rmatch]
+        deadline = ctx._timer[0]
+        self._timers.cancel(ctx._timer)
+        ctx._timer = None
+        promoted = self._promote(ctx)
+        if promoted is None:
+            if self.stats is not None:
+                self.stats.discard(ctx._rmatch)
+            self._release(ctx)
+            return
+        nctx,nwork = promoted
+        work = ctx._work
+        nctx._work = nwork._replace(buf=work.buf,path=work.path)
+        nctx._retries = ctx._retries
+        nctx._resends = ctx._resends
+        nctx._resend_due = ctx._resend_due
+        nctx._sent = ctx._sent
+        nctx._rmatch = ctx._rmatch
+        nctx._target = ctx._target
+        ctx._target = None
+        nctx._timer = self._timers.add(deadline,nctx)
+        self._keys[nctx._rmatch] = nctx
 
     def _step(self,ctx):
         """Advance a context to its next yield statement. If result is None
         then this ctx is brand new. If ctx is not exhausted then it is put
         onto _mqueue for later"""
-        while len(self._keys) < self.max_outstanding:
+        if ctx._bulk:
+            return self._step_bulk(ctx)
+        while self._has_room(ctx._priority):
             result = ctx._result
             ctx._result = None
             try:
@@ -125,12 +515,16 @@ class MADSchedule(rdma.madtransactor.MADTransactor):
                     continue
                 else:
                     self._finish_ctx(ctx)
+                    if (ctx._cancelled and
+                        isinstance(sys.exc_info()[1],rdma.CancelledError)):
+                        return
                     raise
 
             if isinstance(work,Context):
                 if work._done:
                     continue
                 self._ctx_waiters[work].append(ctx)
+                ctx._waiting = work
                 return
 
             if work is None:
@@ -141,7 +535,7 @@ class MADSchedule(rdma.madtransactor.MADTransactor):
             if inspect.isgenerator(work):
                 if ctx._gengen:
                     # Create a new context
-                    self._mqueue.append(ctx)
+                    self._mqueue[ctx._priority].append(ctx)
                     nctx = Context(work,False,ctx)
                     ctx._result = nctx
                     ctx = nctx
@@ -151,132 +545,357 @@ class MADSchedule(rdma.madtransactor.MADTransactor):
                 continue
 
             try:
-                self._sendMAD(ctx,work)
+                self._submit(ctx,work)
             except:
                 ctx._exc = sys.exc_info()
                 continue
             return
 
-        self._mqueue.append(ctx)
+        self._mqueue[ctx._priority].append(ctx)
 
-    def mqueue(self,works):
+    def _step_bulk(self,ctx):
+        """:meth:`_step` for :meth:`get_many`. A finished MAD is passed to the
+        callback, the job issues MADs until the window is full."""
+        if not ctx._gengen:
+            job = ctx._parent
+            path,attributeModifier = ctx._req
+            exc = ctx._exc
+            result = ctx._result
+            ctx._exc = None
+            ctx._result = None
+            self._finish_ctx(ctx)
+            if exc is None:
+                job._on_reply(path,attributeModifier,result)
+            elif ctx._cancelled and isinstance(exc[1],rdma.CancelledError):
+                pass
+            elif job._on_error is not None:
+                job._on_error(path,attributeModifier,exc[1])
+            else:
+                raise exc[1].with_traceback(exc[2])
+            return
+
+        while self._has_room(ctx._priority):
+            try:
+                req = next(ctx._op)
+            except StopIteration:
+                self._finish_ctx(ctx)
+                return
+            mad = _BulkMAD(ctx,req)
+            try:
+                self._submit(mad,ctx._rpc(ctx._payload,req[0],req[1]))
+            except:
+                mad._exc = sys.exc_info()
+                self._step_bulk(mad)
+        self._mqueue[ctx._priority].append(ctx)
+
+    #: The RPC :meth:`get_many` uses for payloads with each method attribute
+    _bulk_rpcs = (("MAD_SUBNGET","SubnGet"),
+                  ("MAD_PERFORMANCEGET","PerformanceGet"),
+                  ("MAD_SUBNADMGET","SubnAdmGet"))
+
+    def get_many(self,payload,requests,on_reply,on_error=None,rpc=None,
+                 priority=PRIORITY_NORMAL,timeout=None):
+        """Issue a Get of *payload* for every (path,attributeModifier) tuple
+        in the iterable *requests*, without running a coroutine for each
+        one. This is much cheaper than queuing a coroutine per MAD for large
+        sweeps. *requests* is consumed as room in the window allows so it
+        can be a generator.
+
+        When a reply arrives ``on_reply(path,attributeModifier,reply)`` is
+        called. If a MAD fails ``on_error(path,attributeModifier,exc)`` is
+        called, or the exception propagates out of :meth:`run` like an
+        exception from a coroutine if *on_error* is :data:`None`.
+
+        The RPC is chosen from the method attributes of *payload*, the first
+        of :meth:`SubnGet`, :meth:`PerformanceGet` and :meth:`SubnAdmGet`
+        that it supports. *rpc* can be set to another RPC method of this
+        instance with the same signature. *priority* and *timeout* are as
+        for :meth:`mqueue`, requests that are cancelled are not reported.
+
+        :returns: An opaque context reference, yielding it waits for all the
+            MADs to complete."""
+        if rpc is None:
+            for attr,name in self._bulk_rpcs:
+                if hasattr(payload,attr):
+                    rpc = getattr(self,name)
+                    break
+            else:
+                raise rdma.RDMAError("No Get RPC for %r"%(payload))
+        ctx = _BulkJob(self,rpc,payload,requests,on_reply,on_error,priority)
+        self._arm(ctx,timeout)
+        self._step(ctx)
+        return ctx
+
+    def _arm(self,ctx,timeout):
+        if timeout is not None:
+            ctx._deadline = self._deadlines.add(
+                rdma.tools.clock_monotonic() + timeout,ctx)
+
+    def mqueue(self,works,priority=PRIORITY_NORMAL,timeout=None):
         """*works* is a generator returning coroutines. All coroutines
-        can run in parallel.
+        can run in parallel. *priority* is one of :data:`PRIORITY_HIGH`,
+        :data:`PRIORITY_NORMAL` or :data:`PRIORITY_LOW` and applies to all
+        the coroutines, contexts of higher priority are always stepped
+        first. If the work has not finished *timeout* seconds from now then
+        it is cancelled, see :meth:`Context.cancel`.
 
         :returns: An opaque context reference."""
         assert(inspect.isgenerator(works))
-        ctx = Context(works,True)
+        ctx = Context(works,True,priority=priority,sched=self)
+        self._arm(ctx,timeout)
         self._step(ctx)
         return ctx
 
-    def queue(self,work):
+    def queue(self,work,priority=PRIORITY_NORMAL,timeout=None):
         """*work* is a single coroutine, or *work* is a tuple of coroutines.
+        *priority* and *timeout* are as for :meth:`mqueue`.
 
         :returns: An opaque context reference."""
         if isinstance(work,tuple):
             for I in work:
-                self.queue(I)
+                self.queue(I,priority,timeout)
             return
         assert(inspect.isgenerator(work))
-        ctx = Context(work,False)
+        ctx = Context(work,False,priority=priority,sched=self)
+        self._arm(ctx,timeout)
         self._step(ctx)
         return ctx
 
-    def run(self,queue=None,mqueue=None):
+    def run(self,queue=None,mqueue=None,timeout=None):
         """Schedule MADs. Exits once all the work has been completed.
         *queue* and *mqueue* arguments as passed straight to the
-        :meth:`queue` and :meth:`mqueue` methods."""
+        :meth:`queue` and :meth:`mqueue` methods. If *timeout* is given
+        then all work still running after that many seconds is cancelled,
+        including work queued by the coroutines themselves.
+
+        :raises rdma.CancelledError: If *timeout* passed."""
         self._ctx_waiters.clear()
         self._keys.clear()
+        self._coalesced.clear()
+        self._timers.clear()
+        self._deadlines.clear()
+        self._cancelq.clear()
         self._replyqueue.clear()
-        self._mqueue.clear()
+        for I in self._mqueue:
+            I.clear()
+        self._reset_window()
         if queue:
             self.queue(queue)
         if mqueue:
             self.mqueue(mqueue)
+        # The scheduler itself marks the deadline for all the work
+        expired = False
+        if timeout is not None:
+            self._deadlines.add(rdma.tools.clock_monotonic() + timeout,self)
+
+        while self._keys or any(self._mqueue) or self._ready or self._cancelq:
+            while self._cancelq:
+                self._do_cancel(self._cancelq.popleft())
+            self._send_ready()
+            while True:
+                ctx = self._runnable()
+                if ctx is None:
+                    break
+                self._step(ctx)
 
-        while self._keys or self._mqueue:
-            while len(self._keys) < self.max_outstanding and self._mqueue:
-                self._step(self._mqueue.pop())
-
-            # Wait for a MAD
+            # Wait for MADs
             if self._replyqueue:
-                ret = self._replyqueue.pop()
+                rets = self._replyqueue
+                self._replyqueue = collections.deque()
             else:
-                if not (self._keys or self._mqueue):
+                if self._cancelq:
+                    continue
+                if not (self._keys or any(self._mqueue)):
                     break
-                ret = self._umad.recvfrom(self._timeouts[0][0])
-                if ret is None:
-                    # Purge timed out values
+                wakeat = self._timers.next_deadline()
+                deadline = self._deadlines.next_deadline()
+                if deadline is not None and (wakeat is None or
+                                             deadline < wakeat):
+                    wakeat = deadline
+                rets = self._recv(wakeat)
+                if not rets:
+                    # Purge timed out values. During timeout processing we
+                    # might cause new MAD sends, those are armed after the
+                    # batch has been taken so they cannot expire here.
                     now = rdma.tools.clock_monotonic()
-
-                    # During timeout processing we might cause new MAD
-                    # sends so we have to iterate here carefully.
-                    while self._timeouts:
-                        k = self._timeouts[0]
-                        if k[0] > now:
-                            break
-                        del self._timeouts[0]
-                        self._do_timeout(k)
+                    for ctx in self._timers.expire(now):
+                        self._do_timeout(ctx)
+                    expired = self._expire_deadlines(now) or expired
                     continue
 
-            # Dispatch the MAD
-            rmatch = self._get_match_key(ret[0])
-            res = self._keys.get(rmatch)
-            if res:
-                del self._keys[rmatch]
-                self._timeouts.remove(res)
-                try:
-                    work = res[1]._work
-                    res[1]._result = self._completeMAD(ret,work.fmt,
-                                                       work.path,
-                                                       work.newer,
-                                                       work.completer)
-                except:
-                    res[1]._exc = sys.exc_info()
-                self._step(res[1])
+            for ret in rets:
+                self._dispatch(ret)
+            if len(self._deadlines):
+                expired = (self._expire_deadlines(rdma.tools.clock_monotonic())
+                           or expired)
+
+        self._deadlines.clear()
+        if expired:
+            raise rdma.CancelledError("MAD schedule did not finish in %s seconds"%(
+                timeout))
+
+    def _expire_deadlines(self,now):
+        """Cancel the contexts whose deadline is before *now*. Returns True
+        if the deadline for :meth:`run` passed."""
+        res = False
+        for ctx in self._deadlines.expire(now):
+            if ctx is self:
+                res = True
+                self._cancel_all()
             else:
-                if self.trace_func is not None:
-                    self.trace_func(self,rdma.madtransactor.TRACE_UNEXPECTED,
-                                    ret=ret)
-
-    def _do_timeout(self,res):
-        """The timeout list entry *res* has timed out - either error it
-        or issue a retry"""
-        ctx = res[1]
-        work = ctx._work
-        del self._keys[ctx._rmatch]
-        if ctx._retries == 0:
-            # Pass the timeout back into MADTransactor and capture the
-            # result
-            try:
-                self._completeMAD(None,work.fmt,work.path,
-                                  work.newer,work.completer)
-            except:
-                ctx._exc = sys.exc_info()
-                self._step(ctx)
+                self._cancel(ctx)
+        return res
+
+    def _get_umad(self,path):
+        """Return the MAD interface that sends to *path*."""
+        if self._poll is None:
+            return self._umad
+        try:
+            return self._umads[path.end_port]
+        except KeyError:
+            raise rdma.RDMAError("No MAD interface for end port %s of path %s"%(
+                path.end_port,path))
+
+    def _recv(self,wakeat):
+        """Return a list of all the MADs that are ready, or an empty list if
+        *wakeat* passes first."""
+        if self._poll is not None:
+            return self._recv_poll(wakeat)
+        recvfrom_many = getattr(self._umad,"recvfrom_many",None)
+        if recvfrom_many is not None:
+            return recvfrom_many(wakeat)
+        ret = self._umad.recvfrom(wakeat)
+        if ret is None:
+            return ()
+        return (ret,)
+
+    def _recv_poll(self,wakeat):
+        """:meth:`_recv` for more than one MAD interface."""
+        while True:
+            if wakeat is None:
+                events = self._poll.poll(-1)
             else:
-                assert(False)
+                # Always poll, even once wakeat has passed replies that
+                # are already waiting must not be timed out.
+                timeout = max(0,wakeat - rdma.tools.clock_monotonic())
+                events = self._poll.poll(timeout*1000)
+            if not events:
+                return ()
+            res = []
+            for fd,event in events:
+                umad,cc = self._fds[fd]
+                if cc is not None:
+                    # VMAD, acknowledge the completion event
+                    cc.check_poll((fd,event))
+                recvfrom_many = getattr(umad,"recvfrom_many",None)
+                if recvfrom_many is not None:
+                    res.extend(recvfrom_many(0))
+                else:
+                    ret = umad.recvfrom(0)
+                    if ret is not None:
+                        res.append(ret)
+            if res:
+                return res
+
+    def _dispatch(self,ret):
+        """Complete the context waiting on the reply MAD *ret*."""
+        rmatch = self._get_match_key(ret[0])
+        ctx = self._keys.pop(rmatch,None)
+        if ctx is None:
+            if self.trace_func is not None:
+                self.trace_func(self,rdma.madtransactor.TRACE_UNEXPECTED,
+                                ret=ret)
+            if self.stats is not None:
+                self.stats.unexpected_reply(*ret)
+            return
+
+        self._timers.cancel(ctx._timer)
+        ctx._timer = None
+        resend = self._check_resend(ret[0],ctx._work.fmt,ctx._work.path,
+                                    ctx._resends)
+        if resend is not None:
+            delay,path = resend
+            if delay:
+                self._window_cut(ctx)
+            ctx._resends = ctx._resends + 1
+            ctx._resend_due = True
+            ctx._work = ctx._work._replace(path=path)
+            ctx._timer = self._timers.add(
+                rdma.tools.clock_monotonic() + delay,ctx)
+            self._keys[rmatch] = ctx
             return
-        ctx._retries = ctx._retries - 1
+
+        self._release(ctx)
+        if ctx._retries == ctx._work.path.retries:
+            self._window_grow()
+            if self.rtt is not None:
+                self.rtt.sample(ctx._work.path,ctx._work.buf[1],
+                                rdma.tools.clock_monotonic() - ctx._sent)
+        followers = self._uncoalesce(ctx)
+        self._complete_ctx(ctx,ctx._work,ret)
+        for fctx,fwork in followers:
+            self._complete_ctx(fctx,fwork,ret)
+
+    def _complete_ctx(self,ctx,work,ret):
+        """Decode the reply *ret* to *work* and resume *ctx* with it."""
+        try:
+            ctx._result = self._completeMAD(ret,work.fmt,
+                                            work.path,
+                                            work.newer,
+                                            work.completer)
+        except:
+            ctx._exc = sys.exc_info()
+        self._step(ctx)
+
+    def _do_timeout(self,ctx):
+        """The MAD outstanding on *ctx* has timed out - either error it
+        or issue a retry. This is also the end of the wait before resending
+        a MAD that got a BUSY or redirect reply."""
+        ctx._timer = None
+        work = ctx._work
+        del self._keys[ctx._rmatch]
+        if ctx._resend_due:
+            ctx._resend_due = False
+        else:
+            self._window_cut(ctx)
+            if ctx._retries == 0:
+                self._release(ctx)
+                # Pass the timeout back into MADTransactor, every coalesced
+                # requester gets its own error.
+                followers = self._uncoalesce(ctx)
+                self._complete_ctx(ctx,work,None)
+                for fctx,fwork in followers:
+                    self._complete_ctx(fctx,fwork,None)
+                return
+            ctx._retries = ctx._retries - 1
 
         # Resend
         if self.trace_func is not None:
             self.trace_func(self,rdma.madtransactor.TRACE_RECEIVE,
                             fmt=work.fmt,path=work.path)
-        rep = self._umad._execute(work.buf,work.path,sendOnly=True)
+        rep = self._get_umad(work.path)._execute(work.buf,work.path,
+                                                 sendOnly=True)
         if rep:
             self._replyqueue.append(rep)
-        res = (work.path.mad_timeout + rdma.tools.clock_monotonic(),ctx)
-        bisect.insort(self._timeouts,res)
-        self._keys[ctx._rmatch] = res
+        ctx._sent = now = rdma.tools.clock_monotonic()
+        ctx._timer = self._timers.add(
+            self._mad_timeout(work.buf,work.path,
+                              work.path.retries - ctx._retries) + now,
+            ctx)
+        self._keys[ctx._rmatch] = ctx
 
     # Implement the MADTransactor interface. This is the asynchronous use model,
     # where the RPC functions return the work to do, not the result.
     def _doMAD(self,fmt,payload,path,attributeModifier,method,completer=None):
+        path = self._redirected(fmt,path)
         buf = self._prepareMAD(fmt,payload,attributeModifier,method,path)
         newer = payload if isinstance(payload,type) else payload.__class__
         return self.Work(buf,fmt,path,newer,completer)
 
+    def _return_value(self,value):
+        # Yielding None returns result
+        self.result = value
+        return None
+
     def _get_new_TID(self):
         return self._umad._get_new_TID()
@@ -0,0 +1,750 @@
+# Copyright 2011 Obsidian Research Corp. GPLv2, see COPYING.
+"""An in-process simulated IB fabric.
+
+:class:`SimFabric` holds a topology of switches and CAs and :class:`SimUMAD`
+answers MADs sent into it the way the management agents of a real fabric
+would. Together they let discovery and the diagnostic tools run at scale
+without any hardware::
+
+    fabric = rdma.sim.fat_tree(8)
+    umad = rdma.sim.SimUMAD(fabric)
+    sched = rdma.sched.MADSchedule(umad)
+    sbn = rdma.subnet.Subnet()
+    sched.run(queue=rdma.discovery.topo_SMP(sched,sbn))
+
+Supported are the SMA attributes NodeInfo, NodeDescription, PortInfo,
+SwitchInfo and the linear and multicast forwarding tables over LID and
+directed routes, SA Get and GetTable for node, port info, link, switch info
+and linear forwarding table records and the PMA ClassPortInfo and port
+counters. Sets are answered with the current value and do not change the
+fabric, except for clearing port counters."""
+import operator
+import random
+import rdma,rdma.fakeumad,rdma.path,rdma.tools
+import rdma.IBA as IBA
+
+#: The first GUID handed out by :class:`SimFabric`.
+GUID_BASE = 0x0002c90300000000
+GID_PREFIX = 0xfe80000000000000
+
+class _Status(Exception):
+    """Raised by the agents to reply with a MAD status."""
+    def __init__(self,status):
+        Exception.__init__(self,status)
+        self.status = status
+
+class SimPort(object):
+    """One port of a :class:`SimNode`."""
+    #: The :class:`SimPort` this is cabled to.
+    peer = None
+    #: Base LID of a CA port, or of switch port 0.
+    LID = 0
+    LMC = 0
+
+    def __init__(self,node,port_id,portGUID):
+        self.node = node
+        self.port_id = port_id
+        self.portGUID = portGUID
+        #: :class:`dict` of :class:`rdma.IBA.PMPortCounters` field names to
+        #: values.
+        self.counters = {}
+
+    def __repr__(self):
+        return "<SimPort %s/%u>"%(self.node.desc,self.port_id)
+
+class SimNode(object):
+    """A switch or CA. Port 0 of a CA is not used."""
+    def __init__(self,nodeType,numPorts,nodeGUID,desc):
+        self.nodeType = nodeType
+        self.nodeGUID = nodeGUID
+        self.desc = desc
+        if nodeType == IBA.NODE_SWITCH:
+            self.ports = [SimPort(self,I,nodeGUID) for I in range(numPorts+1)]
+        else:
+            self.ports = [SimPort(self,I,nodeGUID + I)
+                          for I in range(numPorts+1)]
+        self._lft = None
+
+    @property
+    def numPorts(self):
+        return len(self.ports) - 1
+
+    @property
+    def is_switch(self):
+        return self.nodeType == IBA.NODE_SWITCH
+
+    def iterlinks(self):
+        """Iterate over the ports that are cabled."""
+        return (I for I in self.ports if I.peer is not None)
+
+class SimEndPort(object):
+    """Just enough of :class:`rdma.devices.EndPort` to use a CA port in a
+    :class:`SimFabric` as the local end port."""
+    #: Used for the MAD timeouts of paths from this end port.
+    subnet_timeout = 8
+    sm_sl = 0
+
+    def __init__(self,fabric,port):
+        self.fabric = fabric
+        self._port = port
+        self.parent = port.node
+        self.port_id = port.port_id
+        self.pkeys = (IBA.PKEY_DEFAULT,)
+        self.gids = [IBA.GID(prefix=GID_PREFIX,guid=self.port_guid)]
+
+    @property
+    def lid(self):
+        return self._port.LID
+    @property
+    def lmc(self):
+        return self._port.LMC
+    @property
+    def sm_lid(self):
+        return self.fabric.sm_lid
+    @property
+    def port_guid(self):
+        return IBA.GUID(self._port.portGUID)
+    @property
+    def default_gid(self):
+        return self.gids[0]
+
+    def pkey_index(self,pkey):
+        return self.pkeys.index(pkey)
+
+    @property
+    def sa_path(self):
+        try:
+            return self._cached_sa_path
+        except AttributeError:
+            pass
+        self._cached_sa_path = rdma.path.IBPath(self,DLID=self.sm_lid,
+                                                SLID=self.lid,
+                                                SL=self.sm_sl,dqpn=1,sqpn=1,
+                                                qkey=IBA.IB_DEFAULT_QP1_QKEY,
+                                                pkey=IBA.PKEY_DEFAULT,
+                                                packet_life_time=self.subnet_timeout)
+        return self._cached_sa_path
+
+    def __str__(self):
+        return "sim/%u"%(self.port_id)
+
+class SimFabric(object):
+    """A set of :class:`SimNode` joined by links. Unicast forwarding tables
+    are computed on demand with shortest path routing, spreading LIDs across
+    equal cost ports."""
+    #: The LID of the SA.
+    sm_lid = 0
+
+    def __init__(self):
+        self.nodes = []
+        #: :class:`list` of LID to :class:`SimPort`
+        self.lids = [None]
+
+    def add_node(self,nodeType,numPorts,desc=None):
+        """Create a new :class:`SimNode`."""
+        nodeGUID = GUID_BASE + (len(self.nodes) << 8)
+        if desc is None:
+            desc = "sim %s %u"%("switch" if nodeType == IBA.NODE_SWITCH else "host",
+                                len(self.nodes))
+        node = SimNode(nodeType,numPorts,nodeGUID,desc)
+        self.nodes.append(node)
+        return node
+
+    def add_switch(self,numPorts,desc=None):
+        return self.add_node(IBA.NODE_SWITCH,numPorts,desc)
+    def add_ca(self,numPorts=1,desc=None):
+        return self.add_node(IBA.NODE_CA,numPorts,desc)
+
+    def link(self,a,b):
+        """Cable :class:`SimPort` *a* to *b*."""
+        if a.peer is not None or b.peer is not None:
+            raise rdma.RDMAError("Port %r or %r is already linked"%(a,b))
+        a.peer = b
+        b.peer = a
+        for I in self.nodes:
+            I._lft = None
+
+    def assign_lids(self,lmc=0):
+        """Give every switch and every cabled CA port a LID, in node order.
+        CA ports get 2**\ *lmc* LIDs starting at a multiple of that, the
+        unused LIDs skipped to align them are unassigned. The SA is placed
+        on the first CA."""
+        self.lids = [None]
+        for node in self.nodes:
+            if node.is_switch:
+                ports = node.ports[:1]
+            else:
+                ports = [I for I in node.ports[1:] if I.peer is not None]
+            for port in ports:
+                port.LMC = 0 if node.is_switch else lmc
+                count = 1 << port.LMC
+                pad = -len(self.lids) % count
+                self.lids.extend([None]*pad)
+                port.LID = len(self.lids)
+                self.lids.extend([port]*count)
+                if not self.sm_lid and not node.is_switch:
+                    self.sm_lid = port.LID
+        if len(self.lids) >= IBA.LID_MULTICAST:
+            raise rdma.RDMAError("Too many LIDs for %u nodes"%(len(self.nodes)))
+        for I in self.nodes:
+            I._lft = None
+
+    def lid_to_port(self,lid):
+        """Return the :class:`SimPort` that owns *lid* or :data:`None`."""
+        if 0 < lid < len(self.lids):
+            return self.lids[lid]
+        return None
+
+    def switch_port(self,port):
+        """Return the switch :class:`SimPort` a LID owned by *port* is
+        delivered through, or :data:`None`."""
+        if port.node.is_switch:
+            return port
+        return port.peer
+
+    def lft(self,switch):
+        """Return the linear forwarding table of *switch* as a
+        :class:`bytearray` indexed by LID."""
+        if switch._lft is not None:
+            return switch._lft
+
+        # Breadth first search over the switches collecting every equal
+        # cost first hop port.
+        hops = {switch:()}
+        level = []
+        for I in switch.iterlinks():
+            peer = I.peer.node
+            if not peer.is_switch:
+                continue
+            if peer not in hops:
+                hops[peer] = [I.port_id]
+                level.append(peer)
+            elif hops[peer] and I.port_id not in hops[peer]:
+                hops[peer].append(I.port_id)
+        while level:
+            nlevel = []
+            for node in level:
+                first = hops[node]
+                for I in node.iterlinks():
+                    peer = I.peer.node
+                    if not peer.is_switch:
+                        continue
+                    cur = hops.get(peer)
+                    if cur is None:
+                        hops[peer] = list(first)
+                        nlevel.append(peer)
+                    elif peer in nlevel:
+                        cur.extend(J for J in first if J not in cur)
+            level = nlevel
+
+        lft = bytearray(b"\xff"*len(self.lids))
+        for lid,port in enumerate(self.lids):
+            if port is None:
+                continue
+            sport = self.switch_port(port)
+            if sport is None:
+                continue
+            if sport.node is switch:
+                lft[lid] = sport.port_id
+                continue
+            first = hops.get(sport.node)
+            if first:
+                lft[lid] = first[lid % len(first)]
+        switch._lft = lft
+        return lft
+
+    def end_port(self,node=None,port_id=1):
+        """Return a :class:`SimEndPort` for port *port_id* of the CA *node*,
+        by default the first CA."""
+        if node is None:
+            node = next(I for I in self.nodes if not I.is_switch)
+        return SimEndPort(self,node.ports[port_id])
+
+def fat_tree(k,lmc=0):
+    """Build a three level *k* ary fat tree, *k* must be even. This has
+    k**3/4 hosts with one port each and 5*k**2/4 switches with *k* ports, eg
+    k=36 gives 11664 hosts."""
+    if k % 2 or k < 2:
+        raise ValueError("Fat tree radix %r must be even"%(k))
+    half = k//2
+    fabric = SimFabric()
+    cores = [fabric.add_switch(k,"sim core %u"%(I)) for I in range(half*half)]
+    for pod in range(k):
+        aggs = [fabric.add_switch(k,"sim pod %u agg %u"%(pod,I))
+                for I in range(half)]
+        edges = [fabric.add_switch(k,"sim pod %u edge %u"%(pod,I))
+                 for I in range(half)]
+        for i,agg in enumerate(aggs):
+            for j,edge in enumerate(edges):
+                fabric.link(agg.ports[1 + j],edge.ports[half + 1 + i])
+            for m in range(half):
+                fabric.link(agg.ports[half + 1 + m],
+                            cores[i*half + m].ports[1 + pod])
+        for j,edge in enumerate(edges):
+            for h in range(half):
+                host = fabric.add_ca(1,"sim pod %u edge %u host %u HCA-1"%(
+                    pod,j,h))
+                fabric.link(edge.ports[1 + h],host.ports[1])
+    fabric.assign_lids(lmc)
+    return fabric
+
+def _counter_max(cls):
+    return dict((I[0],(1 << I[1]) - 1) for I in cls.MEMBERS)
+_PC_MAX = _counter_max(IBA.PMPortCounters)
+_PCE_MAX = _counter_max(IBA.PMPortCountersExt)
+
+class SimUMAD(rdma.fakeumad.FakeUMAD):
+    """A stand in for :class:`rdma.umad.UMAD` connected to a
+    :class:`SimFabric`. Replies arrive *latency* seconds after the request
+    is sent and a *loss* fraction of requests are never answered, chosen
+    by a random generator seeded with *seed*. If *rate* is set then each
+    management agent can only process that many MADs per second and
+    requests queue behind each other; more than *queue_depth* queued
+    requests are dropped, or answered with a BUSY status if *busy* is set.
+
+    *pma_redirect* maps LIDs to a QPN, the PMA at those LIDs answers MADs
+    sent to QP1 with a redirect to that QP of the same port."""
+
+    def __init__(self,fabric,end_port=None,latency=0,loss=0,rate=None,
+                 queue_depth=16,seed=0,busy=False,pma_redirect=None):
+        rdma.fakeumad.FakeUMAD.__init__(self,end_port or fabric.end_port())
+        self.fabric = fabric
+        self.latency = latency
+        self.loss = loss
+        self.rate = rate
+        self.queue_depth = queue_depth
+        self.busy = busy
+        self.pma_redirect = pma_redirect or {}
+        #: Number of MADs that were lost or not answered
+        self.dropped = 0
+        #: Number of MADs answered with BUSY
+        self.busy_replies = 0
+        #: Number of MADs answered with a redirect
+        self.redirects = 0
+        self._random = random.Random(seed)
+        self._busy = {}
+        self._ingress = None
+        self._agents = {IBA.MAD_SUBNET: self._sma,
+                        IBA.MAD_SUBNET_DIRECTED: self._sma,
+                        IBA.MAD_SUBNET_ADMIN: self._sa,
+                        IBA.MAD_PERFORMANCE: self._pma}
+        self._smp_attrs = {
+            IBA.SMPNodeInfo.MAD_ATTRIBUTE_ID: self._smp_node_info,
+            IBA.SMPNodeDescription.MAD_ATTRIBUTE_ID: self._smp_node_desc,
+            IBA.SMPPortInfo.MAD_ATTRIBUTE_ID: self._smp_port_info,
+            IBA.SMPSwitchInfo.MAD_ATTRIBUTE_ID: self._smp_switch_info,
+            IBA.SMPLinearForwardingTable.MAD_ATTRIBUTE_ID: self._smp_lft,
+            IBA.SMPMulticastForwardingTable.MAD_ATTRIBUTE_ID: self._smp_mft}
+        self._sa_records = {
+            IBA.SANodeRecord: self._sa_node_records,
+            IBA.SAPortInfoRecord: self._sa_port_info_records,
+            IBA.SALinkRecord: self._sa_link_records,
+            IBA.SASwitchInfoRecord: self._sa_switch_info_records,
+            IBA.SALinearForwardingTableRecord: self._sa_lft_records}
+
+    # Addressing
+    def _ingress_port(self,switch):
+        """The port of *switch* that LID routed packets from the local end
+        port arrive on."""
+        if self._ingress is None:
+            self._ingress = {}
+            start = self.end_port._port.peer
+            if start is not None:
+                self._ingress[start.node] = start.port_id
+                level = [start.node]
+                while level:
+                    nlevel = []
+                    for node in level:
+                        if not node.is_switch:
+                            continue
+                        for I in node.iterlinks():
+                            if I.peer.node not in self._ingress:
+                                self._ingress[I.peer.node] = I.peer.port_id
+                                nlevel.append(I.peer.node)
+                    level = nlevel
+        return self._ingress.get(switch,0)
+
+    def _lid_route(self,lid):
+        """Return the (node,port_id) a LID routed packet is delivered to."""
+        port = self.fabric.lid_to_port(lid)
+        if port is None:
+            return None
+        if port.node.is_switch:
+            return (port.node,0)
+        return (port.node,port.port_id)
+
+    def _dr_route(self,buf,path):
+        """Follow the directed route in the SMP *buf*. Returns the
+        (node,port_id) it ends at or :data:`None` if the route is invalid."""
+        if path.DLID == IBA.LID_PERMISSIVE:
+            node,inport = self.end_port._port.node,self.end_port.port_id
+        else:
+            ret = self._lid_route(path.DLID)
+            if ret is None:
+                return None
+            node,inport = ret
+        for out in buf[129:129 + buf[7]]:
+            if node.is_switch:
+                if out < 1 or out > node.numPorts:
+                    return None
+            elif out != inport:
+                return None
+            peer = node.ports[out].peer
+            if peer is None:
+                return None
+            node,inport = peer.node,peer.port_id
+        drDLID = (buf[34] << 8) | buf[35]
+        if drDLID != IBA.LID_PERMISSIVE:
+            return self._lid_route(drDLID)
+        return (node,inport)
+
+    # SMA
+    def _sma(self,buf,path):
+        if buf[1] == IBA.MAD_SUBNET_DIRECTED:
+            dest = self._dr_route(buf,path)
+        else:
+            dest = self._lid_route(path.DLID)
+        if dest is None:
+            return None
+        node,inport = dest
+        if inport == 0 and node.is_switch and buf[1] == IBA.MAD_SUBNET:
+            inport = self._ingress_port(node)
+
+        rbuf = bytearray(buf)
+        if buf[1] == IBA.MAD_SUBNET_DIRECTED:
+            rbuf[4] = rbuf[4] | 0x80
+        try:
+            if buf[3] != IBA.MAD_METHOD_GET and buf[3] != IBA.MAD_METHOD_SET:
+                raise _Status(IBA.MAD_STATUS_UNSUP_METHOD)
+            attr = self._smp_attrs.get((buf[16] << 8) | buf[17])
+            if attr is None:
+                raise _Status(IBA.MAD_STATUS_UNSUP_METHOD_ATTR_COMBO)
+            self._set_payload(rbuf,64,
+                              attr(node,inport,int.from_bytes(buf[20:24],"big")))
+        except _Status as e:
+            self._set_status(rbuf,e.status)
+        rbuf[3] = IBA.MAD_METHOD_GET_RESP
+        return (node,rbuf)
+
+    def _smp_node_info(self,node,inport,mod):
+        ninf = IBA.SMPNodeInfo()
+        ninf.baseVersion = IBA.MAD_BASE_VERSION
+        ninf.classVersion = 1
+        ninf.nodeType = node.nodeType
+        ninf.numPorts = node.numPorts
+        ninf.systemImageGUID = IBA.GUID(node.nodeGUID)
+        ninf.nodeGUID = IBA.GUID(node.nodeGUID)
+        if node.is_switch:
+            ninf.portGUID = IBA.GUID(node.nodeGUID)
+        else:
+            ninf.portGUID = IBA.GUID(node.ports[inport].portGUID)
+        ninf.partitionCap = 8
+        ninf.deviceID = 0xbd36 if node.is_switch else 0x673c
+        ninf.localPortNum = inport
+        ninf.vendorID = 0x2c9
+        return ninf
+
+    def _smp_node_desc(self,node,inport,mod):
+        return node.desc.encode()[:64].ljust(64,b"\0")
+
+    def _port_info(self,node,idx,localPortNum):
+        if idx > node.numPorts or (idx == 0 and not node.is_switch):
+            raise _Status(IBA.MAD_STATUS_INVALID_ATTR_OR_MODIFIER)
+        port = node.ports[idx]
+        lport = node.ports[0] if node.is_switch else port
+        pinf = IBA.SMPPortInfo()
+        pinf.GIDPrefix = GID_PREFIX
+        pinf.LID = lport.LID
+        pinf.LMC = lport.LMC
+        pinf.masterSMLID = self.fabric.sm_lid
+        pinf.localPortNum = localPortNum
+        pinf.linkWidthEnabled = IBA.LINK_WIDTH_4x
+        pinf.linkWidthSupported = IBA.LINK_WIDTH_4x
+        pinf.linkSpeedSupported = IBA.LINK_SPEED_10Gb0
+        pinf.linkSpeedEnabled = IBA.LINK_SPEED_10Gb0
+        pinf.MTUCap = IBA.MTU_4096
+        pinf.VLCap = 4
+        pinf.subnetTimeOut = 18
+        if node.is_switch and lport.LID == self.fabric.sm_lid:
+            pinf.capabilityMask = IBA.isSM
+        if not node.is_switch and port.LID == self.fabric.sm_lid:
+            pinf.capabilityMask = IBA.isSM
+        if idx == 0 or port.peer is not None:
+            pinf.portState = IBA.PORT_STATE_ACTIVE
+            pinf.portPhysicalState = IBA.PHYS_PORT_STATE_LINK_UP
+            pinf.linkWidthActive = IBA.LINK_WIDTH_4x
+            pinf.linkSpeedActive = IBA.LINK_SPEED_10Gb0
+            pinf.neighborMTU = IBA.MTU_4096
+            pinf.operationalVLs = 4
+        else:
+            pinf.portState = IBA.PORT_STATE_DOWN
+            pinf.portPhysicalState = IBA.PHYS_PORT_STATE_POLLING
+        return pinf
+
+    def _smp_port_info(self,node,inport,mod):
+        if mod == 0 and not node.is_switch:
+            mod = inport
+        return self._port_info(node,mod,inport)
+
+    def _switch_info(self,node):
+        swinf = IBA.SMPSwitchInfo()
+        swinf.linearFDBCap = IBA.LID_MULTICAST
+        swinf.linearFDBTop = len(self.fabric.lids) - 1
+        swinf.multicastFDBCap = 1024
+        swinf.lifeTimeValue = 18
+        swinf.partitionEnforcementCap = 32
+        return swinf
+
+    def _smp_switch_info(self,node,inport,mod):
+        if not node.is_switch:
+            raise _Status(IBA.MAD_STATUS_UNSUP_METHOD_ATTR_COMBO)
+        return self._switch_info(node)
+
+    def _lft_block(self,node,block):
+        lft = self.fabric.lft(node)
+        if block*64 >= IBA.LID_MULTICAST:
+            raise _Status(IBA.MAD_STATUS_INVALID_ATTR_OR_MODIFIER)
+        return bytes(lft[block*64:block*64 + 64]).ljust(64,b"\xff")
+
+    def _smp_lft(self,node,inport,mod):
+        if not node.is_switch:
+            raise _Status(IBA.MAD_STATUS_UNSUP_METHOD_ATTR_COMBO)
+        return self._lft_block(node,mod)
+
+    def _smp_mft(self,node,inport,mod):
+        if not node.is_switch:
+            raise _Status(IBA.MAD_STATUS_UNSUP_METHOD_ATTR_COMBO)
+        return bytes(64)
+
+    # PMA
+    def _pma(self,buf,path):
+        dest = self._lid_route(path.DLID)
+        if dest is None:
+            return None
+        node = dest[0]
+        rbuf = bytearray(buf)
+        qpn = self.pma_redirect.get(path.DLID)
+        if qpn is not None and path.dqpn != qpn:
+            if path.dqpn != 1:
+                return None
+            cpinf = IBA.MADClassPortInfo()
+            cpinf.baseVersion = IBA.MAD_BASE_VERSION
+            cpinf.classVersion = 1
+            cpinf.redirectQP = qpn
+            cpinf.redirectQKey = path.qkey
+            cpinf.redirectPKey = path.pkey
+            self._set_payload(rbuf,64,cpinf)
+            self._set_status(rbuf,IBA.MAD_STATUS_REDIRECT)
+            rbuf[3] = IBA.MAD_METHOD_GET_RESP
+            self.redirects = self.redirects + 1
+            return (node,rbuf)
+        try:
+            attr = (buf[16] << 8) | buf[17]
+            if buf[3] != IBA.MAD_METHOD_GET and buf[3] != IBA.MAD_METHOD_SET:
+                raise _Status(IBA.MAD_STATUS_UNSUP_METHOD)
+            if attr == IBA.MADClassPortInfo.MAD_ATTRIBUTE_ID:
+                cpinf = IBA.MADClassPortInfo()
+                cpinf.baseVersion = IBA.MAD_BASE_VERSION
+                cpinf.classVersion = 1
+                cpinf.capabilityMask = (IBA.allPortSelect |
+                                        IBA.portCountersXmitWaitSupported)
+                cpinf.respTimeValue = 14
+                payload = cpinf
+            elif attr == IBA.PMPortCounters.MAD_ATTRIBUTE_ID:
+                payload = self._port_counters(node,buf,IBA.PMPortCounters(),
+                                              _PC_MAX)
+            elif attr == IBA.PMPortCountersExt.MAD_ATTRIBUTE_ID:
+                payload = self._port_counters(node,buf,IBA.PMPortCountersExt(),
+                                              _PCE_MAX)
+            else:
+                raise _Status(IBA.MAD_STATUS_UNSUP_METHOD_ATTR_COMBO)
+            self._set_payload(rbuf,64,payload)
+        except _Status as e:
+            self._set_status(rbuf,e.status)
+        rbuf[3] = IBA.MAD_METHOD_GET_RESP
+        return (node,rbuf)
+
+    def _port_counters(self,node,buf,res,limits):
+        sel = buf[65]
+        if sel == 0xFF:
+            ports = node.ports[1:]
+        elif (sel == 0 and not node.is_switch) or sel > node.numPorts:
+            raise _Status(IBA.MAD_STATUS_INVALID_ATTR_OR_MODIFIER)
+        else:
+            ports = [node.ports[sel]]
+        if buf[3] == IBA.MAD_METHOD_SET and (buf[66] or buf[67]):
+            for I in ports:
+                I.counters.clear()
+        res.portSelect = sel
+        for I in ports:
+            for name,value in I.counters.items():
+                if name in limits:
+                    setattr(res,name,getattr(res,name) + value)
+        for name,limit in limits.items():
+            value = getattr(res,name)
+            if isinstance(value,int) and value > limit:
+                setattr(res,name,limit)
+        return res
+
+    # SA
+    def _sa(self,buf,path):
+        if path.DLID != self.fabric.sm_lid:
+            return None
+        node = self.fabric.lid_to_port(path.DLID).node
+        attr = (buf[16] << 8) | buf[17]
+        cls = IBA.ATTR_TO_STRUCT.get((IBA.SAFormat,attr))
+        records = self._sa_records.get(cls)
+        method = buf[3]
+        rbuf = bytearray(buf)
+        rbuf[24:28] = bytes(4)
+        rbuf[3] = method | IBA.MAD_METHOD_RESPONSE
+        if records is None or (method != IBA.MAD_METHOD_GET and
+                               method != IBA.MAD_METHOD_GET_TABLE):
+            self._set_status(rbuf,IBA.MAD_STATUS_UNSUP_METHOD_ATTR_COMBO)
+            return (node,rbuf)
+
+        req = cls(bytes(buf[56:56 + cls.MAD_LENGTH]))
+        mask = int.from_bytes(buf[48:56],"big")
+        checks = [operator.attrgetter(name)
+                  for name,bit in cls.COMPONENT_MASK.items()
+                  if mask & (1 << bit)]
+        checks = [(I,I(req)) for I in checks]
+        res = [I for I in records()
+               if all(get(I) == value for get,value in checks)]
+
+        step = (cls.MAD_LENGTH + 7)//8
+        rbuf[44] = step >> 8
+        rbuf[45] = step & 0xFF
+        if method == IBA.MAD_METHOD_GET:
+            rbuf[56:] = bytes(len(rbuf) - 56)
+            if not res:
+                self._set_status(rbuf,IBA.MAD_STATUS_SA_NO_RECORDS <<
+                                 IBA.MAD_STATUS_CLASS_SHIFT)
+            else:
+                res[0].pack_into(rbuf,56)
+            return (node,rbuf)
+
+        rbuf = rbuf[:56] + bytearray(step*8*len(res))
+        rbuf[24] = 1
+        rbuf[25] = 1
+        rbuf[26] = IBA.RMPP_ACTIVE | IBA.RMPP_FIRST | IBA.RMPP_LAST
+        for I,rec in enumerate(res):
+            rec.pack_into(rbuf,56 + I*step*8)
+        return (node,rbuf)
+
+    def _end_ports(self):
+        """Iterate over (node,port) for every end port with a LID."""
+        for node in self.fabric.nodes:
+            if node.is_switch:
+                yield node,node.ports[0]
+            else:
+                for I in node.ports[1:]:
+                    if I.LID:
+                        yield node,I
+
+    def _sa_node_records(self):
+        for node,port in self._end_ports():
+            rec = IBA.SANodeRecord()
+            rec.LID = port.LID
+            rec.nodeInfo = self._smp_node_info(node,port.port_id,0)
+            rec.nodeDescription.nodeString = bytearray(
+                self._smp_node_desc(node,port.port_id,0))
+            yield rec
+
+    def _sa_port_info_records(self):
+        for node,port in self._end_ports():
+            if node.is_switch:
+                ports = node.ports
+            else:
+                ports = [port]
+            for I in ports:
+                rec = IBA.SAPortInfoRecord()
+                rec.endportLID = port.LID
+                rec.portNum = I.port_id
+                rec.portInfo = self._port_info(node,I.port_id,I.port_id)
+                yield rec
+
+    def _lid_of(self,port):
+        if port.node.is_switch:
+            return port.node.ports[0].LID
+        return port.LID
+
+    def _sa_link_records(self):
+        for node in self.fabric.nodes:
+            for I in node.iterlinks():
+                rec = IBA.SALinkRecord()
+                rec.fromLID = self._lid_of(I)
+                rec.fromPort = I.port_id
+                rec.toPort = I.peer.port_id
+                rec.toLID = self._lid_of(I.peer)
+                yield rec
+
+    def _sa_switch_info_records(self):
+        for node in self.fabric.nodes:
+            if node.is_switch:
+                rec = IBA.SASwitchInfoRecord()
+                rec.LID = node.ports[0].LID
+                rec.switchInfo = self._switch_info(node)
+                yield rec
+
+    def _sa_lft_records(self):
+        for node in self.fabric.nodes:
+            if not node.is_switch:
+                continue
+            for block in range((len(self.fabric.lids) + 63)//64):
+                rec = IBA.SALinearForwardingTableRecord()
+                rec.LID = node.ports[0].LID
+                rec.blockNum = block
+                rec.linearForwardingTable.portBlock = bytearray(
+                    self._lft_block(node,block))
+                yield rec
+
+    @staticmethod
+    def _set_payload(rbuf,offset,payload):
+        if isinstance(payload,bytes):
+            rbuf[offset:offset + len(payload)] = payload
+        else:
+            payload.pack_into(rbuf,offset)
+
+    @staticmethod
+    def _set_status(rbuf,status):
+        rbuf[4] = (rbuf[4] & 0x80) | ((status >> 8) & 0x7F)
+        rbuf[5] = status & 0xFF
+
+    # Transport
+    def _request(self,buf,path):
+        agent = self._agents.get(buf[1])
+        ret = None if agent is None else agent(buf,path)
+        if ret is None or (self.loss and self._random.random() < self.loss):
+            self.dropped = self.dropped + 1
+            return
+        node,rbuf = ret
+
+        now = rdma.tools.clock_monotonic()
+        when = now
+        if self.rate is not None:
+            start = max(now,self._busy.get(node,now))
+            if (start - now)*self.rate >= self.queue_depth:
+                if not self.busy:
+                    self.dropped = self.dropped + 1
+                    return
+                rbuf = bytearray(buf)
+                if buf[1] == IBA.MAD_SUBNET_DIRECTED:
+                    rbuf[4] = rbuf[4] | 0x80
+                self._set_status(rbuf,IBA.MAD_STATUS_BUSY)
+                if buf[3] == IBA.MAD_METHOD_SET:
+                    rbuf[3] = IBA.MAD_METHOD_GET_RESP
+                else:
+                    rbuf[3] = buf[3] | IBA.MAD_METHOD_RESPONSE
+                self.busy_replies = self.busy_replies + 1
+            else:
+                when = self._busy[node] = start + 1.0/self.rate
+
+        if buf[1] == IBA.MAD_SUBNET_DIRECTED:
+            rpath = rdma.path.IBDRPath(self.end_port,retries=0)
+        else:
+            rpath = rdma.path.IBPath(self.end_port,SL=path.SL,
+                                     SLID=path.DLID,DLID=self.end_port.lid,
+                                     dqpn=path.sqpn,sqpn=path.dqpn,
+                                     qkey=path.qkey)
+        self._reply(when + self.latency,rbuf,rpath)
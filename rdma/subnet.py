@@ -1,5 +1,8 @@
 # Copyright 2011 Obsidian Research Corp. GPLv2, see COPYING.
+import array
+import bisect
 import collections
+import collections.abc
 import rdma
 import rdma.path
 import rdma.satransactor
@@ -197,20 +200,32 @@ class Switch(Node):
         # FIXME: How to tell if this is a random FDB switch?
         if do_lfdb:
             self.lfdb = [None]*self.top_unicast_lid
+            blocks = ((path,I) for I in range(len(self.lfdb)//64))
             if isinstance(sched,rdma.satransactor.SATransactor):
                 yield self._get_LFDB_SA(sched,path)
+            elif hasattr(sched,"get_many"):
+                yield sched.get_many(IBA.SMPLinearForwardingTable,blocks,
+                                     self._got_LFDB)
             else:
-                for I in range(len(self.lfdb)/64):
-                    yield self._get_LFDB(sched,I,path)
+                # Other coroutine drivers get one block at a time
+                for path,I in blocks:
+                    self._got_LFDB(path,I,(yield sched.SubnGet(
+                        IBA.SMPLinearForwardingTable,path,I)))
         if do_mfdb:
             self.mfdb = [0]*((self.swinf.multicastFDBCap+31)//32*32)
+            positions = (len(self.ports) + 15)//16
+            blocks = ((path,I | (pos << 28))
+                      for I in range(len(self.mfdb)//32)
+                      for pos in range(0,positions))
             if isinstance(sched,rdma.satransactor.SATransactor):
                 yield self._get_MFDB_SA(sched,path)
+            elif hasattr(sched,"get_many"):
+                yield sched.get_many(IBA.SMPMulticastForwardingTable,blocks,
+                                     self._got_MFDB)
             else:
-                positions = (len(self.ports) + 15)//16
-                for I in range(len(self.mfdb)/32):
-                    for pos in range(0,positions):
-                        yield self._get_MFDB(sched,I,pos,path)
+                for path,I in blocks:
+                    self._got_MFDB(path,I,(yield sched.SubnGet(
+                        IBA.SMPMulticastForwardingTable,path,I)))
 
     def get_switch_inf(self,sched,path):
         """Coroutine to fetch a switch info and then can schedual a LFDB/MFDB
@@ -219,10 +234,9 @@ class Switch(Node):
         :returns: via sched a contex t"""
         self.swinf = yield sched.SubnGet(IBA.SMPSwitchInfo,path)
 
-    def _get_LFDB(self,sched,idx,path):
-        """Coroutine to fetch a single LFDB block."""
-        inf = yield sched.SubnGet(IBA.SMPLinearForwardingTable,
-                                  path,idx)
+    def _got_LFDB(self,path,idx,inf):
+        """:meth:`rdma.sched.MADSchedule.get_many` callback for a LFDB
+        block."""
         self.lfdb[idx*64:idx*64+64] = bytearray(inf.portBlock)
 
     def _get_LFDB_SA(self,sched,path):
@@ -234,10 +248,11 @@ class Switch(Node):
             idx = I.blockNum
             self.lfdb[idx*64:idx*64+64] = bytearray(I.linearForwardingTable.portBlock)
 
-    def _get_MFDB(self,sched,idx,pos,path):
-        """Coroutine to fetch a single MFDB block."""
-        inf = yield sched.SubnGet(IBA.SMPMulticastForwardingTable,
-                                  path,idx | (pos << 28))
+    def _got_MFDB(self,path,attributeModifier,inf):
+        """:meth:`rdma.sched.MADSchedule.get_many` callback for a MFDB
+        block."""
+        idx = attributeModifier & 0xFFFFFFF
+        pos = attributeModifier >> 28
         for I,v in enumerate(inf.portMaskBlock):
             self.mfdb[idx*32+I] = self.mfdb[idx*32+I] | (v << pos*16)
 
@@ -315,15 +330,15 @@ class Subnet(object):
             return None
         if len(drPath) <= 0:
             return start
-        if ord(drPath[0]) != 0:
+        if drPath[0] != 0:
             return None
         if len(drPath) <= 1:
             return start
         if not isinstance(start,Switch):
-            if ord(drPath[1]) != start.port_id:
+            if drPath[1] != start.port_id:
                 return None
         for idx in range(1,len(drPath)):
-            aport = start.parent.get_port_nc(ord(drPath[idx]))
+            aport = start.parent.get_port_nc(drPath[idx])
             if aport is None:
                 return None
             start = self.topology.get(aport)
@@ -374,7 +389,7 @@ class Subnet(object):
         # LID route to a HCA followed by DR route after does not work, in the local
         # host case I think this is a kernel bug, but other cases seem to be as the
         # spec intends.
-        drPath = getattr(path,"drPath","\0") + chr(portIdx)
+        drPath = getattr(path,"drPath",b"\0") + bytes((portIdx,))
         if len(drPath) > 64:
             raise rdma.RDMAError("DR path length limit exceeded, %r"%(drPath))
         if (path.DLID == path.end_port.lid and
@@ -411,7 +426,7 @@ class Subnet(object):
                 # localPortNum, but since we are going in and out of the
                 # same port we can just record what it should have been
                 # here.
-                ret._cached_subnet_localPortNum = ord(drPath[-2])
+                ret._cached_subnet_localPortNum = drPath[-2]
 
             return ret
 
@@ -797,3 +812,546 @@ class Subnet(object):
             elif I.LID is not None:
                 self.set_max_lid(I.LID)
                 self.lids[I.LID] = I
+
+    def compact(self):
+        """Return a :class:`CompactSubnet` copy of this subnet."""
+        return CompactSubnet(self)
+
+def _read_only():
+    return rdma.RDMAError("CompactSubnet is read only, use to_subnet()")
+
+def _guid_int(guid):
+    """Return *guid* as an integer key for the :class:`CompactSubnet` GUID
+    arrays."""
+    if isinstance(guid,int):
+        return guid
+    try:
+        return int.from_bytes(guid,"big")
+    except TypeError:
+        raise KeyError(guid)
+
+def _int_guid(value):
+    return IBA.GUID(value.to_bytes(8,"big"),raw=True)
+
+class _CompactView(object):
+    """Mixin for the read only :class:`Node` and :class:`Port` views of a
+    :class:`CompactSubnet`. A view holds only the subnet and an index,
+    views of the same item compare equal."""
+
+    def __init_subclass__(cls,**kwargs):
+        # Views show the name of the class they stand in for
+        super().__init_subclass__(**kwargs)
+        cls.__name__ = cls.__bases__[-1].__name__
+
+    def __init__(self,sbn,idx):
+        self._sbn = sbn
+        self._idx = idx
+
+    def __eq__(self,other):
+        return (isinstance(other,_CompactView) and self._idx == other._idx and
+                self._sbn is other._sbn and
+                isinstance(other,Port) == isinstance(self,Port))
+
+    def __ne__(self,other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash(self._idx)
+
+class _CompactNode(_CompactView):
+    @property
+    def ninf(self):
+        return self._sbn._get_ninf(self._idx)
+
+    @property
+    def desc(self):
+        return self._sbn._desc[self._idx]
+
+    @property
+    def ports(self):
+        sbn = self._sbn
+        start = sbn._node_port[self._idx]
+        end = sbn._node_port[self._idx+1]
+        if start == end:
+            return None
+        return [sbn._port(I) if sbn._port_flags[I] & CompactSubnet.PORT_SET
+                else None for I in range(start,end)]
+
+    def _port_index(self,portIdx):
+        p = self._sbn._node_port[self._idx] + portIdx
+        if portIdx < 0 or p >= self._sbn._node_port[self._idx+1]:
+            return -1
+        return p
+
+    def get_port_nc(self,portIdx):
+        p = self._port_index(portIdx)
+        if p < 0 or not self._sbn._port_flags[p] & CompactSubnet.PORT_SET:
+            return None
+        return self._sbn._port(p)
+
+    def get_port(self,portIdx):
+        p = self._port_index(portIdx)
+        if p < 0:
+            raise _read_only()
+        return self._sbn._port(p)
+
+    def set_port(self,portIdx,port):
+        raise _read_only()
+
+    def iterports(self):
+        sbn = self._sbn
+        start = sbn._node_port[self._idx]
+        for I in range(start + 1,sbn._node_port[self._idx+1]):
+            if sbn._port_guid[I] != 0 or sbn._port_lid[I] >= 0:
+                yield (sbn._port(I),I - start)
+
+    def iterend_ports(self):
+        return (I for I,idx in self.iterports())
+
+class _CompactSwitch(_CompactNode):
+    @property
+    def swinf(self):
+        return self._sbn._get_switch(self._idx,0)
+
+    @property
+    def lfdb(self):
+        return self._sbn._get_switch(self._idx,1)
+
+    @property
+    def mfdb(self):
+        return self._sbn._get_switch(self._idx,2)
+
+    def iterports(self):
+        sbn = self._sbn
+        start = sbn._node_port[self._idx]
+        return ((sbn._port(I),I - start)
+                for I in range(start,sbn._node_port[self._idx+1]))
+
+    def iterend_ports(self):
+        yield self.get_port(0)
+
+class _NodeView(_CompactNode,Node):
+    pass
+
+class _CAView(_CompactNode,CA):
+    pass
+
+class _RouterView(_CompactNode,Router):
+    pass
+
+class _SwitchView(_CompactSwitch,Switch):
+    pass
+
+class _PortView(_CompactView,Port):
+    @property
+    def parent(self):
+        node = self._sbn._port_node[self._idx]
+        if node < 0:
+            return None
+        return self._sbn._node(node)
+
+    @property
+    def pinf(self):
+        return self._sbn._get_pinf(self._idx)
+
+    @property
+    def portGUID(self):
+        guid = self._sbn._port_guid[self._idx]
+        if guid == 0:
+            return None
+        return _int_guid(guid)
+
+    @property
+    def LID(self):
+        lid = self._sbn._port_lid[self._idx]
+        if lid < 0:
+            return None
+        return lid
+
+    @property
+    def port_id(self):
+        sbn = self._sbn
+        if not sbn._port_flags[self._idx] & CompactSubnet.PORT_SET:
+            raise ValueError("%r is not in the ports of its node"%(self))
+        return self._idx - sbn._node_port[sbn._port_node[self._idx]]
+
+    def __repr__(self):
+        if not self._sbn._port_flags[self._idx] & CompactSubnet.PORT_SET:
+            return "<Port #? %s %s 0x%x>"%(self.portGUID,self.LID,id(self))
+        return Port.__repr__(self)
+
+class _GUIDMap(collections.abc.Mapping):
+    """Read only GUID to :class:`Node` or :class:`Port` mapping for a
+    :class:`CompactSubnet`, held as sorted arrays."""
+    def __init__(self,guids,ids,get):
+        self._guids = guids
+        self._ids = ids
+        self._get = get
+
+    def __getitem__(self,guid):
+        key = _guid_int(guid)
+        idx = bisect.bisect_left(self._guids,key)
+        if idx == len(self._guids) or self._guids[idx] != key:
+            raise KeyError(guid)
+        return self._get(self._ids[idx])
+
+    def __iter__(self):
+        return (_int_guid(I) for I in self._guids)
+
+    def __len__(self):
+        return len(self._guids)
+
+class _LIDList(collections.abc.Sequence):
+    """Read only LID to end :class:`Port` list for a :class:`CompactSubnet`."""
+    def __init__(self,sbn):
+        self._sbn = sbn
+
+    def __getitem__(self,lid):
+        if isinstance(lid,slice):
+            return [self[I] for I in range(*lid.indices(len(self)))]
+        p = self._sbn._lids[lid]
+        if p < 0:
+            return None
+        return self._sbn._port(p)
+
+    def __len__(self):
+        return len(self._sbn._lids)
+
+class _Topology(collections.abc.Mapping):
+    """Read only :class:`Port` to peer :class:`Port` mapping for a
+    :class:`CompactSubnet`."""
+    def __init__(self,sbn):
+        self._sbn = sbn
+
+    def __getitem__(self,port):
+        p = self._sbn._port_index(port)
+        if p < 0 or self._sbn._peer[p] < 0:
+            raise KeyError(port)
+        return self._sbn._port(self._sbn._peer[p])
+
+    def __iter__(self):
+        sbn = self._sbn
+        return (sbn._port(I) for I,peer in enumerate(sbn._peer) if peer >= 0)
+
+    def __len__(self):
+        return self._sbn._links
+
+class _NodeSet(collections.abc.Set):
+    """Read only set of all :class:`Node` for a :class:`CompactSubnet`."""
+    def __init__(self,sbn):
+        self._sbn = sbn
+
+    def __contains__(self,node):
+        return (isinstance(node,_CompactNode) and node._sbn is self._sbn)
+
+    def __iter__(self):
+        return (self._sbn._node(I) for I in range(len(self._sbn._desc)))
+
+    def __len__(self):
+        return len(self._sbn._desc)
+
+class CompactSubnet(Subnet):
+    """A read only copy of a :class:`Subnet` stored in flat arrays, for large
+    fabrics where the object graph takes too much memory or is slow to
+    pickle.
+
+    Nodes and ports are numbered. The ports of a node are a contiguous range
+    of port numbers, links are an array of peer port numbers and
+    :attr:`lids` is an array of port numbers. GUIDs, LIDs and the node
+    types are arrays, and the :class:`~rdma.IBA.SMPNodeInfo`,
+    :class:`~rdma.IBA.SMPPortInfo` and :class:`~rdma.IBA.SMPSwitchInfo`
+    are kept packed and returned as read only views.
+
+    :attr:`nodes`, :attr:`ports`, :attr:`lids`, :attr:`all_nodes` and
+    :attr:`topology` are read only containers that return :class:`Node`
+    and :class:`Port` views, created as they are used. The views are
+    instances of the usual classes, eg :class:`Switch`, and views of the
+    same item compare equal, but they are not the same object. Everything
+    that only reads the subnet works, methods that would change it raise
+    :exc:`rdma.RDMAError`. Use :meth:`to_subnet` to get a :class:`Subnet`
+    that can be changed. As with pickling, :attr:`paths` is not copied."""
+
+    #: :attr:`_port_flags` bit for a port stored in the ports of its node
+    PORT_SET = 1 << 0
+
+    _NODE_TYPES = (Node,CA,Switch,Router)
+    _VIEWS = (_NodeView,_CAView,_SwitchView,_RouterView)
+
+    def __init__(self,sbn):
+        """Copy the contents of the :class:`Subnet` *sbn*."""
+        ninf_len = IBA.SMPNodeInfo.MAD_LENGTH
+        pinf_len = IBA.SMPPortInfo.MAD_LENGTH
+        nodes = sorted(sbn.all_nodes,
+                       key=lambda I: b"" if I.ninf is None else I.ninf.nodeGUID)
+        node_ids = {}
+        port_ids = {}
+        ports = []
+        self._node_type = array.array('B')
+        self._node_port = array.array('I',[0])
+        self._ninf = bytearray(ninf_len*len(nodes))
+        self._node_ninf = array.array('B')
+        self._desc = []
+        self._switches = {}
+        self._port_node = array.array('i')
+        self._port_flags = array.array('B')
+        for n,node in enumerate(nodes):
+            node_ids[node] = n
+            for I,cls in enumerate(self._NODE_TYPES):
+                if node.__class__ is cls:
+                    break
+            else:
+                I = 2 if isinstance(node,Switch) else 0
+            self._node_type.append(I)
+            self._node_ninf.append(node.ninf is not None)
+            if node.ninf is not None:
+                node.ninf.pack_into(self._ninf,n*ninf_len)
+            self._desc.append(node.desc)
+            if isinstance(node,Switch) and (node.swinf is not None or
+                                            node.lfdb is not None or
+                                            node.mfdb is not None):
+                swinf = None
+                if node.swinf is not None:
+                    swinf = bytearray(IBA.SMPSwitchInfo.MAD_LENGTH)
+                    node.swinf.pack_into(swinf)
+                    swinf = bytes(swinf)
+                lfdb = node.lfdb
+                if (lfdb is not None and None not in lfdb and
+                    max(lfdb,default=0) <= 0xFF):
+                    lfdb = bytes(lfdb)
+                self._switches[n] = (swinf,lfdb,node.mfdb)
+            # Room is left for every port in the ninf so get_port works
+            # for all of them, as it does for a Node.
+            node_ports = list(node.ports or ())
+            if node.ninf is not None and node.ports is not None:
+                node_ports.extend(None for I in range(len(node_ports),
+                                                      node.ninf.numPorts+1))
+            for port in node_ports:
+                if port is not None:
+                    port_ids[port] = len(ports)
+                self._port_node.append(n)
+                self._port_flags.append(self.PORT_SET if port is not None else 0)
+                ports.append(port)
+            self._node_port.append(len(ports))
+
+        # Ports that are not in the ports list of their node are still kept
+        # if the subnet refers to them.
+        refs = [I for I in sbn.lids if I is not None]
+        refs.extend(sbn.ports.values())
+        refs.extend(sbn.topology.keys())
+        refs.extend(sbn.topology.values())
+        for port in refs:
+            if port not in port_ids:
+                port_ids[port] = len(ports)
+                self._port_node.append(node_ids.get(port.parent,-1))
+                self._port_flags.append(0)
+                ports.append(port)
+
+        self._pinf = bytearray(pinf_len*sum(1 for I in ports
+                                            if I is not None and
+                                            I.pinf is not None))
+        self._port_pinf = array.array('i',[-1])*len(ports)
+        self._port_guid = array.array('Q',bytes(8*len(ports)))
+        self._port_lid = array.array('i',[-1])*len(ports)
+        self._peer = array.array('i',[-1])*len(ports)
+        pinfs = 0
+        for p,port in enumerate(ports):
+            if port is None:
+                continue
+            if port.pinf is not None:
+                self._port_pinf[p] = pinfs
+                port.pinf.pack_into(self._pinf,pinfs*pinf_len)
+                pinfs = pinfs + 1
+            if port.portGUID is not None:
+                self._port_guid[p] = _guid_int(port.portGUID)
+            if port.LID is not None:
+                self._port_lid[p] = port.LID
+        for port,peer in sbn.topology.items():
+            self._peer[port_ids[port]] = port_ids[peer]
+        self._links = len(sbn.topology)
+
+        self._lids = array.array('i',(-1 if I is None else port_ids[I]
+                                      for I in sbn.lids))
+        guids = sorted((_guid_int(k),node_ids[v]) for k,v in sbn.nodes.items())
+        self._node_guids = array.array('Q',(I[0] for I in guids))
+        self._node_guid_ids = array.array('I',(I[1] for I in guids))
+        guids = sorted((_guid_int(k),port_ids[v]) for k,v in sbn.ports.items())
+        self._port_guids = array.array('Q',(I[0] for I in guids))
+        self._port_guid_ids = array.array('I',(I[1] for I in guids))
+
+        self.loaded = set(sbn.loaded)
+        self.lid_routed = sbn.lid_routed
+        self._make_views()
+
+    def _make_views(self):
+        self.nodes = _GUIDMap(self._node_guids,self._node_guid_ids,self._node)
+        self.ports = _GUIDMap(self._port_guids,self._port_guid_ids,self._port)
+        self.lids = _LIDList(self)
+        self.all_nodes = _NodeSet(self)
+        self.topology = _Topology(self)
+
+    def _node(self,idx):
+        return self._VIEWS[self._node_type[idx]](self,idx)
+
+    def _port(self,idx):
+        return _PortView(self,idx)
+
+    def _port_index(self,port):
+        """Return the port number of the view *port* or -1."""
+        if not isinstance(port,_PortView) or port._sbn is not self:
+            return -1
+        return port._idx
+
+    def _get_ninf(self,idx):
+        if not self._node_ninf[idx]:
+            return None
+        return IBA.SMPNodeInfo.View(memoryview(self._ninf),
+                                    idx*IBA.SMPNodeInfo.MAD_LENGTH)
+
+    def _get_pinf(self,idx):
+        idx = self._port_pinf[idx]
+        if idx < 0:
+            return None
+        return IBA.SMPPortInfo.View(memoryview(self._pinf),
+                                    idx*IBA.SMPPortInfo.MAD_LENGTH)
+
+    def _get_switch(self,idx,what):
+        inf = self._switches.get(idx)
+        if inf is None or inf[what] is None:
+            return None
+        if what == 0:
+            return IBA.SMPSwitchInfo.View(inf[0])
+        if isinstance(inf[what],bytes):
+            return list(inf[what])
+        return inf[what]
+
+    def set_max_lid(self,max_lid):
+        raise _read_only()
+
+    def link_end_port(self,port,*args,**kwargs):
+        raise _read_only()
+
+    def get_node(self,type_,**kwargs):
+        raise _read_only()
+
+    def get_node_ninf(self,ninf,path=None,LID=None):
+        raise _read_only()
+
+    def get_port_pinf(self,pinf,*args,**kwargs):
+        raise _read_only()
+
+    def iterswitches(self):
+        return (self._node(I) for I,ty in enumerate(self._node_type)
+                if ty == 2)
+
+    def iterpeers(self,start):
+        p = self._port_index(start)
+        if p < 0:
+            return
+        node = self._port_node[p]
+        if node < 0 or self._node_type[node] != 2:
+            if self._peer[p] >= 0:
+                yield (self._port(self._peer[p]),start)
+            return
+        for I in range(self._node_port[node] + 1,self._node_port[node+1]):
+            peer = self._peer[I]
+            if peer >= 0:
+                yield (self._port(peer),self._port(I))
+
+    def iterbfs(self,start,priors=None):
+        p = self._port_index(start)
+        if p < 0:
+            yield from Subnet.iterbfs(self,start,priors)
+            return
+        if priors is None:
+            priors = {}
+        else:
+            priors.clear()
+        priors[start] = start
+        yield start
+        seen = bytearray(len(self._port_node))
+        seen[p] = 1
+        todo = collections.deque()
+        todo.append(p)
+        while todo:
+            prior = todo.popleft()
+            node = self._port_node[prior]
+            if node >= 0 and self._node_type[node] == 2:
+                ports = range(self._node_port[node] + 1,self._node_port[node+1])
+            else:
+                ports = (prior,)
+            for I in ports:
+                cur = self._peer[I]
+                if cur < 0:
+                    continue
+                node = self._port_node[cur]
+                if node >= 0 and self._node_type[node] == 2:
+                    cur = self._node_port[node]
+                if seen[cur]:
+                    continue
+                seen[cur] = 1
+                todo.append(cur)
+                cur_ep = self._port(cur)
+                priors[cur_ep] = start if I == p else self._port(I)
+                yield cur_ep
+
+    def compact(self):
+        return self
+
+    def to_subnet(self):
+        """Return a :class:`Subnet` holding a copy of this subnet that can
+        be changed."""
+        sbn = Subnet()
+        nodes = []
+        for n,ty in enumerate(self._node_type):
+            node = self._NODE_TYPES[ty]()
+            if self._node_ninf[n]:
+                node.ninf = self._get_ninf(n).decode()
+            node.desc = self._desc[n]
+            if n in self._switches:
+                swinf,lfdb,mfdb = self._switches[n]
+                if swinf is not None:
+                    node.swinf = IBA.SMPSwitchInfo(swinf)
+                if lfdb is not None:
+                    node.lfdb = list(lfdb)
+                if mfdb is not None:
+                    node.mfdb = list(mfdb)
+            nodes.append(node)
+
+        ports = []
+        for p,node in enumerate(self._port_node):
+            if not self._port_flags[p] & self.PORT_SET and p < self._node_port[-1]:
+                ports.append(None)
+                continue
+            port = Port(None if node < 0 else nodes[node])
+            if self._port_pinf[p] >= 0:
+                port.pinf = self._get_pinf(p).decode()
+            if self._port_guid[p] != 0:
+                port.portGUID = _int_guid(self._port_guid[p])
+            if self._port_lid[p] >= 0:
+                port.LID = self._port_lid[p]
+            ports.append(port)
+        for n,node in enumerate(nodes):
+            start = self._node_port[n]
+            end = self._node_port[n+1]
+            if start != end:
+                node.ports = ports[start:end]
+
+        sbn.all_nodes = set(nodes)
+        sbn.nodes = dict((_int_guid(k),nodes[v]) for k,v in
+                         zip(self._node_guids,self._node_guid_ids))
+        sbn.ports = dict((_int_guid(k),ports[v]) for k,v in
+                         zip(self._port_guids,self._port_guid_ids))
+        sbn.lids = [None if I < 0 else ports[I] for I in self._lids]
+        sbn.topology = dict((ports[I],ports[peer])
+                            for I,peer in enumerate(self._peer) if peer >= 0)
+        sbn.loaded = set(self.loaded)
+        sbn.lid_routed = self.lid_routed
+        return sbn
+
+    def __getstate__(self):
+        return dict((k,v) for k,v in self.__dict__.items()
+                    if k.startswith("_") or k in ("loaded","lid_routed"))
+
+    def __setstate__(self,v):
+        self.__dict__.update(v)
+        self._make_views()
@@ -5,6 +5,8 @@ import os.path
 import stat
 import io
 import collections
+import heapq
+import itertools
 
 def _IOC(dir,type,nr,size):
     """Emulate the C _IOC macro"""
@@ -90,6 +92,73 @@ def clock_monotonic():
         raise OSError(errno_, os.strerror(errno_))
     return t.tv_sec + t.tv_nsec * 1e-9
 
+class TimerHeap(object):
+    """A priority queue of deadlines. Adding a timer is O(log n),
+    cancelling is O(1) and expiry pops every timer that is due in one pass.
+
+    Cancelled timers are only marked dead and are discarded when they reach
+    the top of the heap, or when dead entries outnumber live ones and the
+    heap is compacted. The object stored with a timer must not be
+    :data:`None`."""
+    def __init__(self):
+        self._heap = []
+        self._seq = itertools.count()
+        self._live = 0
+
+    def __len__(self):
+        return self._live
+
+    def add(self,deadline,obj):
+        """Arm a timer for *obj* that expires at *deadline*, a
+        :func:`clock_monotonic` value. The returned handle can be passed to
+        :meth:`cancel`."""
+        ent = [deadline,next(self._seq),obj]
+        heapq.heappush(self._heap,ent)
+        self._live = self._live + 1
+        return ent
+
+    def cancel(self,ent):
+        """Disarm the timer *ent* returned by :meth:`add`. Cancelling an
+        expired or already cancelled timer does nothing."""
+        if ent is None or ent[2] is None:
+            return
+        ent[2] = None
+        self._live = self._live - 1
+        heap = self._heap
+        if len(heap) > 64 and self._live*2 < len(heap):
+            self._heap = [I for I in heap if I[2] is not None]
+            heapq.heapify(self._heap)
+
+    def next_deadline(self):
+        """Return the deadline of the earliest live timer, or :data:`None`
+        if there are none."""
+        heap = self._heap
+        while heap:
+            if heap[0][2] is not None:
+                return heap[0][0]
+            heapq.heappop(heap)
+        return None
+
+    def expire(self,now):
+        """Remove every live timer with a deadline at or before *now* and
+        return their objects in deadline order."""
+        res = []
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            ent = heapq.heappop(heap)
+            obj = ent[2]
+            if obj is not None:
+                ent[2] = None
+                self._live = self._live - 1
+                res.append(obj)
+        return res
+
+    def clear(self):
+        for I in self._heap:
+            I[2] = None
+        self._heap = []
+        self._live = 0
+
 finfo = collections.namedtuple('finfo', 'type mask')
 def struct(name, fields):
     """Construct a mutable :class:`collections.namedtuple` with a MASK
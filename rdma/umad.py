@@ -58,6 +58,10 @@ class UMAD(rdma.tools.SysFSDevice,rdma.madtransactor.MADTransactor):
     IB_USER_MAD_UNREGISTER_AGENT = rdma.tools._IOC(1,IB_IOCTL_MAGIC,2,4)
     IB_USER_MAD_ENABLE_PKEY = rdma.tools._IOC(0,IB_IOCTL_MAGIC,3,0)
 
+    #: A :class:`rdma.madcapture.MADCapture` that records every MAD sent
+    #: and received.
+    capture = None
+
     # typedef struct ib_user_mad {
     #  uint32_t agent_id
     #  uint32_t status
@@ -104,6 +108,7 @@ class UMAD(rdma.tools.SysFSDevice,rdma.madtransactor.MADTransactor):
             raise rdma.RDMAError("UMAD ABI is not compatible, we need PKey support.")
 
         self.sbuf = bytearray(320)
+        self._rbuf = bytearray(320)
 
         fcntl.fcntl(self.dev.fileno(),fcntl.F_SETFL,
                     fcntl.fcntl(self.dev.fileno(), fcntl.F_GETFL) | os.O_NONBLOCK)
@@ -250,6 +255,53 @@ class UMAD(rdma.tools.SysFSDevice,rdma.madtransactor.MADTransactor):
         del self.sbuf[64:]
         self.sbuf.extend(buf)
         self.dev.write(self.sbuf)
+        if self.capture is not None:
+            self.capture.sent(buf,path)
+        if self.stats is not None:
+            self.stats.sent(buf,path)
+
+    def _readinto(self,buf):
+        """Read one MAD from the kernel into *buf*. Returns a tuple of the
+        buffer holding the MAD and the length read, the length is
+        :data:`None` if nothing is ready. RMPP MADs larger than *buf* are
+        read into a new buffer of the right size."""
+        while True:
+            try:
+                return (buf,self.dev.readinto(buf))
+            except IOError as err:
+                if err.errno == errno.ENOSPC:
+                    # Hmm.. Must be RMPP.. The kernel returns just the header
+                    # with the full length so resize the buffer accordingly.
+                    length = struct.unpack_from("=L",buf,16)[0]
+                    buf = bytearray(max(len(buf)*2,length))
+                    continue
+                raise
+
+    def _unpack_recv(self,buf,rc):
+        """Convert a MAD read by :meth:`_readinto` into the tuple(buf,path)
+        result of :meth:`recvfrom`. Returns :data:`None` if this was a kernel
+        send timeout notification."""
+        path = rdma.path.IBPath(self.parent)
+        (path.umad_agent_id,status,timeout_ms,retries,length,
+         path._cached_umad_ah) = self.ib_user_mad_t.unpack_from(buf,0)
+        path.dqpn = self._agent_id_dqpn.get(path.umad_agent_id,0)
+        path.__class__ = LazyIBPath
+
+        if status != 0:
+            if status == errno.ETIMEDOUT:
+                return None
+            raise rdma.RDMAError("umad send failure code=%d for %s"%(status,repr(buf[:rc])))
+        if self.capture is not None:
+            self.capture.received(buf[64:rc],path)
+        return (buf[64:rc],path)
+
+    def _wait(self,wakeat):
+        """Sleep until the fd is readable. Returns False if
+        :func:`rdma.tools.clock_monotonic()` passed *wakeat* first."""
+        if wakeat is None:
+            return bool(self._poll.poll(-1))
+        timeout = wakeat - rdma.tools.clock_monotonic()
+        return timeout > 0 and bool(self._poll.poll(timeout*1000))
 
     def recvfrom(self,wakeat):
         '''Receive a MAD packet. If the value of
@@ -257,44 +309,50 @@ class UMAD(rdma.tools.SysFSDevice,rdma.madtransactor.MADTransactor):
         is returned.
 
         :returns: tuple(buf,path)'''
-        buf = bytearray(320)
         first = True
         while True:
-            try:
-                rc = self.dev.readinto(buf)
-            except IOError as err:
-                if err.errno == errno.ENOSPC:
-                    # Hmm.. Must be RMPP.. Resize the buffer accordingly.
-                    rmpp_data2 = struct.unpack_from(">L",bytes(buf),32)
-                    buf = bytearray(min(len(buf)*2,rmpp_data2))
-                    continue
-                raise
-
+            buf,rc = self._readinto(self._rbuf)
             if rc is None:
                 if not first:
                     raise IOError(errno.EAGAIN,"Invalid read after poll")
-                if wakeat is None:
-                    if not self._poll.poll(-1):
-                        return None
-                else:
-                    timeout = wakeat - rdma.tools.clock_monotonic()
-                    if timeout <= 0 or not self._poll.poll(timeout*1000):
-                        return None
+                if not self._wait(wakeat):
+                    return None
                 first = False
                 continue
 
-            path = rdma.path.IBPath(self.parent)
-            (path.umad_agent_id,status,timeout_ms,retries,length,
-             path._cached_umad_ah) = self.ib_user_mad_t.unpack_from(bytes(buf),0)
-            path.dqpn = self._agent_id_dqpn.get(path.umad_agent_id,0)
-            path.__class__ = LazyIBPath
+            ret = self._unpack_recv(buf,rc)
+            if ret is None:
+                first = True
+                continue
+            return ret
 
-            if status != 0:
-                if status == errno.ETIMEDOUT:
-                    first = True
-                    continue
-                raise rdma.RDMAError("umad send failure code=%d for %s"%(status,repr(buf)))
-            return (buf[64:rc],path)
+    def recvfrom_many(self,wakeat,limit=None):
+        '''Receive every MAD packet that is ready, up to *limit*. This
+        sleeps like :meth:`recvfrom` until at least one MAD is available, an
+        empty list is returned if *wakeat* passes first. All the MADs are read
+        through one reusable buffer and each is copied out only once.
+
+        :returns: list of tuple(buf,path)'''
+        res = []
+        first = True
+        while limit is None or len(res) < limit:
+            buf,rc = self._readinto(self._rbuf)
+            if rc is None:
+                if res:
+                    break
+                if not first:
+                    raise IOError(errno.EAGAIN,"Invalid read after poll")
+                if not self._wait(wakeat):
+                    break
+                first = False
+                continue
+
+            ret = self._unpack_recv(buf,rc)
+            if ret is None:
+                first = True
+                continue
+            res.append(ret)
+        return res
 
     def _gen_error(self,buf,path):
         """Sadly the kernel can return EINVAL if it could not process the MAD,
@@ -345,7 +403,8 @@ class UMAD(rdma.tools.SysFSDevice,rdma.madtransactor.MADTransactor):
             return None
 
         rmatch = self._get_reply_match_key(buf)
-        expire = path.mad_timeout + rdma.tools.clock_monotonic()
+        sent = rdma.tools.clock_monotonic()
+        expire = self._mad_timeout(buf,path) + sent
         retries = path.retries
         while True:
             ret = self.recvfrom(expire)
@@ -355,14 +414,20 @@ class UMAD(rdma.tools.SysFSDevice,rdma.madtransactor.MADTransactor):
                 retries = retries - 1
                 self._execute(buf,path,True)
 
-                expire = path.mad_timeout + rdma.tools.clock_monotonic()
+                expire = (self._mad_timeout(buf,path,path.retries - retries) +
+                          rdma.tools.clock_monotonic())
                 continue
             elif rmatch == self._get_match_key(ret[0]):
+                if retries == path.retries and self.rtt is not None:
+                    self.rtt.sample(path,buf[1],
+                                    rdma.tools.clock_monotonic() - sent)
                 return ret
             else:
                 if self.trace_func is not None:
                     self.trace_func(self,rdma.madtransactor.TRACE_UNEXPECTED,
                                     path=path,ret=ret)
+                if self.stats is not None:
+                    self.stats.unexpected_reply(*ret)
     def __repr__(self):
         return "<%s.%s object for %s at 0x%x>"%\
                (self.__class__.__module__,
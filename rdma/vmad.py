@@ -16,6 +16,9 @@ class VMAD(rdma.madtransactor.MADTransactor):
     used with GMP (eg QPN=1) traffic.'''
     #: :class:`rdma.devices.EndPort` this is associated with.
     end_port = None
+    #: A :class:`rdma.madcapture.MADCapture` that records every MAD sent
+    #: and received.
+    capture = None
 
     _pd = None
     _cq = None
@@ -71,6 +74,10 @@ class VMAD(rdma.madtransactor.MADTransactor):
         buf_idx = self._pool.pop()
         self._pool.copy_to(buf,buf_idx)
         self._qp.post_send(self._pool.make_send_wr(buf_idx,len(buf),path))
+        if self.capture is not None:
+            self.capture.sent(buf,path)
+        if self.stats is not None:
+            self.stats.sent(buf,path)
 
     def _cq_drain(self):
         """Empty the CQ and return and send buffers back to the pool. receive
@@ -93,12 +100,15 @@ class VMAD(rdma.madtransactor.MADTransactor):
             if self._recvs:
                 wc = self._recvs.pop()
                 buf = pool.copy_from(wc.wr_id,40,wc.byte_len)
+                path = ibv.WCPath(self.end_port,wc,
+                                  pool._mem,
+                                  (wc.wr_id & pool.BUF_ID_MASK)*pool.size,
+                                  pkey=self.pkey,
+                                  qkey=self.qkey)
                 pool.finish_wcs(self._qp,wc)
-                return (buf,ibv.WCPath(self.end_port,wc,
-                                       pool._mem,
-                                       (wc.wr_id & pool.BUF_ID_MASK)*pool.size,
-                                       pkey=self.pkey,
-                                       qkey=self.qkey))
+                if self.capture is not None:
+                    self.capture.received(buf,path)
+                return (buf,path)
 
             self._cq.req_notify()
             self._cq_drain()
@@ -106,6 +116,23 @@ class VMAD(rdma.madtransactor.MADTransactor):
                 if not self._poller.sleep(wakeat):
                     return None
 
+    def recvfrom_many(self,wakeat,limit=None):
+        '''Receive every MAD packet that is ready, up to *limit*. This
+        sleeps like :meth:`recvfrom` until at least one MAD is available, an
+        empty list is returned if *wakeat* passes first.
+
+        :returns: list of tuple(buf,path)'''
+        ret = self.recvfrom(wakeat)
+        if ret is None:
+            return []
+        res = [ret]
+        while limit is None or len(res) < limit:
+            ret = self.recvfrom(0)
+            if ret is None:
+                break
+            res.append(ret)
+        return res
+
     def _execute(self,buf,path,sendOnly = False):
         """Send the fully formed MAD in buf to path and copy the reply
         into buf. Return path of the reply. This is a synchronous method, all
@@ -114,7 +141,8 @@ class VMAD(rdma.madtransactor.MADTransactor):
         if sendOnly:
             return None
         rmatch = self._get_reply_match_key(buf)
-        expire = path.mad_timeout + rdma.tools.clock_monotonic()
+        sent = rdma.tools.clock_monotonic()
+        expire = self._mad_timeout(buf,path) + sent
         retries = path.retries
         while True:
             ret = self.recvfrom(expire)
@@ -124,14 +152,20 @@ class VMAD(rdma.madtransactor.MADTransactor):
                 retries = retries - 1
                 self._execute(buf,path,True)
 
-                expire = path.mad_timeout + rdma.tools.clock_monotonic()
+                expire = (self._mad_timeout(buf,path,path.retries - retries) +
+                          rdma.tools.clock_monotonic())
                 continue
             elif rmatch == self._get_match_key(ret[0]):
+                if retries == path.retries and self.rtt is not None:
+                    self.rtt.sample(path,buf[1],
+                                    rdma.tools.clock_monotonic() - sent)
                 return ret
             else:
                 if self.trace_func is not None:
                     self.trace_func(self,rdma.madtransactor.TRACE_UNEXPECTED,
                                     path=path,ret=ret)
+                if self.stats is not None:
+                    self.stats.unexpected_reply(*ret)
 
     def __enter__(self):
         return self
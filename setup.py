@@ -161,7 +161,7 @@ setup(name='rdma',
       version=version,
       description='RDMA functionality for python',
       ext_modules=[ibverbs_module],
-      packages=['rdma','libibtool'],
+      packages=['rdma','rdma.IBA_struct','libibtool'],
       scripts=['ibtool'],
       cmdclass={'build_ext': build_ext,
                 'docs': sphinx_build},
@@ -0,0 +1,64 @@
+# Copyright 2011 Obsidian Research Corp. GPLv2, see COPYING.
+import unittest
+import asyncio
+import rdma,rdma.asyncmad
+import rdma.IBA as IBA
+from tests.sched_fake import SocketUMAD,fake_path
+
+class asyncmad_test(unittest.TestCase):
+    def test_gather(self):
+        """Many concurrent RPCs complete on one loop."""
+        umad = SocketUMAD(shuffle=True)
+        self.addCleanup(umad.close)
+        mad = rdma.asyncmad.AsyncMAD(umad)
+        async def go():
+            return await asyncio.gather(*(mad.SubnGet(IBA.SMPNodeInfo,
+                                                      fake_path(umad,I))
+                                          for I in range(1,300)))
+        res = asyncio.run(go())
+        self.assertEqual(len(res),299)
+        self.assertTrue(all(isinstance(I,IBA.SMPNodeInfo) for I in res))
+        self.assertEqual(mad._loop,None)
+
+    def test_retry(self):
+        """Lost MADs are retried, then time out."""
+        lost = set()
+        def drop(path,buf):
+            if path.DLID == 5:
+                return True
+            if path.DLID in lost:
+                return False
+            lost.add(path.DLID)
+            return True
+        umad = SocketUMAD(drop=drop)
+        self.addCleanup(umad.close)
+        mad = rdma.asyncmad.AsyncMAD(umad)
+        async def go():
+            ok = await mad.SubnGet(IBA.SMPNodeInfo,fake_path(umad,4,retries=1))
+            with self.assertRaises(rdma.MADTimeoutError):
+                await mad.SubnGet(IBA.SMPNodeInfo,fake_path(umad,5,retries=2))
+            return ok
+        self.assertTrue(isinstance(asyncio.run(go()),IBA.SMPNodeInfo))
+        self.assertEqual(umad.sent,5)
+
+    def test_run(self):
+        """Generator coroutines can be driven from asyncio."""
+        umad = SocketUMAD()
+        self.addCleanup(umad.close)
+        mad = rdma.asyncmad.AsyncMAD(umad)
+        def inner(mad,path):
+            ninf = yield mad.SubnGet(IBA.SMPNodeInfo,path)
+            mad.result = ninf.numPorts + 1
+        def outer(mad):
+            count = yield inner(mad,fake_path(umad,3))
+            try:
+                yield mad.SubnGet(IBA.SMPNodeInfo,
+                                  fake_path(umad,3,umad_agent_id=1))
+            except rdma.MADError:
+                count = count + 1
+            mad.result = count
+        umad.drop = lambda path,buf:path.umad_agent_id == 1
+        self.assertEqual(asyncio.run(mad.run(outer(mad))),2)
+
+if __name__ == '__main__':
+    unittest.main()
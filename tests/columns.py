@@ -0,0 +1,61 @@
+# Copyright 2011 Obsidian Research Corp. GPLv2, see COPYING.
+import unittest
+import operator
+import rdma,rdma.columns,rdma.sim
+import rdma.IBA as IBA
+
+class columns_test(unittest.TestCase):
+    def setUp(self):
+        self.umad = rdma.sim.SimUMAD(rdma.sim.fat_tree(4))
+
+    def check(self,table,cols):
+        for name,col in cols.items():
+            get = operator.attrgetter(name)
+            for rec,value in zip(table,col):
+                want = get(rec)
+                if rdma.columns.numpy is not None:
+                    value = value.tolist()
+                    if isinstance(want,IBA.GUID):
+                        want = int(want)
+                    elif isinstance(want,bytearray):
+                        want = bytes(want)
+                self.assertEqual(value,want)
+
+    def test_columns(self):
+        """Every column matches the members of the records."""
+        for cls in (IBA.SAPortInfoRecord,IBA.SANodeRecord,IBA.SALinkRecord,
+                    IBA.SALinearForwardingTableRecord):
+            res = self.umad.SubnAdmGetTable(cls,views=True)
+            cols = rdma.columns.columns(res)
+            self.assertTrue(all(len(I) == len(res) for I in cols.values()))
+            self.check(res,cols)
+            self.check(res,rdma.columns.columns(self.umad.SubnAdmGetTable(cls)))
+
+        cols = rdma.columns.columns(res,["LID","blockNum"])
+        self.assertEqual(sorted(cols),["LID","blockNum"])
+        self.assertRaises(rdma.RDMAError,rdma.columns.columns,res,["foo"])
+        self.assertEqual(rdma.columns.columns([]),{})
+
+    def test_query(self):
+        """Whole table queries on the columns."""
+        res = self.umad.SubnAdmGetTable(IBA.SAPortInfoRecord,views=True)
+        cols = rdma.columns.columns(res,["endportLID","portInfo.LID",
+                                         "portInfo.portState"])
+        want = sorted(I.endportLID for I in res
+                      if I.portInfo.portState == IBA.PORT_STATE_ACTIVE)
+        if rdma.columns.numpy is None:
+            self.assertRaises(rdma.RDMAError,rdma.columns.structured,res)
+            got = [I for I,state in zip(cols["endportLID"],
+                                        cols["portInfo.portState"])
+                   if state == IBA.PORT_STATE_ACTIVE]
+        else:
+            active = cols["portInfo.portState"] == IBA.PORT_STATE_ACTIVE
+            got = cols["endportLID"][active].tolist()
+            arr = rdma.columns.structured(res)
+            self.assertEqual(len(arr),len(res))
+            self.assertEqual(arr["portInfo.LID"].tolist(),
+                             cols["portInfo.LID"].tolist())
+        self.assertEqual(sorted(got),want)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -34,5 +34,27 @@ class compmask_test(unittest.TestCase):
 
         self.assertEqual(cm.component_mask,1<<3)
 
+    def test_sa_query(self):
+        """sa_query computes the same mask as ComponentMask."""
+        for I in range(2):
+            q = IBA.sa_query(IBA.SAPathRecord,DGID=IBA.GID("::1"),DLID=I,
+                             reversible=True)
+            self.assertEqual(q.component_mask,20 | 1<<11)
+            self.assertEqual(q.payload.DGID,IBA.GID("::1"))
+            self.assertEqual(q.payload.DLID,I)
+            self.assertEqual(q.payload.reversible,1)
+
+        q = IBA.sa_query(IBA.SAPortInfoRecord,{"portInfo.capabilityMask": 1},
+                         endportLID=2)
+        self.assertEqual(q.component_mask,1<<7 | 1<<0)
+        self.assertEqual(q.payload.portInfo.capabilityMask,1)
+        self.assertEqual(q.payload.endportLID,2)
+
+        self.assertEqual(IBA.sa_query(IBA.SANodeRecord).component_mask,0)
+        self.assertRaises(AttributeError,IBA.sa_query,IBA.SANodeRecord,
+                          foo=1)
+        self.assertRaises(AttributeError,IBA.sa_query,IBA.SANodeRecord,
+                          {"nodeInfo.foo": 1})
+
 if __name__ == '__main__':
     unittest.main()
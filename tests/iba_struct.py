@@ -1,11 +1,13 @@
 # Copyright 2011 Obsidian Research Corp. GPLv2, see COPYING.
-import unittest,sys
+import unittest,sys,io
+import subprocess
 import rdma.IBA as IBA;
 import rdma.binstruct;
+import rdma.IBA_struct;
 import os
+import random
 
-structs = set(I for I in IBA.__dict__.values()
-              if isinstance(I,type) and issubclass(I,rdma.binstruct.BinStruct));
+structs = set(getattr(IBA,I) for I in rdma.IBA_struct.STRUCTS);
 
 class structs_test(unittest.TestCase):
     def test_component_mask(self):
@@ -44,6 +46,89 @@ class structs_test(unittest.TestCase):
             attr.pack_into(test);
             self.assertEqual(raw[0:I.MAD_LENGTH], test[0:I.MAD_LENGTH]);
 
+    def test_copy(self):
+        """Structures can be built from other structures and bytearrays."""
+        pinf = IBA.SMPPortInfo();
+        pinf.LID = 0x1234;
+        pinf.linkSpeedEnabled = 0xF;
+        pinf.portState = IBA.PORT_STATE_ACTIVE;
+        buf = bytearray(pinf.MAD_LENGTH);
+        pinf.pack_into(buf);
+        for I in (IBA.SMPPortInfo(pinf),IBA.SMPPortInfo(buf)):
+            self.assertEqual((I.LID,I.linkSpeedEnabled,I.portState),
+                             (0x1234,0xF,IBA.PORT_STATE_ACTIVE));
+
+        buf = bytearray(IBA.SMPFormatDirected.MAD_LENGTH);
+        buf[-1] = 0xAA;
+        fmt = IBA.SMPFormatDirected(bytes(buf));
+        self.assertEqual(fmt.returnPath[-1],0xAA);
+        self.assertEqual(IBA.SMPFormatDirected(fmt).returnPath,fmt.returnPath);
+
+    def check_array8(self):
+        rand = random.Random(1);
+        for mlen in (1,2,3,4,8,12,16,32,64):
+            for count in (8,16,24,256,512):
+                vals = [rand.getrandbits(mlen) for I in range(count)];
+                width = mlen*count//8;
+                ref = sum(v << ((count - 1 - I)*mlen) for I,v in enumerate(vals));
+                buf = bytearray(width + 3);
+                rdma.binstruct.pack_array8(buf,3,mlen,count,vals);
+                self.assertEqual(bytes(buf[3:]),ref.to_bytes(width,"big"));
+                for data in (bytes(buf),memoryview(buf)):
+                    inp = [0]*count;
+                    res = rdma.binstruct.unpack_array8(data,3,mlen,count,inp);
+                    self.assertIs(res,inp);
+                    self.assertEqual(res,vals);
+
+    def test_array8(self):
+        """Sub byte arrays round trip through pack_array8 and unpack_array8."""
+        self.check_array8();
+        self.assertEqual(IBA.SMPSLToVLMappingTable(bytes(range(0x10,0x18))).SLtoVL,
+                         [1,0,1,1,1,2,1,3,1,4,1,5,1,6,1,7]);
+        self.assertRaises(ValueError,rdma.binstruct.pack_array8,
+                          bytearray(8),0,4,16,[16]*16);
+
+    @unittest.skipIf(rdma.binstruct._get_numpy() is None,"NumPy is not installed")
+    def test_array8_numpy(self):
+        """The NumPy path gives the same results as the Python path."""
+        old = rdma.binstruct.NUMPY_MIN_COUNT;
+        rdma.binstruct.NUMPY_MIN_COUNT = 1;
+        try:
+            self.check_array8();
+            for mlen in (1,2,4):
+                for bad in (1 << mlen,-1):
+                    self.assertRaises(ValueError,rdma.binstruct.pack_array8,
+                                      bytearray(8),0,mlen,16,[0]*15 + [bad]);
+        finally:
+            rdma.binstruct.NUMPY_MIN_COUNT = old;
+
+    def test_numpy_lazy(self):
+        """Short arrays do not import NumPy."""
+        code = """if 1:
+            import sys,rdma.IBA as IBA
+            IBA.SMPSLToVLMappingTable(bytes(8)).SLtoVL
+            print("numpy" in sys.modules)""";
+        out = subprocess.check_output([sys.executable,"-c",code]);
+        self.assertEqual(out.strip(),b"False");
+
+    def test_lazy(self):
+        """Structures are only imported when they are used."""
+        code = """if 1:
+            import sys,rdma.IBA as IBA
+            IBA.get_fmt_payload(IBA.SMPFormat.MAD_CLASS,0x101,
+                                IBA.SMPPortInfo.MAD_ATTRIBUTE_ID)
+            assert "ATTR_TO_STRUCT" not in vars(IBA)
+            print(sorted(I for I in sys.modules if I.startswith("rdma.IBA_struct.")))""";
+        out = subprocess.check_output([sys.executable,"-c",code]);
+        self.assertEqual(out.strip(),b"['rdma.IBA_struct.iba_14']");
+
+        for (cls,attr),name in rdma.IBA_struct.ATTR_TO_STRUCT_NAME.items():
+            fmt = getattr(IBA,cls);
+            ver = (IBA.MAD_BASE_VERSION << 8) | fmt.MAD_CLASS_VERSION;
+            self.assertEqual(IBA.get_fmt_payload(fmt.MAD_CLASS,ver,attr),
+                             (fmt,getattr(IBA,name)));
+            self.assertIs(IBA.ATTR_TO_STRUCT[fmt,attr],getattr(IBA,name));
+
     def test_struct_printer_dump(self):
         """Checking printer dump style"""
         for I in structs:
@@ -54,5 +139,39 @@ class structs_test(unittest.TestCase):
         for I in structs:
             I().printer(sys.stdout,format="dotted");
 
+    def test_struct_printer_layout(self):
+        """Checking the printed layout of nested structures"""
+        fmt = IBA.SAFormat();
+        fmt.attributeID = IBA.SAPathRecord.MAD_ATTRIBUTE_ID;
+        pr = IBA.SAPathRecord();
+        pr.DLID = 5;
+        pr.PKey = 0xFFFF;
+        pr.pack_into(fmt.data);
+        out = io.StringIO();
+        fmt.printer(out,header=False);
+        lines = out.getvalue().splitlines();
+        self.assertIn("   + data SAPathRecord",lines);
+        self.assertIn(" 96 00050000 DLID=5,SLID=0",lines);
+        self.assertEqual(lines[-1],"116 00000000 reserved_480=0");
+
+        out = io.StringIO();
+        fmt.printer(out,format="dotted",column=20);
+        lines = out.getvalue().splitlines();
+        self.assertIn("data.DLID...........5",lines);
+        self.assertIn("data.PKey...........0xffff",lines);
+        out = io.StringIO();
+        fmt.printer(out,format="dotted",column=20,colon=True,
+                    name_map={"DLID": "Dlid"});
+        self.assertIn("data.Dlid:..........5",out.getvalue().splitlines());
+
+        # Arrays of structures are printed at the offset of each entry
+        rft = IBA.SMPRandomForwardingTable();
+        rft.LIDPortBlock[1].LID = 3;
+        out = io.StringIO();
+        rft.printer(out,offset=8,header=False);
+        lines = out.getvalue().splitlines();
+        self.assertEqual(lines[2],"   + LIDPortBlock[1] SMPLIDPortBlock");
+        self.assertEqual(lines[3]," 12 00030000 LID=3,valid=0,LMC=0,reserved_20=0,port=0");
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,133 @@
+# Copyright 2011 Obsidian Research Corp. GPLv2, see COPYING.
+import unittest
+import asyncio
+import rdma,rdma.asyncmad,rdma.madcache,rdma.madtransactor,rdma.sched
+import rdma.IBA as IBA
+from tests.sched_fake import FakeEndPort,FakeUMAD,SocketUMAD,fake_path
+
+class SyncFake(rdma.madtransactor.MADTransactor):
+    """A synchronous transactor that echos the request back as the reply."""
+    def __init__(self):
+        self.end_port = FakeEndPort()
+        self.sent = 0
+        self._tid = 0
+
+    def _get_new_TID(self):
+        self._tid = self._tid + 1
+        return self._tid
+
+    def _execute(self,buf,path):
+        self.sent = self.sent + 1
+        rbuf = bytearray(buf)
+        rbuf[3] = buf[3] | IBA.MAD_METHOD_RESPONSE
+        return (rbuf,path)
+
+class madcache_test(unittest.TestCase):
+    def test_hit(self):
+        """Repeated Gets are answered from the cache with fresh objects."""
+        umad = SyncFake()
+        mad = rdma.madcache.MADCache(umad)
+        path = fake_path(umad)
+        ninf = mad.SubnGet(IBA.SMPNodeInfo,path)
+        ninf.numPorts = 10
+        ninf = mad.SubnGet(IBA.SMPNodeInfo,path)
+        self.assertEqual(ninf.numPorts,0)
+        self.assertEqual(umad.sent,1)
+        mad.SubnGet(IBA.SMPNodeInfo,path,1)
+        mad.SubnGet(IBA.SMPNodeInfo,fake_path(umad,3))
+        mad.SubnGet(IBA.SMPPortInfo,path)
+        mad.SubnGet(IBA.SMPPortInfo,path)
+        self.assertEqual(umad.sent,5)
+        self.assertEqual((mad.hits,mad.misses),(1,3))
+        self.assertEqual(len(mad),3)
+
+    def test_set(self):
+        """A Set drops the cached replies for that attribute."""
+        umad = SyncFake()
+        mad = rdma.madcache.MADCache(umad)
+        path = fake_path(umad)
+        mad.SubnGet(IBA.SMPSwitchInfo,path)
+        mad.SubnGet(IBA.SMPNodeInfo,path)
+        mad.SubnSet(IBA.SMPSwitchInfo(),path)
+        mad.SubnGet(IBA.SMPSwitchInfo,path)
+        mad.SubnGet(IBA.SMPNodeInfo,path)
+        self.assertEqual(umad.sent,4)
+
+        mad.invalidate(IBA.SMPNodeInfo,path)
+        mad.SubnGet(IBA.SMPNodeInfo,path)
+        self.assertEqual(umad.sent,5)
+
+    def test_limits(self):
+        """Entries expire and the least recently used are evicted."""
+        umad = SyncFake()
+        mad = rdma.madcache.MADCache(umad,ttl={IBA.SMPNodeInfo:60,
+                                               IBA.SMPSwitchInfo:0},
+                                     max_entries=2)
+        path = fake_path(umad)
+        mad.SubnGet(IBA.SMPSwitchInfo,path)
+        mad.SubnGet(IBA.SMPSwitchInfo,path)
+        self.assertEqual(umad.sent,2)
+        mad.clear()
+
+        for I in (2,3,2,4,2,3):
+            mad.SubnGet(IBA.SMPNodeInfo,fake_path(umad,I))
+        self.assertEqual(umad.sent,6)
+        self.assertEqual(len(mad),2)
+
+        mad = rdma.madcache.MADCache(umad,max_bytes=100)
+        for I in range(10):
+            mad.SubnGet(IBA.SMPNodeInfo,fake_path(umad,I + 2))
+        self.assertEqual(len(mad),2)
+
+    def test_sched(self):
+        """Hits complete coroutines without sending MADs."""
+        umad = FakeUMAD()
+        sched = rdma.sched.MADSchedule(umad)
+        mad = rdma.madcache.MADCache(sched)
+        res = []
+        def get_info(path):
+            ninf = yield mad.SubnGet(IBA.SMPNodeInfo,path)
+            res.append(ninf)
+            ninf = yield mad.SubnGet(IBA.SMPNodeInfo,path)
+            res.append(ninf)
+        sched.run(mqueue=(get_info(fake_path(umad,I)) for I in range(2,12)))
+        self.assertEqual(len(res),20)
+        self.assertTrue(all(isinstance(I,IBA.SMPNodeInfo) for I in res))
+        self.assertEqual(umad.sent,10)
+
+    def test_set_in_flight(self):
+        """A Get outstanding while a Set is sent does not cache its reply."""
+        umad = FakeUMAD(delay=0.005)
+        sched = rdma.sched.MADSchedule(umad)
+        mad = rdma.madcache.MADCache(sched)
+        path = fake_path(umad)
+        path.resp_time = 16
+        def get_info():
+            yield mad.SubnGet(IBA.SMPSwitchInfo,path)
+        def set_info():
+            yield mad.SubnSet(IBA.SMPSwitchInfo(),path)
+        def start():
+            ctx = sched.queue(get_info())
+            yield set_info()
+            yield ctx
+        sched.run(queue=start())
+        self.assertEqual(len(mad),0)
+        sched.run(queue=get_info())
+        self.assertEqual(umad.sent,3)
+        self.assertEqual(len(mad),1)
+
+    def test_asyncio(self):
+        """Hits are awaitable."""
+        umad = SocketUMAD()
+        self.addCleanup(umad.close)
+        mad = rdma.madcache.MADCache(rdma.asyncmad.AsyncMAD(umad))
+        path = fake_path(umad)
+        async def go():
+            first = await mad.SubnGet(IBA.SMPNodeInfo,path)
+            return first,await mad.SubnGet(IBA.SMPNodeInfo,path)
+        res = asyncio.run(go())
+        self.assertTrue(isinstance(res[1],IBA.SMPNodeInfo))
+        self.assertEqual(umad.sent,1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+# Copyright 2011 Obsidian Research Corp. GPLv2, see COPYING.
+import unittest
+import io
+import rdma,rdma.madcapture,rdma.sched
+import rdma.IBA as IBA
+from tests.sched_fake import FakeEndPort,FakeUMAD,fake_path
+
+class CaptureUMAD(FakeUMAD):
+    """A :class:`FakeUMAD` that records like :class:`rdma.umad.UMAD` does."""
+    capture = None
+    def _execute(self,buf,path,sendOnly=False):
+        self.capture.sent(buf,path)
+        return FakeUMAD._execute(self,buf,path,sendOnly)
+
+    def recvfrom(self,wakeat):
+        ret = FakeUMAD.recvfrom(self,wakeat)
+        if ret is not None:
+            rpath = ret[1].copy()
+            rpath.reverse()
+            self.capture.received(ret[0],rpath)
+        return ret
+
+class madcapture_test(unittest.TestCase):
+    def get_info(self,sched,path,res):
+        ninf = yield sched.SubnGet(IBA.SMPNodeInfo,path)
+        res.append(ninf)
+
+    def record(self):
+        lost = set()
+        def drop(path,buf):
+            if path.DLID != 5 or path.DLID in lost:
+                return False
+            lost.add(path.DLID)
+            return True
+        f = io.BytesIO()
+        umad = CaptureUMAD(drop=drop,delay=0.0005)
+        umad.capture = rdma.madcapture.MADCapture(f)
+        sched = rdma.sched.MADSchedule(umad)
+        res = []
+        sched.run(mqueue=(self.get_info(sched,fake_path(umad,I,retries=1),res)
+                          for I in range(2,12)))
+        umad.capture.close()
+        self.assertEqual(len(res),10)
+        return f.getvalue()
+
+    def test_read(self):
+        """Every MAD sent and received is recorded in order."""
+        recs = list(rdma.madcapture.read_capture(io.BytesIO(self.record())))
+        sends = [I for I in recs if I.kind == rdma.madcapture.CAPTURE_SEND]
+        recvs = [I for I in recs if I.kind == rdma.madcapture.CAPTURE_RECV]
+        self.assertEqual(len(sends),11)
+        self.assertEqual(len(recvs),10)
+        self.assertEqual(sorted(I.DLID for I in sends),
+                         sorted(list(range(2,12)) + [5]))
+        self.assertEqual(sorted(I.SLID for I in recvs),list(range(2,12)))
+        self.assertTrue(all(len(I.buf) == 256 for I in recs))
+        self.assertEqual(recs,sorted(recs,key=lambda x:x.time))
+        self.assertRaises(rdma.RDMAError,list,
+                          rdma.madcapture.read_capture(io.BytesIO(b"junk")))
+
+    def test_replay(self):
+        """Replies are served back with the recorded losses."""
+        data = self.record()
+        umad = rdma.madcapture.ReplayUMAD(FakeEndPort(),io.BytesIO(data),
+                                          scale=0)
+        sched = rdma.sched.MADSchedule(umad)
+        traced = []
+        sched.trace_func = lambda mt,kind,**kw:traced.append(kind)
+        res = []
+        sched.run(mqueue=(self.get_info(sched,fake_path(umad,I,retries=1),res)
+                          for I in range(2,12)))
+        self.assertEqual(len(res),10)
+        self.assertEqual(traced.count(rdma.madtransactor.TRACE_RECEIVE),1)
+        self.assertEqual(umad.unmatched,0)
+
+        # Synchronous use, outcomes are repeated once used up
+        ninf = umad.SubnGet(IBA.SMPNodeInfo,fake_path(umad,5))
+        self.assertTrue(isinstance(ninf,IBA.SMPNodeInfo))
+        self.assertRaises(rdma.MADTimeoutError,umad.SubnGet,
+                          IBA.SMPNodeInfo,fake_path(umad,20))
+        self.assertEqual(umad.unmatched,1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+# Copyright 2011 Obsidian Research Corp. GPLv2, see COPYING.
+import unittest
+import io
+import rdma,rdma.madstats,rdma.sched,rdma.sim
+import rdma.IBA as IBA
+from tests.sim import short_path
+
+class madstats_test(unittest.TestCase):
+    def get_info(self,sched,path,res):
+        ninf = yield sched.SubnGet(IBA.SMPNodeInfo,path)
+        res.append(ninf)
+
+    def test_sched(self):
+        """Sends, retries and completions are counted per attribute."""
+        umad = rdma.sim.SimUMAD(rdma.sim.fat_tree(4),loss=0.3,
+                                latency=0.0002,seed=1)
+        umad.stats = stats = rdma.madstats.MADStats(size=16)
+        sched = rdma.sched.MADSchedule(umad)
+        self.assertTrue(sched.stats is stats)
+        res = []
+        sched.run(mqueue=(self.get_info(sched,short_path(umad,I,retries=20),
+                                        res)
+                          for I in range(1,37)))
+        self.assertEqual(len(res),36)
+
+        st = stats.attrs[(IBA.MAD_SUBNET,(1 << 8) | 1,
+                          IBA.SMPNodeInfo.MAD_ATTRIBUTE_ID)]
+        self.assertEqual(st.sent,36)
+        self.assertEqual(st.completed,36)
+        self.assertEqual(st.timeouts,0)
+        self.assertEqual(st.retries + st.sent,umad.sent)
+        self.assertEqual(sum(st.hist),36)
+        self.assertTrue(0 < st.percentile(50) <= st.max_latency)
+        self.assertTrue(1 < stats.peak_outstanding <= sched.max_outstanding)
+        self.assertEqual(stats.classes()[IBA.MAD_SUBNET].completed,36)
+
+        self.assertEqual(stats.count,36*2 + st.retries)
+        events = stats.events()
+        self.assertEqual(len(events),16)
+        self.assertEqual(events,sorted(events,key=lambda x:x.time))
+        self.assertEqual(events[-1].kind,rdma.madstats.EVENT_COMPLETE)
+
+    def test_sync(self):
+        """Timeouts are recorded and the summary names the attributes."""
+        umad = rdma.sim.SimUMAD(rdma.sim.fat_tree(4))
+        umad.stats = stats = rdma.madstats.MADStats()
+        umad.SubnGet(IBA.SMPPortInfo,short_path(umad,1),1)
+        self.assertRaises(rdma.MADTimeoutError,umad.SubnGet,IBA.SMPPortInfo,
+                          short_path(umad,100,retries=1))
+        self.assertEqual([I.kind for I in stats.events()],
+                         [rdma.madstats.EVENT_SEND,
+                          rdma.madstats.EVENT_COMPLETE,
+                          rdma.madstats.EVENT_SEND,
+                          rdma.madstats.EVENT_RETRY,
+                          rdma.madstats.EVENT_TIMEOUT])
+        self.assertEqual(stats.events()[-1].LID,100)
+
+        f = io.StringIO()
+        stats.summary(f)
+        out = f.getvalue()
+        self.assertTrue("2 sent, 1 completed, 1 retries, 1 timeouts" in out)
+        self.assertTrue("SMPPortInfo" in out)
+
+    def test_discard(self):
+        """MADs that are given up on are no longer counted as outstanding."""
+        umad = rdma.sim.SimUMAD(rdma.sim.fat_tree(4))
+        umad.stats = stats = rdma.madstats.MADStats()
+        sched = rdma.sched.MADSchedule(umad)
+        res = []
+        def start():
+            ctx = sched.mqueue(
+                self.get_info(sched,short_path(umad,100 + I,retries=1000),res)
+                for I in range(4))
+            yield sched.SubnGet(IBA.SMPNodeInfo,short_path(umad,1))
+            ctx.cancel()
+            try:
+                yield ctx
+            except rdma.CancelledError:
+                pass
+        sched.run(queue=start())
+        self.assertEqual(res,[])
+        self.assertTrue(stats.peak_outstanding > 1)
+        self.assertEqual(stats._pending,{})
+
+        # The rest of execute_many is abandoned by the port 99 error
+        self.assertRaises(rdma.MADError,umad.SubnGetMany,IBA.SMPPortInfo,
+                          [(short_path(umad,100,retries=1000),1),
+                           (short_path(umad,1),99)])
+        self.assertEqual(stats._pending,{})
+
+if __name__ == '__main__':
+    unittest.main()
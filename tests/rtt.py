@@ -0,0 +1,70 @@
+# Copyright 2011 Obsidian Research Corp. GPLv2, see COPYING.
+import unittest
+import rdma,rdma.path,rdma.rtt,rdma.sched,rdma.sim,rdma.tools
+import rdma.IBA as IBA
+
+class rtt_test(unittest.TestCase):
+    def test_estimate(self):
+        """Timeouts follow the samples and are clamped."""
+        umad = rdma.sim.SimUMAD(rdma.sim.fat_tree(4))
+        est = rdma.rtt.RTTEstimator()
+        path = rdma.path.IBPath(umad.end_port,DLID=1,retries=30)
+        other = rdma.path.IBPath(umad.end_port,DLID=2,retries=30)
+        self.assertEqual(est.timeout(path,IBA.MAD_SUBNET),path.mad_timeout)
+
+        est.sample(path,IBA.MAD_SUBNET,0.1)
+        self.assertEqual(est.get(path,IBA.MAD_SUBNET),(0.1,0.05))
+        self.assertAlmostEqual(est.timeout(path,IBA.MAD_SUBNET),0.3)
+        self.assertAlmostEqual(est.timeout(path,IBA.MAD_SUBNET,1),0.6)
+        self.assertEqual(est.timeout(path,IBA.MAD_SUBNET,20),path.mad_timeout)
+        est.sample(path,IBA.MAD_SUBNET,0.2)
+        srtt,rttvar = est.get(path,IBA.MAD_SUBNET)
+        self.assertAlmostEqual(srtt,0.1125)
+        self.assertAlmostEqual(rttvar,0.0625)
+
+        # Other destinations, classes and QPs have their own estimate
+        self.assertEqual(est.get(other,IBA.MAD_SUBNET),None)
+        self.assertEqual(est.get(path,IBA.MAD_SUBNET_ADMIN),None)
+        self.assertEqual(est.timeout(path,IBA.MAD_SUBNET_ADMIN),
+                         path.mad_timeout)
+        self.assertEqual(est.get(path.copy(dqpn=1),IBA.MAD_SUBNET),None)
+        est.sample(other,IBA.MAD_SUBNET,0.0001)
+        self.assertEqual(est.timeout(other,IBA.MAD_SUBNET),est.min_timeout)
+
+        # The last send always gets the full timeout
+        self.assertEqual(est.timeout(path.copy(retries=0),IBA.MAD_SUBNET),
+                         path.mad_timeout)
+        self.assertEqual(est.timeout(path.copy(retries=1),IBA.MAD_SUBNET,1),
+                         path.mad_timeout)
+        est.clear()
+        self.assertEqual(est.get(path,IBA.MAD_SUBNET),None)
+
+    def test_default(self):
+        """Transactors use the static timeouts unless given an estimator."""
+        umad = rdma.sim.SimUMAD(rdma.sim.fat_tree(4))
+        self.assertEqual(umad.rtt,None)
+        self.assertEqual(rdma.sched.MADSchedule(umad).rtt,None)
+
+    def test_dead(self):
+        """Lost MADs are resent after the estimated timeout, the last send
+        waits for the full timeout."""
+        umad = rdma.sim.SimUMAD(rdma.sim.fat_tree(4))
+        umad.rtt = rdma.rtt.RTTEstimator()
+        def path(lid):
+            return rdma.path.IBPath(umad.end_port,DLID=lid,
+                                    SLID=umad.end_port.lid,dqpn=0,sqpn=0,
+                                    resp_time=17,retries=2)
+        umad.SubnGet(IBA.SMPNodeInfo,path(1))
+        self.assertTrue(umad.rtt.timeout(path(1),IBA.MAD_SUBNET) <
+                        path(1).mad_timeout)
+
+        dead = path(1)
+        umad.loss = 1
+        start = rdma.tools.clock_monotonic()
+        self.assertRaises(rdma.MADTimeoutError,umad.SubnGet,IBA.SMPNodeInfo,
+                          dead)
+        elapsed = rdma.tools.clock_monotonic() - start
+        self.assertTrue(dead.mad_timeout <= elapsed < 2*dead.mad_timeout)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,476 @@
+# Copyright 2011 Obsidian Research Corp. GPLv2, see COPYING.
+import unittest
+import collections
+import random
+import socket
+import time
+import rdma,rdma.path,rdma.sched,rdma.tools
+import rdma.IBA as IBA
+
+class FakeEndPort(object):
+    """Just enough of :class:`rdma.devices.EndPort` to build paths."""
+    lid = 1
+    subnet_timeout = 0
+    pkeys = (IBA.PKEY_DEFAULT,)
+    def __str__(self):
+        return "fake/1"
+
+class FakeUMAD(object):
+    """A stand in for :class:`rdma.umad.UMAD` that answers every MAD with
+    an all zeros reply. *drop* is called with the path and MAD buffer and
+    returns True if that MAD should be lost. Replies are held back for
+    *delay* seconds. :attr:`peak` records the most MADs that were ever
+    waiting on a reply from one DLID."""
+    trace_func = None
+
+    def __init__(self,drop=None,shuffle=False,delay=0):
+        self.end_port = FakeEndPort()
+        self.drop = drop
+        self.shuffle = shuffle
+        self.delay = delay
+        self.replies = collections.deque()
+        self.sent = 0
+        self.pending = collections.defaultdict(int)
+        self.peak = collections.defaultdict(int)
+        self._tid = 0
+
+    def _get_new_TID(self):
+        self._tid = (self._tid + 1) % (1 << 32)
+        return self._tid
+
+    def _execute(self,buf,path,sendOnly=False):
+        assert sendOnly
+        self.sent = self.sent + 1
+        if self.drop is not None and self.drop(path,buf):
+            return None
+        rbuf = bytearray(len(buf))
+        rbuf[:24] = buf[:24]
+        rbuf[3] = buf[3] | IBA.MAD_METHOD_RESPONSE
+        self.pending[path.DLID] = count = self.pending[path.DLID] + 1
+        self.peak[path.DLID] = max(self.peak[path.DLID],count)
+        self.replies.append((rdma.tools.clock_monotonic() + self.delay,
+                             rbuf,path))
+        return None
+
+    def recvfrom(self,wakeat):
+        if self.replies:
+            if self.shuffle:
+                idx = random.randrange(len(self.replies))
+                self.replies.rotate(-idx)
+            when = self.replies[0][0]
+            now = rdma.tools.clock_monotonic()
+            if when > now:
+                if wakeat is not None and wakeat < when:
+                    time.sleep(max(0,wakeat - now))
+                    return None
+                time.sleep(when - now)
+            when,rbuf,path = self.replies.popleft()
+            self.pending[path.DLID] = self.pending[path.DLID] - 1
+            return (rbuf,path)
+        if wakeat is not None:
+            delay = wakeat - rdma.tools.clock_monotonic()
+            if delay > 0:
+                time.sleep(delay)
+        return None
+
+    def recvfrom_many(self,wakeat):
+        self.batches = getattr(self,"batches",0) + 1
+        ret = self.recvfrom(wakeat)
+        if ret is None:
+            return []
+        res = [ret]
+        now = rdma.tools.clock_monotonic()
+        while self.replies and self.replies[0][0] <= now:
+            res.append(self.recvfrom(None))
+        return res
+
+class SocketUMAD(FakeUMAD):
+    """A :class:`FakeUMAD` with a file descriptor that polls readable while
+    replies are queued."""
+    def __init__(self,*args,**kwargs):
+        FakeUMAD.__init__(self,*args,**kwargs)
+        self.dev,self._wake = socket.socketpair()
+        self.dev.setblocking(False)
+
+    def _execute(self,buf,path,sendOnly=False):
+        empty = not self.replies
+        FakeUMAD._execute(self,buf,path,sendOnly)
+        if empty and self.replies:
+            self._wake.send(b"x")
+
+    def recvfrom(self,wakeat):
+        if not self.replies:
+            return None
+        ret = FakeUMAD.recvfrom(self,wakeat)
+        if not self.replies:
+            self.dev.recv(1)
+        return ret
+
+    def close(self):
+        self.dev.close()
+        self._wake.close()
+
+def fake_path(umad,DLID=2,**kwargs):
+    """A LID routed SMP path with a ~1ms MAD timeout."""
+    return rdma.path.IBPath(umad.end_port,DLID=DLID,SLID=1,dqpn=0,
+                            sqpn=0,resp_time=8,**kwargs)
+
+class timerheap_test(unittest.TestCase):
+    def test_order(self):
+        """Timers expire in deadline order, in batches."""
+        th = rdma.tools.TimerHeap()
+        for I in (5,1,4,2,3):
+            th.add(I,I)
+        self.assertEqual(len(th),5)
+        self.assertEqual(th.next_deadline(),1)
+        self.assertEqual(th.expire(3),[1,2,3])
+        self.assertEqual(th.expire(3),[])
+        self.assertEqual(th.next_deadline(),4)
+        self.assertEqual(len(th),2)
+
+    def test_cancel(self):
+        """Cancelled timers never expire and do not hold up the heap."""
+        th = rdma.tools.TimerHeap()
+        ents = [th.add(I,I) for I in range(1000)]
+        for I in ents[:900]:
+            th.cancel(I)
+        th.cancel(ents[0])
+        self.assertEqual(len(th),100)
+        self.assertTrue(len(th._heap) < 1000)
+        self.assertEqual(th.next_deadline(),900)
+        self.assertEqual(th.expire(2000),list(range(900,1000)))
+        self.assertEqual(th.next_deadline(),None)
+
+class sched_fake_test(unittest.TestCase):
+    def get_info(self,sched,path,res):
+        ninf = yield sched.SubnGet(IBA.SMPNodeInfo,path)
+        res.append(ninf)
+
+    def test_many(self):
+        """Out of order replies complete the right coroutines."""
+        umad = FakeUMAD(shuffle=True)
+        sched = rdma.sched.MADSchedule(umad)
+        sched.initial_window = 64
+        res = []
+        sched.run(mqueue=(self.get_info(sched,fake_path(umad,I),res)
+                          for I in range(1,500)))
+        self.assertEqual(len(res),499)
+        self.assertEqual(umad.sent,499)
+        self.assertEqual(len(sched._timers),0)
+        self.assertTrue(umad.batches < 499)
+
+    def test_retry(self):
+        """A lost MAD is resent when its timer expires."""
+        lost = set()
+        def drop(path,buf):
+            if path.DLID in lost:
+                return False
+            lost.add(path.DLID)
+            return True
+        umad = FakeUMAD(drop=drop)
+        sched = rdma.sched.MADSchedule(umad)
+        res = []
+        sched.run(mqueue=(self.get_info(sched,fake_path(umad,I,retries=1),res)
+                          for I in range(1,20)))
+        self.assertEqual(len(res),19)
+        self.assertEqual(umad.sent,38)
+
+    def test_timeout(self):
+        """A MAD that is never answered raises MADTimeoutError."""
+        umad = FakeUMAD(drop=lambda path,buf:True)
+        sched = rdma.sched.MADSchedule(umad)
+        self.assertRaises(rdma.MADTimeoutError,sched.run,
+                          self.get_info(sched,fake_path(umad,retries=2),[]))
+        self.assertEqual(umad.sent,3)
+
+    def test_per_target(self):
+        """A single slow agent never sees more than max_per_target MADs."""
+        umad = FakeUMAD(delay=0.0005)
+        sched = rdma.sched.MADSchedule(umad)
+        sched.initial_window = 32
+        sched.max_per_target = 2
+        sched.coalesce = False
+        res = []
+        sched.run(mqueue=(self.get_info(sched,fake_path(umad,7 if I % 2 else I),res)
+                          for I in range(1,200)))
+        self.assertEqual(len(res),199)
+        self.assertEqual(umad.peak[7],2)
+        self.assertTrue(max(umad.peak.values()) <= 2)
+        self.assertFalse(sched._parked or sched._targets)
+
+    def test_park_path(self):
+        """Parked MADs are sent to the path they were formed for."""
+        umad = FakeUMAD(delay=0.0005)
+        sched = rdma.sched.MADSchedule(umad)
+        sched.max_per_target = 1
+        sched.coalesce = False
+        path = fake_path(umad,7)
+        def get_info(port):
+            yield sched.SubnGet(IBA.SMPPortInfo,path,port)
+            # Like discovery moving to a LID route
+            path.DLID = 9
+        sent = []
+        orig = umad._execute
+        def execute(buf,path,sendOnly=False):
+            sent.append(path.DLID)
+            return orig(buf,path,sendOnly)
+        umad._execute = execute
+        sched.run(mqueue=(get_info(I) for I in range(1,4)))
+        self.assertEqual(sent,[7,7,7])
+
+    def test_priority(self):
+        """High priority work is not stuck behind a low priority sweep."""
+        umad = FakeUMAD(delay=0.0005)
+        sched = rdma.sched.MADSchedule(umad)
+        sched.max_outstanding = 4
+        order = []
+        def get_info(tag,DLID,count=1):
+            for I in range(count):
+                yield sched.SubnGet(IBA.SMPNodeInfo,fake_path(umad,DLID))
+            order.append(tag)
+        def start():
+            sched.mqueue((get_info("H",I,4) for I in range(2,6)),
+                         rdma.sched.PRIORITY_HIGH)
+            sched.mqueue((get_info("L",I) for I in range(6,106)),
+                         rdma.sched.PRIORITY_LOW)
+            yield sched.SubnGet(IBA.SMPNodeInfo,fake_path(umad,1))
+        sched.run(queue=start())
+        self.assertEqual(len(order),104)
+        self.assertTrue(order.index("H") < 8)
+        self.assertTrue(len(order) - order[::-1].index("H") < 16)
+
+        # Low priority work never uses the reserved slots
+        sched.reserved_window = 2
+        sched.initial_window = 4
+        outstanding = []
+        orig = umad._execute
+        def execute(buf,path,sendOnly=False):
+            outstanding.append(len(sched._keys))
+            return orig(buf,path,sendOnly)
+        umad._execute = execute
+        sched.run(mqueue=(get_info("L",I) for I in range(6,56)))
+        self.assertEqual(max(outstanding),1)
+
+    def test_window_grow(self):
+        """On time replies open the window up to max_outstanding."""
+        umad = FakeUMAD()
+        sched = rdma.sched.MADSchedule(umad)
+        sched.max_outstanding = 16
+        res = []
+        sched.run(mqueue=(self.get_info(sched,fake_path(umad,I),res)
+                          for I in range(1,500)))
+        self.assertEqual(len(res),499)
+        self.assertEqual(sched.window,16)
+        self.assertTrue(max(umad.peak.values()) <= 1)
+
+    def test_window_shrink(self):
+        """Timeouts shrink the window, once per window of lost MADs."""
+        lost = set()
+        def drop(path,buf):
+            if path.DLID in lost or path.DLID % 4:
+                return False
+            lost.add(path.DLID)
+            return True
+        umad = FakeUMAD(drop=drop)
+        sched = rdma.sched.MADSchedule(umad)
+        sched.initial_window = 16
+        sched.max_outstanding = 16
+        res = []
+        sched.run(mqueue=(self.get_info(sched,fake_path(umad,I,retries=1),res)
+                          for I in range(1,17)))
+        self.assertEqual(len(res),16)
+        self.assertEqual(sched.window,8)
+
+    def test_coalesce(self):
+        """Identical outstanding Gets share one MAD, each requester gets its
+        own decoded reply."""
+        umad = FakeUMAD(delay=0.001)
+        sched = rdma.sched.MADSchedule(umad)
+        sched.initial_window = 16
+        res = []
+        sched.run(mqueue=(self.get_info(sched,fake_path(umad,I % 4 + 2),res)
+                          for I in range(40)))
+        self.assertEqual(len(res),40)
+        self.assertEqual(len(set(id(I) for I in res)),40)
+        self.assertEqual(umad.sent,4)
+        self.assertFalse(sched._coalesced)
+
+        umad = FakeUMAD(delay=0.001)
+        sched = rdma.sched.MADSchedule(umad)
+        sched.initial_window = 16
+        sched.coalesce = False
+        res = []
+        sched.run(mqueue=(self.get_info(sched,fake_path(umad,I % 4 + 2),res)
+                          for I in range(40)))
+        self.assertEqual(umad.sent,40)
+
+    def test_coalesce_timeout(self):
+        """Every requester sharing a lost MAD sees the timeout."""
+        def get_err(sched,path,res):
+            try:
+                yield sched.SubnGet(IBA.SMPNodeInfo,path)
+            except rdma.MADTimeoutError as e:
+                res.append(e)
+        umad = FakeUMAD(drop=lambda path,buf:True)
+        sched = rdma.sched.MADSchedule(umad)
+        sched.initial_window = 16
+        path = fake_path(umad,retries=1)
+        res = []
+        sched.run(mqueue=(get_err(sched,path,res) for I in range(10)))
+        self.assertEqual(len(res),10)
+        self.assertEqual(umad.sent,2)
+
+    def assertIdle(self,sched):
+        self.assertFalse(sched._keys or sched._parked or sched._ready or
+                         sched._targets or sched._coalesced or
+                         sched._ctx_waiters)
+        self.assertEqual(len(sched._timers),0)
+
+    def test_cancel(self):
+        """Cancelling a sweep stops every coroutine it started."""
+        umad = FakeUMAD(drop=lambda path,buf:path.DLID != 1)
+        sched = rdma.sched.MADSchedule(umad)
+        sched.max_per_target = 1
+        sched.initial_window = 16
+        def get_info(DLID):
+            try:
+                yield sched.SubnGet(IBA.SMPNodeInfo,
+                                    fake_path(umad,DLID,retries=1000))
+            except rdma.CancelledError:
+                cancelled.append(DLID)
+                raise
+        def start():
+            ctx = sched.mqueue(get_info(2 + I % 4) for I in range(40))
+            yield sched.SubnGet(IBA.SMPNodeInfo,fake_path(umad,1))
+            ctx.cancel()
+            yield ctx
+        # Cancel coalesced and parked MADs
+        for coalesce in (True,False):
+            sched.coalesce = coalesce
+            cancelled = []
+            sched.run(queue=start())
+            self.assertTrue(4 < len(cancelled) <= 40)
+            self.assertIdle(sched)
+
+    def test_cancel_coalesced(self):
+        """A cancelled MAD is still completed for other requesters."""
+        lost = set()
+        def drop(path,buf):
+            if path.DLID != 3 or path.DLID in lost:
+                return False
+            lost.add(path.DLID)
+            return True
+        umad = FakeUMAD(drop=drop)
+        sched = rdma.sched.MADSchedule(umad)
+        res = []
+        def get_info(tag):
+            try:
+                yield sched.SubnGet(IBA.SMPNodeInfo,
+                                    fake_path(umad,3,retries=1))
+                res.append(tag)
+            except rdma.CancelledError:
+                res.append("cancelled " + tag)
+        def start():
+            ctx = sched.queue(get_info("A"))
+            sched.queue(get_info("B"))
+            yield sched.SubnGet(IBA.SMPNodeInfo,fake_path(umad,2))
+            ctx.cancel()
+        sched.run(queue=start())
+        self.assertEqual(sorted(res),["B","cancelled A"])
+        self.assertEqual(umad.sent,3)
+        self.assertIdle(sched)
+
+    def test_deadline(self):
+        """Contexts and whole runs can be bounded in time."""
+        umad = FakeUMAD(drop=lambda path,buf:path.DLID != 1)
+        sched = rdma.sched.MADSchedule(umad)
+        res = []
+        def get_info(DLID):
+            try:
+                yield sched.SubnGet(IBA.SMPNodeInfo,
+                                    fake_path(umad,DLID,retries=100000))
+            except rdma.CancelledError:
+                res.append(DLID)
+                raise
+        def start():
+            ctx = sched.queue(get_info(2),timeout=0.01)
+            yield ctx
+            res.append(1)
+        start_time = rdma.tools.clock_monotonic()
+        sched.run(queue=start())
+        self.assertEqual(res,[2,1])
+        self.assertIdle(sched)
+
+        res = []
+        def spawn():
+            sched.queue(get_info(3))
+            yield sched.SubnGet(IBA.SMPNodeInfo,fake_path(umad,1))
+        self.assertRaises(rdma.CancelledError,sched.run,
+                          mqueue=(get_info(I) for I in range(4,40)),
+                          queue=spawn(),timeout=0.02)
+        self.assertTrue(rdma.tools.clock_monotonic() - start_time < 1)
+        # Only the coroutines the sweep got to start see the error
+        self.assertTrue(3 in res and 4 in res)
+        self.assertTrue(set(res) <= set(range(3,40)))
+        self.assertIdle(sched)
+
+    def test_get_many(self):
+        """Bulk Gets report every reply and error through the callbacks."""
+        umad = FakeUMAD(drop=lambda path,buf:path.DLID % 10 == 0,shuffle=True)
+        sched = rdma.sched.MADSchedule(umad)
+        sched.initial_window = 16
+        res = {}
+        errors = []
+        def on_reply(path,attributeModifier,reply):
+            self.assertTrue(isinstance(reply,IBA.SMPPortInfo))
+            res[path.DLID,attributeModifier] = reply
+        def on_error(path,attributeModifier,exc):
+            self.assertTrue(isinstance(exc,rdma.MADTimeoutError))
+            errors.append(path.DLID)
+        reqs = [(fake_path(umad,I),I % 3) for I in range(1,301)]
+        def start():
+            yield sched.get_many(IBA.SMPPortInfo,iter(reqs),on_reply,on_error)
+            self.assertEqual(len(res) + len(errors),300)
+        sched.run(queue=start())
+        self.assertEqual(len(res),270)
+        self.assertEqual(sorted(errors),list(range(10,301,10)))
+        self.assertEqual(res[1,1].LID,0)
+        self.assertIdle(sched)
+
+        # Without on_error the first error stops run
+        def start():
+            yield sched.get_many(IBA.SMPPortInfo,iter(reqs),on_reply)
+        self.assertRaises(rdma.MADTimeoutError,sched.run,queue=start())
+
+        # Cancelled like any other context
+        res.clear()
+        def start():
+            ctx = sched.get_many(IBA.SMPNodeInfo,
+                                 ((fake_path(umad,10,retries=1000),0)
+                                  for I in range(1000)),
+                                 on_reply,on_error,timeout=0.01)
+            yield ctx
+        sched.run(queue=start())
+        self.assertIdle(sched)
+
+    def test_multi_port(self):
+        """MADs are routed to the interface for their end port."""
+        umads = [SocketUMAD(shuffle=True) for I in range(3)]
+        for I in umads:
+            self.addCleanup(I.close)
+        sched = rdma.sched.MADSchedule(umads)
+        sched.initial_window = 16
+        res = []
+        sched.run(mqueue=(self.get_info(sched,fake_path(umads[I % 3],I),res)
+                          for I in range(1,301)))
+        self.assertEqual(len(res),300)
+        for I in umads:
+            self.assertEqual(I.sent,100)
+            self.assertEqual(list(I.peak.keys()),
+                             list(range(umads.index(I) or 3,301,3)))
+
+        self.assertRaises(rdma.RDMAError,sched.run,
+                          self.get_info(sched,fake_path(FakeUMAD()),res))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,398 @@
+# Copyright 2011 Obsidian Research Corp. GPLv2, see COPYING.
+import unittest,pickle
+import rdma,rdma.binstruct,rdma.discovery,rdma.madcache,rdma.path,rdma.sched,rdma.sim,rdma.subnet
+import rdma.IBA as IBA
+
+def short_path(umad,DLID,**kwargs):
+    """A LID routed SMP path with a ~1ms MAD timeout."""
+    return rdma.path.IBPath(umad.end_port,DLID=DLID,SLID=umad.end_port.lid,
+                            dqpn=0,sqpn=0,resp_time=8,**kwargs)
+
+class sim_test(unittest.TestCase):
+    def setUp(self):
+        self.fabric = rdma.sim.fat_tree(4)
+
+    def test_fat_tree(self):
+        """The topology has the expected shape and routing."""
+        f = self.fabric
+        self.assertEqual(len([I for I in f.nodes if I.is_switch]),20)
+        self.assertEqual(len([I for I in f.nodes if not I.is_switch]),16)
+        self.assertEqual(len(f.lids),37)
+        self.assertTrue(all(I.peer is not None
+                            for node in f.nodes for I in node.ports[1:]))
+        for node in f.nodes:
+            if not node.is_switch:
+                continue
+            lft = f.lft(node)
+            self.assertEqual(lft[node.ports[0].LID],0)
+            self.assertTrue(all(1 <= lft[I] <= 4 for I in range(1,len(f.lids))
+                                if I != node.ports[0].LID))
+        self.assertRaises(ValueError,rdma.sim.fat_tree,3)
+
+    def test_discovery(self):
+        """A full SMP discovery finds every node and link."""
+        for lid_routed in (True,False):
+            umad = rdma.sim.SimUMAD(self.fabric)
+            sched = rdma.sched.MADSchedule(umad)
+            sbn = rdma.subnet.Subnet()
+            sbn.lid_routed = lid_routed
+            sched.run(queue=rdma.discovery.topo_SMP(sched,sbn))
+            self.assertEqual(len(sbn.all_nodes),36)
+            self.assertEqual(len(list(sbn.iterswitches())),20)
+            self.assertEqual(len(sbn.topology),96)
+            self.assertEqual(umad.dropped,0)
+            for node in sbn.all_nodes:
+                self.assertTrue(node.desc.startswith("sim "))
+
+    def test_discovery_lmc(self):
+        """Ports with a LMC are found under their aligned LID range."""
+        fabric = rdma.sim.fat_tree(4,lmc=2)
+        umad = rdma.sim.SimUMAD(fabric)
+        sched = rdma.sched.MADSchedule(umad)
+        sbn = rdma.subnet.Subnet()
+        sched.run(queue=rdma.discovery.topo_SMP(sched,sbn))
+        self.assertEqual(len(sbn.all_nodes),36)
+        self.assertEqual(umad.dropped,0)
+        count = 0
+        for lid,sport in enumerate(fabric.lids):
+            if sport is None:
+                continue
+            if not sport.node.is_switch:
+                self.assertEqual(sport.LID % 4,0)
+            port = sbn.lids[lid]
+            self.assertEqual(port.parent.ninf.nodeGUID,
+                             IBA.GUID(sport.node.nodeGUID))
+            count = count + 1
+        self.assertEqual(count,20 + 16*4)
+
+    def test_switch_fdb(self):
+        """Forwarding tables are loaded with bulk Gets."""
+        umad = rdma.sim.SimUMAD(self.fabric)
+        sched = rdma.sched.MADSchedule(umad)
+        sbn = rdma.subnet.Subnet()
+        sched.run(queue=rdma.discovery.topo_SMP(sched,sbn))
+        for switch in sbn.iterswitches():
+            path = sbn.get_path_smp(sched,switch.ports[0])
+            def load():
+                switch.swinf = yield sched.SubnGet(IBA.SMPSwitchInfo,path)
+                yield switch.get_switch_fdb(sched,True,True,path)
+            sent = umad.sent
+            sched.run(queue=load())
+            self.assertEqual(umad.sent - sent,1 + 1 + 1024//32)
+            lft = self.fabric.lft(
+                self.fabric.lid_to_port(switch.ports[0].LID).node)
+            self.assertEqual(switch.lfdb[:len(lft)],list(lft))
+            self.assertEqual(switch.mfdb,[0]*1024)
+
+        # Drivers without get_many fetch one block at a time
+        switch.lfdb = switch.mfdb = None
+        sent = umad.sent
+        umad.do_async(switch.get_switch_fdb(umad,True,True,path))
+        self.assertEqual(umad.sent - sent,1 + 1024//32)
+        self.assertEqual(switch.lfdb[:len(lft)],list(lft))
+        self.assertEqual(switch.mfdb,[0]*1024)
+
+    def test_compact(self):
+        """A CompactSubnet holds the same subnet as the Subnet it came from."""
+        umad = rdma.sim.SimUMAD(self.fabric)
+        sched = rdma.sched.MADSchedule(umad)
+        sbn = rdma.subnet.Subnet()
+        sched.run(queue=rdma.discovery.topo_SMP(sched,sbn))
+        switch = next(sbn.iterswitches())
+        path = sbn.get_path_smp(sched,switch.ports[0])
+        def load():
+            switch.swinf = yield sched.SubnGet(IBA.SMPSwitchInfo,path)
+            yield switch.get_switch_fdb(sched,True,False,path)
+        sched.run(queue=load())
+
+        def key(port):
+            if port is None:
+                return None
+            return (port.parent.ninf.nodeGUID,port.port_id,port.LID,
+                    port.portGUID)
+        cpt = sbn.compact()
+        for tmp in (cpt,pickle.loads(pickle.dumps(cpt)),cpt.to_subnet()):
+            self.assertEqual(len(tmp.all_nodes),36)
+            self.assertEqual(sorted(tmp.nodes),sorted(sbn.nodes))
+            self.assertEqual(sorted(tmp.ports),sorted(sbn.ports))
+            self.assertEqual([key(I) for I in tmp.lids],
+                             [key(I) for I in sbn.lids])
+            self.assertEqual(sorted((key(I),key(J))
+                                    for I,J in tmp.topology.items()),
+                             sorted((key(I),key(J))
+                                    for I,J in sbn.topology.items()))
+            for guid,node in sbn.nodes.items():
+                other = tmp.nodes[guid]
+                self.assertIsInstance(other,node.__class__)
+                self.assertEqual(other.desc,node.desc)
+                self.assertEqual(other.ninf.numPorts,node.ninf.numPorts)
+                self.assertEqual([(key(I),J) for I,J in other.iterports()],
+                                 [(key(I),J) for I,J in node.iterports()])
+                for I,J in node.iterports():
+                    self.assertEqual(other.get_port(J).pinf.portState,
+                                     I.pinf.portState)
+            other = tmp.nodes[switch.ninf.nodeGUID]
+            self.assertEqual(other.lfdb,switch.lfdb)
+            self.assertEqual(other.swinf.linearFDBTop,switch.swinf.linearFDBTop)
+
+            start = tmp.ports[umad.end_port.port_guid]
+            self.assertEqual([key(I) for I in tmp.iterbfs(start)],
+                             [key(I) for I in sbn.iterbfs(
+                                 sbn.ports[umad.end_port.port_guid])])
+            dr = sbn.get_dr_cache(umad.end_port)
+            tmp_dr = tmp.get_dr_cache(umad.end_port)
+            for I in sbn.iterend_ports():
+                self.assertEqual(tmp_dr.get_path(tmp.ports[I.portGUID]).drPath,
+                                 dr.get_path(I).drPath)
+
+        self.assertEqual(cpt.ports[umad.end_port.port_guid],
+                         cpt.lids[umad.end_port.lid])
+        self.assertRaises(KeyError,cpt.nodes.__getitem__,IBA.GUID(1))
+        self.assertRaises(rdma.RDMAError,cpt.get_port_pinf,IBA.SMPPortInfo(),
+                          portIdx=1)
+        self.assertRaises(rdma.RDMAError,cpt.nodes[switch.ninf.nodeGUID].set_port,
+                          0,None)
+
+    def test_smp(self):
+        """SMPs are answered over directed and LID routes."""
+        umad = rdma.sim.SimUMAD(self.fabric)
+        ninf = umad.SubnGet(IBA.SMPNodeInfo,rdma.path.IBDRPath(umad.end_port))
+        self.assertEqual(ninf.portGUID,umad.end_port.port_guid)
+
+        # Host -> edge -> agg
+        path = rdma.path.IBDRPath(umad.end_port,drPath=b"\0\1\3")
+        ninf = umad.SubnGet(IBA.SMPNodeInfo,path)
+        self.assertEqual(ninf.nodeType,IBA.NODE_SWITCH)
+        self.assertEqual(ninf.localPortNum,1)
+        lid = umad.SubnGet(IBA.SMPPortInfo,path,0).LID
+        self.assertEqual(umad.SubnGet(IBA.SMPNodeInfo,
+                                      short_path(umad,lid)).nodeGUID,
+                         ninf.nodeGUID)
+        swinf = umad.SubnGet(IBA.SMPSwitchInfo,path)
+        self.assertEqual(swinf.linearFDBTop,36)
+        lft = umad.SubnGet(IBA.SMPLinearForwardingTable,path,0)
+        self.assertEqual(lft.portBlock[lid],0)
+
+        # Ports that go nowhere are never answered
+        self.assertRaises(rdma.MADTimeoutError,umad.SubnGet,IBA.SMPNodeInfo,
+                          rdma.path.IBDRPath(umad.end_port,drPath=b"\0\2",
+                                             resp_time=8))
+        try:
+            umad.SubnGet(IBA.SMPSwitchInfo,rdma.path.IBDRPath(umad.end_port))
+        except rdma.MADError as e:
+            self.assertEqual(e.status,IBA.MAD_STATUS_UNSUP_METHOD_ATTR_COMBO)
+        else:
+            self.fail("Expected MADError")
+
+    def test_sa(self):
+        """SA queries return the fabric's records."""
+        umad = rdma.sim.SimUMAD(self.fabric)
+        self.assertEqual(len(umad.SubnAdmGetTable(IBA.SANodeRecord)),36)
+        self.assertEqual(len(umad.SubnAdmGetTable(IBA.SALinkRecord)),96)
+        self.assertEqual(len(umad.SubnAdmGetTable(IBA.SASwitchInfoRecord)),20)
+
+        req = IBA.ComponentMask(IBA.SANodeRecord())
+        req.nodeInfo.nodeType = IBA.NODE_CA
+        self.assertEqual(len(umad.SubnAdmGetTable(req)),16)
+        req = IBA.ComponentMask(IBA.SANodeRecord())
+        req.LID = umad.end_port.lid
+        rec = umad.SubnAdmGet(req)
+        self.assertEqual(rec.nodeInfo.portGUID,umad.end_port.port_guid)
+
+        req = IBA.ComponentMask(IBA.SAPortInfoRecord())
+        req.endportLID = 1
+        self.assertEqual(len(umad.SubnAdmGetTable(req)),5)
+        req = IBA.sa_query(IBA.SAPortInfoRecord,endportLID=1)
+        self.assertEqual(len(umad.SubnAdmGetTable(req)),5)
+
+        sched = rdma.sched.MADSchedule(umad)
+        sbn = rdma.subnet.Subnet()
+        sched.run(queue=rdma.discovery.subnet_ninf_SA(sched,sbn,
+                                                      node_type=IBA.NODE_CA))
+        self.assertEqual(len(sbn.all_nodes),16)
+
+    def test_sa_views(self):
+        """SA tables can be returned as views into the reply."""
+        umad = rdma.sim.SimUMAD(self.fabric)
+        recs = umad.SubnAdmGetTable(IBA.SAPortInfoRecord)
+        self.assertTrue(isinstance(recs,list))
+        self.assertEqual(recs[0].__class__,IBA.SAPortInfoRecord)
+        recs[0].portNum = recs[0].portNum
+        res = umad.SubnAdmGetTable(IBA.SAPortInfoRecord,views=True)
+        self.assertTrue(isinstance(res,rdma.binstruct.ViewList))
+        self.assertEqual(len(recs),len(res))
+        for rec,view in zip(recs,res):
+            self.assertTrue(isinstance(view,IBA.SAPortInfoRecord))
+            self.assertEqual(view.__class__.__name__,"SAPortInfoRecord")
+            self.assertEqual((view.endportLID,view.portNum),
+                             (rec.endportLID,rec.portNum))
+            self.assertEqual(view.portInfo.LID,rec.portInfo.LID)
+            self.assertEqual(view.portInfo.linkWidthActive,
+                             rec.portInfo.linkWidthActive)
+            self.assertEqual(view.portInfo.portState,rec.portInfo.portState)
+        self.assertEqual(res[-1].endportLID,recs[-1].endportLID)
+        self.assertEqual([I.portNum for I in res[2:4]],
+                         [I.portNum for I in recs[2:4]])
+
+        view = res[3]
+        self.assertRaises(AttributeError,setattr,view,"portNum",1)
+        cpy = IBA.SAPortInfoRecord(view)
+        cpy.portNum = 1
+        self.assertEqual(cpy.portInfo.LID,view.portInfo.LID)
+        cpy = pickle.loads(pickle.dumps(view))
+        self.assertEqual(cpy.__class__,IBA.SAPortInfoRecord)
+        self.assertEqual(cpy.portInfo.GIDPrefix,view.portInfo.GIDPrefix)
+
+    def test_pma(self):
+        """Port counters are summed, clamped and cleared."""
+        umad = rdma.sim.SimUMAD(self.fabric)
+        path = short_path(umad,1,qkey=IBA.IB_DEFAULT_QP1_QKEY)
+        path.dqpn = path.sqpn = 1
+        cpinf = umad.PerformanceGet(IBA.MADClassPortInfo,path)
+        self.assertTrue(cpinf.capabilityMask & IBA.allPortSelect)
+
+        switch = self.fabric.lid_to_port(1).node
+        switch.ports[1].counters["symbolErrorCounter"] = 0x10000
+        switch.ports[2].counters["portXmitData"] = 100
+        switch.ports[3].counters["portXmitData"] = 10
+        req = IBA.PMPortCounters()
+        req.portSelect = 2
+        self.assertEqual(umad.PerformanceGet(req,path).portXmitData,100)
+        req.portSelect = 0xFF
+        pc = umad.PerformanceGet(req,path)
+        self.assertEqual(pc.portXmitData,110)
+        self.assertEqual(pc.symbolErrorCounter,0xFFFF)
+
+        req.counterSelect = 0xFFFF
+        umad.PerformanceSet(req,path)
+        self.assertEqual(umad.PerformanceGet(req,path).portXmitData,0)
+
+    def test_execute_many(self):
+        """Pipelined synchronous Gets return in order despite losses."""
+        umad = rdma.sim.SimUMAD(self.fabric,loss=0.3,latency=0.0002,seed=2)
+        reqs = [(short_path(umad,I,retries=20),0) for I in range(1,37)]
+        res = umad.SubnGetMany(IBA.SMPNodeInfo,reqs,window=8)
+        self.assertEqual([int(I.nodeGUID) for I in res],
+                         [self.fabric.lid_to_port(I).node.nodeGUID
+                          for I in range(1,37)])
+        self.assertTrue(umad.dropped > 0)
+
+        umad = rdma.sim.SimUMAD(self.fabric)
+        reqs = [(short_path(umad,1),0),(short_path(umad,100),0),
+                (short_path(umad,2),0)]
+        self.assertRaises(rdma.MADTimeoutError,umad.SubnGetMany,
+                          IBA.SMPNodeInfo,reqs)
+        res = umad.SubnGetMany(IBA.SMPNodeInfo,reqs,return_exceptions=True)
+        self.assertTrue(isinstance(res[0],IBA.SMPNodeInfo))
+        self.assertTrue(isinstance(res[1],rdma.MADTimeoutError))
+        self.assertTrue(isinstance(res[2],IBA.SMPNodeInfo))
+        self.assertRaises(rdma.RDMAError,umad.execute_many,
+                          umad.SubnAdmGet,IBA.SANodeRecord,[(None,0)])
+
+        # A cache answers what it can and pipelines the rest
+        mad = rdma.madcache.MADCache(umad)
+        reqs = [(short_path(umad,I),0) for I in range(1,9)]
+        mad.SubnGet(IBA.SMPNodeInfo,reqs[2][0])
+        sent = umad.sent
+        res = mad.SubnGetMany(IBA.SMPNodeInfo,reqs)
+        self.assertEqual(umad.sent - sent,7)
+        self.assertEqual([int(I.nodeGUID) for I in res],
+                         [self.fabric.lid_to_port(I).node.nodeGUID
+                          for I in range(1,9)])
+        self.assertEqual(mad.SubnGetMany(IBA.SMPNodeInfo,reqs)[7].nodeGUID,
+                         res[7].nodeGUID)
+        self.assertEqual(umad.sent - sent,7)
+
+    def test_busy(self):
+        """BUSY replies are resent after a delay without using retries."""
+        umad = rdma.sim.SimUMAD(self.fabric,rate=2000,queue_depth=4,busy=True)
+        sched = rdma.sched.MADSchedule(umad)
+        sched.coalesce = False
+        sched.max_per_target = 32
+        res = []
+        sched.run(mqueue=(self.get_info(sched,short_path(umad,1,retries=20),
+                                        res)
+                          for I in range(40)))
+        self.assertEqual(len(res),40)
+        self.assertTrue(umad.busy_replies > 0)
+        self.assertEqual(umad.dropped,0)
+
+        busy = umad.busy_replies
+        res = umad.SubnGetMany(IBA.SMPNodeInfo,
+                               [(short_path(umad,2,retries=20),0)]*40,
+                               window=40)
+        self.assertEqual(len(res),40)
+        self.assertTrue(umad.busy_replies > busy)
+
+        umad.busy_retries = 0
+        self.assertRaises(rdma.MADError,umad.SubnGetMany,IBA.SMPNodeInfo,
+                          [(short_path(umad,3),0)]*40,window=40)
+
+    def test_redirect(self):
+        """PMA redirects are followed and remembered."""
+        umad = rdma.sim.SimUMAD(self.fabric,pma_redirect={1:5})
+        path = short_path(umad,1,qkey=IBA.IB_DEFAULT_QP1_QKEY)
+        path.dqpn = path.sqpn = 1
+        req = IBA.PMPortCounters()
+        req.portSelect = 1
+        umad.PerformanceGet(req,path)
+        self.assertEqual(umad.redirects,1)
+        self.assertEqual(umad.reply_path.sqpn,5)
+        umad.PerformanceGet(req,path)
+        self.assertEqual(umad.redirects,1)
+
+        # Each caller's own path is redirected, not a shared one
+        other = path.copy(retries=3)
+        umad.PerformanceGet(req,other)
+        self.assertEqual(umad.redirects,1)
+        self.assertIsNot(umad._redirected(IBA.PMFormat,other),
+                         umad._redirected(IBA.PMFormat,other))
+        npath = umad._redirected(IBA.PMFormat,other)
+        self.assertEqual((npath.dqpn,npath.retries,path.dqpn),(5,3,1))
+
+        sched = rdma.sched.MADSchedule(umad)
+        def get(path):
+            yield sched.PerformanceGet(req,path)
+        sched.run(queue=get(path))
+        self.assertEqual(umad.redirects,1)
+
+        umad.forget_redirects()
+        res = umad.PerformanceGetMany(req,[(path,0)]*4,window=1)
+        self.assertEqual(len(res),4)
+        self.assertEqual(umad.redirects,2)
+
+        # SMPs are never redirected
+        self.assertEqual(umad.SubnGet(IBA.SMPNodeInfo,short_path(umad,1)).
+                         nodeType,IBA.NODE_SWITCH)
+
+    def get_info(self,sched,path,res):
+        ninf = yield sched.SubnGet(IBA.SMPNodeInfo,path)
+        res.append(ninf)
+
+    def test_loss(self):
+        """Lost MADs are recovered by retries."""
+        umad = rdma.sim.SimUMAD(self.fabric,loss=0.3,latency=0.0002,seed=1)
+        sched = rdma.sched.MADSchedule(umad)
+        res = []
+        sched.run(mqueue=(self.get_info(sched,short_path(umad,I,retries=20),
+                                        res)
+                          for I in range(1,37)))
+        self.assertEqual(len(res),36)
+        self.assertTrue(umad.dropped > 0)
+        self.assertTrue(umad.sent >= 36 + umad.dropped)
+
+    def test_rate(self):
+        """A busy agent drops MADs beyond its queue."""
+        umad = rdma.sim.SimUMAD(self.fabric,rate=2000,queue_depth=4)
+        sched = rdma.sched.MADSchedule(umad)
+        sched.coalesce = False
+        sched.max_per_target = 32
+        res = []
+        sched.run(mqueue=(self.get_info(sched,short_path(umad,1,retries=20),
+                                        res)
+                          for I in range(40)))
+        self.assertEqual(len(res),40)
+        self.assertTrue(umad.dropped > 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+# Copyright 2011 Obsidian Research Corp. GPLv2, see COPYING.
+import unittest
+import errno
+import select
+import io
+import socket
+import rdma,rdma.madcapture,rdma.umad,rdma.tools
+from tests.sched_fake import FakeEndPort
+
+class umad_recv_test(unittest.TestCase):
+    """Feed :class:`rdma.umad.UMAD` from a packet socket that behaves like
+    the umad char device."""
+    def setUp(self):
+        self.kern,sock = socket.socketpair(socket.AF_UNIX,socket.SOCK_SEQPACKET)
+        sock.setblocking(False)
+        umad = rdma.umad.UMAD.__new__(rdma.umad.UMAD)
+        umad.parent = FakeEndPort()
+        umad.dev = socket.SocketIO(sock,"rwb")
+        umad._sock = sock
+        umad._poll = select.poll()
+        umad._poll.register(sock.fileno(),select.POLLIN)
+        umad._rbuf = bytearray(320)
+        umad._agent_id_dqpn = {3:1}
+        self.umad = umad
+
+    def tearDown(self):
+        self.umad.dev.close()
+        self.umad._sock.close()
+        self.kern.close()
+
+    def deliver(self,tid,status=0,agent_id=3):
+        hdr = rdma.umad.UMAD.ib_user_mad_t.pack(agent_id,status,0,0,256,
+                                                bytes(44))
+        mad = bytearray(256)
+        mad[12:16] = tid.to_bytes(4,"big")
+        self.kern.send(hdr + mad)
+
+    def test_many(self):
+        """All ready MADs are returned by one call."""
+        for I in range(5):
+            self.deliver(I)
+        self.deliver(9,status=errno.ETIMEDOUT)
+        wakeat = rdma.tools.clock_monotonic() + 1
+        res = self.umad.recvfrom_many(wakeat)
+        self.assertEqual([I[0][15] for I in res],[0,1,2,3,4])
+        self.assertEqual(len(res[0][0]),256)
+        self.assertEqual(res[0][1].dqpn,1)
+        self.assertEqual(self.umad.recvfrom_many(rdma.tools.clock_monotonic()),[])
+
+    def test_limit(self):
+        """recvfrom_many honours limit and recvfrom returns one MAD."""
+        for I in range(5):
+            self.deliver(I)
+        wakeat = rdma.tools.clock_monotonic() + 1
+        self.assertEqual(len(self.umad.recvfrom_many(wakeat,2)),2)
+        self.assertEqual(self.umad.recvfrom(wakeat)[0][15],2)
+        self.assertEqual(len(self.umad.recvfrom_many(wakeat)),2)
+        self.assertEqual(self.umad.recvfrom(rdma.tools.clock_monotonic()),None)
+
+    def test_capture(self):
+        """Received MADs are recorded, send timeouts are not."""
+        f = io.BytesIO()
+        self.umad.capture = rdma.madcapture.MADCapture(f)
+        self.deliver(1)
+        self.deliver(2,status=errno.ETIMEDOUT)
+        self.deliver(3)
+        wakeat = rdma.tools.clock_monotonic() + 1
+        self.assertEqual(len(self.umad.recvfrom_many(wakeat)),2)
+        self.umad.capture.close()
+        recs = list(rdma.madcapture.read_capture(io.BytesIO(f.getvalue())))
+        self.assertEqual([I.buf[15] for I in recs],[1,3])
+        self.assertEqual(recs[0].kind,rdma.madcapture.CAPTURE_RECV)
+        self.assertEqual(recs[0].dqpn,1)
+
+if __name__ == '__main__':
+    unittest.main()